@@ -40,10 +40,23 @@ LOGGING_CONFIG = {
   }
 }
 
-def init_logging():
+# Queued backend settings. With ASYNC_LOGGING on, callers only enqueue records and a
+# background listener thread does the formatting and file I/O.
+ASYNC_LOGGING = True
+ASYNC_LOG_CAPACITY = 10_000
+ASYNC_LOG_OVERFLOW = 'DROP_NEWEST'  # DROP_NEWEST, DROP_OLDEST or BLOCK
+
+def init_logging(asynchronous: bool = ASYNC_LOGGING):
   """Call this to explicitly start logging"""
   os.makedirs('logs', exist_ok=True)
   logging.config.dictConfig(LOGGING_CONFIG)
+  if asynchronous:
+    from util.logging.backend import OverflowPolicy, QueuedLogBackend
+    # Flushed and stopped automatically at interpreter exit.
+    QueuedLogBackend.start(
+      capacity=ASYNC_LOG_CAPACITY,
+      policy=OverflowPolicy[ASYNC_LOG_OVERFLOW],
+    )
   logger = logging.getLogger(__name__)
   logger.info("Logging notification ready")
   return logger
\ No newline at end of file
@@ -24,4 +24,5 @@ from .string import *
 from .toggle import *
 
 # Module
+from .trust import TrustBlock, TrustedValidation
 from .validator import Validator
@@ -11,12 +11,13 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from domain.model import Persona, TokenContext
+from domain.model import DeploymentState, Persona, TokenActivityState, TokenContext
 from result import ValidationResult
 from setting import GameColor
 from toolkit import TokenToolkit
 from util import LoggingLevelRouter
 from assurance.validator import ContextValidator
+from assurance.validator.trust import TrustedValidation
 from err import (
     GameColorNullException, TokenContextNullException, TokenContextValidatorException,
     TokenContextValidationRouteException
@@ -42,6 +43,10 @@ class TokenContextValidator(ContextValidator):
                     integrity_checker: TokenToolkit,
             ) -> ValidationResult[Token]:
 
+    Notes:
+        Contexts do not change after they are built, so inside a TrustedValidation.trusted()
+        block a context is certified once and the stamped result is sent for it afterward.
+
     Super Class:
         ContextValidator
     """
@@ -51,6 +56,32 @@ class TokenContextValidator(ContextValidator):
             cls,
             candidate: Any,
             integrity_checker: TokenToolkit | None = None,
+    ) -> ValidationResult[TokenContext]:
+        """
+        Certify a candidate is a TokenContext that is safe to use, or send the stamped
+        result if it was certified earlier in a trusted block.
+        
+        Args:
+            candidate: Any,
+            integrity_checker: TokenToolkit,
+        Returns:
+            ValidationResult[Token]
+        Raises:
+            TokenContextValidatorException
+            TokenContextValidationRouteException
+        """
+        # Handle the case that, the candidate was already certified in a trusted block.
+        stamped = TrustedValidation.lookup(cls, candidate)
+        if stamped is not None:
+            return stamped
+        # --- Certify the candidate, stamp it then forward the work product. ---#
+        return TrustedValidation.stamp(cls, candidate, cls._certify(candidate, integrity_checker))
+    
+    @classmethod
+    def _certify(
+            cls,
+            candidate: Any,
+            integrity_checker: TokenToolkit | None = None,
     ) -> ValidationResult[TokenContext]:
         """
         Certify a candidate is a TokenContext that is safe to use.
@@ -254,6 +285,30 @@ class TokenContextValidator(ContextValidator):
                 # On validation success forward the work product to the caller.
             return ValidationResult.success(context)
         
+        # Certification for the indexed enum targets. A context may set several of them.
+        enum_targets = (
+            (context.persona, Persona),
+            (context.readiness_state, TokenActivityState),
+            (context.deployment_state, DeploymentState),
+        )
+        if any(target is not None for target, _ in enum_targets):
+            for target, enum_type in enum_targets:
+                if target is not None and not isinstance(target, enum_type):
+                    # Send the exception chain on failure.
+                    return ValidationResult.failure(
+                        TokenContextValidatorException(
+                            cls_mthd=method,
+                            cls_name=self.__class__.__name__,
+                            msg=TokenContextValidatorException.MSG,
+                            err_code=TokenContextValidatorException.ERR_CODE,
+                            ex=TypeError(
+                                f"{method}: Expected {enum_type.__name__}, got {type(target).__name__} instead."
+                            )
+                        )
+                    )
+            # On validation success forward the work product to the caller.
+            return ValidationResult.success(context)
+        
         # Handle the case that, there is no validation logic for the attribute.
         return ValidationResult.failure(
             TokenContextValidatorException(
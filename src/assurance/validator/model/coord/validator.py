@@ -17,6 +17,7 @@ from assurance import CoordIntegrityChecker
 from result import ValidationResult
 from util import LoggingLevelRouter
 from assurance.validator import ModelValidator
+from assurance.validator.trust import TrustedValidation
 
 
 class CoordValidator(ModelValidator[Coord]):
@@ -36,6 +37,10 @@ class CoordValidator(ModelValidator[Coord]):
     Provides:
         -   execute(candidate: Any) -> ValidationResult
 
+    Notes:
+        Coords are immutable, so inside a TrustedValidation.trusted() block a coord is
+        certified once and the stamped result is sent for it afterward.
+
     Super Class:
         ModelValidator
     """
@@ -70,6 +75,11 @@ class CoordValidator(ModelValidator[Coord]):
         """
         method = f"{self.__class__.__name__}.execute"
         
+        # Handle the case that, the candidate was already certified in a trusted block.
+        stamped = TrustedValidation.lookup(type(self), candidate)
+        if stamped is not None:
+            return stamped
+        
         # Handle the case that, the candidate is not safe.
         certification = self.integrity_checker.execute(candidate)
         if certification.is_failure:
@@ -83,10 +93,14 @@ class CoordValidator(ModelValidator[Coord]):
                     ex=certification.exception,
                 )
             )
-        # --- Forward the work product to the caller. ---#
-        return ValidationResult.success(
-            cast(
-                self.integrity_checker.bundle.model,
-                certification.payload
-            )
+        # --- Stamp the candidate then forward the work product to the caller. ---#
+        return TrustedValidation.stamp(
+            type(self),
+            candidate,
+            ValidationResult.success(
+                cast(
+                    self.integrity_checker.bundle.model,
+                    certification.payload
+                )
+            ),
         )
\ No newline at end of file
@@ -10,6 +10,7 @@ version: 0.0.2
 from __future__ import annotations
 from typing import Any, Type, TypeVar, cast
 
+from assurance.validator.trust import TrustedValidation
 from result import ValidationResult
 from util import LoggingLevelRouter
 from err import NullException, PrimingException
@@ -39,6 +40,10 @@ class PrimingValidator:
                     null_exception: NullException,
             ) -> ValidationResult:
 
+    Notes:
+        Inside a TrustedValidation.trusted() block a candidate primed for a target_model
+        is not primed again for it until its version changes.
+
     Super Class:
         Validator
     """
@@ -72,6 +77,11 @@ class PrimingValidator:
         """
         method = f"{cls.__class__.__name__}.validate"
         
+        # Handle the case that, the candidate was already primed in a trusted block.
+        stamped = TrustedValidation.lookup(cls, candidate, target_model)
+        if stamped is not None:
+            return stamped
+        
         # Handle the nonexistence case.
         if candidate is None:
             # Send the exception chain on failure.
@@ -96,12 +106,12 @@ class PrimingValidator:
                     msg=PrimingException.MSG,
                     err_code=PrimingException.ERR_CODE,
                     ex=TypeError(
-                        f"Expected {type(target_model).__name}, "
+                        f"Expected {target_model.__name__}, "
                         f"got {type(candidate).__name__} instead."
                     )
                 )
             )
-        # --- Cast the candidate to the target_model then forward the work product. ---#
-        return ValidationResult.success(cast(T, candidate))
+        # --- Cast the candidate to the target_model, stamp it then forward the work product. ---#
+        return TrustedValidation.stamp(cls, candidate, ValidationResult.success(cast(T, candidate)), target_model)
     
 
@@ -0,0 +1,153 @@
+# src/assurance/validator/trust.py
+
+"""
+Module: assurance.validator.trust
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+from result import ValidationResult
+
+
+class TrustBlock:
+    """
+    Role:
+        -   Certification Memo Store
+
+    Responsibilities:
+        1.  Hold the stamps one trusted() block made and count how often they answered.
+
+    Attributes:
+        stamps: Dict[Tuple[Hashable, ...], Tuple[Any, Optional[int], ValidationResult]]
+        hits: int
+        misses: int
+
+    Notes:
+        Counters live on the block, not on TrustedValidation, so two move decisions running
+        side by side each report their own hit rate.
+
+    Super Class:
+    """
+    __slots__ = ("stamps", "hits", "misses")
+
+    stamps: Dict[Tuple[Hashable, ...], Tuple[Any, Optional[int], ValidationResult]]
+    hits: int
+    misses: int
+
+    def __init__(self):
+        self.stamps = {}
+        self.hits = 0
+        self.misses = 0
+
+
+class TrustedValidation:
+    """
+    Role:
+        -   Certification Memo
+        -   Validation Short-Circuit
+
+    Responsibilities:
+        1.  Inside a trusted() block, remember which validator certified which object at
+            which version.
+        2.  Hand the remembered success back until the object's version changes, so a Coord
+            certified once in a move decision is not re-certified by every layer below.
+
+    Attributes:
+
+    Provides:
+        -   def trusted(block: Optional[TrustBlock]) -> Iterator[TrustBlock]
+        -   def is_enabled() -> bool
+        -   def hits() -> int
+        -   def misses() -> int
+        -   def lookup(validator: type, candidate: Any, *qualifiers: Hashable) -> Optional[ValidationResult]
+        -   def stamp(validator: type, candidate: Any, result: ValidationResult, *qualifiers: Hashable)
+                -> ValidationResult
+        -   def version(candidate: Any) -> Optional[int]
+
+    Notes:
+        Outside a trusted() block every lookup misses and nothing is stamped, so validators
+        behave exactly as before. Turn.execute opens a block around the adviser's move
+        decision.
+
+        An object's version is its `version` attribute. StateModel subclasses advance it in
+        their setters through touch(). Objects without one are stamped as immutable, which
+        suits Coord and the search contexts.
+
+        Stamps hold a reference to the object, which keeps its id from being reused while
+        the block is open. Blocks are per context, like ServiceContainer.game_scope, so
+        search threads do not share stamps by accident. hits() and misses() report the
+        current block's counters.
+
+    Super Class:
+    """
+    _block: ContextVar[Optional[TrustBlock]] = ContextVar("trusted_validation_block", default=None)
+
+    @classmethod
+    @contextmanager
+    def trusted(cls, block: Optional[TrustBlock] = None) -> Iterator[TrustBlock]:
+        """
+        Validations inside the block may be answered from its stamps. A nested block shares
+        the enclosing block. Pass the yielded TrustBlock to trusted() in another thread to
+        share it there. The stamps are dropped when the block that made them exits.
+        """
+        if block is None:
+            block = cls._block.get()
+        if block is None:
+            block = TrustBlock()
+        token = cls._block.set(block)
+        try:
+            yield block
+        finally:
+            cls._block.reset(token)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._block.get() is not None
+
+    @classmethod
+    def hits(cls) -> int:
+        block = cls._block.get()
+        return 0 if block is None else block.hits
+
+    @classmethod
+    def misses(cls) -> int:
+        block = cls._block.get()
+        return 0 if block is None else block.misses
+
+    @classmethod
+    def version(cls, candidate: Any) -> Optional[int]:
+        return getattr(candidate, "version", None)
+
+    @classmethod
+    def lookup(cls, validator: type, candidate: Any, *qualifiers: Hashable) -> Optional[ValidationResult]:
+        """The success validator last sent for candidate, if candidate has not changed since."""
+        block = cls._block.get()
+        if block is None:
+            return None
+        stamp = block.stamps.get((validator, id(candidate)) + qualifiers)
+        if stamp is None or stamp[0] is not candidate or stamp[1] != cls.version(candidate):
+            block.misses += 1
+            return None
+        block.hits += 1
+        return stamp[2]
+
+    @classmethod
+    def stamp(
+            cls,
+            validator: type,
+            candidate: Any,
+            result: ValidationResult,
+            *qualifiers: Hashable,
+    ) -> ValidationResult:
+        """Remember a successful result for candidate's current version. Returns result."""
+        block = cls._block.get()
+        if block is not None and result.is_success:
+            block.stamps[(validator, id(candidate)) + qualifiers] = (candidate, cls.version(candidate), result)
+        return result
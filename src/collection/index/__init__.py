@@ -0,0 +1,16 @@
+# src/collection/index/__init__.py
+
+"""
+Module: collection.index.__init__
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+# =========== COLLECTION.INDEX PACKAGE ===========#
+
+# Packages
+
+
+# Modules
+from .index import ModelIndex
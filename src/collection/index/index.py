@@ -0,0 +1,168 @@
+# src/collection/index/index.py
+
+"""
+Module: collection.index.index
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, ClassVar, Dict, Generic, Hashable, Iterable, List, Mapping, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ModelIndex(Generic[T]):
+    """
+    Role:
+        -   Secondary Index
+        -   Search Accelerator
+
+    Responsibilities:
+        1.  File every item under one hash key per declared attribute.
+        2.  Answer single and multi-key queries by intersecting the matching sets, smallest
+            first, instead of scanning the collection.
+
+    Attributes:
+        KEYS: Dict[str, Callable[[T], Hashable]]. Index name to the item's key for it.
+            Declared by each model's subclass.
+        NORMALIZE: Dict[str, Callable[[Any], Hashable]]. Applied to a query value before
+            lookup, for indexes whose keys are normalized, e.g. upper-cased names.
+        size: int
+
+    Provides:
+        -   def covers(names: Iterable[str]) -> bool
+        -   def add(item: T) -> None
+        -   def remove(item: T) -> None
+        -   def refresh(item: T) -> None
+        -   def clear() -> None
+        -   def lookup(name: str, value: Any) -> List[T]
+        -   def intersect(criteria: Mapping[str, Any]) -> List[T]
+
+    Notes:
+        The stack that owns an index adds and removes items as they are pushed, popped and
+        deleted. Items whose keyed attributes change in place must call refresh(). Results
+        are checked against each item's live values, so a stale entry is never returned, but
+        an item whose change missed refresh() is missing from searches for its new value.
+        That false negative is a wrong answer, so every write to a keyed attribute has to
+        reach refresh(); SquareIndex is re-keyed by Board.occupy and Board.vacate.
+
+        Items are held in sets, so T must hash consistently with its __eq__.
+
+        SquareStackService, TokenStackService and TeamStackService keep an index, and their
+        routers answer from it through SearchRouter._route_by_index. The player, edge, node,
+        snapshot, board and coord stacks do not: their finders extend StackSearchRouter,
+        DataFinder, Finder or the bare Router rather than SearchRouter, so nothing would read
+        one. Arenas have no stack. An index for any of them starts with moving its finder
+        onto SearchRouter.
+
+    Usage:
+        class TeamIndex(ModelIndex[Team]):
+            KEYS = {
+                "id": lambda team: team.id,
+                "archetype": lambda team: team.archetype,
+            }
+
+    Super Class:
+    """
+    KEYS: ClassVar[Dict[str, Callable[[Any], Hashable]]] = {}
+    NORMALIZE: ClassVar[Dict[str, Callable[[Any], Hashable]]] = {}
+
+    _tables: Dict[str, Dict[Hashable, Set[T]]]
+    _filed: Dict[T, Tuple[Hashable, ...]]
+    _order: Dict[T, int]
+    _counter: int
+
+    def __init__(self):
+        self._tables = {name: {} for name in self.KEYS}
+        self._filed = {}
+        self._order = {}
+        self._counter = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._filed)
+
+    @classmethod
+    def covers(cls, names: Iterable[str]) -> bool:
+        return all(name in cls.KEYS for name in names)
+
+    def add(self, item: T) -> None:
+        if item in self._filed:
+            self.refresh(item)
+            return
+        keys = tuple(key(item) for key in self.KEYS.values())
+        for name, key in zip(self.KEYS, keys):
+            self._tables[name].setdefault(key, set()).add(item)
+        self._filed[item] = keys
+        self._order[item] = self._counter
+        self._counter += 1
+
+    def remove(self, item: T) -> None:
+        keys = self._filed.pop(item, None)
+        if keys is None:
+            return
+        for name, key in zip(self.KEYS, keys):
+            self._discard(name, key, item)
+        del self._order[item]
+
+    def refresh(self, item: T) -> None:
+        """Move the item to the buckets for its current values. A no-op if it is not filed."""
+        filed = self._filed.get(item)
+        if filed is None:
+            return
+        keys = tuple(key(item) for key in self.KEYS.values())
+        for name, old, new in zip(self.KEYS, filed, keys):
+            if old != new:
+                self._discard(name, old, item)
+                self._tables[name].setdefault(new, set()).add(item)
+        self._filed[item] = keys
+
+    def clear(self) -> None:
+        for table in self._tables.values():
+            table.clear()
+        self._filed.clear()
+        self._order.clear()
+
+    def lookup(self, name: str, value: Any) -> List[T]:
+        return self.intersect({name: value})
+
+    def intersect(self, criteria: Mapping[str, Any]) -> List[T]:
+        """
+        Items matching every name: value pair, in the order they were added.
+
+        Raises:
+            KeyError if a name is not one of KEYS.
+        """
+        keys = [(name, self._normalize(name, value)) for name, value in criteria.items()]
+        buckets = []
+        for name, key in keys:
+            bucket = self._tables[name].get(key)
+            if not bucket:
+                return []
+            buckets.append(bucket)
+        if not buckets:
+            return []
+        buckets.sort(key=len)
+        live = list(buckets[0].intersection(*buckets[1:]) if len(buckets) > 1 else buckets[0])
+        # One pass per key rather than one all() per item keeps the live check in comprehensions.
+        for name, key in keys:
+            extract = self.KEYS[name]
+            live = [item for item in live if extract(item) == key]
+        if len(live) > 1:
+            live.sort(key=self._order.__getitem__)
+        return live
+
+    def _normalize(self, name: str, value: Any) -> Hashable:
+        normalize = self.NORMALIZE.get(name)
+        return value if normalize is None else normalize(value)
+
+    def _discard(self, name: str, key: Hashable, item: T) -> None:
+        bucket = self._tables[name].get(key)
+        if bucket is None:
+            return
+        bucket.discard(item)
+        if not bucket:
+            del self._tables[name][key]
@@ -12,7 +12,7 @@ from __future__ import annotations
 from typing import Iterator, List, Optional, Tuple, cast
 
 from collection import SetCollection
-from domain.model import Coord, Vector
+from domain.model import Coord, Vector, VectorTable
 
 
 class CoordSet(SetCollection[Coord]):
@@ -53,5 +53,8 @@ class CoordSet(SetCollection[Coord]):
         return [item for item in self._items]
     
     def to_vector_tuple(self) -> Tuple[Vector, ...]:
-        return tuple(Vector(x=item.column, y=item.row) for item in self._items)
+        return tuple(
+            VectorTable.get(x=item.column, y=item.row) or Vector(x=item.column, y=item.row)
+            for item in self._items
+        )
         
\ No newline at end of file
@@ -13,4 +13,5 @@ version: 0.0.2
 
 
 # Modules
+from .index import SquareIndex
 from .stack import SquareStackService
\ No newline at end of file
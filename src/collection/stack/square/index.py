@@ -0,0 +1,67 @@
+# src/collection/stack/square/index.py
+
+"""
+Module: collection.stack.square.index
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from collection.index import ModelIndex
+from domain.model import Coord, Square, Token
+
+
+class SquareIndex(ModelIndex[Square]):
+    """
+    Role:
+        -   Hash Index
+        -   Search Accelerator
+
+    Responsibilities:
+        1.  Map a square's id, upper-case name, coord and occupant to the squares holding them.
+
+    Attributes:
+        KEYS: Dict[str, Callable[[Square], Hashable]]
+
+    Provides:
+        -   def move_occupant(square: Square, previous: Optional[Token]) -> None
+        -   def by_id(id: int) -> List[Square]
+        -   def by_name(name: str) -> List[Square]
+        -   def by_coord(coord: Coord) -> List[Square]
+        -   def by_occupant(occupant: Token) -> List[Square]
+
+    Notes:
+        Board.occupy and Board.vacate call move_occupant for every occupant change on a
+        board's SquareDatabase. The stack's visits and SquareDatabase's occupant changes
+        call it as well; refresh() is a no-op when nothing moved.
+
+    Super Class:
+        ModelIndex
+    """
+    KEYS = {
+        "id": lambda square: square.id,
+        "name": lambda square: square.name.upper(),
+        "coord": lambda square: square.coord,
+        "occupant": lambda square: square.occupant,
+    }
+    NORMALIZE = {"name": str.upper}
+
+    def move_occupant(self, square: Square, previous: Optional[Token]) -> None:
+        """Re-key square after its occupant changed from previous to square.occupant."""
+        self.refresh(square)
+
+    def by_id(self, id: int) -> List[Square]:
+        return self.lookup("id", id)
+
+    def by_name(self, name: str) -> List[Square]:
+        return self.lookup("name", name)
+
+    def by_coord(self, coord: Coord) -> List[Square]:
+        return self.lookup("coord", coord)
+
+    def by_occupant(self, occupant: Token) -> List[Square]:
+        return self.lookup("occupant", occupant)
@@ -9,6 +9,7 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from collection.stack.square.index import SquareIndex
 
 
 class SquareStackService(StackService[Square]):
@@ -23,6 +24,7 @@ class SquareStackService(StackService[Square]):
         *   StackService
 
     Provides:
+        -   search_many(contexts: List[SquareContext]) -> SearchResult[List[List[Square]]]
 
     Attributes:
             SERVICE_NAME: str
@@ -31,6 +33,7 @@ class SquareStackService(StackService[Square]):
             controller: SquareStackOpsController
             service: SquareService:
             context_service: SquareQueryService
+            index: SquareIndex
     
     # INHERITED ATTRIBUTES:
         *   See StackService for inherited attributes.
@@ -61,6 +64,8 @@ class SquareStackService(StackService[Square]):
         *   See StackService class for inherited methods.
     """
     SERVICE_NAME = "SquareStackService"
+    INDEX = SquareIndex
+    
     _capacity: int
     _stack: List[Square]
     _controller: SquareStackOpsController
@@ -213,6 +218,7 @@ class SquareStackService(StackService[Square]):
             token_service: TokenService = TokenService(),
 ) -> UpdateResult[Square]:
         method = "SquareStackService.start_square_visit"
+        previous_occupant = square.occupant
         
         # --- Handoff the visit management responsibility to _controller ---#
         visitation_result = self._controller.claimant.occupy_stack_square(
@@ -233,6 +239,8 @@ class SquareStackService(StackService[Square]):
                     ex=visitation_result.exception,
                 )
             )
+        self._index.move_occupant(square, previous_occupant)
+        
         # --- Send the success result directly forward to the caller. ---#
         return visitation_result
     
@@ -242,6 +250,7 @@ class SquareStackService(StackService[Square]):
             token_service: TokenService = TokenService(),
     ) -> DeletionResult[Token]:
         method = "SquareStackService.end_square_visit"
+        occupied_squares = self._index.by_occupant(token)
         
         # --- Handoff the visit management responsibility to _controller ---#
         visitation_result = self._controller.claimant.remove_occupant_from_stack(
@@ -260,6 +269,9 @@ class SquareStackService(StackService[Square]):
                     ex=visitation_result.exception,
                 )
             )
+        for square in occupied_squares:
+            self._index.move_occupant(square, token)
+            
         # --- Send the success result directly forward to the caller. ---#
         return visitation_result
 
@@ -267,6 +279,7 @@ class SquareStackService(StackService[Square]):
     def search(
             self,
             context: SquareContext,
+            board: Optional[Board] = None,
     ) -> SearchResult[List[Square]]:
         """
         # ACTION:
@@ -278,6 +291,8 @@ class SquareStackService(StackService[Square]):
                 payload.
         # PARAMETERS:
             *   context (SquareContext)
+            *   board (Optional[Board]): The board when the stack holds its whole square set,
+                so a coord search reads the board's mailbox.
         # RETURN:
             *   SearchResult[List[Square] containing either:
                     - On failure: An exception.
@@ -292,6 +307,8 @@ class SquareStackService(StackService[Square]):
         query_result = self._context_service.finder.route(
             context=context,
             dataset=self._stack,
+            index=self._index,
+            board=board,
         )
         # Handle the case that, the search is not completed.
         if query_result.is_failure:
@@ -306,4 +323,49 @@ class SquareStackService(StackService[Square]):
                 )
             )
         # --- For either a successful or empty search result directly forward to the caller. ---#
-        return query_result
\ No newline at end of file
+        return query_result
+    
+    @LoggingLevelRouter.monitor
+    def search_many(
+            self,
+            contexts: List[SquareContext],
+            board: Optional[Board] = None,
+    ) -> SearchResult[List[List[Square]]]:
+        """
+        # ACTION:
+            1.  Pass every context to the finder's batch route, which certifies each once and
+                answers them all in one pass over the stack.
+            2.  Any failure is encapsulated inside a SquareStackException sent in a SearchResult.
+        # PARAMETERS:
+            *   contexts (List[SquareContext])
+            *   board (Optional[Board]): As in search().
+        # RETURN:
+            *   SearchResult[List[List[Square]]] containing either:
+                    - On failure: An exception.
+                    - On success: Each context's matches, in context order.
+        Raises:
+            *   SquareStackException
+        """
+        method = "SquareStackService.search_many"
+        
+        # --- Handoff the batch to the finder. ---#
+        query_result = self._context_service.finder.route_batch(
+            dataset=self._stack,
+            contexts=contexts,
+            index=self._index,
+            board=board,
+        )
+        # Handle the case that, the batch is not completed.
+        if query_result.is_failure:
+            # Send the exception chain on failure.
+            return SearchResult.failure(
+                SquareStackException(
+                    cls_mthd=method,
+                    cls_name=self.__class__.__name__,
+                    err_code=SquareStackException.ERR_CODE,
+                    msg=SquareStackException.MSG,
+                    ex=query_result.exception,
+                )
+            )
+        # --- Forward the work product to the caller. ---#
+        return query_result
@@ -11,9 +11,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from typing import Generic, Iterator, List, Optional, TypeVar
+from typing import ClassVar, Generic, Iterator, List, Optional, Type, TypeVar
 
 from collection import DomainObjectCollection
+from collection.index import ModelIndex
 from microservice import IdentityService, Microservice
 from result import DeletionResult, InsertionResult, SearchResult
 
@@ -37,10 +38,14 @@ class StackService(DomainObjectCollection, ABC, Generic[T]):
     Attributes:
         id: int
         schema: str
+        INDEX: Optional[Type[ModelIndex]]. The secondary index a concrete stack keeps over its
+            items. Stacks which leave it None are searched by scanning.
+        index: Optional[ModelIndex[T]]
 
     Provides:
         -   id: int
         -   schema: str
+        -   index: Optional[ModelIndex[T]]
         -   items() -> List[T]
         -   size() -> int
         -   iterator() -> Iterator[T]
@@ -55,11 +60,19 @@ class StackService(DomainObjectCollection, ABC, Generic[T]):
 
     Super class:
     """
+    INDEX: ClassVar[Optional[Type[ModelIndex]]] = None
+    
     _id: int
     _name: str
+    _index: Optional[ModelIndex[T]]
 
     def __init__(self, id: int, name: str,):
         super().__init__(id=id, name=name)
+        self._index = self.INDEX() if self.INDEX is not None else None
+    
+    @property
+    def index(self) -> Optional[ModelIndex[T]]:
+        return self._index
     
     @property
     @abstractmethod
@@ -122,4 +135,14 @@ class StackService(DomainObjectCollection, ABC, Generic[T]):
     @LoggingLevelRouter.monitor
     def search(self, context: Context[T]) -> SearchResult[List[T]]:
         """Implement to read from the schema."""
-        pass
\ No newline at end of file
+        pass
+    
+    def _indexed(self, item: T) -> None:
+        """File a pushed item in the stack's index, if it keeps one."""
+        if self._index is not None:
+            self._index.add(item)
+    
+    def _unindexed(self, item: Optional[T]) -> None:
+        """Drop a popped or deleted item from the stack's index, if it keeps one."""
+        if self._index is not None and item is not None:
+            self._index.remove(item)
@@ -13,4 +13,5 @@ version: 0.0.2
 
 
 # Modules
+from .index import TeamIndex
 from .stack import TeamStackService
\ No newline at end of file
@@ -0,0 +1,38 @@
+# src/collection/stack/team/index.py
+
+"""
+Module: collection.stack.team.index
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from collection.index import ModelIndex
+from domain.model import Team
+
+
+class TeamIndex(ModelIndex[Team]):
+    """
+    Role:
+        -   Secondary Index
+        -   Search Accelerator
+
+    Responsibilities:
+        1.  File every team in its stack under its id, board, archetype and owner.
+
+    Attributes:
+        KEYS: Dict[str, Callable[[Team], Hashable]]
+
+    Provides:
+
+    Super Class:
+        ModelIndex
+    """
+    KEYS = {
+        "id": lambda team: team.id,
+        "board": lambda team: team.board,
+        "archetype": lambda team: team.archetype,
+        "owner": lambda team: team.owner,
+    }
@@ -14,6 +14,7 @@ from typing import List
 from microservice import TeamService
 from domain.model import Team
 from collection.stack import StackService
+from collection.stack.team.index import TeamIndex
 
 
 class TeamStackService(StackService[Team]):
@@ -36,6 +37,7 @@ class TeamStackService(StackService[Team]):
         *   See StackService class for inherited attributes.
     """
     SERVICE_NAME = "TeamStack"
+    INDEX = TeamIndex
     
     _stack: List[Team]
     _microservice: TeamService
@@ -129,6 +131,7 @@ class TeamStackService(StackService[Team]):
             )
         # --- Team order is not required. Direct insertion into the schema is simpler that a push. ---#
         self._stack.append(item)
+        self._indexed(item)
         return InsertionResult.success()
     
     @LoggingLevelRouter.monitor
@@ -165,6 +168,7 @@ class TeamStackService(StackService[Team]):
                 )
             )
         team = self._stack.pop(-1)
+        self._unindexed(team)
         return DeletionResult.success(team)
     
     @LoggingLevelRouter.monitor
@@ -238,6 +242,7 @@ class TeamStackService(StackService[Team]):
                 # --- Cast the item before removal and return the deleted item in the DeletionResult. ---#
                 team = cast(Team, item)
                 self._stack.remove(team)
+                self._unindexed(team)
                 return DeletionResult.success(payload=team)
         
         # If none of the items had that id return an empty DeletionResult.
@@ -266,7 +271,11 @@ class TeamStackService(StackService[Team]):
         method = "TeamStack.context"
         
         # --- Handoff the search responsibility to _stack_service. ---#
-        query_result = self._context_service.finder.find(dataset=self._stack, context=context)
+        query_result = self._context_service.finder.route(
+            context=context,
+            dataset=self._stack,
+            index=self._index,
+        )
         
         # Handle the case that, the search is not completed.
         if query_result.is_failure:
@@ -303,7 +312,11 @@ class TeamStackService(StackService[Team]):
         method = "TeamStack.context"
         
         # --- Handoff the search responsibility to _stack_service. ---#
-        query_result = self._context_service.finder.find(dataset=self._stack, context=context)
+        query_result = self._context_service.finder.route(
+            context=context,
+            dataset=self._stack,
+            index=self._index,
+        )
         
         # Handle the case that, the search is not completed.
         if query_result.is_failure:
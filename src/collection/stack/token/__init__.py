@@ -14,4 +14,5 @@ version: 0.0.2
 
 # Modules
 from .state import TokenStackState
+from .index import TokenIndex
 from .stack import TokenStackService
\ No newline at end of file
@@ -0,0 +1,45 @@
+# src/collection/stack/token/index.py
+
+"""
+Module: collection.stack.token.index
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from collection.index import ModelIndex
+from domain.model import Token
+
+
+class TokenIndex(ModelIndex[Token]):
+    """
+    Role:
+        -   Secondary Index
+        -   Search Accelerator
+
+    Responsibilities:
+        1.  File every token in its stack under its id, team, persona, current coord,
+            readiness state and deployment state.
+
+    Attributes:
+        KEYS: Dict[str, Callable[[Token], Hashable]]
+
+    Provides:
+
+    Notes:
+        Token changes coord, state and rank after it is filed and calls refresh() through
+        Team.reindex whenever one of them changes.
+
+    Super Class:
+        ModelIndex
+    """
+    KEYS = {
+        "id": lambda token: token.id,
+        "team": lambda token: token.team,
+        "persona": lambda token: token.rank.persona,
+        "coord": lambda token: token.current_position,
+        "readiness_state": lambda token: token.readiness_state,
+        "deployment_state": lambda token: token.deployment_state,
+    }
@@ -18,7 +18,9 @@ from microservice import TokenService
 from domain.model import Token, TokenContext, TokenQuery
 from result import DeletionResult, InsertionResult, SearchResult
 from collection.stack import StackService, TokenStackState
+from collection.stack.token.index import TokenIndex
 from system import IdFactory, LoggingLevelRouter
+from util import ServiceContainer, ServiceScope
 
 
 class TokenStackService(StackService[Token]):
@@ -50,6 +52,7 @@ class TokenStackService(StackService[Token]):
         current_item: Optional[Token]
         integrity_service: TokenService
         controller: TokenStackOpsController
+        index: TokenIndex
 
     Provides:
         -   is_empty() -> bool
@@ -61,12 +64,14 @@ class TokenStackService(StackService[Token]):
         -   is_getting_ready_for_deployment() -> bool
         -   delete_by_id(id: int) -> DeletionResult[Token]
         -   context(context: Context[Token]) -> SearchResult[List[Token]]
+        -   search_many(contexts: List[TokenContext]) -> SearchResult[List[List[Token]]]
 
     Super Class:
         StackService
     """
     DEFAULT_CAPACITY: int = 16
     SERVICE_NAME: str = "TokenStackService"
+    INDEX = TokenIndex
     
     _capacity: int
     _stack: List[Token]
@@ -77,20 +82,20 @@ class TokenStackService(StackService[Token]):
             self,
             name: str = SERVICE_NAME,
             capacity: int = DEFAULT_CAPACITY,
-            id: int = IdFactory.next_id(class_name="TokenStackService"),
-            controller: TokenStackController | None = TokenStackController(),
+            id: Optional[int] = None,
+            controller: TokenStackController | None = None,
     ):
         """
         Args:
-            id: int
+            id: Optional[int]. A fresh id is issued when None.
             name: str
             capacity: int
-            controller: TokenStackOpsController
+            controller: Optional[TokenStackOpsController]. The game's controller when None.
         """
-        super().__init__(id=id, name=name,)
+        super().__init__(id=id if id is not None else IdFactory.next_id(class_name="TokenStackService"), name=name,)
         self._stack = []
         self._capacity = capacity
-        self._controller = controller
+        self._controller = controller or ServiceContainer.resolve(TokenStackController, ServiceScope.GAME)
         self._state = TokenStackState.NOT_READY_FORD_DEPLOYMENT
     
     @property
@@ -204,6 +209,8 @@ class TokenStackService(StackService[Token]):
                     ex=request_result.exception,
                 )
             )
+        self._unindexed(request_result.payload)
+            
         # --- Forward the work product to the caller. ---#
         return request_result
     
@@ -241,6 +248,8 @@ class TokenStackService(StackService[Token]):
                     ex=request_result.exception,
                 )
             )
+        self._indexed(item)
+        
         # --- Forward the work product to the caller. ---#
         return InsertionResult.success()
     
@@ -278,6 +287,7 @@ class TokenStackService(StackService[Token]):
                     ex=request_result.exception,
                 )
             )
+        self._unindexed(request_result.payload)
         # --- Forward the work product to the caller. ---#
         return request_result
     
@@ -315,4 +325,39 @@ class TokenStackService(StackService[Token]):
                 )
             )
         # --- Forward the work product to the caller. ---#
-        return request_result
\ No newline at end of file
+        return request_result
+    
+    @LoggingLevelRouter.monitor
+    def search_many(self, contexts: List[TokenContext]) -> SearchResult[List[List[Token]]]:
+        """
+        Find the tokens fitting each of many contexts in one pass over the stack.
+
+        Action:
+            Send an exception chain if the operation gets interrupted. Otherwise, send
+            the success result.
+        Args:
+            contexts: List[TokenContext]
+        Returns:
+            SearchResult[List[List[Token]]]. Each context's matches, in context order.
+        Raises:
+            TokenStackServiceException
+        """
+        method = f"{self.__class__.__name__}.search_many"
+        
+        # --- Handoff request fulfilment to the controller. ---#
+        request_result = self._controller.searcher.execute_batch(stack=self, contexts=contexts)
+        
+        # Handle the case that, the request was not fulfilled.
+        if request_result.is_failure:
+            # Send the exception chain on failure.
+            return SearchResult.failure(
+                TokenStackServiceException(
+                    cls_mthd=method,
+                    cls_name=self.__class__.__name__,
+                    msg=TokenStackServiceException.MSG,
+                    err_code=TokenStackServiceException.ERR_CODE,
+                    ex=request_result.exception,
+                )
+            )
+        # --- Forward the work product to the caller. ---#
+        return request_result
@@ -70,8 +70,11 @@ class SquareStackPopper:
                     )
                 )
             )
+        square = square_stack.items.pop(-1)
+        square_stack.index.remove(square)
+        
         # --- Send the work product. ---#
-        return DeletionResult.success(square_stack.items.pop(-1))
+        return DeletionResult.success(square)
     
     @classmethod
     @LoggingLevelRouter.monitor
@@ -142,6 +145,7 @@ class SquareStackPopper:
                 # Record a hit before pulling it from the schema.
                 target = square
                 square_stack.items.remove(square)
+                square_stack.index.remove(square)
         # --- After the purging loop finishes handle the possible return cases. ---#
         
         # Nothing was deleted
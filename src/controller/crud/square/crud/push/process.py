@@ -144,6 +144,7 @@ class SquareStackPush:
         
         # Push the square onto the schema
         square_stack.items.append(square)
+        square_stack.index.add(square)
         # Maintain state.
         if square_stack.is_full:
             square_stack.state = SquareStackState.READY_FOR_DEPLOYMENT
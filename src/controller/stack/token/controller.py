@@ -9,12 +9,15 @@ version: 1.0.0
 
 from __future__ import annotations
 
+from typing import Optional
+
 from sensor.analyzer import RankQuotaAnalyzer
 from controller.crud import TokenStackCrudController
 from detection import TokenCollisionDetector
 from microservice import TokenService
 from operation import TokenDeleter, TokenHomePlacer, TokenPopper, TokenPusher
 from operation.crud.search.token.searcher import TokenSearcher
+from util import ServiceContainer
 
 
 class TokenStackController:
@@ -45,16 +48,21 @@ class TokenStackController:
     
     def __init__(
             self,
-            crud: TokenStackCrudController | None = TokenStackCrudController(),
-            microservice: TokenService = TokenService(),
-            token_deployer: TokenHomePlacer | None = TokenHomePlacer(),
-            popper: TokenPopper | None = TokenPopper(),
-            pusher: TokenPusher | None = TokenPusher(),
-            deleter: TokenDeleter | None = TokenDeleter(),
-            searcher: TokenSearcher | None = TokenSearcher(),
-            rank_quota_analyzer: RankQuotaAnalyzer | None = RankQuotaAnalyzer(),
+            crud: Optional[TokenStackCrudController] = None,
+            microservice: Optional[TokenService] = None,
+            token_deployer: Optional[TokenHomePlacer] = None,
+            popper: Optional[TokenPopper] = None,
+            pusher: Optional[TokenPusher] = None,
+            deleter: Optional[TokenDeleter] = None,
+            searcher: Optional[TokenSearcher] = None,
+            rank_quota_analyzer: Optional[RankQuotaAnalyzer] = None,
             collision_detector: TokenCollisionDetector | None = None,
     ):
+        """
+        Args:
+            Every collaborator is optional. Missing ones are resolved through
+            ServiceContainer the first time they are used.
+        """
         self._crud = crud
         self._token_deployer = token_deployer
         self._microservice = microservice
@@ -67,34 +75,50 @@ class TokenStackController:
         
     @property
     def pusher(self) -> TokenPusher:
+        if self._pusher is None:
+            self._pusher = ServiceContainer.resolve(TokenPusher)
         return self._pusher
     
     @property
     def popper(self) -> TokenPopper:
+        if self._popper is None:
+            self._popper = ServiceContainer.resolve(TokenPopper)
         return self._popper
     
     @property
     def deleter(self) -> TokenDeleter:
+        if self._deleter is None:
+            self._deleter = ServiceContainer.resolve(TokenDeleter)
         return self._deleter
     
     @property
     def searcher(self) -> TokenSearcher:
+        if self._searcher is None:
+            self._searcher = ServiceContainer.resolve(TokenSearcher)
         return self._searcher
 
     @property
     def crud(self) -> TokenStackCrudController:
+        if self._crud is None:
+            self._crud = ServiceContainer.resolve(TokenStackCrudController)
         return self._crud
     
     @property
     def token_deployer(self) -> TokenHomePlacer:
+        if self._token_deployer is None:
+            self._token_deployer = ServiceContainer.resolve(TokenHomePlacer)
         return self._token_deployer
     
     @property
     def microservice(self) -> TokenService:
+        if self._microservice is None:
+            self._microservice = ServiceContainer.resolve(TokenService)
         return self._microservice
     
     @property
     def rank_quota_analyzer(self) -> RankQuotaAnalyzer:
+        if self._rank_quota_analyzer is None:
+            self._rank_quota_analyzer = ServiceContainer.resolve(RankQuotaAnalyzer)
         return self._rank_quota_analyzer
     
     @property
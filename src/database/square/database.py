@@ -9,8 +9,13 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, List, Optional
+
 from microservice import SquareService
 
+if TYPE_CHECKING:
+    from domain.model import Board, BoardQueryCache
+
 
 class SquareDatabase(Database[Square]):
     """
@@ -31,12 +36,16 @@ class SquareDatabase(Database[Square]):
         is_empty: bool
         current_item: Optional[T]
         integrity_service: Microservice[T]
+        index: SquareIndex
+        query_cache: Optional[BoardQueryCache]. The owning board's cache, when it has one.
+        board: Optional[Board]. The board whose whole square set this database holds.
 
     Provides:
         -   iterator() ->: iter
         -   insert(item: T) -> InsertionResult:
         -   delete_by_id(id: int) -> DeletionResult[T]:
         -   search(context: Context[T]) -> SearchResult[List[T]]
+        -   search_many(contexts: List[SquareContext]) -> SearchResult[List[List[Square]]]
     """
     """
     Role:Data Repository, CRUD Search Microservice, CRUD Controller, Encapsulation, API layer.
@@ -76,22 +85,30 @@ class SquareDatabase(Database[Square]):
     SERVICE_NAME = "SquareDatabase"
     _token_map: Dict[Token, Square]
     _stack_service: SquareStackService
+    _query_cache: Optional[BoardQueryCache]
+    _board: Optional[Board]
 
     def __init__(
             self,
-            stack_service: SquareStackService,
+            stack_service: Optional[SquareStackService] = None,
             id: int = IdFactory.next_id(class_name="SquareDatabase"),
             name: str = SERVICE_NAME,
+            query_cache: Optional[BoardQueryCache] = None,
+            board: Optional[Board] = None,
     ):
         """
         Args:
             id: int
             name: str
-            stack_service: SquareStackService
+            stack_service: Optional[SquareStackService]
+            query_cache: Optional[BoardQueryCache]. Searches are not cached when None.
+            board: Optional[Board]. Coord searches read the board's mailbox when set.
         """
         super().__init__(id=id, name=name)
         self._token_map = {}
-        self._stack_service = stack_service
+        self._stack_service = stack_service or SquareStackService()
+        self._query_cache = query_cache
+        self._board = board
 
     @property
     def integrity_service(self) -> SquareService:
@@ -117,6 +134,18 @@ class SquareDatabase(Database[Square]):
     def is_empty(self) -> bool:
         return self._stack_service.no_recurrences_exist
     
+    @property
+    def index(self) -> SquareIndex:
+        return self._stack_service.index
+    
+    @property
+    def query_cache(self) -> Optional[BoardQueryCache]:
+        return self._query_cache
+    
+    @property
+    def board(self) -> Optional[Board]:
+        return self._board
+    
     @property
     def token_map(self) -> dict[Token, Square]:
         return self._token_map
@@ -134,7 +163,7 @@ class SquareDatabase(Database[Square]):
         ) -> UpdateResult[Square]:
         """
         # ACTION:
-            1.  Handoff validation and occupation responsibility to stack_service.util.occupation_service.
+            1.  Handoff validation and occupation responsibility to stack_service.start_square_visit.
             2.  If occupation_service fails, wrap the exception in SquareDatabaseException then send in
                 the UpdateResult.
             3.  If occupation_service succeeds, update token_map with the with its new square.
@@ -150,7 +179,7 @@ class SquareDatabase(Database[Square]):
         method = "SquareDatabase.add_occupant_to_square"
         
         # --- Handoff the responsibility for the occupation to stack_service. ---#
-        occupation_update_result = self._stack_service.handler.token.occupy_stack_square(
+        occupation_update_result = self._stack_service.start_square_visit(
             token=token,
             square=square,
             token_service=token_service,
@@ -165,8 +194,9 @@ class SquareDatabase(Database[Square]):
                     ex=occupation_update_result.exception
                 )
             )
-        # update the token_map with the token's current location.
+        # update the token_map with the token's current location. The stack re-keyed its index.
         self._token_map[token] = square
+        self._invalidate()
         
         # --- Forward the success result to the client. ---#
         return occupation_update_result
@@ -175,7 +205,7 @@ class SquareDatabase(Database[Square]):
     def remove_occupant_by_search(self, occupant: Token) -> DeletionResult[Token]:
         """
         # ACTION:
-            1.  Handoff validation and eviction responsibility to stack_service.util.remove_occupant_by_search.
+            1.  Handoff validation and eviction responsibility to stack_service.end_square_visit.
             2.  If occupation_service fails, wrap the exception in SquareDatabaseException then send in
                 the DeletionResult.
             3.  If occupation_service succeeds, if the token exists in token_map remove it.
@@ -190,9 +220,7 @@ class SquareDatabase(Database[Square]):
         method = "SquareDatabase.remove_occupant_by_search"
         
         # --- Handoff eviction responsibility to stack_service. ---#
-        occupant_removal_result = self._stack_service.util.occupation_service.remove_occupant_from_stack(
-            token=occupant
-        )
+        occupant_removal_result = self._stack_service.end_square_visit(token=occupant)
         # Handle the case that, the eviction was aborted.
         if occupant_removal_result.is_failure:
             # Send the exception chain on failure.
@@ -202,9 +230,9 @@ class SquareDatabase(Database[Square]):
                     ex=occupant_removal_result.exception
                 )
             )
-        # Remove the token from the map, if it exists.
-        if occupant in self._token_map.keys():
-            self._token_map.pop(occupant)
+        # Remove the token from the map, if it exists. The stack re-keyed its index.
+        self._token_map.pop(occupant, None)
+        self._invalidate()
         
         # --- Forward the success result to the client. ---#
         return occupant_removal_result
@@ -226,7 +254,7 @@ class SquareDatabase(Database[Square]):
         method = "SquareDatabase.insert_square"
         
         # --- Handoff square insertion responsibility to stack_service. ---#
-        square_insertion_result = self._stack_service.push(square=square)
+        square_insertion_result = self._stack_service.push(item=square)
         
         # Handle the case that, the square insertion was aborted.
         if square_insertion_result.is_failure:
@@ -237,6 +265,7 @@ class SquareDatabase(Database[Square]):
                     ex=square_insertion_result.exception
                 )
             )
+        self._invalidate()
         # --- Forward the success result to the client. ---#
         return square_insertion_result
     
@@ -256,8 +285,16 @@ class SquareDatabase(Database[Square]):
         """
         method = "SquareDatabase.search"
         
+        # --- Answer a repeat of a search made since the board's last write from the cache. ---#
+        cache_key = None
+        if self._query_cache is not None:
+            cache_key = self._query_cache.key(context, self.index.NORMALIZE)
+            cached_result = self._query_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+        
         # --- Handoff square insertion responsibility to stack_service. ---#
-        query_result = self._stack_service.execute(context=context)
+        query_result = self._stack_service.search(context=context, board=self._board)
         
         # Handle the case that, the context was aborted.
         if query_result.is_failure:
@@ -268,5 +305,68 @@ class SquareDatabase(Database[Square]):
                     ex=query_result.exception
                 )
             )
+        if cache_key is not None:
+            self._query_cache.put(cache_key, query_result)
         # --- Forward the success result to the client. ---#
-        return query_result
\ No newline at end of file
+        return query_result
+    
+    @LoggingLevelRouter.monitor
+    def search_many(self, contexts: List[SquareContext]) -> SearchResult[List[List[Square]]]:
+        """
+        # ACTION:
+            1.  Answer the contexts searched since the board's last write from the query cache.
+            2.  Handoff the rest to stack_service in one batch with the board, which certifies
+                each context once and answers them in a single pass. Every context gets the
+                matches search() would send it.
+            3.  If stack_service fails, wrap the exception in SquareDatabaseException then send in
+                the SearchResult. Otherwise cache the new answers and send every context's matches.
+        # PARAMETERS:
+            *   contexts (List[SquareContext])
+        # RETURN:
+            *   SearchResult[List[List[Square]]]. Each context's matches, in context order.
+        Raises:
+            *   SquareDatabaseException
+        """
+        method = "SquareDatabase.search_many"
+        
+        # --- Take what the cache already holds. ---#
+        matches: List[Optional[List[Square]]] = [None] * len(contexts)
+        keys = [None] * len(contexts)
+        if self._query_cache is not None:
+            for position, context in enumerate(contexts):
+                keys[position] = self._query_cache.key(context, self.index.NORMALIZE)
+                cached_result = self._query_cache.get(keys[position])
+                if cached_result is not None:
+                    matches[position] = cached_result.payload or []
+        missing = [position for position, found in enumerate(matches) if found is None]
+        if not missing:
+            return SearchResult.success(payload=matches)
+        
+        # --- Handoff the rest of the batch to stack_service. ---#
+        query_result = self._stack_service.search_many(
+            contexts=[contexts[position] for position in missing],
+            board=self._board,
+        )
+        
+        # Handle the case that, the batch was aborted.
+        if query_result.is_failure:
+            # Send the exception chain on failure.
+            return SearchResult.failure(
+                SquareDatabaseException(
+                    msg=f"ServiceID:{self.id} {method}: {SquareDatabaseException.ERR_CODE}",
+                    ex=query_result.exception
+                )
+            )
+        for position, found in zip(missing, query_result.payload):
+            matches[position] = found
+            if keys[position] is not None:
+                self._query_cache.put(
+                    keys[position],
+                    SearchResult.success(payload=found) if found else SearchResult.empty()
+                )
+        # --- Forward every context's matches to the client. ---#
+        return SearchResult.success(payload=matches)
+    
+    def _invalidate(self) -> None:
+        if self._query_cache is not None:
+            self._query_cache.bump()
\ No newline at end of file
@@ -14,8 +14,8 @@ from sensor.analyzer import CollisionReport
 from database import Database
 from microservice import IdentityService, RankService, TokenService
 from domain.model import Rank, Token, TokenBlueprint
-from result import AnalysisResult, ComputationResult, DeletionResult
-from collection.stack import TokenStackService
+from result import AnalysisResult, ComputationResult, DeletionResult, SearchResult
+from collection.stack import TokenIndex, TokenStackService
 from system import IdFactory, LoggingLevelRouter
 
 
@@ -68,10 +68,13 @@ class TokenDatabase(Database[Token]):
         is_ready_for_deployment: bool
         current_item: Optional[Token]
         integrity_service: TokenService
+        index: TokenIndex
 
     Provides:
         -   insert(token: Token) -> InsertionResult[bool]
+        -   reindex(token: Token) -> None
         -   search(context: TokenContext) -> SearchResult[List[Token]]
+        -   search_many(contexts: List[TokenContext]) -> SearchResult[List[List[Token]]]
         
         -   rank_quota_report(
                     rank: Rank,
@@ -135,6 +138,14 @@ class TokenDatabase(Database[Token]):
     @property
     def is_deployed_on_board(self) -> bool:
         return self._kernel.is_deployed_on_board
+    
+    @property
+    def index(self) -> TokenIndex:
+        return self._kernel.index
+    
+    def reindex(self, token: Token) -> None:
+        """Re-file the token after its coord, state or rank changed."""
+        self._kernel.index.refresh(token)
     #
     # @property
     # def stack_state(self) -> TokenStackState:
@@ -310,4 +321,39 @@ class TokenDatabase(Database[Token]):
                 )
             )
         # --- Forward the response to the client. ---#
-        return query_result
\ No newline at end of file
+        return query_result
+    
+    @LoggingLevelRouter.monitor
+    def search_many(self, contexts: List[TokenContext]) -> SearchResult[List[List[Token]]]:
+        """
+        Find the tokens fitting each of many contexts in one round trip.
+
+        Action:
+            Send an exception chain if the operation gets interrupted. Otherwise, send
+            the success result.
+        Args:
+            contexts: List[TokenContext]
+        Returns:
+            SearchResult[List[List[Token]]]. Each context's matches, in context order.
+        Raises:
+            TokenDatabaseException
+        """
+        method = f"{self.__class__.__name__}.search_many"
+        
+        # --- Forward the request to the kernel. ---#
+        query_result = self._kernel.search_many(contexts=contexts)
+        
+        # Handle the case that, the request was not completed.
+        if query_result.is_failure:
+            # Return the exception chain on failure
+            return SearchResult.failure(
+                TokenDatabaseException(
+                    cls_mthd=method,
+                    cls_name=self.__class__.__name__,
+                    msg=TokenDatabaseException.MSG,
+                    err_code=TokenDatabaseException.ERR_CODE,
+                    ex=query_result.exception
+                )
+            )
+        # --- Forward the response to the client. ---#
+        return query_result
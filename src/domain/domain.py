@@ -13,4 +13,5 @@ from abc import ABC
 
 
 class DomainObject(ABC):
-    pass
\ No newline at end of file
+    # Empty so slotted models stay slotted. Subclasses without __slots__ still get a __dict__.
+    __slots__ = ()
\ No newline at end of file
@@ -13,4 +13,4 @@ from system import Result
 
 
 class AttackResult(Result[Hostage, OccupationResult]):
-    pass
\ No newline at end of file
+    __slots__ = ()
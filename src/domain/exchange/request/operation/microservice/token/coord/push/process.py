@@ -161,6 +161,6 @@ class TokenPushCoordProcess:
                 )
             )
         # Update the token's previous position marker.
-        token.previous_position = pre_insertion_top_coord
+        token.previous_coord = pre_insertion_top_coord
         # --- Send the work product. ---#
         return coord_insertion_result
@@ -13,4 +13,5 @@ version: 0.0.2
 
 
 # Modules
-from .model import Coord
\ No newline at end of file
+from .model import Coord
+from .table import CoordTable
\ No newline at end of file
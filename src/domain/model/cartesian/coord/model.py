@@ -9,7 +9,10 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from typing import Optional
+
 from domain import CartesianPoint
+from setting.board.dimension.config import number_of_columns, number_of_rows
 
 
 class Coord(CartesianPoint):
@@ -24,14 +27,24 @@ class Coord(CartesianPoint):
     Attributes:
         row: int
         column: int
+        index: Optional[int]. row * columns + column for a coord on the board, else None.
     
     Provides:
     
+    Notes:
+        On-board coords should come from CoordTable, which hands out one shared instance
+        per square. Two of those are equal only if they are the same object.
+
+        The row and column live in CartesianPoint's y and x slots, the same mapping vector
+        transforms use, so an interned Coord carries no slots beyond index and hash.
+    
     Super Class:
         Model
     """
-    _row: int
-    _column: int
+    __slots__ = ("_index", "_hash")
+
+    _index: Optional[int]
+    _hash: int
     
     def __init__(self, row: int, column: int):
         """
@@ -39,26 +52,35 @@ class Coord(CartesianPoint):
             row: int
             column: int
         """
-        self._row = row
-        self._column = column
+        super().__init__(x=column, y=row)
+        if 0 <= row < number_of_rows and 0 <= column < number_of_columns:
+            self._index = row * number_of_columns + column
+            self._hash = self._index
+        else:
+            self._index = None
+            self._hash = hash((row, column))
     
     @property
     def row(self) -> int:
-        return self._row
+        return self._y
     
     @property
     def column(self) -> int:
-        return self._column
+        return self._x
+    
+    @property
+    def index(self) -> Optional[int]:
+        return self._index
     
     def __eq__(self, other):
         if other is self: return True
         if other is None: return False
         if isinstance(other, Coord):
-            return self._row == other.row and self._column == other.column
+            return self._y == other._y and self._x == other._x
         return False
     
     def __hash__(self):
-        return hash((self._row, self._column))
+        return self._hash
     
     def __str__(self):
-        return f"Coord{{(row:{self._row}, column:{self._column}}})"
+        return f"Coord{{(row:{self._y}, column:{self._x}}})"
@@ -0,0 +1,92 @@
+# src/domain/model/cartesian/coord/table.py
+
+"""
+Module: domain.model.cartesian.coord.table
+Author: Banji Lawal
+Created: 2026-04-05
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from domain.model.cartesian.coord.model import Coord
+from setting.board.dimension.config import number_of_columns, number_of_rows
+
+
+class CoordTable:
+    """
+    Role:
+        -   Flyweight Factory
+        -   Addressing
+
+    Responsibilities:
+        1.  Preallocate one Coord per square, sized from setting.board.dimension.
+        2.  Hand out the shared instance for a row and column, or by linear index.
+
+    Attributes:
+        ROWS: int
+        COLUMNS: int
+        SIZE: int
+
+    Provides:
+        -   def get(row: int, column: int) -> Coord
+        -   def at(index: int) -> Coord
+        -   def all() -> Tuple[Coord, ...]
+        -   def contains(row: int, column: int) -> bool
+        -   def is_interned(coord: Coord) -> bool
+        -   def intern(coord: Optional[Coord]) -> Optional[Coord]
+
+    Notes:
+        get() still returns a Coord for a row or column off the board, so ray computers can
+        step past an edge. Those are fresh instances: compare them with ==, not `is`.
+
+    Super Class:
+    """
+    ROWS: int = number_of_rows
+    COLUMNS: int = number_of_columns
+    SIZE: int = number_of_rows * number_of_columns
+
+    _table: Tuple[Coord, ...] = tuple(
+        Coord(row=row, column=column) for row in range(number_of_rows) for column in range(number_of_columns)
+    )
+
+    @classmethod
+    def get(cls, row: int, column: int) -> Coord:
+        if 0 <= row < cls.ROWS and 0 <= column < cls.COLUMNS:
+            return cls._table[row * cls.COLUMNS + column]
+        return Coord(row=row, column=column)
+
+    @classmethod
+    def at(cls, index: int) -> Coord:
+        """
+        Args:
+            index: int. row * COLUMNS + column.
+        Raises:
+            IndexError if the index is not on the board.
+        """
+        if not 0 <= index < cls.SIZE:
+            raise IndexError(f"{cls.__name__}.at: index {index} is outside the {cls.ROWS}x{cls.COLUMNS} board.")
+        return cls._table[index]
+
+    @classmethod
+    def all(cls) -> Tuple[Coord, ...]:
+        """Every on-board coord in linear index order."""
+        return cls._table
+
+    @classmethod
+    def contains(cls, row: int, column: int) -> bool:
+        return 0 <= row < cls.ROWS and 0 <= column < cls.COLUMNS
+
+    @classmethod
+    def is_interned(cls, coord: Coord) -> bool:
+        index = coord.index
+        return index is not None and cls._table[index] is coord
+
+    @classmethod
+    def intern(cls, coord: Optional[Coord]) -> Optional[Coord]:
+        """The shared instance equal to coord, or coord itself if it is off the board."""
+        if coord is None or coord.index is None:
+            return coord
+        return cls._table[coord.index]
@@ -48,6 +48,8 @@ class CartesianPoint(Model):
     Super Class:
         Model
     """
+    __slots__ = ("_x", "_y")
+
     _x: int
     _y: int
     
@@ -13,5 +13,6 @@ version: 0.0.2
 
 # Modules
 from .model import Vector
+from .table import VectorTable
 
 
@@ -45,11 +45,18 @@ class Vector(CartesianPoint):
     
     Provides:
     
+    Notes:
+        Offsets that fit the board should come from VectorTable, which hands out one shared,
+        already validated instance per offset.
+    
     Super Class:
         CartesianPoint
     """
+    __slots__ = ("_hash",)
+
     _x: int
     _y: int
+    _hash: int
     
     def __init__(self, x: int, y: int):
         """
@@ -59,6 +66,7 @@ class Vector(CartesianPoint):
         """
         self._x = x
         self._y = y
+        self._hash = hash((x, y))
     
     @property
     def x(self):
@@ -72,11 +80,11 @@ class Vector(CartesianPoint):
         if other is self: return True
         if other is None: return False
         if isinstance(other, Vector):
-            return self._x == other.x and self._y == other.y
+            return self._x == other._x and self._y == other._y
         return False
     
     def __hash__(self):
-        return hash((self._x, self._y))
+        return self._hash
     
     def __str__(self):
         return f"Vector:{{x:{self._x}, y:{self._y}}}"
@@ -0,0 +1,77 @@
+# src/domain/model/cartesian/vector/table.py
+
+"""
+Module: domain.model.cartesian.vector.table
+Author: Banji Lawal
+Created: 2026-04-05
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from domain.model.cartesian.vector.model import Vector
+from setting.board.dimension.config import board_size
+
+
+class VectorTable:
+    """
+    Role:
+        -   Flyweight Factory
+
+    Responsibilities:
+        1.  Preallocate one Vector for every offset that fits the board, i.e. each of x and y
+            between -(board_size - 1) and board_size - 1.
+        2.  Hand out the shared instance for an offset. A vector from the table has already
+            passed the bounds checks VectorValidator makes, so callers can skip revalidating it.
+
+    Attributes:
+        LIMIT: int. Largest absolute component.
+        SPAN: int. Offsets per axis.
+
+    Provides:
+        -   def get(x: int, y: int) -> Optional[Vector]
+        -   def contains(x: int, y: int) -> bool
+        -   def is_interned(vector: Vector) -> bool
+        -   def intern(vector: Optional[Vector]) -> Optional[Vector]
+        -   def all() -> Tuple[Vector, ...]
+
+    Super Class:
+    """
+    LIMIT: int = board_size - 1
+    SPAN: int = 2 * (board_size - 1) + 1
+
+    # Row-major over (x, y), both shifted by LIMIT so the smallest offset is at index 0.
+    _table: Tuple[Vector, ...] = tuple(
+        Vector(x=x, y=y)
+        for x in range(-(board_size - 1), board_size)
+        for y in range(-(board_size - 1), board_size)
+    )
+
+    @classmethod
+    def get(cls, x: int, y: int) -> Optional[Vector]:
+        """The shared vector for (x, y), or None if the offset does not fit the board."""
+        limit = cls.LIMIT
+        if -limit <= x <= limit and -limit <= y <= limit:
+            return cls._table[(x + limit) * cls.SPAN + y + limit]
+        return None
+
+    @classmethod
+    def contains(cls, x: int, y: int) -> bool:
+        return -cls.LIMIT <= x <= cls.LIMIT and -cls.LIMIT <= y <= cls.LIMIT
+
+    @classmethod
+    def is_interned(cls, vector: Vector) -> bool:
+        return cls.get(vector.x, vector.y) is vector
+
+    @classmethod
+    def intern(cls, vector: Optional[Vector]) -> Optional[Vector]:
+        """The shared instance equal to vector, or vector itself if it does not fit the board."""
+        if vector is None:
+            return None
+        return cls.get(vector.x, vector.y) or vector
+
+    @classmethod
+    def all(cls) -> Tuple[Vector, ...]:
+        return cls._table
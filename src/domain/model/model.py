@@ -29,4 +29,4 @@ class Model(DomainObject, ABC):
     Super Class:
         Domain
     """
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -70,7 +70,6 @@ class King(OffsetRank):
         
         span_result = self._spanner.compute(
             origin=origin,
-            vectors=self.persona.vectors,
             coord_service=self.coord_service,
             vector_service=self._vector_service,
         )
@@ -70,7 +70,6 @@ class Knight(OffsetRank):
         
         span_result = self._spanner.compute(
             origin=origin,
-            vectors=self.persona.vectors,
             coord_service=self.coord_service,
             vector_service=self.vector_service,
         )
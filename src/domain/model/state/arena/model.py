@@ -9,22 +9,53 @@ version: 1.0.0
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 
 from domain.model import ArenaBinder, StateModel
+from util import ServiceContainer
 
 
 class Arena(StateModel):
+    """
+    Notes:
+        -   Each Arena owns the cache behind its ServiceContainer game scope. An Arena
+            built inside an open game_scope() adopts that scope, so the services its
+            builder resolved stay with it. Enter game_scope() to resolve GAME-scoped
+            services for this arena rather than the process-wide ones.
+    """
+    __slots__ = ("_id", "_arena_player_binder", "_services")
+
     _id: int
     _arena_player_binder: ArenaBinder
+    _services: Dict[Any, Any]
     
-    def __init__(self, id: int, arena_player_binder: ArenaBinder):
+    def __init__(
+            self,
+            id: int,
+            arena_player_binder: ArenaBinder,
+            services: Optional[Dict[Any, Any]] = None,
+    ):
+        super().__init__()
         self._id = id
         self._arena_player_binder = arena_player_binder
+        if services is None:
+            services = ServiceContainer.current_game_scope()
+        self._services = services if services is not None else {}
     
     @property
     def id(self) -> int:
         return self._id
     
+    @property
+    def services(self) -> Dict[Any, Any]:
+        return self._services
+    
+    @contextmanager
+    def game_scope(self) -> Iterator[Dict[Any, Any]]:
+        with ServiceContainer.game_scope(self._services) as services:
+            yield services
+
     @property
     def binder(self) ->ArenaBinder:
         return self._arena_player_binder
@@ -56,6 +56,7 @@ class Attack(StateModel, Generic[T]):
             maneuver: Maneuver
             attacker_benefit: Optional[int]
         """
+        super().__init__()
         self._id = id
         self._victim: victim
         self._maneuver = maneuver
@@ -13,5 +13,8 @@ version: 0.0.2
 
 
 # Modules
+from .cache import BoardQueryCache
+from .occupancy import BoardOccupancy
+from .zobrist import ZobristTable
 from .model import Board
 from .state import BoardState
\ No newline at end of file
@@ -0,0 +1,130 @@
+# src/domain/model/state/board/cache.py
+
+"""
+Module: domain.model.state.board.cache
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from domain.search import SearchContext
+    from result import SearchResult
+
+
+class BoardQueryCache:
+    """
+    Role:
+        -   Query Cache
+        -   Search Accelerator
+
+    Responsibilities:
+        1.  Hold the results of the searches run against one board since its last write.
+        2.  Drop every entry when the board's mutation epoch advances.
+        3.  Count hits and misses.
+
+    Attributes:
+        epoch: int. Advanced by every write to the board or its squares.
+        hits: int
+        misses: int
+        size: int
+        hit_rate: float
+
+    Provides:
+        -   def key(context: SearchContext, normalize: Optional[Mapping]) -> Hashable
+        -   def get(key: Hashable) -> Optional[SearchResult]
+        -   def put(key: Hashable, result: SearchResult) -> None
+        -   def bump() -> None
+        -   def reset_counters() -> None
+
+    Notes:
+        Board owns the only instance. Board.place_square, occupy, vacate and change_rank,
+        the Square state and occupant setters and SquareDatabase's writes call bump(), so a
+        cached result never outlives the squares it was computed from.
+
+        Only successful and empty results are stored. Callers must not mutate a cached
+        result's payload list.
+
+    Super Class:
+    """
+    __slots__ = ("_epoch", "_entries", "_hits", "_misses")
+
+    _epoch: int
+    _entries: Dict[Hashable, SearchResult]
+    _hits: int
+    _misses: int
+
+    def __init__(self):
+        self._epoch = 0
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def key(
+            cls,
+            context: SearchContext,
+            normalize: Optional[Mapping[str, Callable[[Any], Hashable]]] = None,
+    ) -> Tuple[Any, ...]:
+        """
+        The context's class and the attributes it sets, in a fixed order.
+
+        Args:
+            context: SearchContext
+            normalize: Optional[Mapping[str, Callable[[Any], Hashable]]]. Applied to the
+                named values first, so contexts the search treats as equal share a key.
+                Callers pass their index's NORMALIZE.
+        """
+        normalize = normalize or {}
+        return (type(context),) + tuple(
+            (name, normalize[name](value) if name in normalize else value)
+            for name, value in sorted(context.to_dict.items()) if value is not None
+        )
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> Optional[SearchResult]:
+        result = self._entries.get(key)
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return result
+
+    def put(self, key: Hashable, result: SearchResult) -> None:
+        if result.is_failure:
+            return
+        self._entries[key] = result
+
+    def bump(self) -> None:
+        """Advance the epoch and drop every entry computed under the old one."""
+        self._epoch += 1
+        if self._entries:
+            self._entries.clear()
+
+    def reset_counters(self) -> None:
+        self._hits = 0
+        self._misses = 0
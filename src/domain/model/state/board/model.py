@@ -9,11 +9,20 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, List, Optional
+
 from controller import BoardTeamBinderController
 from database import HostageDatabase, SquareDatabase
 
 
-from domain.model import Arena, BoardState, StateModel
+from domain.model import Arena, BoardState, Coord, CoordTable, StateModel
+from domain.model.state.board.cache import BoardQueryCache
+from domain.model.state.board.occupancy import BoardOccupancy
+from domain.model.state.board.zobrist import ZobristTable
+
+if TYPE_CHECKING:
+    from domain.model import Square, Token
+    from domain.schema import Persona
 
 
 class Board(StateModel):
@@ -27,16 +36,60 @@ class Board(StateModel):
         id: int
         biard: Board
         binder_controller: ArenaBinderController
+        square_count: int
+        occupancy: BoardOccupancy
+        zobrist_key: int
+        query_cache: BoardQueryCache
+        
+    Provides:
+        -   def square_at(coord: Coord) -> Optional[Square]
+        -   def occupant_at(coord: Coord) -> Optional[Token]
+        -   def place_square(square: Square) -> None
+        -   def occupy(coord: Coord, token: Token) -> None
+        -   def vacate(coord: Coord) -> Optional[Token]
+        -   def change_rank(coord: Coord, token: Token, previous: Persona) -> None
+        -   def pass_turn() -> None
+        
+    Notes:
+        The mailbox is two flat lists indexed by Coord.index: the squares placed on the board
+        and their occupants. SquareBuilderFinalizer places each square, so lookups by coord
+        do not have to search the SquareDatabase. Coords off the board have no index and find
+        nothing.
+        
+        occupy() and vacate() are the only write path for occupants. They update the square
+        placed at the coord, its entry in the SquareIndex, the team and Persona bitboards in
+        occupancy and zobrist_key together. Setting Square.occupant on a placed square calls
+        them, so entries, departures, captures and moves all keep every view in step.
+        
+        zobrist_key identifies the position: the XOR of the ZobristTable keys of every
+        occupant on its square, plus ZobristTable.SIDE while the second team is to move. Each
+        mailbox change XORs the affected keys in or out, so it is never recomputed.
+        
+        query_cache holds the square searches run since the last write. Every method here
+        that changes a square bumps its epoch, which empties it. pass_turn does not: the side
+        to move is not a square value, so no cached square search depends on it.
         
     Super Class:
         Model
     """
+    __slots__ = (
+        "_id", "_arena", "_state", "_squares", "_hostage_database", "_binder_controller",
+        "_mailbox", "_occupants", "_square_count", "_occupancy",
+        "_zobrist_key", "_query_cache",
+    )
+
     _id: int
     _arena: Arena
     _state: BoardState
-    _squares: SquareDatabase
-    _hostage_database: HostageDatabase
-    _binder_controller: BoardTeamBinderController
+    _squares: Optional[SquareDatabase]
+    _hostage_database: Optional[HostageDatabase]
+    _binder_controller: Optional[BoardTeamBinderController]
+    _mailbox: List[Optional[Square]]
+    _occupants: List[Optional[Token]]
+    _square_count: int
+    _occupancy: BoardOccupancy
+    _zobrist_key: int
+    _query_cache: BoardQueryCache
 
     def __init__(self, id: int, arena: Arena,):
         """
@@ -44,11 +97,19 @@ class Board(StateModel):
             id: int
             arena: Arena
         """
+        super().__init__()
         self._id = id
         self._arena = arena
-        self._squares = SquareDatabase()
-        self._hostage_database = HostageDatabase()
-        self._binder_controller = BoardTeamBinderController()
+        # Built on first use. Most boards held for analysis never take a hostage.
+        self._squares = None
+        self._hostage_database = None
+        self._binder_controller = None
+        self._mailbox = [None] * CoordTable.SIZE
+        self._occupants = [None] * CoordTable.SIZE
+        self._square_count = 0
+        self._occupancy = BoardOccupancy()
+        self._zobrist_key = 0
+        self._query_cache = BoardQueryCache()
         self._state = BoardState.IS_EMPTY
     
     @property
@@ -62,6 +123,7 @@ class Board(StateModel):
     @state.setter
     def state(self, state: BoardState):
         self._state = state
+        self.touch()
     
     @property
     def arena(self) -> Arena:
@@ -69,16 +131,123 @@ class Board(StateModel):
     
     @property
     def squares(self) -> SquareDatabase:
+        if self._squares is None:
+            self._squares = SquareDatabase(query_cache=self._query_cache, board=self)
         return self._squares
     
     @property
     def binder_controller(self) -> BoardTeamBinderController:
+        if self._binder_controller is None:
+            self._binder_controller = BoardTeamBinderController()
         return self._binder_controller
     
     @property
     def hostage_database(self) -> HostageDatabase:
+        if self._hostage_database is None:
+            self._hostage_database = HostageDatabase()
         return self._hostage_database
     
+    @property
+    def square_count(self) -> int:
+        return self._square_count
+    
+    @property
+    def occupancy(self) -> BoardOccupancy:
+        return self._occupancy
+    
+    @property
+    def zobrist_key(self) -> int:
+        return self._zobrist_key
+    
+    @property
+    def query_cache(self) -> BoardQueryCache:
+        return self._query_cache
+    
+    def square_at(self, coord: Coord) -> Optional[Square]:
+        index = coord.index
+        return None if index is None else self._mailbox[index]
+    
+    def occupant_at(self, coord: Coord) -> Optional[Token]:
+        index = coord.index
+        return None if index is None else self._occupants[index]
+    
+    def place_square(self, square: Square) -> None:
+        """
+        Put the square in the mailbox slot for its coord, with its current occupant.
+        
+        Raises:
+            IndexError if the square's coord is not on the board.
+        """
+        index = square.coord.index
+        if index is None:
+            raise IndexError(f"Board.place_square: {square.name} at {square.coord} is not on the board.")
+        if self._mailbox[index] is None:
+            self._square_count += 1
+        occupant = square.occupant
+        self._mailbox[index] = square
+        self.touch()
+        self._query_cache.bump()
+        self.vacate(square.coord)
+        if occupant is not None:
+            self.occupy(square.coord, occupant)
+    
+    def occupy(self, coord: Coord, token: Token) -> None:
+        index = coord.index
+        if index is None:
+            return
+        previous = self._occupants[index]
+        if previous is not None:
+            self._occupancy.remove(coord, previous)
+            self._zobrist_key ^= ZobristTable.token_key(previous, index)
+        self._occupants[index] = token
+        self._occupancy.add(coord, token)
+        self._zobrist_key ^= ZobristTable.token_key(token, index)
+        self._seat(index, token)
+        token.touch()
+        self.touch()
+        self._query_cache.bump()
+    
+    def vacate(self, coord: Coord) -> Optional[Token]:
+        """Clear the occupant at coord and return whoever was there."""
+        index = coord.index
+        if index is None:
+            return None
+        token, self._occupants[index] = self._occupants[index], None
+        if token is not None:
+            self._occupancy.remove(coord, token)
+            self._zobrist_key ^= ZobristTable.token_key(token, index)
+            token.touch()
+            self.touch()
+            self._query_cache.bump()
+        self._seat(index, None)
+        return token
+    
+    def change_rank(self, coord: Coord, token: Token, previous: Persona) -> None:
+        """Re-key the occupant at coord after its rank changed from previous, e.g. on promotion."""
+        index = coord.index
+        if index is None or self._occupants[index] is not token:
+            return
+        current = token.rank.persona
+        self._occupancy.change_persona(coord, previous, current)
+        archetype = token.team.archetype
+        self._zobrist_key ^= ZobristTable.key(archetype, previous, index) ^ ZobristTable.key(archetype, current, index)
+        self.touch()
+        self._query_cache.bump()
+    
+    def _seat(self, index: int, token: Optional[Token]) -> None:
+        """Give the square placed at index the same occupant as the mailbox and re-key it."""
+        square = self._mailbox[index]
+        if square is None or square.occupant is token:
+            return
+        previous = square.occupant
+        square.hold(token)
+        if self._squares is not None:
+            self._squares.index.move_occupant(square, previous)
+    
+    def pass_turn(self) -> None:
+        self._zobrist_key ^= ZobristTable.SIDE
+        self.touch()
+    
     def __eq__(self, other):
         if other is self: return True
         if other is None: return False
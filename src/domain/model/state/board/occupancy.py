@@ -0,0 +1,121 @@
+# src/domain/model/state/board/occupancy.py
+
+"""
+Module: domain.model.state.board.occupancy
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator
+
+from domain.model.cartesian.coord.model import Coord
+from domain.model.cartesian.coord.table import CoordTable
+
+if TYPE_CHECKING:
+    from domain.model import Team, Token
+    from domain.schema import Persona
+
+
+class BoardOccupancy:
+    """
+    Role:
+        -   Bitboard Set
+        -   Occupancy Index
+
+    Responsibilities:
+        1.  Hold one integer bitboard per team and one per Persona. Bit n is set when the
+            square at Coord.index n holds a token of that team or persona.
+        2.  Answer occupancy, empty and enemy square queries with integer operations.
+
+    Attributes:
+        occupied: int
+        empty: int
+
+    Provides:
+        -   def bit(coord: Coord) -> int
+        -   def coords(bits: int) -> Iterator[Coord]
+        -   def add(coord: Coord, token: Token) -> None
+        -   def remove(coord: Coord, token: Token) -> None
+        -   def change_persona(coord: Coord, previous: Persona, current: Persona) -> None
+        -   def team(team: Team) -> int
+        -   def enemies(team: Team) -> int
+        -   def persona(persona: Persona) -> int
+        -   def is_occupied(coord: Coord) -> bool
+
+    Notes:
+        Board owns the only instance and updates it from Board.occupy, Board.vacate and
+        Board.change_rank, so the bitboards change exactly when the mailbox does. A move is
+        a vacate of the origin and an occupy of the destination; ManeuverLauncher makes both
+        calls, so a normal move updates the bitboards as well as a capture or promotion does.
+
+    Super Class:
+    """
+    __slots__ = ("_occupied", "_teams", "_personas")
+
+    FULL: int = (1 << CoordTable.SIZE) - 1
+
+    _occupied: int
+    _teams: Dict[Team, int]
+    _personas: Dict[Persona, int]
+
+    def __init__(self):
+        self._occupied = 0
+        self._teams = {}
+        self._personas = {}
+
+    @classmethod
+    def bit(cls, coord: Coord) -> int:
+        """The single bit for coord, or 0 if it is off the board."""
+        index = coord.index
+        return 0 if index is None else 1 << index
+
+    @classmethod
+    def coords(cls, bits: int) -> Iterator[Coord]:
+        """The coords of the set bits, lowest index first."""
+        while bits:
+            lowest = bits & -bits
+            yield CoordTable.at(lowest.bit_length() - 1)
+            bits ^= lowest
+
+    @property
+    def occupied(self) -> int:
+        return self._occupied
+
+    @property
+    def empty(self) -> int:
+        return ~self._occupied & self.FULL
+
+    def add(self, coord: Coord, token: Token) -> None:
+        bit = self.bit(coord)
+        self._occupied |= bit
+        self._teams[token.team] = self._teams.get(token.team, 0) | bit
+        persona = token.rank.persona
+        self._personas[persona] = self._personas.get(persona, 0) | bit
+
+    def remove(self, coord: Coord, token: Token) -> None:
+        mask = ~self.bit(coord)
+        self._occupied &= mask
+        self._teams[token.team] = self._teams.get(token.team, 0) & mask
+        persona = token.rank.persona
+        self._personas[persona] = self._personas.get(persona, 0) & mask
+
+    def change_persona(self, coord: Coord, previous: Persona, current: Persona) -> None:
+        bit = self.bit(coord)
+        self._personas[previous] = self._personas.get(previous, 0) & ~bit
+        self._personas[current] = self._personas.get(current, 0) | bit
+
+    def team(self, team: Team) -> int:
+        return self._teams.get(team, 0)
+
+    def enemies(self, team: Team) -> int:
+        """Every occupied square not held by team."""
+        return self._occupied & ~self._teams.get(team, 0)
+
+    def persona(self, persona: Persona) -> int:
+        return self._personas.get(persona, 0)
+
+    def is_occupied(self, coord: Coord) -> bool:
+        return bool(self._occupied & self.bit(coord))
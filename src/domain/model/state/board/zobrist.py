@@ -0,0 +1,63 @@
+# src/domain/model/state/board/zobrist.py
+
+"""
+Module: domain.model.state.board.zobrist
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from random import Random
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from domain.model.cartesian.coord.table import CoordTable
+
+if TYPE_CHECKING:
+    from domain.model import Token
+    from domain.schema import Archetype, Persona
+
+
+class ZobristTable:
+    """
+    Role:
+        -   Key Table
+        -   Position Identity
+
+    Responsibilities:
+        1.  Supply a fixed random 64-bit key for every (archetype, persona, square) and one
+            for the side to move.
+        2.  Keep keys stable across processes so stored hashes stay comparable.
+
+    Attributes:
+        BITS: int
+        SIDE: int. XORed into a position's key while the second team is to move.
+
+    Provides:
+        -   def key(archetype: Archetype, persona: Persona, index: int) -> int
+        -   def token_key(token: Token, index: int) -> int
+
+    Notes:
+        Each (archetype, persona) row is generated on first use from a generator seeded with
+        the members' names, so the keys do not depend on the order rows are first asked for.
+
+    Super Class:
+    """
+    BITS: int = 64
+    SIDE: int = Random("zobrist:side").getrandbits(64)
+
+    _rows: Dict[Tuple[Archetype, Persona], Tuple[int, ...]] = {}
+
+    @classmethod
+    def key(cls, archetype: Archetype, persona: Persona, index: int) -> int:
+        row = cls._rows.get((archetype, persona))
+        if row is None:
+            generator = Random(f"zobrist:{archetype.name}:{persona.name}")
+            row = tuple(generator.getrandbits(cls.BITS) for _ in range(CoordTable.SIZE))
+            cls._rows[(archetype, persona)] = row
+        return row[index]
+
+    @classmethod
+    def token_key(cls, token: Token, index: int) -> int:
+        return cls.key(token.team.archetype, token.rank.persona, index)
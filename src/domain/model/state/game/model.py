@@ -7,7 +7,8 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 from domain.model import PlayerAgent
 from domain.model import Arena
@@ -36,6 +37,8 @@ class Game(StateModel):
     # INHERITED ATTRIBUTES:
     None
     """
+    __slots__ = ("_id", "_arena", "_white_player", "_black_player", "_timeline")
+
     _id: int
     _arena: Arena
     _white_player: PlayerAgent
@@ -43,6 +46,7 @@ class Game(StateModel):
     _timeline: GameTimeline
     
     def __init__(self, id: int, white_player: PlayerAgent, black_player: PlayerAgent, arena: Arena):
+        super().__init__()
         self._id = id
         self._arena = arena
         self._white_player = white_player
@@ -73,6 +77,12 @@ class Game(StateModel):
     def timeline(self) -> GameTimeline:
         return self._timeline
     
+    @contextmanager
+    def game_scope(self) -> Iterator[Dict[Any, Any]]:
+        """Resolve GAME-scoped services against this game's arena."""
+        with self._arena.game_scope() as services:
+            yield services
+    
     @property
     def previous_move(self) -> Optional[Snapshot]:
         return self._timeline.previous_move()
@@ -53,6 +53,7 @@ class Maneuver(StateModel, Generic[T]):
             token: T
             path: Path
         """
+        super().__init__()
         self._token = token
         self._path = path
         self._id = id
@@ -21,10 +21,32 @@ class StateModel(Model):
         1. Represents a Model which posses sate.
 
     Attributes:
+        version: int. Advanced by every write to the model.
 
     Provides:
+        -   def touch() -> None
+
+    Notes:
+        TrustedValidation stamps a certified model with its version and stops trusting the
+        stamp once the version moves, so every setter and mutating method calls touch().
+        A collaborator that changes a model through one of its collections, as Board does
+        when it moves a token, calls touch() for it.
 
     Super Class:
         Model
     """
-    pass
\ No newline at end of file
+    __slots__ = ("_version",)
+    
+    _version: int
+    
+    def __init__(self):
+        super().__init__()
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        return self._version
+    
+    def touch(self) -> None:
+        self._version += 1
+
@@ -9,9 +9,12 @@ version: 1.0.0
 
 from __future__ import annotations
 
+from typing import Optional
+
 from domain.model import StateModel
 from report import ManeuverRequestDecision
 from turn import TurnAdviser
+from util import ServiceContainer
 
 
 class Player(StateModel):
@@ -37,17 +40,18 @@ class Player(StateModel):
     # INHERITED ATTRIBUTES:
     None
     """
+    __slots__ = ("_id", "_name", "_adviser", "_teams")
+
     _id: int
     _name: str
     _adviser: TurnAdviser
-    _current_team: Team
-    _teams: TeamDatabase
+    _teams: Optional[TeamDatabase]
     
-    def player(
+    def __init__(
             self,
             id: int,
             name: str,
-            adviser: TurnAdviser
+            adviser: Optional[TurnAdviser] = None,
     ):
         """
         # ACTION:
@@ -60,12 +64,13 @@ class Player(StateModel):
             None
         Raises:
         """
-        method = "PlayerQueryService.owner"
+        super().__init__()
         self._id = id
         self._name = name
-        self._adviser = adviser
-        self._teams = TeamDatabase()
-        self._current_team = self._teams.current_team
+        # TurnAdviser is stateless, so every player shares one.
+        self._adviser = adviser or ServiceContainer.resolve(TurnAdviser)
+        # Built on first use.
+        self._teams = None
     
     @property
     def id(self) -> int:
@@ -81,11 +86,13 @@ class Player(StateModel):
     
     @property
     def teams(self) -> TeamDatabase:
+        if self._teams is None:
+            self._teams = TeamDatabase()
         return self._teams
     
     @property
     def current_team(self) -> Optional[Team]:
-        return self._teams.current_team
+        return self.teams.current_team
     
     @property
     def adviser(self) -> TurnAdviser:
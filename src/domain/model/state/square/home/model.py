@@ -39,6 +39,8 @@ class HomeSquare(Square):
     Super Class:
         Square
     """
+    __slots__ = ("_formation", "_token_claim_state")
+
     _formation: Formation
     _token_claim_state: TokenHomeClaimState
     
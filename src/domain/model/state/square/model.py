@@ -36,10 +36,19 @@ class Square(StateModel):
     Provides:
         -   def is_empty() -> bool
         -   def is_occupied() -> bool
+        -   def hold(token: Optional[Token]) -> None
+
+    Notes:
+        Setting state or occupant bumps the board's query_cache, so cached square searches
+        do not outlive the write. Once the square is placed on its board, setting occupant
+        calls Board.occupy or Board.vacate, so no write path can leave the board or the
+        SquareIndex behind.
 
     Super Class:
         Model
     """
+    __slots__ = ("_id", "_name", "_board", "_coord", "_state", "_occupant")
+
     _id: int
     _name: str
     _board: Board
@@ -94,6 +103,8 @@ class Square(StateModel):
     @state.setter
     def state(self, state: SquareState):
         self._state = state
+        self.touch()
+        self._board.query_cache.bump()
     
     @property
     def occupant(self) -> Optional[Token]:
@@ -101,7 +112,22 @@ class Square(StateModel):
     
     @occupant.setter
     def occupant(self, token: Optional[Token]):
+        # A placed square is written through the board, which seats it and keeps the mailbox,
+        # bitboards, position key and SquareIndex in step.
+        if self._board.square_at(self._coord) is self:
+            if token is None:
+                self._board.vacate(self._coord)
+            else:
+                self._board.occupy(self._coord, token)
+            return
+        self._occupant = token
+        self.touch()
+        self._board.query_cache.bump()
+    
+    def hold(self, token: Optional[Token]) -> None:
+        """Set the occupant without touching the board. Board.occupy and Board.vacate call this."""
         self._occupant = token
+        self.touch()
     
     def __eq__(self, other: object) -> bool:
         if other is self: return True
@@ -9,10 +9,15 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Optional
+
 from database import TokenDatabase
 from domain.model import Board, Player, StateModel, TeamState
 from domain.schema import Archetype
 
+if TYPE_CHECKING:
+    from domain.model import Token
+
 
 class Team(StateModel):
     """
@@ -35,16 +40,19 @@ class Team(StateModel):
         -   def is_ready_to_play() -> bool
         -   def is_waiting_to_play() -> bool
         -   def is_not_ready_to_play() -> bool
+        -   def reindex(token: Token) -> None
         
     Super Class
     """
     MAX_ROSTER_SIZE = 16
     
+    __slots__ = ("_id", "_board", "_owner", "_archetype", "_roster", "_state")
+
     _id: int
     _board: Board
     _owner: Player
     _archetype: Archetype
-    _roster: TokenDatabase
+    _roster: Optional[TokenDatabase]
     _state: TeamState
 
     def __init__(
@@ -68,7 +76,8 @@ class Team(StateModel):
         self._archetype = archetype
         self._owner = owner
         self._state = TeamState.NOT_READY_TO_PLAY
-        self._roster = TokenDatabase()
+        # Built on first use.
+        self._roster = None
     
     @property
     def id(self) -> int:
@@ -96,6 +105,8 @@ class Team(StateModel):
 
     @property
     def roster(self) -> TokenDatabase:
+        if self._roster is None:
+            self._roster = TokenDatabase()
         return self._roster
     
     @property
@@ -105,15 +116,21 @@ class Team(StateModel):
     @state.setter
     def state(self, state: TeamState):
         self._state = state
+        self.touch()
         
     def is_ready_to_play(self) -> bool:
-        return self._roster.is_deployed_on_board and self._state == TeamState.READY_TO_PLAY
+        return self.roster.is_deployed_on_board and self._state == TeamState.READY_TO_PLAY
     
     def is_not_ready_to_play(self) -> bool:
-        return not self._roster.is_deployed_on_board and not self._state != TeamState.NOT_READY_TO_PLAY
+        return not self.roster.is_deployed_on_board and not self._state != TeamState.NOT_READY_TO_PLAY
     
     def is_waiting_to_play(self) -> bool:
-        return self._roster.is_deployed_on_board and self._state == TeamState.WAITING_TO_PLAY
+        return self.roster.is_deployed_on_board and self._state == TeamState.WAITING_TO_PLAY
+    
+    def reindex(self, token: Token) -> None:
+        """Re-file the token in the roster's indexes. Nothing to do until the roster exists."""
+        if self._roster is not None:
+            self._roster.reindex(token)
     
     def __eq__(self, other) -> bool:
         if other is self: return True
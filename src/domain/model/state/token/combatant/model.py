@@ -50,6 +50,8 @@ class CombatantToken(Token):
     Super Class:
         Token
     """
+    __slots__ = ("_captor",)
+
     _captor: Optional[Token]
     
     def __init__(
@@ -133,6 +135,7 @@ class CombatantToken(Token):
     @captor.setter
     def captor(self, captor: Token):
         self._captor = captor
+        self.touch()
     
     def set_rank(self, rank: Rank):
         pass
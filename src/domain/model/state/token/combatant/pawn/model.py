@@ -52,10 +52,15 @@ class PawnToken(CombatantToken):
         
     Provides:
         -   set_new_rank(new_rank: Rank):
+        -   record_previous_rank() -> None
+        -   restore_previous_rank() -> None
         
     Super Class:
         CombatantToken
     """
+    __slots__ = ("_previous_rank", "_promotion_state")
+
+    _previous_rank: Optional[Rank]
     _promotion_state: PromotionState
     
     def __init__(
@@ -95,6 +100,7 @@ class PawnToken(CombatantToken):
     @promotion_state.setter
     def promotion_state(self, promotion_state: PromotionState):
         self._promotion_state = promotion_state
+        self.touch()
         
     @property
     def can_promote(self) -> bool:
@@ -109,6 +115,18 @@ class PawnToken(CombatantToken):
     
     def set_new_rank(self, new_rank: Rank):
         self.set_rank(new_rank)
+    
+    def record_previous_rank(self) -> None:
+        """Remember the current rank so a failed promotion can be rolled back to it."""
+        self._previous_rank = self._rank
+        self.touch()
+    
+    def restore_previous_rank(self) -> None:
+        """Roll back to the recorded rank, if any, and forget it."""
+        if self._previous_rank is not None:
+            self.set_rank(self._previous_rank)
+        self._previous_rank = None
+        self.touch()
        
     def __eq__(self, other):
         if super().__eq__(other):
@@ -46,6 +46,7 @@ class KingToken(Token):
     Super Class:
         Token
     """
+    __slots__ = ()
 
     def __init__(
             self,
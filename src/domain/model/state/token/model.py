@@ -46,13 +46,17 @@ class Token(StateModel):
     Super Class:
         Model
     """
+    __slots__ = (
+        "_id", "_team", "_rank", "_formation", "_positions", "_home_square", "_previous_address",
+        "_deployment_state", "_readiness_state", "_checked_enemy_king",
+    )
+
     _id: int
     _team: Team
     _rank: Rank
     _formation: Formation
-    _positions: CoordDatabase
+    _positions: Optional[CoordDatabase]
     _home_square: HomeSquare
-    _current_position: Optional[Coord]
     _previous_address: Optional[Coord]
     _deployment_state: DeploymentState
     _readiness_state: TokenActivityState
@@ -79,10 +83,10 @@ class Token(StateModel):
         self._team = team
         self._rank = rank
         self._formation = formation
-        self._positions = CoordDatabase()
+        # Built on first use. A new position history has no current or previous coord.
+        self._positions = None
         self._home_square = home_square
-        self._current_position = self._positions.current_item
-        self._previous_address = self._positions.previous_coord
+        self._previous_address = None
         self._deployment_state = DeploymentState.NOT_DEPLOYED
         self._readiness_state = TokenActivityState.NOT_INITIALIZED
         self._checked_enemy_king = None
@@ -126,29 +130,45 @@ class Token(StateModel):
     @readiness_state.setter
     def readiness_state(self, readiness_state: TokenActivityState):
         self._readiness_state = readiness_state
+        self.touch()
+        self._team.reindex(self)
         
     @checked_enemy_king.setter
     def checked_enemy_king(self, other: KingToken):
         self._checked_enemy_king = other
+        self.touch()
     
     @property
     def positions(self) -> CoordDatabase:
+        if self._positions is None:
+            self._positions = CoordDatabase()
         return self._positions
     
     @property
     def current_position(self) -> Optional[Coord]:
-        return self._positions.current_item
+        return self.positions.current_item
     
     @property
     def previous_coord(self) -> Optional[Coord]:
         return self._previous_address
     
+    @previous_coord.setter
+    def previous_coord(self, coord: Optional[Coord]):
+        self._previous_address = coord
+        self.touch()
+    
     @property
     def deployment_state(self) -> DeploymentState:
         return self._deployment_state
     
+    @deployment_state.setter
+    def deployment_state(self, deployment_state: DeploymentState):
+        self._deployment_state = deployment_state
+        self.touch()
+        self._team.reindex(self)
+    
     def mark_deployed(self,):
-        self._deployment_state = DeploymentState.DEPLOYED
+        self.deployment_state = DeploymentState.DEPLOYED
     
     @property
     def is_not_deployed(self) -> bool:
@@ -176,6 +196,8 @@ class Token(StateModel):
     
     def set_rank(self, rank: Rank) -> None:
         self._rank = rank
+        self.touch()
+        self._team.reindex(self)
     
     def is_friend(self, token: Token) -> bool:
         return self._team == token.team
@@ -194,7 +216,7 @@ class Token(StateModel):
     
     def __eq__(self, other: object) -> bool:
         if other is self: return True
-        if other in None: return False
+        if other is None: return False
         if isinstance(other, Token):
             return self._id == other.id
         return False
@@ -10,7 +10,7 @@ version: 0.0.2
 from __future__ import annotations
 from enum import Enum
 
-from domain.model import Bishop, King, Knight, Pawn, Rank, Rook
+from domain.model import Bishop, King, Knight, Pawn, Queen, Rank, Rook
 from domain.schema import Persona
 from setting import GameColor
 
@@ -63,9 +63,9 @@ class Formation(Enum):
     
     BLACK_KING_CASTLE = ("A1", GameColor.BLACK, "BC1", 1, Rook, Persona.ROOK)
     BLACK_KING_KNIGHT = ("B1", GameColor.BLACK, "BN1", 2, Knight, Persona.KNIGHT)
-    BLACK_KING_BISHOP = ("BB1", GameColor.BLACK, "C1", 3, Bishop, Persona.BISHOP)
+    BLACK_KING_BISHOP = ("C1", GameColor.BLACK, "BB1", 3, Bishop, Persona.BISHOP)
     BLACK_KING = ("D1", GameColor.BLACK, "BK", 4, King, Persona.KING)
-    BLACK_QUEEN = ("E1", GameColor.BLACK, "BQ", 5, Persona.QUEEN)
+    BLACK_QUEEN = ("E1", GameColor.BLACK, "BQ", 5, Queen, Persona.QUEEN)
     BLACK_QUEEN_BISHOP = ("F1", GameColor.BLACK, "BB2", 6, Bishop, Persona.BISHOP)
     BLACK_QUEEN_KNIGHT = ("G1", GameColor.BLACK, "BN2", 7, Knight, Persona.KNIGHT)
     BLACK_QUEEN_CASTLE = ("H1", GameColor.BLACK, "BC2", 8, Rook, Persona.ROOK)
@@ -76,14 +76,14 @@ class Formation(Enum):
     BLACK_PAWN_4 = ("D2", GameColor.BLACK, "BP4", 12, Pawn, Persona.PAWN)
     BLACK_PAWN_5 = ("E2",  GameColor.BLACK, "BP5", 13, Pawn, Persona.PAWN)
     BLACK_PAWN_6 = ("F2", GameColor.BLACK, "BP6", 14, Pawn, Persona.PAWN)
-    BLACK_PAWN_7 = ("G2", GameColor.BLACK, "BP8", 15, Pawn, Persona.PAWN)
+    BLACK_PAWN_7 = ("G2", GameColor.BLACK, "BP7", 15, Pawn, Persona.PAWN)
     BLACK_PAWN_8 = ("H2", GameColor.BLACK, "BP8", 16, Pawn, Persona.PAWN)
     
     WHITE_KING_CASTLE = ("A8", GameColor.WHITE, "WC1", 1, Rook, Persona.ROOK)
     WHITE_KING_KNIGHT = ("B8", GameColor.WHITE, "WN1", 2, Knight, Persona.KNIGHT)
     WHITE_KING_BISHOP = ("C8", GameColor.WHITE, "WB1", 3, Bishop, Persona.BISHOP)
     WHITE_KING = ("D8", GameColor.WHITE, "WK", 4, King, Persona.KING)
-    WHITE_QUEEN = ("E8", GameColor.WHITE, "WQ", 5, Persona.QUEEN)
+    WHITE_QUEEN = ("E8", GameColor.WHITE, "WQ", 5, Queen, Persona.QUEEN)
     WHITE_QUEEN_BISHOP = ("F8", GameColor.WHITE, "WB2", 6, Bishop, Persona.BISHOP)
     WHITE_QUEEN_KNIGHT = ("G8", GameColor.WHITE, "WN2", 7, Knight, Persona.KNIGHT)
     WHITE_QUEEN_CASTLE = ("H8", GameColor.WHITE, "WC2", 8, Rook, Persona.ROOK)
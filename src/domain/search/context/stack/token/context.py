@@ -11,7 +11,8 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 from domain.search.context.stack import SearchContext
-from domain import Coord, HomeSquare, Rank, Team, Token
+from domain import Coord, DeploymentState, HomeSquare, Rank, Team, Token, TokenActivityState
+from domain.schema import Persona
 from setting import GameColor
 
 
@@ -34,6 +35,9 @@ class TokenContext(SearchContext[Token]):
             designation: Optional[str]
             color: Optional[GameColor]
             home_square: Optional[HomeSquare]
+            persona: Optional[Persona]
+            readiness_state: Optional[TokenActivityState]
+            deployment_state: Optional[DeploymentState]
     
         Provides:
             -   to_dict() -> Dict[str, Any]
@@ -49,6 +53,9 @@ class TokenContext(SearchContext[Token]):
         _designation: Optional[str] | None = None
         _current_position:Optional[Coord] | None = None
         _home_square: Optional[HomeSquare] | None = None
+        _persona: Optional[Persona] | None = None
+        _readiness_state: Optional[TokenActivityState] | None = None
+        _deployment_state: Optional[DeploymentState] | None = None
         
         def __init__(
             self,
@@ -60,6 +67,9 @@ class TokenContext(SearchContext[Token]):
             designation: Optional[str] | None = None,
             current_position: Optional[Coord] | None = None,
             home_square: Optional[HomeSquare] | None = None,
+            persona: Optional[Persona] | None = None,
+            readiness_state: Optional[TokenActivityState] | None = None,
+            deployment_state: Optional[DeploymentState] | None = None,
         ):
             """
             Args:
@@ -71,6 +81,9 @@ class TokenContext(SearchContext[Token]):
                 designation: Optional[str]
                 color: Optional[GameColor]
                 home_square: Optional[HomeSquare]
+                persona: Optional[Persona]
+                readiness_state: Optional[TokenActivityState]
+                deployment_state: Optional[DeploymentState]
             """
             super().__init__(id=id, name=designation)
             self._rank = rank
@@ -80,6 +93,9 @@ class TokenContext(SearchContext[Token]):
             self._designation = designation
             self._home_square = home_square
             self._current_position = current_position
+            self._persona = persona
+            self._readiness_state = readiness_state
+            self._deployment_state = deployment_state
             
         @property
         def rank(self) -> Optional[Rank]:
@@ -108,6 +124,18 @@ class TokenContext(SearchContext[Token]):
         @property
         def designation(self) -> Optional[str]:
             return self._designation
+        
+        @property
+        def persona(self) -> Optional[Persona]:
+            return self._persona
+        
+        @property
+        def readiness_state(self) -> Optional[TokenActivityState]:
+            return self._readiness_state
+        
+        @property
+        def deployment_state(self) -> Optional[DeploymentState]:
+            return self._deployment_state
     
         @property
         def to_dict(self) -> Dict[str, Any]:
@@ -119,5 +147,8 @@ class TokenContext(SearchContext[Token]):
                 "ransom": self._ransom,
                 "designation": self._designation,
                 "current_position": self._current_position,
-                "home_square": self._home_square
+                "home_square": self._home_square,
+                "persona": self._persona,
+                "readiness_state": self._readiness_state,
+                "deployment_state": self._deployment_state,
             }
\ No newline at end of file
@@ -7,54 +7,63 @@ Created: 2025-10-03
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 #=========== ERR PACKAGE ===========#
 
-# Packages
-from .analyzer import *
-from .array import *
-from .assurance import *
-from .bidirectional import *
-from .bootstrapper import *
-from .builder import *
-from err.domain.transit import *
-from .collider import *
-from .config import *
-from .collection import *
-from .controller import *
-from .detection import *
-from .domain import *
-from .duplicate import *
-from .empty import *
-from .factory import *
-from .full import *
-from .mapper import *
-from .math import *
-from .method import *
-from .microservice import *
-from .movement import *
-from .null import *
-from .number import *
-from .operand import *
-from .operation import *
-from .permitter import *
-from .pipeline import *
-from .query import *
-from .recurrence import *
-from .resource import *
-from .rollback import *
-from .route import *
-from .search import *
-from .service import *
-from .size import *
-from .space import *
-from err.collection.stack import *
-from .state import *
-from .string import *
-from .tester import *
-from .timeout import *
-from .toolkit import *
-from .transaction import *
-from .util import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .analyzer import *
+    from .array import *
+    from .assurance import *
+    from .bidirectional import *
+    from .bootstrapper import *
+    from .builder import *
+    from err.domain.transit import *
+    from .collider import *
+    from .config import *
+    from .collection import *
+    from .controller import *
+    from .detection import *
+    from .domain import *
+    from .duplicate import *
+    from .empty import *
+    from .factory import *
+    from .full import *
+    from .mapper import *
+    from .math import *
+    from .method import *
+    from .microservice import *
+    from .movement import *
+    from .null import *
+    from .number import *
+    from .operand import *
+    from .operation import *
+    from .permitter import *
+    from .pipeline import *
+    from .query import *
+    from .recurrence import *
+    from .resource import *
+    from .rollback import *
+    from .route import *
+    from .search import *
+    from .service import *
+    from .size import *
+    from .space import *
+    from err.collection.stack import *
+    from .state import *
+    from .string import *
+    from .tester import *
+    from .timeout import *
+    from .toolkit import *
+    from .transaction import *
+    from .util import *
 
-# Modules
-from .exception import ChessException
\ No newline at end of file
+    # Modules
+    from .exception import ChessException
+    from .deferred import DeferredChessException
@@ -7,16 +7,24 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.ANALYZER PACKAGE ===========#
 
-# Packages
-from .claim import *
-from .friend import *
-from .itinerary import *
-from .promotion import *
-from .quota import *
-from .readiness import *
-from .relation import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .claim import *
+    from .friend import *
+    from .itinerary import *
+    from .promotion import *
+    from .quota import *
+    from .readiness import *
+    from .relation import *
 
-# Modules
-from .exception import AnalyzerException
+    # Modules
+    from .exception import AnalyzerException
@@ -7,13 +7,21 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.ANALYZER.PROMOTION PACKAGE ===========#
 
-# Packages
-from .double import *
-from .inactive import *
-from .manager import *
-from .rank import *
-from .row import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .double import *
+    from .inactive import *
+    from .manager import *
+    from .rank import *
+    from .row import *
 
-# Modules
\ No newline at end of file
+    # Modules
@@ -7,15 +7,23 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.ASSURANCE.AUDITOR.PATH PACKAGE ===========#
 
-# Packages
-from .attack import *
-from .blocked import *
-from .checked import *
-from .circular import *
-from .combatant import *
-from .king import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .attack import *
+    from .blocked import *
+    from .checked import *
+    from .circular import *
+    from .combatant import *
+    from .king import *
 
-# Modules
-from .exception import PathConsistencyAuditorException
\ No newline at end of file
+    # Modules
+    from .exception import PathConsistencyAuditorException
@@ -7,12 +7,20 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.ASSURANCE.AUDITOR.TOKEN PACKAGE ===========#
 
-# Packages
-from .combatant import *
-from .disabled import *
-from .king import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .combatant import *
+    from .disabled import *
+    from .king import *
 
-# Modules
-from .exception import TokenAuditorException
\ No newline at end of file
+    # Modules
+    from .exception import TokenAuditorException
@@ -7,16 +7,24 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.ASSURANCE.CHECKER PACKAGE ===========#
 
-# Packages
-from .excess import *
-from .id import *
-from .model import *
-from .register import *
-from .space import *
-from .toggle import *
-from .zero import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .excess import *
+    from .id import *
+    from .model import *
+    from .register import *
+    from .space import *
+    from .toggle import *
+    from .zero import *
 
-# Modules
-from .exception import IntegrityCheckerException
\ No newline at end of file
+    # Modules
+    from .exception import IntegrityCheckerException
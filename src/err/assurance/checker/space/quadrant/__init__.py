@@ -7,13 +7,21 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.ASSURANCE.CHECKER.SPACE.QUADRANT PACKAGE ===========#
 
-# Packages
-from .northeast import *
-from .northwest import *
-from .south import *
-from .southwest import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .northeast import *
+    from .northwest import *
+    from .south import *
+    from .southwest import *
 
-# Modules
-from .exception import QuadrantCheckerException
\ No newline at end of file
+    # Modules
+    from .exception import QuadrantCheckerException
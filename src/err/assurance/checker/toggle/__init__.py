@@ -7,21 +7,29 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.ASSURANCE.CHECKER.TOGGLE PACKAGE ===========#
 
-# Packages
-from .arena import *
-from .board import *
-from .coord import *
-from .edge import *
-from .game import *
-from .node import *
-from .player import *
-from .rank import *
-from .square import *
-from .team import *
-from .token import *
-from .vector import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
+    from .board import *
+    from .coord import *
+    from .edge import *
+    from .game import *
+    from .node import *
+    from .player import *
+    from .rank import *
+    from .square import *
+    from .team import *
+    from .token import *
+    from .vector import *
 
-# Modules
-from .exception import ToggleIntegrityCheckerException
\ No newline at end of file
+    # Modules
+    from .exception import ToggleIntegrityCheckerException
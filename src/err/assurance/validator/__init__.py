@@ -7,22 +7,30 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.ASSURANCE.VALIDATOR PACKAGE ===========#
 
-# Packages
-from .binder import *
-from .endpoint import *
-from .identity import *
-from .itinerary import *
-from .model import *
-from .number import *
-from .operand import *
-from .query import *
-from .recurrence import *
-from .register import *
-from .space import *
-from .string import *
-from .toggle import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .binder import *
+    from .endpoint import *
+    from .identity import *
+    from .itinerary import *
+    from .model import *
+    from .number import *
+    from .operand import *
+    from .query import *
+    from .recurrence import *
+    from .register import *
+    from .space import *
+    from .string import *
+    from .toggle import *
 
-# Modules
-from .exception import ValidatorException
\ No newline at end of file
+    # Modules
+    from .exception import ValidatorException
@@ -7,10 +7,18 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.ASSURANCE.VALIDATOR.ITINERARY.BINDING PACKAGE ===========#
 
-# Packages
-from .null import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .null import *
 
-# Modules
-from .exception import  ItineraryConsistencyException
\ No newline at end of file
+    # Modules
+    from .exception import  ItineraryConsistencyException
@@ -7,13 +7,21 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.VALIDATOR.RECURRENCE PACKAGE ===========#
 
-# Packages
-from .axis import *
-from .group import *
-from .quadrant import *
-from .table import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .axis import *
+    from .group import *
+    from .quadrant import *
+    from .table import *
 
-# Modules
-from .exception import RecurrenceValidatorException
\ No newline at end of file
+    # Modules
+    from .exception import RecurrenceValidatorException
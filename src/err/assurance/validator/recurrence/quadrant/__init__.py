@@ -7,13 +7,21 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.VALIDATOR.RECURRENCE.QUADRANT PACKAGE ===========#
 
-# Packages
-from .northeast import *
-from .northwest import *
-from .southeast import *
-from .southwest import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .northeast import *
+    from .northwest import *
+    from .southeast import *
+    from .southwest import *
 
-# Modules
-from .exception import QuadrantRecurrenceValidatorException
\ No newline at end of file
+    # Modules
+    from .exception import QuadrantRecurrenceValidatorException
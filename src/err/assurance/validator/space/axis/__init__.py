@@ -7,13 +7,21 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.ASSURANCE.VALIDATOR.SPACE.AXIS PACKAGE ===========#
 
-# Packages
-from .north import *
-from .west import *
-from .east import *
-from .south import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .north import *
+    from .west import *
+    from .east import *
+    from .south import *
 
-# Modules
-from .exception import AxisValidatorException
\ No newline at end of file
+    # Modules
+    from .exception import AxisValidatorException
@@ -7,17 +7,25 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.BOOTSTRAPPER PACKAGE ===========#
 
-# Packages
-from .analyzer import *
-from .builder import *
-from .collision import *
-from .detector import *
-from .operation import *
-from .permitter import *
-from .searcher import *
-from .validator import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .analyzer import *
+    from .builder import *
+    from .collision import *
+    from .detector import *
+    from .operation import *
+    from .permitter import *
+    from .searcher import *
+    from .validator import *
 
-# Modules
-from .exception import BootstrapperException
\ No newline at end of file
+    # Modules
+    from .exception import BootstrapperException
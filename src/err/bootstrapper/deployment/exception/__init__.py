@@ -7,10 +7,18 @@ Created: 2026-03-14
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== TOKEN.SERVICE.OPERATION.DEPLOYMENT.EXCEPTION PACKAGE ===========#
 
-# Packages
-from .debug import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .debug import *
 
-# Modules
-from .transaction import TokenDeploymentException
\ No newline at end of file
+    # Modules
+    from .transaction import TokenDeploymentException
@@ -7,12 +7,19 @@ Created: 2026-03-14
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== TOKEN.SERVICE.OPERATION.DEPLOYMENT.EXCEPTION.DEBUG.INCONSISTENT PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .coord import InconsistentTokenCoordException
-from .occupant import InconsistentTokenSquareException
-from .board import InconsistentTokenBoardStateException
\ No newline at end of file
+    # Modules
+    from .coord import InconsistentTokenCoordException
+    from .occupant import InconsistentTokenSquareException
+    from .board import InconsistentTokenBoardStateException
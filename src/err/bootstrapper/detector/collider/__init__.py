@@ -7,27 +7,35 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.BOOTSTRAP.DETECTOR.COLLIDER PACKAGE ===========#
 
-# Packages
-from .id import *
-from .board import *
-from .context import *
-from .coord import *
-from .edge import *
-from .formation import *
-from .game import *
-from .hostage import *
-from .name import *
-from .node import *
-from .persona import *
-from .player import *
-from .rank import *
-from .registration import *
-from .scalar import *
-from .schema import *
-from .square import *
-from .team import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .id import *
+    from .board import *
+    from .context import *
+    from .coord import *
+    from .edge import *
+    from .formation import *
+    from .game import *
+    from .hostage import *
+    from .name import *
+    from .node import *
+    from .persona import *
+    from .player import *
+    from .rank import *
+    from .registration import *
+    from .scalar import *
+    from .schema import *
+    from .square import *
+    from .team import *
 
-# Modules
-from .exception import ColliderBootstrapperException
\ No newline at end of file
+    # Modules
+    from .exception import ColliderBootstrapperException
@@ -7,23 +7,31 @@ Created: 2026-04-07
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.BOOTSTRAPPER.OPERATION PACKAGE ===========#
 
-# Packages
-from .assembly import *
-from .attack import *
-from .primer import *
-from .build import *
-from .deletion import *
-from .finalize import *
-from .math import *
-from .maneuver import *
-from .pop import *
-from .push import *
-from .registration import *
-from .registry import *
-from .token import *
-from .visit import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .assembly import *
+    from .attack import *
+    from .primer import *
+    from .build import *
+    from .deletion import *
+    from .finalize import *
+    from .math import *
+    from .maneuver import *
+    from .pop import *
+    from .push import *
+    from .registration import *
+    from .registry import *
+    from .token import *
+    from .visit import *
 
-# Modules
-from .exception import OperationBootstrapperException
\ No newline at end of file
+    # Modules
+    from .exception import OperationBootstrapperException
@@ -7,28 +7,36 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.BOOTSTRAPPER.OPERATION.ASSEMBLY PACKAGE ===========#
 
-# Packages
-from .arena import *
-from .binder import *
-from .board import *
-from .context import *
-from .coord import *
-from .edge import *
-from .formation import *
-from .game import *
-from .hostage import *
-from .node import *
-from .persona import *
-from .player import *
-from .rank import *
-from .scalar import *
-from .schema import *
-from .square import *
-from .team import *
-from .token import *
-from .vector import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
+    from .binder import *
+    from .board import *
+    from .context import *
+    from .coord import *
+    from .edge import *
+    from .formation import *
+    from .game import *
+    from .hostage import *
+    from .node import *
+    from .persona import *
+    from .player import *
+    from .rank import *
+    from .scalar import *
+    from .schema import *
+    from .square import *
+    from .team import *
+    from .token import *
+    from .vector import *
 
-# Modules
-from .exception import AssemblyException
\ No newline at end of file
+    # Modules
+    from .exception import AssemblyException
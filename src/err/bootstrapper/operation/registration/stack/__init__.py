@@ -7,20 +7,28 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.BOOTSTRAPPER.OPERATION.REGISTRATION.STACK PACKAGE ===========#
 
-# Packages
-from .arena import *
-from .board import *
-from .coord import *
-from .edge import *
-from .game import *
-from .hostage import *
-from .node import *
-from .player import *
-from .square import *
-from .team import *
-from .token import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
+    from .board import *
+    from .coord import *
+    from .edge import *
+    from .game import *
+    from .hostage import *
+    from .node import *
+    from .player import *
+    from .square import *
+    from .team import *
+    from .token import *
 
-# Modules
-from .exception import StackRegistrationException
\ No newline at end of file
+    # Modules
+    from .exception import StackRegistrationException
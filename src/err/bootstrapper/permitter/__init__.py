@@ -7,15 +7,23 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== PRIMING.PERMITTER PACKAGE ===========#
 
-# Packages
-from .deletion import *
-from .maneuver import *
-from .pop import *
-from .promotion import *
-from .push import *
-from .search import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .deletion import *
+    from .maneuver import *
+    from .pop import *
+    from .promotion import *
+    from .push import *
+    from .search import *
 
-# Modules
-from .exception import PermitterBootstrapperException
\ No newline at end of file
+    # Modules
+    from .exception import PermitterBootstrapperException
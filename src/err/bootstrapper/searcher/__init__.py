@@ -7,10 +7,18 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.BOOTSTRAP.SEARCHER PACKAGE ===========#
 
-# Packages
-from .origin import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .origin import *
 
-# Modules
-from .exception import SearcherBootstrapperException
\ No newline at end of file
+    # Modules
+    from .exception import SearcherBootstrapperException
@@ -7,12 +7,20 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.BOOTSTRAP.VALIDATOR PACKAGE ===========#
 
-# Packages
-from .endpoint import *
-from .maneuver import *
-from .priming import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .endpoint import *
+    from .maneuver import *
+    from .priming import *
 
-# Modules
-from .exception import ValidatorBootstrapperException
\ No newline at end of file
+    # Modules
+    from .exception import ValidatorBootstrapperException
@@ -7,21 +7,28 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.BUILDER PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
-from .container import *
-from .context import *
-from .dto import *
-from .model import *
-from .movement import *
-from .recurrence import *
-from .register import *
-from .registry import *
-from .space import *
-from .toggle import *
+if TYPE_CHECKING:
+    # Packages
 
+    from .container import *
+    from .context import *
+    from .dto import *
+    from .model import *
+    from .movement import *
+    from .recurrence import *
+    from .register import *
+    from .registry import *
+    from .space import *
+    from .toggle import *
 
-# Modules
-from .exception import BuilderException
\ No newline at end of file
+    # Modules
+    from .exception import BuilderException
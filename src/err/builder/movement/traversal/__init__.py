@@ -7,12 +7,20 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.BUILDER.MOVEMENT.TRAVERSAL PACKAGE ===========#
 
-# Packages
-from .bishop import *
-from .queen import *
-from .rook import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .bishop import *
+    from .queen import *
+    from .rook import *
 
-# Modules
-from .exception import TraversalPatternBuilderException
\ No newline at end of file
+    # Modules
+    from .exception import TraversalPatternBuilderException
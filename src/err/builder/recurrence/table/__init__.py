@@ -7,11 +7,19 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.BUILDER.RECURRENCE.TABLE PACKAGE ===========#
 
-# Packages
-from .axis import *
-from .quadrant import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .axis import *
+    from .quadrant import *
 
-# Modules
-from .exception  import RecurrenceTableException
\ No newline at end of file
+    # Modules
+    from .exception  import RecurrenceTableException
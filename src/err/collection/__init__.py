@@ -7,14 +7,22 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.COLLECTION PACKAGE ===========#
 
-# Packages
-from .chain import *
-from .register import *
-from .stack import *
-from .tuple import *
-from .vector import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .chain import *
+    from .register import *
+    from .stack import *
+    from .tuple import *
+    from .vector import *
 
-# Modules
-from .exception import CollectionException
\ No newline at end of file
+    # Modules
+    from .exception import CollectionException
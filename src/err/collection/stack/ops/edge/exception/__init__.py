@@ -7,9 +7,17 @@ Created: 2025-02-18
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.EDGE.STACK.EXCEPTION PACKAGE ===========#
 
-# Packages
-from .query import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .query import *
 
-# Modules
\ No newline at end of file
+    # Modules
@@ -7,10 +7,18 @@ Created: 2026-02-22
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.TOKEN.DATABASE.KERNEL.OPERATION.COLLISION PACKAGE ===========#
 
-# Packages
-from .exception import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .exception import *
 
-# Modules
-from .process import TokenCollisionAnalysis
\ No newline at end of file
+    # Modules
+    from .process import TokenCollisionAnalysis
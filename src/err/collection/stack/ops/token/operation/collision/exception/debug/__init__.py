@@ -7,12 +7,19 @@ Created: 2026-02-22
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.TOKEN.DATABASE.KERNEL.OPERATION.COLLISION.EXCEPTION.DEBUG PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .id import TokenIdCollisionException
-from .square import TokenOpeningSquareCollisionException
-from .designation import TokenDesignationCollisionException
\ No newline at end of file
+    # Modules
+    from .id import TokenIdCollisionException
+    from .square import TokenOpeningSquareCollisionException
+    from .designation import TokenDesignationCollisionException
@@ -7,11 +7,18 @@ Created: 2026-02-21
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.TOKEN.DATABASE.KERNEL.OPERATION.DEPLOYMENT.EXCEPTION PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .work import TokenStackDeploymentException
-from .double import TokenStackAlreadyDeployedException
\ No newline at end of file
+    # Modules
+    from .work import TokenStackDeploymentException
+    from .double import TokenStackAlreadyDeployedException
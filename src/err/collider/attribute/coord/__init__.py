@@ -7,11 +7,19 @@ Created: 2025-10-03
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.COLLISION.COORD PACKAGE ===========#
 
-# Packages
-from .square import *
-from .token import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .square import *
+    from .token import *
 
-# Modules
-from .exception import CoordCollisionException
\ No newline at end of file
+    # Modules
+    from .exception import CoordCollisionException
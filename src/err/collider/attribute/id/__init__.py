@@ -7,14 +7,22 @@ Created: 2025-10-03
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.COLLISION.ID PACKAGE ===========#
 
-# Packages
-from .arena import *
-from .board import *
-from .square import *
-from .team import *
-from .token import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
+    from .board import *
+    from .square import *
+    from .team import *
+    from .token import *
 
-# Modules
-from .exception import IdCollisionException
\ No newline at end of file
+    # Modules
+    from .exception import IdCollisionException
@@ -0,0 +1,227 @@
+# src/err/deferred.py
+
+"""
+Module: err.deferred
+Author: Banji Lawal
+Created: 2026-04-05
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+from types import CodeType
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type
+
+from err.exception import ChessException
+from result import MethodResultType
+
+
+__all__ = [
+    # ======================#  DEFERRED EXCEPTION CHAIN #======================#
+    "DeferredChessException",
+]
+
+# ======================# DEFERRED EXCEPTION CHAIN #======================#
+class DeferredChessException(ChessException):
+    """
+    Role:
+        -   Exception
+        -   Failure Tracing
+
+    Responsibilities:
+        1.  Stand in for an exception chain on failure paths that are expected and frequent,
+            like an occupied or illegal destination during search.
+        2.  Carry the error codes and the frame that failed without building anything.
+        3.  Build the real chain once, the first time it is inspected, logged or raised.
+        4.  Pass isinstance checks for its outermost link, like the chain it stands in for.
+
+    Attributes:
+        links: Tuple[Type[ChessException], ...]. Outermost exception first. Only worth
+            deferring with two or more; a single link costs the same built eagerly.
+        err_code: str. The outermost link's code.
+        root_code: str. The innermost link's code, i.e. the reason.
+        msg: str
+        var: Optional[str]
+        val: Optional[Any]
+        cls_name: Optional[str]
+        cls_mthd: Optional[str]
+        frame: Tuple[str, int, str]. File, line and function that created the failure.
+        ex: Optional[Exception]. Building the chain on first access.
+        op: Optional[str]
+        mthd_rslt_type: Optional[MethodResultType]
+
+    Provides:
+        -   def chain() -> ChessException
+        -   def has(exception_type: Type[ChessException]) -> bool
+
+    Usage:
+        Instead of
+            SquareEntryException(cls_mthd=method, ..., ex=SquareOccupiedException(...))
+        send
+            DeferredChessException(
+                links=(SquareEntryException, SquareOccupiedException),
+                cls_mthd=method,
+            )
+
+    Super Class:
+        ChessException
+    """
+    _heads: Dict[Type[ChessException], Type[DeferredChessException]] = {}
+    _parameters: Dict[Type[ChessException], Tuple[FrozenSet[str], bool]] = {}
+    
+    _links: Tuple[Type[ChessException], ...]
+    _cause: Optional[Exception]
+    _code: CodeType
+    _lineno: int
+    _chain: Optional[ChessException]
+
+    def __new__(cls, links: Tuple[Type[ChessException], ...], *args, **kwargs):
+        # Serve each head link through its own subclass so isinstance(deferred, head) holds.
+        if cls is DeferredChessException:
+            cls = cls._for_head(links[0])
+        return Exception.__new__(cls)
+
+    def __init__(
+            self,
+            links: Tuple[Type[ChessException], ...],
+            var: Optional[str] | None = None,
+            val: Optional[Any] | None = None,
+            cls_name: Optional[str] | None = None,
+            cls_mthd: Optional[str] | None = None,
+            ex: Optional[Exception] | None = None,
+            op: Optional[str] | None = None,
+            mthd_rslt_type: Optional[MethodResultType] | None = None,
+    ):
+        """
+        Args:
+            links: Tuple[Type[ChessException], ...]. At least two classes, outermost first.
+            var: Optional[str]
+            val: Optional[Any]
+            cls_name: Optional[str]
+            cls_mthd: Optional[str]
+            ex: Optional[Exception]. An already built exception to hang below the innermost link.
+            op: Optional[str]. The outermost link's OP when None.
+            mthd_rslt_type: Optional[MethodResultType]. The outermost link's MTHD_RSLT_TYPE when None.
+        """
+        # ChessException.__init__ is skipped on purpose: nothing is formatted until it is read.
+        Exception.__init__(self)
+        self._links = links
+        self._var = var
+        self._val = val
+        self._cls_name = cls_name
+        self._cls_mthd = cls_mthd
+        self._cause = ex
+        self._op = op
+        self._mthd_rslt_type = mthd_rslt_type
+        self._chain = None
+        frame = sys._getframe(1)
+        self._code = frame.f_code
+        self._lineno = frame.f_lineno
+
+    @property
+    def links(self) -> Tuple[Type[ChessException], ...]:
+        return self._links
+
+    @property
+    def err_code(self) -> str:
+        return self._links[0].ERR_CODE
+
+    @property
+    def root_code(self) -> str:
+        return self._links[-1].ERR_CODE
+
+    @property
+    def msg(self) -> str:
+        return self._links[0].MSG
+
+    @property
+    def op(self) -> Optional[str]:
+        return self._op or self._default_op(self._links[0])
+
+    @property
+    def mthd_rslt_type(self) -> Optional[MethodResultType]:
+        return self._mthd_rslt_type or self._default_mthd_rslt_type(self._links[0])
+
+    @property
+    def frame(self) -> Tuple[str, int, str]:
+        return self._code.co_filename, self._lineno, self._code.co_name
+
+    @property
+    def ex(self) -> Optional[Exception]:
+        return self.chain().ex
+
+    def has(self, exception_type: Type[ChessException]) -> bool:
+        """Whether any link is an exception_type, without building the chain."""
+        return any(issubclass(link, exception_type) for link in self._links)
+
+    def chain(self) -> ChessException:
+        """
+        Build the exception chain the links describe, once.
+
+        Every link gets its own MSG, ERR_CODE, OP and MTHD_RSLT_TYPE and the link below it.
+        The outermost link also gets the call site details and any op or mthd_rslt_type
+        passed in. A field a link's constructor does not take is set on it afterwards,
+        so each link carries every field whatever its signature.
+        """
+        if self._chain is None:
+            inner = self._cause
+            for link in reversed(self._links):
+                fields = {
+                    "msg": link.MSG,
+                    "err_code": link.ERR_CODE,
+                    "op": self._default_op(link),
+                    "mthd_rslt_type": self._default_mthd_rslt_type(link),
+                    "ex": inner,
+                }
+                if link is self._links[0]:
+                    fields.update(
+                        var=self._var,
+                        val=self._val,
+                        cls_name=self._cls_name,
+                        cls_mthd=self._cls_mthd,
+                        op=self.op,
+                        mthd_rslt_type=self.mthd_rslt_type,
+                    )
+                inner = self._build(link, fields)
+            self._chain = inner
+        return self._chain
+
+    @classmethod
+    def _build(cls, link: Type[ChessException], fields: Dict[str, Any]) -> ChessException:
+        names, takes_any = cls._accepted(link)
+        exception = link(**{name: value for name, value in fields.items() if takes_any or name in names})
+        for name, value in fields.items():
+            if not takes_any and name not in names and value is not None:
+                setattr(exception, f"_{name}", value)
+        return exception
+
+    @classmethod
+    def _accepted(cls, link: Type[ChessException]) -> Tuple[FrozenSet[str], bool]:
+        """The keyword arguments link's constructor takes, and whether it takes **kwargs."""
+        if link not in cls._parameters:
+            parameters = inspect.signature(link.__init__).parameters.values()
+            cls._parameters[link] = (
+                frozenset(parameter.name for parameter in parameters),
+                any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters),
+            )
+        return cls._parameters[link]
+
+    @classmethod
+    def _for_head(cls, head: Type[ChessException]) -> Type[DeferredChessException]:
+        if head not in cls._heads:
+            name = f"Deferred{head.__name__}"
+            cls._heads[head] = type(name, (cls, head), {"__module__": cls.__module__, "__qualname__": name})
+        return cls._heads[head]
+
+    @classmethod
+    def _default_op(cls, link: Type[ChessException]) -> Optional[str]:
+        return getattr(link, "OP", None)
+
+    @classmethod
+    def _default_mthd_rslt_type(cls, link: Type[ChessException]) -> Optional[MethodResultType]:
+        return getattr(link, "MTHD_RSLT_TYPE", getattr(link, "MTHD_RSLT", None))
+
+    def __str__(self):
+        return str(self.chain())
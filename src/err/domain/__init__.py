@@ -7,17 +7,25 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.DOMAIN PACKAGE ===========#
 
-# Packages
-from .exchange import *
-from .graph import *
-from .metadata import *
-from .model import *
-from .schema import *
-from .search import *
-from .structure import *
-from .transit import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .exchange import *
+    from .graph import *
+    from .metadata import *
+    from .model import *
+    from .schema import *
+    from .search import *
+    from .structure import *
+    from .transit import *
 
-# Modules
-from .exception import DomainObjectException
\ No newline at end of file
+    # Modules
+    from .exception import DomainObjectException
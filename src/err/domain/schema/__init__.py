@@ -7,18 +7,26 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.DOMAIN.SCHEMA PACKAGE ===========#
 
-# Packages
-from .archetype import *
-from .delta import *
-from .formation import *
-from .offset import *
-from .orientation  import *
-from .persona import *
-from .ruleset import *
-from .stepper import *
-from .terminus import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .archetype import *
+    from .delta import *
+    from .formation import *
+    from .offset import *
+    from .orientation  import *
+    from .persona import *
+    from .ruleset import *
+    from .stepper import *
+    from .terminus import *
 
-# Modules
-from .exception import SchemaException
\ No newline at end of file
+    # Modules
+    from .exception import SchemaException
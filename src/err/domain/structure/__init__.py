@@ -7,12 +7,20 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.DOMAIN.STRUCTURE PACKAGE ===========#
 
-# Packages
-from .node import *
-from .register import *
-from .toggle import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .node import *
+    from .register import *
+    from .toggle import *
 
-# Modules
-from .exception import StructuralWrapperException
\ No newline at end of file
+    # Modules
+    from .exception import StructuralWrapperException
@@ -7,15 +7,23 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.DOMAIN.TRANSIT.MODEL.RANK PACKAGE ===========#
 
-# Packages
-from .bishop import *
-from .king import *
-from .knight import *
-from .pawn import *
-from .queen import *
-from .rook import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .bishop import *
+    from .king import *
+    from .knight import *
+    from .pawn import *
+    from .queen import *
+    from .rook import *
 
-# Modules
-from .exception import RankCarrierException
\ No newline at end of file
+    # Modules
+    from .exception import RankCarrierException
@@ -7,17 +7,25 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.EMPTY PACKAGE ===========#
 
-# Packages
-from .array import *
-from .container import *
-from .graph import *
-from .model import *
-from .query import *
-from .register import *
-from .space import *
-from .stack import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .array import *
+    from .container import *
+    from .graph import *
+    from .model import *
+    from .query import *
+    from .register import *
+    from .space import *
+    from .stack import *
 
-# Modules
-from .exception import EmptyException
\ No newline at end of file
+    # Modules
+    from .exception import EmptyException
@@ -7,12 +7,18 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
-# ============ ERR.EMPTY.MODEL.BINDER PACKAGE ===========#
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
 
-# Packages
-from .arena import *
+# ============ ERR.EMPTY.MODEL.BINDER PACKAGE ===========#
 
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
 
-# Modules
-from .exception import BinderEmptyException
\ No newline at end of file
+    # Modules
+    from .exception import BinderEmptyException
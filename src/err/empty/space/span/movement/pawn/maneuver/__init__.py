@@ -7,12 +7,19 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.EMPTY.SPACE.SPAN.MOVEMENT.PAWN PACKAGE ===========#
 
-# Packages
-from .opening import *
-from .developed import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
+    from .opening import *
+    from .developed import *
 
-# Modules
-from .exception import ManeuverMovementSetEmptyException
+    # Modules
+    from .exception import ManeuverMovementSetEmptyException
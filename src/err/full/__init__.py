@@ -7,17 +7,25 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.FULL PACKAGE ===========#
 
-# Packages
-from .arena import *
-from .array import *
-from .binder import *
-from .board import *
-from .graph import *
-from .query import *
-from .square import *
-from .stack import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
+    from .array import *
+    from .binder import *
+    from .board import *
+    from .graph import *
+    from .query import *
+    from .square import *
+    from .stack import *
 
-# Modules
-from .exception import CapacityFullException
\ No newline at end of file
+    # Modules
+    from .exception import CapacityFullException
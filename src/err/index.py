@@ -0,0 +1,2195 @@
+# src/err/index.py
+
+"""
+Module: err.index
+Author: Banji Lawal
+Created: 2026-04-04
+version: 0.0.2
+
+GENERATED by `python -m err.indexer`. Do not edit by hand.
+
+EXPORTS maps every exported name to its candidate modules. `err` takes the first;
+a subpackage takes the first candidate inside itself. OVERRIDES holds the
+per-package exceptions to that rule.
+"""
+
+from typing import Dict, Tuple, Union
+
+# Not indexed because they could not be parsed or found:
+#   err.assurance.validator.endpoint.origin.null
+#   err.assurance.validator.model.vector.register
+#   err.bootstrapper.detector.collider.context.vector
+#   err.bootstrapper.operation.build
+#   err.bootstrapper.operation.finalize.build
+#   err.collider.context.vector
+#   err.detection.collision.context.vector
+#   err.domain.model.state.node
+#   err.domain.transit.model.rank.bishop
+#   err.domain.transit.model.rank.king
+#   err.domain.transit.model.rank.knight
+#   err.domain.transit.model.rank.pawn
+#   err.domain.transit.model.rank.queen
+#   err.domain.transit.model.rank.rook
+#   err.domain.transit.model.token.combatant
+#   err.domain.transit.model.token.disabled
+#   err.domain.transit.model.token.king
+#   err.domain.transit.model.vectortoggle
+#   err.domain.transit.register.token.combatant
+#   err.domain.transit.register.token.disabled
+#   err.domain.transit.register.token.king
+#   err.empty.register.board
+#   err.empty.register.coord
+#   err.empty.register.edge
+#   err.empty.register.game
+#   err.empty.register.node
+#   err.empty.register.player
+#   err.empty.register.square
+#   err.empty.register.team
+#   err.empty.register.token
+#   err.microservice.blueprint
+#   err.microservice.context
+#   err.microservice.endpoint.origin.null
+#   err.null.carrier.model.square.opening
+#   err.null.consistencey.coord
+#   err.null.consistencey.formation
+#   err.null.consistencey.persona
+#   err.null.consistencey.rank
+#   err.null.consistencey.schema
+#   err.null.consistencey.vector
+#   err.null.pattern.generator
+#   err.null.register.board
+#   err.null.register.coord
+#   err.null.register.edge
+#   err.null.register.game
+#   err.null.register.node
+#   err.null.register.player
+#   err.null.register.square
+#   err.null.register.team
+#   err.null.register.token
+#   err.null.stack.hostage
+#   err.size.register.board
+#   err.size.register.coord
+#   err.size.register.edge
+#   err.size.register.game
+#   err.size.register.node
+#   err.size.register.player
+#   err.size.register.square
+#   err.size.register.team
+#   err.size.register.token
+#   err.state.finalize.build
+#   err.state.validation.number
+#   err.state.validation.vector
+#   err.transaction.update
+#   err/state/pop/__init__.py
+
+EXPORTS: Dict[str, Union[str, Tuple[str, ...]]] = {
+    'AddNodeRequestNullException': 'err.null.request.insertion.node.exception',
+    'AddVectorNodeRequestNullException': 'err.null.request.insertion.node.vector.exception',
+    'AlgebraContextBuildRouteException': 'err.route.build.context.algebra.exception',
+    'AlgebraContextSearchRouteException': 'err.route.search.context.algebra.exception',
+    'AlgebraContextValidationRouteException': 'err.route.validation.context.algebra.exception',
+    'AnalyzerBootstrapperException': 'err.bootstrapper.analyzer.exception',
+    'AnalyzerException': 'err.analyzer.exception',
+    'ArchetypeException': 'err.domain.schema.archetype.exception',
+    'ArchetypeNullException': 'err.null.schema.archetype.exception',
+    'ArenaAssemblyException': ('err.state.assembly.arena.exception', 'err.bootstrapper.operation.assembly.arena.exception', 'err.operation.assembly.arena.exception'),
+    'ArenaBinderAssemblyException': ('err.state.assembly.binder.arena.exception', 'err.bootstrapper.operation.assembly.binder.arena.exception', 'err.operation.assembly.binder.arena.exception'),
+    'ArenaBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.arena.exception',
+    'ArenaBinderBuilderException': ('err.operation.build.binder.arena.exception', 'err.builder.model.binder.arena.exception'),
+    'ArenaBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.arena.exception',
+    'ArenaBinderTokenOperationException': 'err.operation.token.binder.arena.exception',
+    'ArenaBinderTokenStateException': 'err.state.token.binder.arena.exception',
+    'ArenaBlueprintNullException': 'err.null.blueprint.model.arena.exception',
+    'ArenaBoardRelationAnalyzerException': 'err.analyzer.relation.board.arena.exception',
+    'ArenaBuildPipelineException': 'err.pipeline.build.arena.exception',
+    'ArenaBuildRouteException': 'err.route.build.arena.exception',
+    'ArenaBuilderBootstrapperException': 'err.bootstrapper.builder.arena.exception',
+    'ArenaBuilderException': ('err.operation.build.arena.exception', 'err.builder.model.arena.exception'),
+    'ArenaCarrierException': 'err.domain.transit.model.arena.exception',
+    'ArenaCarrierNullException': 'err.null.carrier.model.arena.exception',
+    'ArenaCarrierValidatorException': 'err.assurance.validator.toggle.carrier.arena.exception',
+    'ArenaConsistencyAuditorException': 'err.assurance.auditor.arena.exception',
+    'ArenaConsistencyCheckerNullException': 'err.null.consistencey.arena.exception',
+    'ArenaContextAssemblyException': ('err.state.assembly.context.arena.exception', 'err.bootstrapper.operation.assembly.context.arena.exception', 'err.operation.assembly.context.arena.exception'),
+    'ArenaContextBuildPipelineException': 'err.pipeline.build.context.arena.exception',
+    'ArenaContextBuildRouteException': 'err.route.build.context.arena.exception',
+    'ArenaContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.arena.exception',
+    'ArenaContextBuilderException': ('err.operation.build.context.arena.exception', 'err.builder.context.arena.exception'),
+    'ArenaContextCollisionException': ('err.detection.collision.context.arena.exception', 'err.bootstrapper.detector.collider.context.arena.exception', 'err.collider.context.arena.exception'),
+    'ArenaContextException': ('err.toolkit.context.arena.exception', 'err.domain.search.context.arena.exception'),
+    'ArenaContextNullException': 'err.null.context.arena.exception',
+    'ArenaContextSearchRouteException': 'err.route.search.context.arena.exception',
+    'ArenaContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.arena.exception',
+    'ArenaContextTokenOperationException': 'err.operation.token.context.arena.exception',
+    'ArenaContextTokenStateException': 'err.state.token.context.arena.exception',
+    'ArenaContextValidationRouteException': 'err.route.validation.context.arena.exception',
+    'ArenaContextValidatorException': ('err.state.validation.context.arena.exception', 'err.assurance.validator.toggle.context.arena.exception'),
+    'ArenaDatabaseNullException': 'err.null.database.arena.exception',
+    'ArenaEmptyException': 'err.empty.model.arena.exception',
+    'ArenaException': ('err.toolkit.arena.exception', 'err.domain.model.state.arena.exception'),
+    'ArenaFullException': 'err.full.arena.exception',
+    'ArenaIdCollisionException': 'err.collider.attribute.id.arena.exception',
+    'ArenaIntegrityCheckerException': 'err.assurance.checker.model.arena.exception',
+    'ArenaMicroserviceException': 'err.microservice.arena.exception',
+    'ArenaNameCollisionException': 'err.collider.attribute.name.arena.exception',
+    'ArenaNoValidationRouteException': 'err.route.validation.arena.exception',
+    'ArenaNullException': 'err.null.model.state.arena.exception',
+    'ArenaPlayerBinderConsistencyAuditorException': 'err.assurance.auditor.binder.arena.exception',
+    'ArenaPlayerBinderConsistencyCheckerNullException': 'err.null.consistencey.binder.arena.exception',
+    'ArenaPlayerBinderEmptyException': 'err.empty.model.binder.arena.exception',
+    'ArenaPlayerBinderException': ('err.toolkit.binder.arena.exception', 'err.domain.model.binder.arena.exception'),
+    'ArenaPlayerBinderFullException': 'err.full.binder.arena.exception',
+    'ArenaPlayerBinderMicroserviceException': 'err.microservice.binder.arena.exception',
+    'ArenaPlayerBinderModelNullException': 'err.null.model.binder.arena.exception',
+    'ArenaPlayerBinderSizeException': 'err.size.model.binder.arena.exception',
+    'ArenaPlayerBinderValidatorException': ('err.state.validation.binder.arena.exception', 'err.assurance.validator.binder.arena.exception'),
+    'ArenaPushPermitterException': 'err.permitter.push.arena.exception',
+    'ArenaQueryFullException': 'err.full.query.arena.exception',
+    'ArenaQueryNullException': 'err.null.query.arena.exception',
+    'ArenaQueryStackEmptyException': 'err.empty.query.arena.exception',
+    'ArenaQueryStackSizeException': 'err.size.query.arena.exception',
+    'ArenaRegisterCarrierException': 'err.domain.transit.register.arena.exception',
+    'ArenaSearchHitConflictException': 'err.search.conflict.arena.exception',
+    'ArenaSearchResultEmptyException': 'err.search.empty.arena.exception',
+    'ArenaSearchRouteException': 'err.route.search.arena.exception',
+    'ArenaSearcherException': 'err.search.arena.exception',
+    'ArenaSizeException': 'err.size.model.arena.exception',
+    'ArenaStackEmptyException': 'err.empty.stack.arena.exception',
+    'ArenaStackFullException': 'err.full.stack.arena.exception',
+    'ArenaStackNullException': 'err.null.stack.arena.exception',
+    'ArenaStackPushException': ('err.state.push.stack.token.exception', 'err.bootstrapper.operation.push.stack.arena.exception', 'err.bootstrapper.operation.push.stack.node.exception', 'err.bootstrapper.operation.push.stack.square.exception', 'err.bootstrapper.operation.push.stack.team.exception', 'err.operation.push.stack.arena.exception', 'err.operation.push.stack.node.exception', 'err.operation.push.stack.square.exception', 'err.operation.push.stack.team.exception', 'err.state.push.stack.arena.exception', 'err.state.push.stack.node.exception', 'err.state.push.stack.square.exception', 'err.state.push.stack.team.exception'),
+    'ArenaStackRegistrationException': ('err.state.registration.stack.token.exception', 'err.bootstrapper.operation.registration.stack.arena.exception', 'err.bootstrapper.operation.registration.stack.node.exception', 'err.bootstrapper.operation.registration.stack.square.exception', 'err.bootstrapper.operation.registration.stack.team.exception', 'err.bootstrapper.operation.registration.stack.token.exception', 'err.operation.registration.stack.arena.exception', 'err.operation.registration.stack.node.exception', 'err.operation.registration.stack.square.exception', 'err.operation.registration.stack.team.exception', 'err.operation.registration.stack.token.exception', 'err.state.registration.stack.arena.exception', 'err.state.registration.stack.node.exception', 'err.state.registration.stack.square.exception', 'err.state.registration.stack.team.exception'),
+    'ArenaStackServiceException': 'err.collection.stack.arena.exception',
+    'ArenaStackSizeException': 'err.size.stack.arena.exception',
+    'ArenaToggleBlueprintNullException': 'err.null.blueprint.toggle.arena.exception',
+    'ArenaToggleCheckerException': 'err.assurance.checker.toggle.arena.exception',
+    'ArenaValidatorException': ('err.state.validation.arena.exception', 'err.assurance.validator.model.state.arena.exception'),
+    'ArrayException': 'err.array.exception',
+    'AssemblyBootstrapperException': 'err.state.bootstrap.assembly.exception',
+    'AssemblyException': ('err.state.assembly.exception', 'err.bootstrapper.operation.assembly.exception', 'err.operation.assembly.exception'),
+    'AssemblyPrimerException': ('err.operation.primer.assembly.exception', 'err.bootstrapper.operation.primer.assembly.exception'),
+    'AssuranceException': 'err.assurance.exception',
+    'AttackBasisEmptyException': 'err.empty.space.span.basis.pawn.attack.exception',
+    'AttackBasisSizeException': 'err.size.space.span.basis.pawn.attack.exception',
+    'AttackDestinationEmptyException': ('err.operation.attack.empty.exception', 'err.bootstrapper.operation.attack.empty.exception'),
+    'AttackException': ('err.operation.attack.exception', 'err.bootstrapper.operation.attack.exception'),
+    'AttackMovementSetEmptyException': 'err.empty.space.span.movement.pawn.attack.exception',
+    'AttackMovementSetSizeException': 'err.size.space.span.movement.pawn.attack.exception',
+    'AttackOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.pawn.attack.exception',
+    'AttackOffsetPatternBuilderException': 'err.builder.movement.pawn.attack.exception',
+    'AttackOffsetPatternCarrierException': 'err.domain.transit.movement.pawn.attack.exception',
+    'AttackOffsetPatternCarrierNullException': 'err.null.carrier.movement.pawn.attack.exception',
+    'AttackOffsetPatternException': 'err.movement.pawn.attack.exception',
+    'AttackOffsetPatternNullException': 'err.null.pattern.pawn.attack.exception',
+    'AttackPathConsistencyAuditorException': 'err.assurance.auditor.path.attack.exception',
+    'AttackPathConsistencyCheckerNullException': 'err.null.consistencey.path.attack.exception',
+    'AttackPathException': 'err.domain.model.state.path.attack.exception',
+    'AttackPathMicroserviceException': 'err.microservice.path.attack.exception',
+    'AttackPathNullException': 'err.null.model.state.path.attack.exception',
+    'AttackPathSearchHitConflictException': 'err.search.conflict.path.attack.exception',
+    'AttackPathSearchResultEmptyException': 'err.search.empty.path.attack.exception',
+    'AttackPathSearcherException': 'err.search.path.attack.exception',
+    'AttackPathValidatorException': 'err.assurance.validator.model.state.path.attack.exception',
+    'AttackPushPermitterException': 'err.permitter.push.attack.exception',
+    'AttackSearchHitConflictException': 'err.search.conflict.attack.exception',
+    'AttackSearchResultEmptyException': 'err.search.empty.attack.exception',
+    'AttackSearcherException': 'err.search.attack.exception',
+    'AttributeCollisionException': 'err.collider.attribute.exception',
+    'AxisBlueprintNullException': 'err.null.blueprint.space.axis.exception',
+    'AxisBuilderException': 'err.builder.space.axis.exception',
+    'AxisCarrierException': 'err.domain.transit.space.axis.exception',
+    'AxisCarrierNullException': 'err.null.carrier.space.axis.exception',
+    'AxisCheckerException': 'err.assurance.checker.space.axis.exception',
+    'AxisEmptyException': 'err.empty.space.linear.axis.exception',
+    'AxisException': 'err.space.axis.exception',
+    'AxisLineSegmentEmptyException': 'err.empty.space.linear.segment.axis.exception',
+    'AxisLineSegmentSizeException': 'err.size.space.linear.segment.axis.exception',
+    'AxisMappingFunctionException': 'err.mapper.axis.exception',
+    'AxisMappingFunctionStreamException': 'err.mapper.stream.axis.exception',
+    'AxisNullException': 'err.null.space.axis.exception',
+    'AxisRecurrenceRegistryNullException': 'err.null.recurrence.registry.axis.exception',
+    'AxisRecurrenceTableException': ('err.recurrence.table.axis.exception', 'err.assurance.validator.recurrence.table.axis.exception', 'err.null.carrier.recurrence.table.axis.exception', 'err.builder.recurrence.table.axis.exception'),
+    'AxisReservoirBuilderException': 'err.builder.registry.space.axis.exception',
+    'AxisReservoirException': 'err.space.reservoir.axis.exception',
+    'AxisReservoirNullException': 'err.null.space.reservoir.axis.exception',
+    'AxisSizeException': 'err.size.space.linear.axis.exception',
+    'AxisValidatorException': 'err.assurance.validator.space.axis.exception',
+    'BasisEmptyException': 'err.empty.space.span.basis.exception',
+    'BasisSizeException': 'err.size.space.span.basis.exception',
+    'BidirectionalRelationException': 'err.bidirectional.exception',
+    'BidirectionalSourceTokenRelationException': ('err.microservice.itinerary.binding.null.exception', 'err.assurance.validator.itinerary.binding.null.exception'),
+    'BinderAssemblyException': ('err.state.assembly.binder.exception', 'err.bootstrapper.operation.assembly.binder.exception', 'err.operation.assembly.binder.exception'),
+    'BinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.exception',
+    'BinderBuilderException': ('err.operation.build.binder.exception', 'err.builder.model.binder.exception'),
+    'BinderConsistencyAuditorException': 'err.assurance.auditor.binder.exception',
+    'BinderConsistencyCheckerNullException': 'err.null.consistencey.binder.exception',
+    'BinderEmptyException': 'err.empty.model.binder.exception',
+    'BinderException': ('err.toolkit.binder.exception', 'err.domain.model.binder.exception'),
+    'BinderFullException': 'err.full.binder.exception',
+    'BinderMicroserviceException': 'err.microservice.binder.exception',
+    'BinderModelNullException': 'err.null.model.binder.exception',
+    'BinderSizeException': 'err.size.model.binder.exception',
+    'BinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.exception',
+    'BinderTokenOperationException': 'err.operation.token.binder.exception',
+    'BinderTokenStateException': 'err.state.token.binder.exception',
+    'BinderValidatorException': ('err.state.validation.binder.exception', 'err.assurance.validator.binder.exception'),
+    'BishopBasisEmptyException': 'err.empty.space.span.basis.bishop.exception',
+    'BishopBasisSizeException': 'err.size.space.span.basis.bishop.exception',
+    'BishopException': ('err.toolkit.rank.bishop.exception', 'err.domain.model.rank.bishop.exception'),
+    'BishopMicroserviceException': 'err.microservice.rank.bishop.exception',
+    'BishopMovementSetEmptyException': 'err.empty.space.span.movement.bishop.exception',
+    'BishopMovementSetSizeException': 'err.size.space.span.movement.bishop.exception',
+    'BishopRecurrenceSeriesBuilderException': 'err.builder.recurrence.group.bishop.exception',
+    'BishopRecurrenceSeriesException': 'err.recurrence.group.bishop.exception',
+    'BishopRecurrenceSeriesNullException': 'err.null.recurrence.group.bishop.exception',
+    'BishopRecurrenceSeriesValidatorException': 'err.assurance.validator.recurrence.group.bishop.exception',
+    'BishopSignatureNullException': 'err.null.pattern.traversal.bishop.exception',
+    'BishopTopologyGeneratorException': 'err.movement.generator.bishop.exception',
+    'BishopTraversalPatternBlueprintNullException': 'err.null.blueprint.movement.traversal.bishop.exception',
+    'BishopTraversalPatternBuilderException': 'err.builder.movement.traversal.bishop.exception',
+    'BishopTraversalPatternCarrierException': 'err.domain.transit.movement.traversal.bishop.exception',
+    'BishopTraversalPatternCarrierNullException': 'err.null.carrier.movement.traversal.bishop.exception',
+    'BishopTraversalPatternException': 'err.movement.traversal.bishop.exception',
+    'BishopValidatorException': ('err.state.validation.rank.bishop.exception', 'err.assurance.validator.model.rank.bishop.exception'),
+    'BlockedPathConsistencyAuditorException': 'err.assurance.auditor.path.blocked.exception',
+    'BlockedPathConsistencyCheckerNullException': 'err.null.consistencey.path.blocked.exception',
+    'BlockedPathException': 'err.domain.model.state.path.blocked.exception',
+    'BlockedPathMicroserviceException': 'err.microservice.path.blocked.exception',
+    'BlockedPathNullException': 'err.null.model.state.path.blocked.exception',
+    'BlockedPathSearchHitConflictException': 'err.search.conflict.path.blocked.exception',
+    'BlockedPathSearchResultEmptyException': 'err.search.empty.path.blocked.exception',
+    'BlockedPathSearcherException': 'err.search.path.blocked.exception',
+    'BlockedPathValidatorException': 'err.assurance.validator.model.state.path.blocked.exception',
+    'BlueprintException': 'err.domain.metadata.blueprint.exception',
+    'BlueprintHomeSquareExtractorException': ('err.assurance.checker.toggle.token.home.exception', 'err.assurance.checker.model.token.home.exception', 'err.assurance.checker.model.vector.home.exception'),
+    'BlueprintIdValidatorException': 'err.assurance.checker.id.exception',
+    'BlueprintNullException': 'err.null.blueprint.exception',
+    'BlueprintRankExtractorException': ('err.assurance.checker.toggle.token.rank.exception', 'err.assurance.checker.model.token.rank.exception', 'err.assurance.checker.model.vector.rank.exception'),
+    'BoardAssemblyException': ('err.state.assembly.board.exception', 'err.bootstrapper.operation.assembly.board.exception', 'err.operation.assembly.board.exception'),
+    'BoardBinderAssemblyException': ('err.state.assembly.binder.board.exception', 'err.bootstrapper.operation.assembly.binder.board.exception', 'err.operation.assembly.binder.board.exception'),
+    'BoardBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.board.exception',
+    'BoardBinderBuilderException': ('err.operation.build.binder.board.exception', 'err.builder.model.binder.board.exception'),
+    'BoardBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.board.exception',
+    'BoardBinderTokenOperationException': 'err.operation.token.binder.board.exception',
+    'BoardBinderTokenStateException': 'err.state.token.binder.board.exception',
+    'BoardBlueprintNullException': 'err.null.blueprint.model.board.exception',
+    'BoardBuildPipelineException': 'err.pipeline.build.board.exception',
+    'BoardBuildRouteException': 'err.route.build.board.exception',
+    'BoardBuilderBootstrapperException': 'err.bootstrapper.builder.board.exception',
+    'BoardBuilderException': ('err.operation.build.board.exception', 'err.builder.model.board.exception'),
+    'BoardCarrierException': 'err.domain.transit.model.board.exception',
+    'BoardCarrierNullException': 'err.null.carrier.model.board.exception',
+    'BoardCarrierValidatorException': 'err.assurance.validator.toggle.carrier.board.exception',
+    'BoardColliderBootstrapperException': 'err.bootstrapper.detector.collider.board.exception',
+    'BoardColliderException': 'err.collider.board.exception',
+    'BoardCollisionDetectorException': 'err.detection.collision.board.exception',
+    'BoardConsistencyAuditorException': 'err.assurance.auditor.board.exception',
+    'BoardConsistencyCheckerNullException': 'err.null.consistencey.board.exception',
+    'BoardContextAssemblyException': ('err.state.assembly.context.board.exception', 'err.bootstrapper.operation.assembly.context.board.exception', 'err.operation.assembly.context.board.exception'),
+    'BoardContextBuildPipelineException': 'err.pipeline.build.context.board.exception',
+    'BoardContextBuildRouteException': 'err.route.build.context.board.exception',
+    'BoardContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.board.exception',
+    'BoardContextBuilderException': ('err.operation.build.context.board.exception', 'err.builder.context.board.exception'),
+    'BoardContextCollisionException': ('err.detection.collision.context.board.exception', 'err.bootstrapper.detector.collider.context.board.exception', 'err.collider.context.board.exception'),
+    'BoardContextException': ('err.toolkit.context.board.exception', 'err.domain.search.context.board.exception'),
+    'BoardContextNullException': 'err.null.context.board.exception',
+    'BoardContextSearchRouteException': 'err.route.search.context.board.exception',
+    'BoardContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.board.exception',
+    'BoardContextTokenOperationException': 'err.operation.token.context.board.exception',
+    'BoardContextTokenStateException': 'err.state.token.context.board.exception',
+    'BoardContextValidationRouteException': 'err.route.validation.context.board.exception',
+    'BoardContextValidatorException': ('err.state.validation.context.board.exception', 'err.assurance.validator.toggle.context.board.exception'),
+    'BoardDatabaseNullException': 'err.null.database.board.exception',
+    'BoardEmptyException': 'err.empty.model.board.exception',
+    'BoardException': ('err.toolkit.board.exception', 'err.domain.model.state.board.exception'),
+    'BoardFullException': 'err.full.board.exception',
+    'BoardIdCollisionException': 'err.collider.attribute.id.board.exception',
+    'BoardIntegrityCheckerException': 'err.assurance.checker.model.board.exception',
+    'BoardMicroserviceException': 'err.microservice.board.exception',
+    'BoardNameCollisionException': 'err.collider.attribute.name.board.exception',
+    'BoardNoValidationRouteException': 'err.route.validation.board.exception',
+    'BoardNullException': 'err.null.model.state.board.exception',
+    'BoardPushPermitterException': 'err.permitter.push.board.exception',
+    'BoardQueryFullException': 'err.full.query.board.exception',
+    'BoardQueryNullException': 'err.null.query.board.exception',
+    'BoardQueryStackEmptyException': 'err.empty.query.board.exception',
+    'BoardQueryStackSizeException': 'err.size.query.board.exception',
+    'BoardRegisterCarrierException': 'err.domain.transit.register.board.exception',
+    'BoardSearchHitConflictException': 'err.search.conflict.board.exception',
+    'BoardSearchResultEmptyException': 'err.search.empty.board.exception',
+    'BoardSearchRouteException': 'err.route.search.board.exception',
+    'BoardSearcherException': 'err.search.board.exception',
+    'BoardSizeException': 'err.size.model.board.exception',
+    'BoardStackEmptyException': 'err.empty.stack.board.exception',
+    'BoardStackFullException': 'err.full.stack.board.exception',
+    'BoardStackNullException': 'err.null.stack.board.exception',
+    'BoardStackPushException': ('err.state.push.stack.board.exception', 'err.bootstrapper.operation.push.stack.board.exception', 'err.operation.push.stack.board.exception'),
+    'BoardStackRegistrationException': ('err.state.registration.stack.board.exception', 'err.bootstrapper.operation.registration.stack.board.exception', 'err.operation.registration.stack.board.exception'),
+    'BoardStackServiceException': 'err.collection.stack.board.exception',
+    'BoardStackSizeException': 'err.size.stack.board.exception',
+    'BoardTeamBinderConsistencyAuditorException': 'err.assurance.auditor.binder.board.exception',
+    'BoardTeamBinderConsistencyCheckerNullException': 'err.null.consistencey.binder.board.exception',
+    'BoardTeamBinderException': ('err.toolkit.binder.board.exception', 'err.domain.model.binder.board.exception'),
+    'BoardTeamBinderFullException': 'err.full.binder.board.exception',
+    'BoardTeamBinderMicroserviceException': 'err.microservice.binder.board.exception',
+    'BoardTeamBinderModelNullException': 'err.null.model.binder.board.exception',
+    'BoardTeamBinderValidatorException': ('err.state.validation.binder.board.exception', 'err.assurance.validator.binder.board.exception'),
+    'BoardTeamRelationAnalyzerException': 'err.analyzer.relation.team.board.exception',
+    'BoardToggleBlueprintNullException': 'err.null.blueprint.toggle.board.exception',
+    'BoardToggleCheckerException': 'err.assurance.checker.toggle.board.exception',
+    'BoardTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.board.exception',
+    'BoardTokenOperationException': 'err.operation.token.board.exception',
+    'BoardValidatorException': ('err.state.validation.board.exception', 'err.assurance.validator.model.state.board.exception'),
+    'BootstrapArenaAssemblyException': 'err.state.bootstrap.assembly.arena.exception',
+    'BootstrapArenaContextAssemblyException': 'err.state.bootstrap.assembly.context.arena.exception',
+    'BootstrapBoardAssemblyException': 'err.state.bootstrap.assembly.board.exception',
+    'BootstrapBoardContextAssemblyException': 'err.state.bootstrap.assembly.context.board.exception',
+    'BootstrapContextAssemblyException': 'err.state.bootstrap.assembly.context.exception',
+    'BootstrapCoordAssemblyException': 'err.state.bootstrap.assembly.coord.exception',
+    'BootstrapCoordContextAssemblyException': 'err.state.bootstrap.assembly.context.coord.exception',
+    'BootstrapEdgeAssemblyException': 'err.state.bootstrap.assembly.edge.exception',
+    'BootstrapEdgeContextAssemblyException': 'err.state.bootstrap.assembly.context.edge.exception',
+    'BootstrapException': 'err.state.bootstrap.exception',
+    'BootstrapFormationContextAssemblyException': 'err.state.bootstrap.assembly.context.formation.exception',
+    'BootstrapGameAssemblyException': 'err.state.bootstrap.assembly.game.exception',
+    'BootstrapGameContextAssemblyException': 'err.state.bootstrap.assembly.context.game.exception',
+    'BootstrapHostageAssemblyException': 'err.state.bootstrap.assembly.hostage.exception',
+    'BootstrapHostageContextAssemblyException': 'err.state.bootstrap.assembly.context.hostage.exception',
+    'BootstrapNodeAssemblyException': 'err.state.bootstrap.assembly.node.exception',
+    'BootstrapNodeContextAssemblyException': 'err.state.bootstrap.assembly.context.node.exception',
+    'BootstrapPersonaContextAssemblyException': 'err.state.bootstrap.assembly.context.persona.exception',
+    'BootstrapPlayerAssemblyException': 'err.state.bootstrap.assembly.player.exception',
+    'BootstrapPlayerContextAssemblyException': 'err.state.bootstrap.assembly.context.player.exception',
+    'BootstrapRankAssemblyException': 'err.state.bootstrap.assembly.rank.exception',
+    'BootstrapRankContextAssemblyException': 'err.state.bootstrap.assembly.context.rank.exception',
+    'BootstrapScalarAssemblyException': 'err.state.bootstrap.assembly.scalar.exception',
+    'BootstrapSchemaContextAssemblyException': 'err.state.bootstrap.assembly.context.schema.exception',
+    'BootstrapSquareAssemblyException': 'err.state.bootstrap.assembly.square.exception',
+    'BootstrapSquareContextAssemblyException': 'err.state.bootstrap.assembly.context.square.exception',
+    'BootstrapTeamAssemblyException': 'err.state.bootstrap.assembly.team.exception',
+    'BootstrapTokenAssemblyException': 'err.state.bootstrap.assembly.token.exception',
+    'BootstrapTokenContextAssemblyException': 'err.state.bootstrap.assembly.context.token.exception',
+    'BootstrapperException': 'err.bootstrapper.exception',
+    'BuildPipelineException': 'err.pipeline.build.exception',
+    'BuildRouteException': 'err.route.build.exception',
+    'BuilderBootstrapperException': 'err.bootstrapper.builder.exception',
+    'BuilderException': ('err.operation.build.exception', 'err.builder.exception'),
+    'CapacityFullException': 'err.full.exception',
+    'CartesianOperandException': 'err.operand.cartesian.exception',
+    'CartesianPointException': 'err.domain.model.cartesian.exception',
+    'CartesianToggleCarrierException': 'err.domain.transit.toggle.cartesian.exception',
+    'CartesianToggleException': ('err.domain.structure.toggle.cartesian.exception', 'err.domain.structure.register.cartesian.exception'),
+    'CartesianToggleRegisterCarrierException': 'err.domain.transit.register.cartesian.exception',
+    'ChainException': 'err.collection.chain.exception',
+    'ChainNullException': 'err.null.collection.chain.exception',
+    'CheckSearcherException': 'err.search.check.exception',
+    'CheckedPathConsistencyAuditorException': 'err.assurance.auditor.path.checked.exception',
+    'CheckedPathConsistencyCheckerNullException': 'err.null.consistencey.path.checked.exception',
+    'CheckedPathException': 'err.domain.model.state.path.checked.exception',
+    'CheckedPathMicroserviceException': 'err.microservice.path.checked.exception',
+    'CheckedPathNullException': 'err.null.model.state.path.checked.exception',
+    'CheckedPathSearchHitConflictException': 'err.search.conflict.path.checked.exception',
+    'CheckedPathSearchResultEmptyException': 'err.search.empty.path.checked.exception',
+    'CheckedPathSearcherException': 'err.search.path.checked.exception',
+    'CheckedPathValidatorException': 'err.assurance.validator.model.state.path.checked.exception',
+    'ChessException': 'err.exception',
+    'CircularPathConsistencyAuditorException': 'err.assurance.auditor.path.circular.exception',
+    'CircularPathConsistencyCheckerNullException': 'err.null.consistencey.path.circular.exception',
+    'CircularPathException': 'err.domain.model.state.path.circular.exception',
+    'CollectionException': 'err.collection.exception',
+    'CollectionNullException': 'err.null.collection.exception',
+    'ColliderBootstrapperException': 'err.bootstrapper.detector.collider.exception',
+    'ColliderException': 'err.collider.exception',
+    'CollisionBootstrapperException': 'err.bootstrapper.collision.exception',
+    'CollisionDetectorException': 'err.detection.collision.exception',
+    'CombatantPathConsistencyAuditorException': 'err.assurance.auditor.path.combatant.exception',
+    'CombatantPathConsistencyCheckerNullException': 'err.null.consistencey.path.combatant.exception',
+    'CombatantPathException': 'err.domain.model.state.path.combatant.exception',
+    'CombatantPathMicroserviceException': 'err.microservice.path.combatant.exception',
+    'CombatantPathNullException': 'err.null.model.state.path.combatant.exception',
+    'CombatantPathSearchHitConflictException': 'err.search.conflict.path.combatant.exception',
+    'CombatantPathSearchResultEmptyException': 'err.search.empty.path.combatant.exception',
+    'CombatantPathSearcherException': 'err.search.path.combatant.exception',
+    'CombatantPathValidatorException': 'err.assurance.validator.model.state.path.combatant.exception',
+    'CombatantTokenConsistencyAuditorException': 'err.assurance.auditor.token.combatant.exception',
+    'CombatantTokenConsistencyCheckerNullException': 'err.null.consistencey.token.combatant.exception',
+    'CombatantTokenException': ('err.toolkit.token.combatant.exception', 'err.domain.model.state.token.combatant.exception'),
+    'ComputationTransactionException': 'err.transaction.compuation.exception',
+    'ConfigException': 'err.config.exception',
+    'ConsistencyAuditorException': 'err.assurance.auditor.exception',
+    'ConsistencyCheckerNullException': 'err.null.consistencey.exception',
+    'ContainerBuilderException': 'err.builder.container.exception',
+    'ContainerCarrierNullException': 'err.null.carrier.container.exception',
+    'ContainerEmptyException': 'err.empty.container.exception',
+    'ContainerSizeException': 'err.size.container.exception',
+    'ContextAssemblyException': ('err.state.assembly.context.exception', 'err.bootstrapper.operation.assembly.context.exception', 'err.operation.assembly.context.exception'),
+    'ContextBuildPipelineException': 'err.pipeline.build.context.exception',
+    'ContextBuildRouteException': 'err.route.build.context.exception',
+    'ContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.exception',
+    'ContextBuilderException': ('err.operation.build.context.exception', 'err.builder.context.exception'),
+    'ContextColliderBootstrapperException': 'err.bootstrapper.detector.collider.context.exception',
+    'ContextColliderException': 'err.collider.context.exception',
+    'ContextCollisionDetectorException': 'err.detection.collision.context.exception',
+    'ContextException': ('err.toolkit.context.exception', 'err.domain.search.context.exception'),
+    'ContextNoValidationRouteException': 'err.route.validation.context.exception',
+    'ContextNullException': 'err.null.context.exception',
+    'ContextSearchRouteException': 'err.route.search.context.exception',
+    'ContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.exception',
+    'ContextTokenOperationException': 'err.operation.token.context.exception',
+    'ContextTokenStateException': 'err.state.token.context.exception',
+    'ContextValidatorException': ('err.state.validation.context.exception', 'err.assurance.validator.toggle.context.exception'),
+    'ControllerException': 'err.controller.exception',
+    'CoordAssemblyException': ('err.state.assembly.coord.exception', 'err.bootstrapper.operation.assembly.coord.exception', 'err.operation.assembly.coord.exception'),
+    'CoordBinderAssemblyException': ('err.state.assembly.binder.coord.exception', 'err.bootstrapper.operation.assembly.binder.coord.exception', 'err.operation.assembly.binder.coord.exception'),
+    'CoordBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.coord.exception',
+    'CoordBinderBuilderException': ('err.operation.build.binder.coord.exception', 'err.builder.model.binder.coord.exception'),
+    'CoordBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.coord.exception',
+    'CoordBinderTokenOperationException': 'err.operation.token.binder.coord.exception',
+    'CoordBinderTokenStateException': 'err.state.token.binder.coord.exception',
+    'CoordBlueprintNullException': 'err.null.blueprint.model.coord.exception',
+    'CoordBuildPipelineException': 'err.pipeline.build.coord.exception',
+    'CoordBuildRouteException': 'err.route.build.coord.exception',
+    'CoordBuilderBootstrapperException': 'err.bootstrapper.builder.coord.exception',
+    'CoordBuilderException': ('err.operation.build.coord.exception', 'err.builder.model.coord.exception'),
+    'CoordCarrierException': 'err.domain.transit.model.coord.exception',
+    'CoordCarrierNullException': 'err.null.carrier.model.coord.exception',
+    'CoordCarrierValidatorException': 'err.assurance.validator.toggle.carrier.coord.exception',
+    'CoordColliderBootstrapperException': 'err.bootstrapper.detector.collider.coord.exception',
+    'CoordColliderException': 'err.collider.coord.exception',
+    'CoordCollisionDetectorException': 'err.detection.collision.coord.exception',
+    'CoordCollisionException': 'err.collider.attribute.coord.exception',
+    'CoordContextAssemblyException': ('err.state.assembly.context.coord.exception', 'err.bootstrapper.operation.assembly.context.coord.exception', 'err.operation.assembly.context.coord.exception'),
+    'CoordContextBuildPipelineException': 'err.pipeline.build.context.coord.exception',
+    'CoordContextBuildRouteException': 'err.route.build.context.coord.exception',
+    'CoordContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.coord.exception',
+    'CoordContextBuilderException': ('err.operation.build.context.coord.exception', 'err.builder.context.coord.exception'),
+    'CoordContextCollisionException': ('err.detection.collision.context.coord.exception', 'err.bootstrapper.detector.collider.context.coord.exception', 'err.collider.context.coord.exception'),
+    'CoordContextException': ('err.toolkit.context.coord.exception', 'err.domain.search.context.coord.exception'),
+    'CoordContextNullException': 'err.null.context.coord.exception',
+    'CoordContextSearchRouteException': 'err.route.search.context.coord.exception',
+    'CoordContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.coord.exception',
+    'CoordContextTokenOperationException': 'err.operation.token.context.coord.exception',
+    'CoordContextTokenStateException': 'err.state.token.context.coord.exception',
+    'CoordContextValidationRouteException': 'err.route.validation.context.coord.exception',
+    'CoordContextValidatorException': ('err.state.validation.context.coord.exception', 'err.assurance.validator.toggle.context.coord.exception'),
+    'CoordDatabaseNullException': 'err.null.database.coord.exception',
+    'CoordException': ('err.toolkit.coord.exception', 'err.domain.model.cartesian.coord.exception'),
+    'CoordIntegrityCheckerException': 'err.assurance.checker.model.coord.exception',
+    'CoordMicroserviceException': 'err.microservice.coord.exception',
+    'CoordModelNullException': 'err.null.model.coord.exception',
+    'CoordNoValidationRouteException': 'err.route.validation.coord.exception',
+    'CoordPushPermitterException': ('err.permitter.push.edge.exception', 'err.permitter.push.coord.exception'),
+    'CoordQueryFullException': 'err.full.query.coord.exception',
+    'CoordQueryNullException': 'err.null.query.coord.exception',
+    'CoordQueryStackEmptyException': 'err.empty.query.coord.exception',
+    'CoordQueryStackSizeException': 'err.size.query.coord.exception',
+    'CoordRegisterCarrierException': 'err.domain.transit.register.coord.exception',
+    'CoordSearchHitConflictException': 'err.search.conflict.coord.exception',
+    'CoordSearchResultEmptyException': 'err.search.empty.coord.exception',
+    'CoordSearchRouteException': 'err.route.search.coord.exception',
+    'CoordSearcherException': 'err.search.coord.exception',
+    'CoordStackEmptyException': 'err.empty.stack.coord.exception',
+    'CoordStackFullException': 'err.full.stack.coord.exception',
+    'CoordStackNullException': 'err.null.stack.coord.exception',
+    'CoordStackPushException': ('err.state.push.stack.coord.exception', 'err.bootstrapper.operation.push.stack.coord.exception', 'err.operation.push.stack.coord.exception'),
+    'CoordStackRegistrationException': ('err.state.registration.stack.coord.exception', 'err.bootstrapper.operation.registration.stack.coord.exception', 'err.operation.registration.stack.coord.exception'),
+    'CoordStackServiceException': 'err.collection.stack.coord.exception',
+    'CoordStackSizeException': 'err.size.stack.coord.exception',
+    'CoordToggleBlueprintNullException': 'err.null.blueprint.toggle.coord.exception',
+    'CoordToggleCheckerException': 'err.assurance.checker.toggle.coord.exception',
+    'CoordTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.coord.exception',
+    'CoordTokenOperationException': 'err.operation.token.coord.exception',
+    'CoordTokenStateException': 'err.state.token.coord.exception',
+    'CoordValidatorException': ('err.state.validation.coord.exception', 'err.assurance.validator.model.coord.exception'),
+    'DatabaseNullException': 'err.null.database.exception',
+    'DeferredChessException': 'err.deferred',
+    'DeletePermitterException': 'err.permitter.delete.exception',
+    'DeleterException': ('err.operation.deletion.exception', 'err.bootstrapper.operation.deletion.exception'),
+    'DeletionException': 'err.transaction.deletion.exception',
+    'DeletionPermitterBootstrapperException': 'err.bootstrapper.permitter.deletion.exception',
+    'DeletionRequestNullException': 'err.null.request.deletion.exception',
+    'DeletionRequestTesterException': 'err.tester.request.deletion.exception',
+    'DeltaException': 'err.domain.schema.delta.exception',
+    'DependencyListNullException': 'err.null.dependecy.exception',
+    'DestinationCertifierBootstrapperException': 'err.bootstrapper.validator.endpoint.destination.exception',
+    'DetectorBootstrapperException': 'err.bootstrapper.detector.exception',
+    'DetectorException': 'err.detection.exception',
+    'DevelopedAttackBasisEmptyException': 'err.empty.space.span.basis.pawn.attack.developed.exception',
+    'DevelopedAttackBasisSizeException': 'err.size.space.span.basis.pawn.attack.developed.exception',
+    'DevelopedAttackMovementSetEmptyException': 'err.empty.space.span.movement.pawn.attack.developed.exception',
+    'DevelopedAttackMovementSetSizeException': 'err.size.space.span.movement.pawn.attack.developed.exception',
+    'DevelopedAttackOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.pawn.attack.developed.exception',
+    'DevelopedAttackOffsetPatternBuilderException': 'err.builder.movement.pawn.attack.developed.exception',
+    'DevelopedAttackOffsetPatternCarrierException': 'err.domain.transit.movement.pawn.attack.developed.exception',
+    'DevelopedAttackOffsetPatternCarrierNullException': 'err.null.carrier.movement.pawn.attack.developed.exception',
+    'DevelopedAttackOffsetPatternException': 'err.movement.pawn.attack.developed.exception',
+    'DevelopedAttackOffsetPatternNullException': 'err.null.pattern.pawn.attack.developed.exception',
+    'DevelopedManeuverBasisEmptyException': 'err.empty.space.span.basis.pawn.maneuver.developed.exception',
+    'DevelopedManeuverBasisSizeException': 'err.size.space.span.basis.pawn.maneuver.developed.exception',
+    'DevelopedManeuverMovementSetEmptyException': 'err.empty.space.span.movement.pawn.maneuver.developed.exception',
+    'DevelopedManeuverMovementSetSizeException': 'err.size.space.span.movement.pawn.maneuver.developed.exception',
+    'DevelopedManeuverOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.pawn.maneuver.developed.exception',
+    'DevelopedManeuverOffsetPatternBuilderException': 'err.builder.movement.pawn.maneuver.developed.exception',
+    'DevelopedManeuverOffsetPatternCarrierException': 'err.domain.transit.movement.pawn.maneuver.developed.exception',
+    'DevelopedManeuverOffsetPatternCarrierNullException': 'err.null.carrier.movement.pawn.maneuver.developed.exception',
+    'DevelopedManeuverOffsetPatternException': 'err.movement.pawn.maneuver.developed.exception',
+    'DevelopedManeuverOffsetPatternNullException': 'err.null.pattern.pawn.maneuver.developed.exception',
+    'DisabledPawnConsistencyAuditorException': 'err.assurance.auditor.token.disabled.pawn.exception',
+    'DisabledPawnConsistencyCheckerNullException': 'err.null.consistencey.token.disabled.pawn.exception',
+    'DisabledPawnException': 'err.domain.model.state.token.disabled.pawn.exception',
+    'DisabledPawnPromotionConsistencyAuditorException': 'err.assurance.auditor.token.disabled.pawn.promotion.exception',
+    'DisabledPawnPromotionConsistencyCheckerNullException': 'err.null.consistencey.token.disabled.pawn.promotion.exception',
+    'DisabledPawnPromotionException': 'err.domain.model.state.token.disabled.pawn.promotion.exception',
+    'DisabledTokenConsistencyAuditorException': 'err.assurance.auditor.token.disabled.exception',
+    'DisabledTokenConsistencyCheckerNullException': 'err.null.consistencey.token.disabled.exception',
+    'DisabledTokenException': 'err.domain.model.state.token.disabled.exception',
+    'DisabledTokenLaunchAttackConsistencyAuditorException': 'err.assurance.auditor.token.disabled.attack.exception',
+    'DisabledTokenLaunchAttackConsistencyCheckerNullException': 'err.null.consistencey.token.disabled.attack.exception',
+    'DisabledTokenLaunchAttackException': 'err.domain.model.state.token.disabled.attack.exception',
+    'DisabledTokenManeuverConsistencyAuditorException': 'err.assurance.auditor.token.disabled.maneuver.exception',
+    'DisabledTokenManeuverConsistencyCheckerNullException': 'err.null.consistencey.token.disabled.maneuver.exception',
+    'DisabledTokenManeuverException': ('err.operation.maneuver.disability.exception', 'err.domain.model.state.token.disabled.maneuver.exception', 'err.bootstrapper.operation.maneuver.disability.exception'),
+    'DisabledTokenUndoMoveConsistencyAuditorException': 'err.assurance.auditor.token.disabled.maneuver.undo.exception',
+    'DisabledTokenUndoMoveConsistencyCheckerNullException': 'err.null.consistencey.token.disabled.maneuver.undo.exception',
+    'DisabledTokenUndoMoveException': 'err.domain.model.state.token.disabled.maneuver.undo.exception',
+    'DomainMetadataException': 'err.domain.metadata.exception',
+    'DomainObjectException': 'err.domain.exception',
+    'DossierChainException': 'err.collection.chain.dossier.exception',
+    'DossierNodeBlueprintNullException': 'err.null.blueprint.node.dossier.exception',
+    'DossierNodeCarrierNullException': 'err.null.carrier.node.dossier.exception',
+    'DossierNodeException': 'err.domain.structure.node.dossier.exception',
+    'DossierNodeNullException': 'err.null.node.dossier.exception',
+    'DtoBuilderBootstrapperException': 'err.bootstrapper.builder.dto.exception',
+    'DtoBuilderException': 'err.builder.dto.exception',
+    'DuplicateArenaException': 'err.duplicate.arena.exception',
+    'DuplicateArenaPushException': ('err.transaction.insertion.duplicate.arena.exception', 'err.state.push.duplicate.arena.exception'),
+    'DuplicateBoardException': 'err.duplicate.board.exception',
+    'DuplicateBoardPushException': ('err.transaction.insertion.duplicate.board.exception', 'err.state.push.duplicate.board.exception'),
+    'DuplicateCoordException': 'err.duplicate.coord.exception',
+    'DuplicateCoordPushException': ('err.transaction.insertion.duplicate.coord.exception', 'err.state.push.duplicate.coord.exception'),
+    'DuplicateEdgeException': 'err.duplicate.edge.exception',
+    'DuplicateEdgePushException': ('err.transaction.insertion.duplicate.edge.exception', 'err.state.push.duplicate.edge.exception'),
+    'DuplicateGameException': 'err.duplicate.game.exception',
+    'DuplicateGamePushException': ('err.transaction.insertion.duplicate.game.exception', 'err.state.push.duplicate.game.exception'),
+    'DuplicateGraphPushException': 'err.transaction.insertion.duplicate.graph.exception',
+    'DuplicateHostagePushException': ('err.transaction.insertion.duplicate.hostage.exception', 'err.state.push.duplicate.hostage.exception'),
+    'DuplicateItemException': 'err.duplicate.exception',
+    'DuplicateNodeException': 'err.duplicate.node.exception',
+    'DuplicateNodePushException': ('err.transaction.insertion.duplicate.node.exception', 'err.state.push.duplicate.node.exception'),
+    'DuplicatePlayerException': 'err.duplicate.player.exception',
+    'DuplicatePlayerPushException': ('err.transaction.insertion.duplicate.player.exception', 'err.state.push.duplicate.player.exception'),
+    'DuplicatePrisonerException': 'err.duplicate.prisoner.exception',
+    'DuplicatePushException': 'err.state.push.duplicate.exception',
+    'DuplicateSquareException': 'err.duplicate.square.exception',
+    'DuplicateSquarePushException': ('err.transaction.insertion.duplicate.square.exception', 'err.state.push.duplicate.square.exception'),
+    'DuplicateStackPushException': 'err.transaction.insertion.duplicate.exception',
+    'DuplicateTeamException': 'err.duplicate.team.exception',
+    'DuplicateTeamPushException': ('err.transaction.insertion.duplicate.team.exception', 'err.state.push.duplicate.team.exception'),
+    'DuplicateTokenException': 'err.duplicate.token.exception',
+    'DuplicateTokenPushException': ('err.transaction.insertion.duplicate.token.exception', 'err.state.push.duplicate.token.exception'),
+    'EastAxisBlueprintNullException': 'err.null.blueprint.space.axis.east.exception',
+    'EastAxisBuilderException': 'err.builder.space.axis.east.exception',
+    'EastAxisCarrierException': 'err.domain.transit.space.axis.east.exception',
+    'EastAxisCarrierNullException': 'err.null.carrier.space.axis.east.exception',
+    'EastAxisCheckerException': 'err.assurance.checker.space.axis.east.exception',
+    'EastAxisException': 'err.space.axis.southeast.exception',
+    'EastAxisMappingFunctionException': 'err.mapper.axis.east.exception',
+    'EastAxisNullException': 'err.null.space.axis.east.exception',
+    'EastAxisValidatorException': 'err.assurance.validator.space.axis.east.exception',
+    'EastQuadrantRecurrenceBuilderException': 'err.builder.recurrence.axis.east.exception',
+    'EastQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.axis.east.exception',
+    'EastQuadrantRecurrenceException': 'err.recurrence.axis.east.exception',
+    'EastQuadrantRecurrenceNullException': 'err.null.recurrence.axis.east.exception',
+    'EastQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.axis.east.exception',
+    'EdgeAssemblyException': ('err.state.assembly.edge.exception', 'err.bootstrapper.operation.assembly.edge.exception', 'err.operation.assembly.edge.exception'),
+    'EdgeBinderAssemblyException': ('err.state.assembly.binder.edge.exception', 'err.bootstrapper.operation.assembly.binder.edge.exception', 'err.operation.assembly.binder.edge.exception'),
+    'EdgeBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.edge.exception',
+    'EdgeBinderBuilderException': ('err.operation.build.binder.edge.exception', 'err.builder.model.binder.edge.exception'),
+    'EdgeBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.edge.exception',
+    'EdgeBinderTokenOperationException': 'err.operation.token.binder.edge.exception',
+    'EdgeBinderTokenStateException': 'err.state.token.binder.edge.exception',
+    'EdgeBlueprintNullException': 'err.null.blueprint.model.edge.exception',
+    'EdgeBuildPipelineException': 'err.pipeline.build.edge.exception',
+    'EdgeBuildRouteException': 'err.route.build.edge.exception',
+    'EdgeBuilderBootstrapperException': 'err.bootstrapper.builder.edge.exception',
+    'EdgeBuilderException': ('err.operation.build.edge.exception', 'err.builder.model.edge.exception'),
+    'EdgeCarrierException': 'err.domain.transit.model.edge.exception',
+    'EdgeCarrierNullException': 'err.null.carrier.model.edge.exception',
+    'EdgeCarrierValidatorException': 'err.assurance.validator.toggle.carrier.edge.exception',
+    'EdgeColliderBootstrapperException': 'err.bootstrapper.detector.collider.edge.exception',
+    'EdgeColliderException': 'err.collider.edge.exception',
+    'EdgeCollisionDetectorException': 'err.detection.collision.edge.exception',
+    'EdgeConsistencyAuditorException': 'err.assurance.auditor.edge.exception',
+    'EdgeConsistencyCheckerNullException': 'err.null.consistencey.edge.exception',
+    'EdgeContextAssemblyException': ('err.state.assembly.context.edge.exception', 'err.bootstrapper.operation.assembly.context.edge.exception', 'err.operation.assembly.context.edge.exception'),
+    'EdgeContextBuildPipelineException': 'err.pipeline.build.context.edge.exception',
+    'EdgeContextBuildRouteException': 'err.route.build.context.edge.exception',
+    'EdgeContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.edge.exception',
+    'EdgeContextBuilderException': ('err.operation.build.context.edge.exception', 'err.builder.context.edge.exception'),
+    'EdgeContextCollisionException': ('err.detection.collision.context.edge.exception', 'err.bootstrapper.detector.collider.context.edge.exception', 'err.collider.context.edge.exception'),
+    'EdgeContextException': ('err.toolkit.context.edge.exception', 'err.domain.search.context.edge.exception'),
+    'EdgeContextNullException': 'err.null.context.edge.exception',
+    'EdgeContextSearchRouteException': 'err.route.search.context.edge.exception',
+    'EdgeContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.edge.exception',
+    'EdgeContextTokenOperationException': 'err.operation.token.context.edge.exception',
+    'EdgeContextTokenStateException': 'err.state.token.context.edge.exception',
+    'EdgeContextValidationRouteException': 'err.route.validation.context.edge.exception',
+    'EdgeContextValidatorException': ('err.state.validation.context.edge.exception', 'err.assurance.validator.toggle.context.edge.exception'),
+    'EdgeDatabaseNullException': 'err.null.database.edge.exception',
+    'EdgeException': ('err.toolkit.edge.exception', 'err.domain.model.state.edge.exception', 'err.domain.graph.edge.exception'),
+    'EdgeIntegrityCheckerException': 'err.assurance.checker.model.edge.exception',
+    'EdgeMicroserviceException': 'err.microservice.edge.exception',
+    'EdgeNoValidationRouteException': 'err.route.validation.edge.exception',
+    'EdgeNullException': 'err.null.model.state.edge.exception',
+    'EdgeQueryFullException': 'err.full.query.edge.exception',
+    'EdgeQueryNullException': 'err.null.query.edge.exception',
+    'EdgeQueryStackEmptyException': 'err.empty.query.edge.exception',
+    'EdgeQueryStackSizeException': 'err.size.query.edge.exception',
+    'EdgeRegisterCarrierException': 'err.domain.transit.register.edge.exception',
+    'EdgeSearchHitConflictException': 'err.search.conflict.edge.exception',
+    'EdgeSearchResultEmptyException': 'err.search.empty.edge.exception',
+    'EdgeSearchRouteException': 'err.route.search.edge.exception',
+    'EdgeSearcherException': 'err.search.edge.exception',
+    'EdgeStackEmptyException': 'err.empty.stack.edge.exception',
+    'EdgeStackFullException': 'err.full.stack.edge.exception',
+    'EdgeStackNullException': 'err.null.stack.edge.exception',
+    'EdgeStackPushException': ('err.state.push.stack.edge.exception', 'err.bootstrapper.operation.push.stack.edge.exception', 'err.operation.push.stack.edge.exception'),
+    'EdgeStackRegistrationException': ('err.state.registration.stack.edge.exception', 'err.bootstrapper.operation.registration.stack.edge.exception', 'err.operation.registration.stack.edge.exception'),
+    'EdgeStackServiceException': 'err.collection.stack.edge.exception',
+    'EdgeStackSizeException': 'err.size.stack.edge.exception',
+    'EdgeToggleBlueprintNullException': 'err.null.blueprint.toggle.edge.exception',
+    'EdgeToggleCheckerException': 'err.assurance.checker.toggle.edge.exception',
+    'EdgeTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.edge.exception',
+    'EdgeTokenOperationException': 'err.operation.token.edge.exception',
+    'EdgeTokenStateException': 'err.state.token.edge.exception',
+    'EdgeValidatorException': ('err.state.validation.edge.exception', 'err.assurance.validator.model.state.edge.exception'),
+    'EmptyArenaStackDeletionException': 'err.transaction.deletion.empty.arena.exception',
+    'EmptyBoardStackDeletionException': 'err.transaction.deletion.empty.board.exception',
+    'EmptyCoordStackDeletionException': 'err.transaction.deletion.empty.coord.exception',
+    'EmptyDependencyListException': 'err.toolkit.dependency.exception',
+    'EmptyEdgeStackDeletionException': 'err.transaction.deletion.empty.edge.exception',
+    'EmptyException': 'err.empty.exception',
+    'EmptyGameStackDeletionException': 'err.transaction.deletion.empty.game.exception',
+    'EmptyGraphStackDeletionException': 'err.transaction.deletion.empty.graph.exception',
+    'EmptyHostageStackDeletionException': 'err.transaction.deletion.empty.hostage.exception',
+    'EmptyListException': 'err.array.empty.exception',
+    'EmptyNodeStackDeletionException': 'err.transaction.deletion.empty.node.exception',
+    'EmptyPlayerStackDeletionException': 'err.transaction.deletion.empty.player.exception',
+    'EmptySquareStackDeletionException': 'err.transaction.deletion.empty.square.exception',
+    'EmptyStackDeletionException': 'err.transaction.deletion.empty.exception',
+    'EmptyTeamStackDeletionException': 'err.transaction.deletion.empty.team.exception',
+    'EmptyTokenStackDeletionException': 'err.transaction.deletion.empty.token.exception',
+    'EnemyCombatantAnalyzerException': 'err.analyzer.friend.combatant.exception',
+    'EnemyKingAnalyzerException': 'err.analyzer.friend.king.exception',
+    'EntityCarrierException': 'err.domain.transit.exception',
+    'EntityCarrierNullException': 'err.null.carrier.exception',
+    'EntityCarrierValidatorException': ('err.assurance.validator.toggle.exception', 'err.assurance.validator.toggle.carrier.exception'),
+    'ExcessArenaBlueprintFlagsException': 'err.assurance.checker.excess.arena.exception',
+    'ExcessArenaToggleActivationException': 'err.state.validation.context.excess.arena.exception',
+    'ExcessBlueprintFlagsException': 'err.assurance.checker.excess.exception',
+    'ExcessBoardBlueprintFlagsException': 'err.assurance.checker.excess.board.exception',
+    'ExcessBoardToggleActivationException': 'err.state.validation.context.excess.board.exception',
+    'ExcessContextFlagsException': 'err.state.validation.context.excess.exception',
+    'ExcessCoordBlueprintFlagsException': 'err.assurance.checker.excess.coord.exception',
+    'ExcessCoordToggleActivationException': 'err.state.validation.context.excess.coord.exception',
+    'ExcessEdgeBlueprintFlagsException': 'err.assurance.checker.excess.edge.exception',
+    'ExcessEdgeToggleActivationException': 'err.state.validation.context.excess.edge.exception',
+    'ExcessFormationBlueprintFlagsException': 'err.assurance.checker.excess.formation.exception',
+    'ExcessFormationToggleActivationException': 'err.state.validation.context.excess.formation.exception',
+    'ExcessGameBlueprintFlagsException': 'err.assurance.checker.excess.game.exception',
+    'ExcessGameToggleActivationException': 'err.state.validation.context.excess.game.exception',
+    'ExcessHostageBlueprintFlagsException': 'err.assurance.checker.excess.hostage.exception',
+    'ExcessHostageToggleActivationException': 'err.state.validation.context.excess.hostage.exception',
+    'ExcessNodeBlueprintFlagsException': 'err.assurance.checker.excess.node.exception',
+    'ExcessNodeToggleActivationException': 'err.state.validation.context.excess.node.exception',
+    'ExcessOrientationToggleActivationException': 'err.assurance.validator.toggle.excess.orientation.exception',
+    'ExcessPersonaBlueprintFlagsException': 'err.assurance.checker.excess.persona.exception',
+    'ExcessPersonaToggleActivationException': 'err.state.validation.context.excess.persona.exception',
+    'ExcessPlayerBlueprintFlagsException': 'err.assurance.checker.excess.player.exception',
+    'ExcessPlayerToggleActivationException': 'err.state.validation.context.excess.player.exception',
+    'ExcessRankBlueprintFlagsException': 'err.assurance.checker.excess.rank.exception',
+    'ExcessRankToggleActivationException': 'err.state.validation.context.excess.rank.exception',
+    'ExcessSchemaBlueprintFlagsException': 'err.assurance.checker.excess.schema.exception',
+    'ExcessSchemaToggleActivationException': 'err.state.validation.context.excess.schema.exception',
+    'ExcessSquareBlueprintFlagsException': 'err.assurance.checker.excess.square.exception',
+    'ExcessSquareToggleActivationException': 'err.state.validation.context.excess.square.exception',
+    'ExcessTeamBlueprintFlagsException': 'err.assurance.checker.excess.team.exception',
+    'ExcessTeamToggleActivationException': 'err.state.validation.context.excess.team.exception',
+    'ExcessToggleActivationException': 'err.assurance.validator.toggle.excess.exception',
+    'ExcessTokenBlueprintFlagsException': 'err.assurance.checker.excess.token.exception',
+    'ExcessTokenToggleActivationException': 'err.state.validation.context.excess.token.exception',
+    'ExcessVectorToggleActivationException': 'err.assurance.validator.toggle.excess.vector.exception',
+    'ExcessVectorToggleFlagsException': ('err.state.validation.context.excess.operand.exception', 'err.assurance.checker.excess.operand.exception'),
+    'ExchangeObjectException': 'err.domain.exchange.exception',
+    'ExecutionRouteException': 'err.route.exception',
+    'FactoryException': 'err.factory.exception',
+    'FinalizationException': ('err.state.finalize.exception', 'err.bootstrapper.operation.finalize.exception', 'err.operation.finalize.exception'),
+    'FinalizeArenaBuilderException': 'err.operation.finalize.build.arena.exception',
+    'FinalizeArenaContextBuilderException': 'err.operation.finalize.build.context.arena.exception',
+    'FinalizeBoardBuilderException': 'err.operation.finalize.build.board.exception',
+    'FinalizeBoardContextBuilderException': 'err.operation.finalize.build.context.board.exception',
+    'FinalizeBuilderException': 'err.operation.finalize.build.exception',
+    'FinalizeContextBuilderException': 'err.operation.finalize.build.context.exception',
+    'FinalizeCoordBuilderException': 'err.operation.finalize.build.coord.exception',
+    'FinalizeCoordContextBuilderException': 'err.operation.finalize.build.context.coord.exception',
+    'FinalizeEdgeBuilderException': 'err.operation.finalize.build.edge.exception',
+    'FinalizeEdgeContextBuilderException': 'err.operation.finalize.build.context.edge.exception',
+    'FinalizeFormationContextBuilderException': 'err.operation.finalize.build.context.formation.exception',
+    'FinalizeGameBuilderException': 'err.operation.finalize.build.game.exception',
+    'FinalizeGameContextBuilderException': 'err.operation.finalize.build.context.game.exception',
+    'FinalizeHostageBuilderException': 'err.operation.finalize.build.hostage.exception',
+    'FinalizeHostageContextBuilderException': 'err.operation.finalize.build.context.hostage.exception',
+    'FinalizeNodeBuilderException': 'err.operation.finalize.build.node.exception',
+    'FinalizeNodeContextBuilderException': 'err.operation.finalize.build.context.node.exception',
+    'FinalizePersonaContextBuilderException': 'err.operation.finalize.build.context.persona.exception',
+    'FinalizePlayerBuilderException': 'err.operation.finalize.build.player.exception',
+    'FinalizePlayerContextBuilderException': 'err.operation.finalize.build.context.player.exception',
+    'FinalizeRankBuilderException': 'err.operation.finalize.build.rank.exception',
+    'FinalizeRankContextBuilderException': 'err.operation.finalize.build.context.rank.exception',
+    'FinalizeScalarBuilderException': 'err.operation.finalize.build.scalar.exception',
+    'FinalizeSchemaContextBuilderException': 'err.operation.finalize.build.context.schema.exception',
+    'FinalizeSquareBuilderException': 'err.operation.finalize.build.square.exception',
+    'FinalizeSquareContextBuilderException': 'err.operation.finalize.build.context.square.exception',
+    'FinalizeTeamBuilderException': 'err.operation.finalize.build.team.exception',
+    'FinalizeTokenBuilderException': 'err.operation.finalize.build.token.exception',
+    'FinalizeTokenContextBuilderException': 'err.operation.finalize.build.context.token.exception',
+    'FinalizeVectorBuilderException': 'err.operation.finalize.build.vector.exception',
+    'FormationAssemblyBootstrapperException': 'err.state.bootstrap.assembly.formation.exception',
+    'FormationAssemblyException': ('err.state.assembly.formation.exception', 'err.bootstrapper.operation.assembly.formation.exception', 'err.operation.assembly.formation.exception'),
+    'FormationAssemblyPrimerException': ('err.operation.primer.assembly.formation.exception', 'err.bootstrapper.operation.primer.assembly.formation.exception'),
+    'FormationBinderAssemblyException': ('err.state.assembly.binder.formation.exception', 'err.bootstrapper.operation.assembly.binder.formation.exception', 'err.operation.assembly.binder.formation.exception'),
+    'FormationBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.formation.exception',
+    'FormationBinderBuilderException': ('err.operation.build.binder.formation.exception', 'err.builder.model.binder.formation.exception'),
+    'FormationBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.formation.exception',
+    'FormationBinderTokenOperationException': 'err.operation.token.binder.formation.exception',
+    'FormationBinderTokenStateException': 'err.state.token.binder.formation.exception',
+    'FormationBuildRouteException': 'err.route.build.formation.exception',
+    'FormationBuilderBootstrapperException': 'err.bootstrapper.builder.formation.exception',
+    'FormationBuilderException': 'err.operation.build.formation.exception',
+    'FormationColliderBootstrapperException': 'err.bootstrapper.detector.collider.formation.exception',
+    'FormationColliderException': 'err.collider.formation.exception',
+    'FormationCollisionDetectorException': 'err.detection.collision.formation.exception',
+    'FormationContextAssemblyException': ('err.state.assembly.context.formation.exception', 'err.bootstrapper.operation.assembly.context.formation.exception', 'err.operation.assembly.context.formation.exception'),
+    'FormationContextBuildPipelineException': 'err.pipeline.build.context.formation.exception',
+    'FormationContextBuildRouteException': 'err.route.build.context.formation.exception',
+    'FormationContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.formation.exception',
+    'FormationContextBuilderException': ('err.operation.build.context.formation.exception', 'err.builder.context.formation.exception'),
+    'FormationContextCollisionException': ('err.detection.collision.context.formation.exception', 'err.bootstrapper.detector.collider.context.formation.exception', 'err.collider.context.formation.exception'),
+    'FormationContextException': ('err.toolkit.context.formation.exception', 'err.domain.search.context.formation.exception'),
+    'FormationContextNullException': 'err.null.context.formation.exception',
+    'FormationContextSearchRouteException': 'err.route.search.context.formation.exception',
+    'FormationContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.formation.exception',
+    'FormationContextTokenOperationException': 'err.operation.token.context.formation.exception',
+    'FormationContextTokenStateException': 'err.state.token.context.formation.exception',
+    'FormationContextValidationRouteException': 'err.route.validation.context.formation.exception',
+    'FormationContextValidatorException': 'err.state.validation.context.formation.exception',
+    'FormationException': ('err.toolkit.formation.exception', 'err.domain.schema.formation.exception'),
+    'FormationFinalizeBuilderException': 'err.operation.finalize.build.formation.exception',
+    'FormationMicroserviceException': 'err.microservice.formation.exception',
+    'FormationNoValidationRouteException': 'err.route.validation.formation.exception',
+    'FormationNullException': 'err.null.schema.formation.exception',
+    'FormationQueryFullException': 'err.full.query.formation.exception',
+    'FormationQueryNullException': 'err.null.query.formation.exception',
+    'FormationQueryStackEmptyException': 'err.empty.query.formation.exception',
+    'FormationQueryStackSizeException': 'err.size.query.formation.exception',
+    'FormationSearchRouteException': 'err.route.search.formation.exception',
+    'FormationTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.formation.exception',
+    'FormationTokenOperationException': 'err.operation.token.formation.exception',
+    'FormationTokenStateException': 'err.state.token.formation.exception',
+    'FormationValidatorException': 'err.state.validation.formation.exception',
+    'FriendshipAnalyzerException': 'err.analyzer.friend.exception',
+    'GameAssemblyException': ('err.state.assembly.game.exception', 'err.bootstrapper.operation.assembly.game.exception', 'err.operation.assembly.game.exception'),
+    'GameBinderAssemblyException': ('err.state.assembly.binder.game.exception', 'err.bootstrapper.operation.assembly.binder.game.exception', 'err.operation.assembly.binder.game.exception'),
+    'GameBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.game.exception',
+    'GameBinderBuilderException': ('err.operation.build.binder.game.exception', 'err.builder.model.binder.game.exception'),
+    'GameBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.game.exception',
+    'GameBinderTokenOperationException': 'err.operation.token.binder.game.exception',
+    'GameBinderTokenStateException': 'err.state.token.binder.game.exception',
+    'GameBlueprintNullException': 'err.null.blueprint.model.game.exception',
+    'GameBuildPipelineException': 'err.pipeline.build.game.exception',
+    'GameBuildRouteException': 'err.route.build.game.exception',
+    'GameBuilderBootstrapperException': 'err.bootstrapper.builder.game.exception',
+    'GameBuilderException': ('err.operation.build.game.exception', 'err.builder.model.game.exception'),
+    'GameCarrierException': 'err.domain.transit.model.game.exception',
+    'GameCarrierNullException': 'err.null.carrier.model.game.exception',
+    'GameCarrierValidatorException': 'err.assurance.validator.toggle.carrier.game.exception',
+    'GameColliderBootstrapperException': 'err.bootstrapper.detector.collider.game.exception',
+    'GameColliderException': 'err.collider.game.exception',
+    'GameCollisionDetectorException': 'err.detection.collision.game.exception',
+    'GameColorException': 'err.config.gui.color.exception',
+    'GameColorNullException': 'err.null.color.exception',
+    'GameConsistencyAuditorException': 'err.assurance.auditor.game.exception',
+    'GameConsistencyCheckerNullException': 'err.null.consistencey.game.exception',
+    'GameContextAssemblyException': ('err.state.assembly.context.game.exception', 'err.bootstrapper.operation.assembly.context.game.exception', 'err.operation.assembly.context.game.exception'),
+    'GameContextBuildPipelineException': 'err.pipeline.build.context.game.exception',
+    'GameContextBuildRouteException': 'err.route.build.context.game.exception',
+    'GameContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.game.exception',
+    'GameContextBuilderException': ('err.operation.build.context.game.exception', 'err.builder.context.game.exception'),
+    'GameContextCollisionException': ('err.detection.collision.context.game.exception', 'err.bootstrapper.detector.collider.context.game.exception', 'err.collider.context.game.exception'),
+    'GameContextException': ('err.toolkit.context.game.exception', 'err.domain.search.context.game.exception'),
+    'GameContextNullException': 'err.null.context.game.exception',
+    'GameContextSearchRouteException': 'err.route.search.context.game.exception',
+    'GameContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.game.exception',
+    'GameContextTokenOperationException': 'err.operation.token.context.game.exception',
+    'GameContextTokenStateException': 'err.state.token.context.game.exception',
+    'GameContextValidationRouteException': 'err.route.validation.context.game.exception',
+    'GameContextValidatorException': ('err.state.validation.context.game.exception', 'err.assurance.validator.toggle.context.game.exception'),
+    'GameDatabaseNullException': 'err.null.database.game.exception',
+    'GameEmptyException': 'err.empty.model.game.exception',
+    'GameException': ('err.toolkit.game.exception', 'err.domain.model.state.game.exception'),
+    'GameIntegrityCheckerException': 'err.assurance.checker.model.game.exception',
+    'GameMicroserviceException': 'err.microservice.game.exception',
+    'GameNoValidationRouteException': 'err.route.validation.game.exception',
+    'GameNullException': 'err.null.model.state.game.exception',
+    'GameQueryFullException': 'err.full.query.game.exception',
+    'GameQueryNullException': 'err.null.query.game.exception',
+    'GameQueryStackEmptyException': 'err.empty.query.game.exception',
+    'GameQueryStackSizeException': 'err.size.query.game.exception',
+    'GameRegisterCarrierException': 'err.domain.transit.register.game.exception',
+    'GameSearchHitConflictException': 'err.search.conflict.game.exception',
+    'GameSearchResultEmptyException': 'err.search.empty.game.exception',
+    'GameSearchRouteException': 'err.route.search.game.exception',
+    'GameSearcherException': 'err.search.game.exception',
+    'GameSizeException': 'err.size.model.game.exception',
+    'GameStackEmptyException': 'err.empty.stack.game.exception',
+    'GameStackFullException': 'err.full.stack.game.exception',
+    'GameStackNullException': 'err.null.stack.game.exception',
+    'GameStackPushException': ('err.state.push.stack.game.exception', 'err.bootstrapper.operation.push.stack.game.exception', 'err.operation.push.stack.game.exception'),
+    'GameStackRegistrationException': ('err.state.registration.stack.game.exception', 'err.bootstrapper.operation.registration.stack.game.exception', 'err.operation.registration.stack.game.exception'),
+    'GameStackServiceException': 'err.collection.stack.game.exception',
+    'GameStackSizeException': 'err.size.stack.game.exception',
+    'GameToggleBlueprintNullException': 'err.null.blueprint.toggle.game.exception',
+    'GameToggleCheckerException': 'err.assurance.checker.toggle.game.exception',
+    'GameTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.game.exception',
+    'GameTokenOperationException': 'err.operation.token.game.exception',
+    'GameTokenStateException': 'err.state.token.game.exception',
+    'GameValidatorException': ('err.state.validation.game.exception', 'err.assurance.validator.model.state.game.exception'),
+    'GraphComponentException': 'err.domain.graph.exception',
+    'GraphEmptyException': 'err.empty.graph.exception',
+    'GraphFullException': 'err.full.graph.exception',
+    'GraphSearchHitConflictException': 'err.search.conflict.graph.exception',
+    'GraphSearchResultEmptyException': 'err.search.empty.graph.exception',
+    'GraphSearcherException': 'err.search.graph.exception',
+    'GraphSizeException': 'err.size.graph.exception',
+    'HashtableConsistencyAuditorException': 'err.assurance.auditor.hashtable.exception',
+    'HashtableConsistencyCheckerNullException': 'err.null.consistencey.hashtable.exception',
+    'HashtableException': 'err.toolkit.hashtable.exception',
+    'HomeDetectorBootstrapperException': 'err.bootstrapper.detector.home.exception',
+    'HomeSquareAlreadyClaimedException': 'err.analyzer.claim.exist.exception',
+    'HomeSquareClaimAnalyzerException': 'err.analyzer.claim.exception',
+    'HomeSquareDetectorException': 'err.detection.home.exception',
+    'HomeSquareSearchResultEmptyException': 'err.search.empty.home.exception',
+    'HostageAssemblyException': ('err.state.assembly.hostage.exception', 'err.bootstrapper.operation.assembly.hostage.exception', 'err.operation.assembly.hostage.exception'),
+    'HostageAssemblyPrimerException': ('err.operation.primer.assembly.hostage.exception', 'err.bootstrapper.operation.primer.assembly.hostage.exception'),
+    'HostageBinderAssemblyException': ('err.state.assembly.binder.hostage.exception', 'err.bootstrapper.operation.assembly.binder.hostage.exception', 'err.operation.assembly.binder.hostage.exception'),
+    'HostageBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.hostage.exception',
+    'HostageBinderBuilderException': ('err.operation.build.binder.hostage.exception', 'err.builder.model.binder.hostage.exception'),
+    'HostageBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.hostage.exception',
+    'HostageBinderTokenOperationException': 'err.operation.token.binder.hostage.exception',
+    'HostageBinderTokenStateException': 'err.state.token.binder.hostage.exception',
+    'HostageBuildPipelineException': 'err.pipeline.build.hostage.exception',
+    'HostageBuildRouteException': 'err.route.build.hostage.exception',
+    'HostageBuilderBootstrapperException': 'err.bootstrapper.builder.hostage.exception',
+    'HostageBuilderException': 'err.operation.build.hostage.exception',
+    'HostageCarrierValidatorException': 'err.assurance.validator.toggle.carrier.hostage.exception',
+    'HostageColliderBootstrapperException': 'err.bootstrapper.detector.collider.hostage.exception',
+    'HostageColliderException': 'err.collider.hostage.exception',
+    'HostageCollisionDetectorException': 'err.detection.collision.hostage.exception',
+    'HostageConsistencyAuditorException': 'err.assurance.auditor.hostage.exception',
+    'HostageConsistencyCheckerNullException': 'err.null.consistencey.hostage.exception',
+    'HostageContextAssemblyException': ('err.state.assembly.context.hostage.exception', 'err.bootstrapper.operation.assembly.context.hostage.exception', 'err.operation.assembly.context.hostage.exception'),
+    'HostageContextBuildPipelineException': 'err.pipeline.build.context.hostage.exception',
+    'HostageContextBuildRouteException': 'err.route.build.context.hostage.exception',
+    'HostageContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.hostage.exception',
+    'HostageContextBuilderException': ('err.operation.build.context.hostage.exception', 'err.builder.context.hostage.exception'),
+    'HostageContextCollisionException': ('err.detection.collision.context.hostage.exception', 'err.bootstrapper.detector.collider.context.hostage.exception', 'err.collider.context.hostage.exception'),
+    'HostageContextException': ('err.toolkit.context.hostage.exception', 'err.domain.search.context.hostage.exception'),
+    'HostageContextNullException': 'err.null.context.hostage.exception',
+    'HostageContextSearchRouteException': 'err.route.search.context.hostage.exception',
+    'HostageContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.hostage.exception',
+    'HostageContextTokenOperationException': 'err.operation.token.context.hostage.exception',
+    'HostageContextTokenStateException': 'err.state.token.context.hostage.exception',
+    'HostageContextValidationRouteException': 'err.route.validation.context.hostage.exception',
+    'HostageContextValidatorException': ('err.state.validation.context.hostage.exception', 'err.assurance.validator.toggle.context.hostage.exception'),
+    'HostageDatabaseNullException': 'err.null.database.hostage.exception',
+    'HostageException': 'err.toolkit.hostage.exception',
+    'HostageMicroserviceException': 'err.microservice.hostage.exception',
+    'HostageNoValidationRouteException': 'err.route.validation.hostage.exception',
+    'HostageQueryFullException': 'err.full.query.hostage.exception',
+    'HostageQueryNullException': 'err.null.query.hostage.exception',
+    'HostageQueryStackEmptyException': 'err.empty.query.hostage.exception',
+    'HostageQueryStackSizeException': 'err.size.query.hostage.exception',
+    'HostageSearchRouteException': 'err.route.search.hostage.exception',
+    'HostageStackEmptyException': 'err.empty.stack.hostage.exception',
+    'HostageStackPushException': ('err.state.push.stack.hostage.exception', 'err.bootstrapper.operation.push.stack.hostage.exception', 'err.operation.push.stack.hostage.exception'),
+    'HostageStackRegistrationException': ('err.state.registration.stack.hostage.exception', 'err.bootstrapper.operation.registration.stack.hostage.exception', 'err.operation.registration.stack.hostage.exception'),
+    'HostageStackServiceException': 'err.collection.stack.hostage.exception',
+    'HostageStackSizeException': 'err.size.stack.hostage.exception',
+    'HostageTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.hostage.exception',
+    'HostageTokenOperationException': 'err.operation.token.hostage.exception',
+    'HostageTokenStateException': 'err.state.token.hostage.exception',
+    'HostageValidatorException': 'err.state.validation.hostage.exception',
+    'HumanPlayerConsistencyAuditorException': 'err.assurance.auditor.player.human.exception',
+    'HumanPlayerConsistencyCheckerNullException': 'err.null.consistencey.player.human.exception',
+    'HumanPlayerException': ('err.toolkit.player.human.exception', 'err.domain.model.state.player.human.exception', 'err.domain.transit.model.player.human.exception', 'err.domain.transit.register.player.human.exception'),
+    'IdColliderBootstrapperException': 'err.bootstrapper.detector.collider.id.exception',
+    'IdColliderException': 'err.collider.id.exception',
+    'IdCollisionDetectorException': 'err.detection.collision.id.exception',
+    'IdCollisionException': 'err.collider.attribute.id.exception',
+    'IdentifierException': 'err.util.identifier.exception',
+    'IdentifierNullException': 'err.null.identifier.exception',
+    'IdentityRegisterBlueprintNullException': 'err.null.blueprint.register.identity.exception',
+    'IdentityRegisterCarrierNullException': 'err.null.carrier.register.identity.exception',
+    'IdentityRegisterCheckerException': 'err.assurance.checker.register.identity.exception',
+    'IdentityRegisterEmptyException': 'err.empty.register.identity.exception',
+    'IdentityRegisterNullException': 'err.null.register.identity.exception',
+    'IdentityRegisterSizeException': 'err.size.register.identity.exception',
+    'IdentityRegisterValidatorException': 'err.assurance.validator.register.identity.exception',
+    'IdentityServiceException': 'err.microservice.identity.exception',
+    'IdentityValidatorException': ('err.state.validation.identity.exception', 'err.assurance.validator.identity.exception'),
+    'InsertionException': 'err.transaction.insertion.exception',
+    'InsertionRequestNullException': 'err.null.request.insertion.exception',
+    'IntegrityCheckerException': 'err.assurance.checker.exception',
+    'ItineraryAnalyzerException': 'err.analyzer.itinerary.exception',
+    'ItineraryAssemblyPrimerException': ('err.operation.primer.assembly.itinerary.exception', 'err.bootstrapper.operation.primer.assembly.itinerary.exception'),
+    'ItineraryConsistencyException': ('err.microservice.itinerary.binding.exception', 'err.assurance.validator.itinerary.binding.exception'),
+    'ItineraryMicroserviceException': 'err.microservice.itinerary.exception',
+    'ItinerarySourceEqualsDestinationException': ('err.microservice.itinerary.same.exception', 'err.assurance.validator.itinerary.same.exception'),
+    'ItineraryValidatorException': 'err.assurance.validator.itinerary.exception',
+    'KingBasisEmptyException': 'err.empty.space.span.basis.king.exception',
+    'KingBasisSizeException': 'err.size.space.span.basis.king.exception',
+    'KingException': ('err.toolkit.rank.king.exception', 'err.domain.model.rank.king.exception'),
+    'KingMicroserviceException': 'err.microservice.rank.king.exception',
+    'KingMovementSetEmptyException': 'err.empty.space.span.movement.king.exception',
+    'KingMovementSetSizeException': 'err.size.space.span.movement.king.exception',
+    'KingOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.offset.king.exception',
+    'KingOffsetPatternBuilderException': 'err.builder.movement.offset.king.exception',
+    'KingOffsetPatternCarrierException': 'err.domain.transit.movement.offset.king.exception',
+    'KingOffsetPatternCarrierNullException': 'err.null.carrier.movement.offset.king.exception',
+    'KingOffsetPatternException': 'err.movement.offset.king.exception',
+    'KingOffsetSignatureNullException': 'err.null.pattern.offset.king.exception',
+    'KingPathConsistencyAuditorException': 'err.assurance.auditor.path.king.exception',
+    'KingPathConsistencyCheckerNullException': 'err.null.consistencey.path.king.exception',
+    'KingPathException': 'err.domain.model.state.path.king.exception',
+    'KingPathMicroserviceException': 'err.microservice.path.king.exception',
+    'KingPathNullException': 'err.null.model.state.path.king.exception',
+    'KingPathSearchHitConflictException': 'err.search.conflict.path.king.exception',
+    'KingPathSearchResultEmptyException': 'err.search.empty.path.king.exception',
+    'KingPathSearcherException': 'err.search.path.king.exception',
+    'KingPathValidatorException': 'err.assurance.validator.model.state.path.king.exception',
+    'KingTokenConsistencyAuditorException': 'err.assurance.auditor.token.king.exception',
+    'KingTokenConsistencyCheckerNullException': 'err.null.consistencey.token.king.exception',
+    'KingTokenException': ('err.toolkit.token.king.exception', 'err.domain.model.state.token.king.exception'),
+    'KingValidatorException': ('err.state.validation.rank.king.exception', 'err.assurance.validator.model.rank.king.exception'),
+    'KnightBasisEmptyException': 'err.empty.space.span.basis.knight.exception',
+    'KnightBasisSizeException': 'err.size.space.span.basis.knight.exception',
+    'KnightException': ('err.toolkit.rank.knight.exception', 'err.domain.model.rank.knight.exception'),
+    'KnightMicroserviceException': 'err.microservice.rank.knight.exception',
+    'KnightMovementSetEmptyException': 'err.empty.space.span.movement.knight.exception',
+    'KnightMovementSetSizeException': 'err.size.space.span.movement.knight.exception',
+    'KnightOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.offset.knight.exception',
+    'KnightOffsetPatternBuilderException': 'err.builder.movement.offset.knight.exception',
+    'KnightOffsetPatternCarrierException': 'err.domain.transit.movement.offset.knight.exception',
+    'KnightOffsetPatternCarrierNullException': 'err.null.carrier.movement.offset.knight.exception',
+    'KnightOffsetPatternException': 'err.movement.offset.knight.exception',
+    'KnightOffsetSignatureNullException': 'err.null.pattern.offset.knight.exception',
+    'KnightValidatorException': ('err.state.validation.rank.knight.exception', 'err.assurance.validator.model.rank.knight.exception'),
+    'LineSegmentEmptyException': 'err.empty.space.linear.segment.exception',
+    'LineSegmentOriginEmptyException': 'err.empty.space.linear.segment.origin.exception',
+    'LineSegmentOriginSizeException': 'err.size.space.linear.segment.origin.exception',
+    'LineSegmentSizeException': 'err.size.space.linear.segment.exception',
+    'LineSegmentTerminusEmptyException': 'err.empty.space.linear.segment.terminus.exception',
+    'LineSegmentTerminusSizeException': 'err.size.space.linear.segment.terminus.exception',
+    'LinearSpaceEmptyException': 'err.empty.space.linear.exception',
+    'LinearSpaceSizeException': 'err.size.space.linear.exception',
+    'LinearTargetSetEmptyExceptionException': 'err.empty.space.destination.linear.exception',
+    'LinearTargetSetSizeExceptionException': 'err.size.space.destination.linear.exception',
+    'ListEmptyException': 'err.empty.array.exception',
+    'ListFullException': 'err.full.array.exception',
+    'ListNullException': 'err.null.array.exception',
+    'ListSizeException': 'err.size.array.exception',
+    'MachinePlayerConsistencyAuditorException': 'err.assurance.auditor.player.machine.exception',
+    'MachinePlayerConsistencyCheckerNullException': 'err.null.consistencey.player.machine.exception',
+    'MachinePlayerException': ('err.toolkit.player.machine.exception', 'err.domain.model.state.player.machine.exception', 'err.domain.transit.model.player.machine.exception', 'err.domain.transit.register.player.machine.exception'),
+    'ManeuverBasisEmptyException': 'err.empty.space.span.basis.pawn.maneuver.exception',
+    'ManeuverBasisSizeException': 'err.size.space.span.basis.pawn.maneuver.exception',
+    'ManeuverDestinationOccupiedException': ('err.operation.maneuver.occupied.exception', 'err.bootstrapper.operation.maneuver.occupied.exception'),
+    'ManeuverEndpointMicroserviceException': 'err.microservice.endpoint.exception',
+    'ManeuverEndpointValidatorException': 'err.assurance.validator.endpoint.exception',
+    'ManeuverException': ('err.operation.maneuver.exception', 'err.bootstrapper.operation.maneuver.exception'),
+    'ManeuverMicroserviceException': 'err.microservice.maneuver.exception',
+    'ManeuverMovementSetEmptyException': 'err.empty.space.span.movement.pawn.maneuver.exception',
+    'ManeuverMovementSetSizeException': 'err.size.space.span.movement.pawn.maneuver.exception',
+    'ManeuverNullException': 'err.null.model.state.maneuver.exception',
+    'ManeuverOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.pawn.maneuver.exception',
+    'ManeuverOffsetPatternBuilderException': 'err.builder.movement.pawn.maneuver.exception',
+    'ManeuverOffsetPatternCarrierException': 'err.domain.transit.movement.pawn.maneuver.exception',
+    'ManeuverOffsetPatternCarrierNullException': 'err.null.carrier.movement.pawn.maneuver.exception',
+    'ManeuverOffsetPatternException': 'err.movement.pawn.maneuver.exception',
+    'ManeuverOffsetPatternNullException': 'err.null.pattern.pawn.maneuver.exception',
+    'ManeuverPermitterBootstrapperException': 'err.bootstrapper.permitter.maneuver.exception',
+    'ManeuverPermitterException': 'err.permitter.maneuver.exception',
+    'ManeuverRequestAdjudicatorException': 'err.tester.request.maneuver.exception',
+    'ManeuverRequestNullException': 'err.null.request.maneuver.exception',
+    'ManeuverValidatorBootstrapperException': 'err.bootstrapper.validator.maneuver.exception',
+    'ManeuverValidatorException': 'err.assurance.validator.model.state.maneuver.exception',
+    'MappingFunctionException': 'err.mapper.exception',
+    'MappingFunctionStreamException': 'err.mapper.stream.exception',
+    'MaxMoveUndoException': 'err.permitter.maneuver.undo.max.exception',
+    'MaxNameLengthException': 'err.string.name.max.exception',
+    'MethodImplementationException': 'err.method.exception',
+    'MicroserviceException': 'err.microservice.exception',
+    'MicroserviceNullException': 'err.null.microservice.exception',
+    'MinNameLengthException': 'err.string.name.min.exception',
+    'MissingRegistrationException': 'err.bidirectional.missing.exception',
+    'MissingRegistrationWithSquareException': 'err.bidirectional.missing.square.exception',
+    'MissingRegistrationWithTeamException': 'err.bidirectional.missing.team.exception',
+    'ModelBlueprintNullException': 'err.null.blueprint.model.exception',
+    'ModelBuilderException': 'err.builder.model.exception',
+    'ModelCarrierException': 'err.domain.transit.model.exception',
+    'ModelCarrierNullException': 'err.null.carrier.model.exception',
+    'ModelEmptyException': 'err.empty.model.exception',
+    'ModelException': 'err.domain.model.exception',
+    'ModelIntegrityCheckerException': 'err.assurance.checker.model.exception',
+    'ModelNullException': 'err.null.model.exception',
+    'ModelRegisterEmptyException': 'err.empty.register.model.exception',
+    'ModelRegisterNullException': 'err.null.register.model.exception',
+    'ModelRegisterSizeException': 'err.size.register.model.exception',
+    'ModelSizeException': 'err.size.model.exception',
+    'ModelValidatorException': 'err.assurance.validator.model.exception',
+    'MoveUndeployedTokenException': 'err.permitter.maneuver.deployed.exception',
+    'MovementPatternBlueprintNullException': 'err.null.blueprint.movement.exception',
+    'MovementPatternBuilderException': 'err.builder.movement.exception',
+    'MovementPatternCarrierException': 'err.domain.transit.movement.exception',
+    'MovementPatternCarrierNullException': 'err.null.carrier.movement.exception',
+    'MovementPatternException': 'err.movement.exception',
+    'MovementVectorSetEmptyException': 'err.empty.space.span.movement.exception',
+    'MovementVectorSetSizeException': 'err.size.space.span.movement.exception',
+    'NameColliderBootstrapperException': 'err.bootstrapper.detector.collider.name.exception',
+    'NameColliderException': 'err.collider.name.exception',
+    'NameCollisionDetectorException': 'err.detection.collision.name.exception',
+    'NameCollisionException': 'err.collider.attribute.name.exception',
+    'NameException': 'err.string.name.exception',
+    'NameMicroserviceException': 'err.microservice.string.name.exception',
+    'NameNullException': 'err.null.string.name.exception',
+    'NameValidatorException': ('err.state.validation.string.name.exception', 'err.assurance.validator.string.name.exception'),
+    'NegativeNumberException': 'err.number.negative.exception',
+    'NewRegistrationException': ('err.state.registry.insert.exception', 'err.bootstrapper.operation.registry.insert.exception', 'err.operation.registry.insert.exception'),
+    'NewServiceRegistrationException': ('err.state.registry.insert.service.exception', 'err.bootstrapper.operation.registry.insert.service.exception', 'err.operation.registry.insert.service.exception'),
+    'NewWorkerRegistrationException': ('err.state.registry.insert.worker.exception', 'err.bootstrapper.operation.registry.insert.worker.exception', 'err.operation.registry.insert.worker.exception'),
+    'NoActiveTogglesException': ('err.state.validation.context.zero.token.exception', 'err.state.validation.context.zero.arena.exception', 'err.state.validation.context.zero.board.exception', 'err.state.validation.context.zero.coord.exception', 'err.state.validation.context.zero.edge.exception', 'err.state.validation.context.zero.formation.exception', 'err.state.validation.context.zero.game.exception', 'err.state.validation.context.zero.hostage.exception', 'err.state.validation.context.zero.node.exception', 'err.state.validation.context.zero.persona.exception', 'err.state.validation.context.zero.player.exception', 'err.state.validation.context.zero.rank.exception', 'err.state.validation.context.zero.schema.exception', 'err.state.validation.context.zero.square.exception', 'err.state.validation.context.zero.team.exception'),
+    'NoValidationRouteException': 'err.route.validation.exception',
+    'NodeAssemblyException': ('err.state.assembly.node.exception', 'err.bootstrapper.operation.assembly.node.exception', 'err.operation.assembly.node.exception'),
+    'NodeBinderAssemblyException': ('err.state.assembly.binder.node.exception', 'err.bootstrapper.operation.assembly.binder.node.exception', 'err.operation.assembly.binder.node.exception'),
+    'NodeBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.node.exception',
+    'NodeBinderBuilderException': ('err.operation.build.binder.node.exception', 'err.builder.model.binder.node.exception'),
+    'NodeBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.node.exception',
+    'NodeBinderTokenOperationException': 'err.operation.token.binder.node.exception',
+    'NodeBinderTokenStateException': 'err.state.token.binder.node.exception',
+    'NodeBlueprintNullException': ('err.null.blueprint.node.exception', 'err.null.blueprint.model.node.exception'),
+    'NodeBuildPipelineException': 'err.pipeline.build.node.exception',
+    'NodeBuildRouteException': 'err.route.build.node.exception',
+    'NodeBuilderBootstrapperException': 'err.bootstrapper.builder.node.exception',
+    'NodeBuilderException': ('err.operation.build.node.exception', 'err.builder.model.node.exception'),
+    'NodeCarrierException': 'err.domain.transit.model.node.exception',
+    'NodeCarrierNullException': ('err.null.carrier.node.exception', 'err.null.carrier.model.node.exception'),
+    'NodeCarrierValidatorException': 'err.assurance.validator.toggle.carrier.node.exception',
+    'NodeColliderBootstrapperException': 'err.bootstrapper.detector.collider.node.exception',
+    'NodeColliderException': 'err.collider.node.exception',
+    'NodeCollisionDetectorException': 'err.detection.collision.node.exception',
+    'NodeConsistencyAuditorException': 'err.assurance.auditor.node.exception',
+    'NodeConsistencyCheckerNullException': 'err.null.consistencey.node.exception',
+    'NodeContextAssemblyException': ('err.state.assembly.context.node.exception', 'err.bootstrapper.operation.assembly.context.node.exception', 'err.operation.assembly.context.node.exception'),
+    'NodeContextBuildPipelineException': 'err.pipeline.build.context.node.exception',
+    'NodeContextBuildRouteException': 'err.route.build.context.node.exception',
+    'NodeContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.node.exception',
+    'NodeContextBuilderException': ('err.operation.build.context.node.exception', 'err.builder.context.node.exception'),
+    'NodeContextCollisionException': ('err.detection.collision.context.node.exception', 'err.bootstrapper.detector.collider.context.node.exception', 'err.collider.context.node.exception'),
+    'NodeContextException': ('err.toolkit.context.node.exception', 'err.domain.search.context.node.exception'),
+    'NodeContextNullException': 'err.null.context.node.exception',
+    'NodeContextSearchRouteException': 'err.route.search.context.node.exception',
+    'NodeContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.node.exception',
+    'NodeContextTokenOperationException': 'err.operation.token.context.node.exception',
+    'NodeContextTokenStateException': 'err.state.token.context.node.exception',
+    'NodeContextValidationRouteException': 'err.route.validation.context.node.exception',
+    'NodeContextValidatorException': ('err.state.validation.context.node.exception', 'err.assurance.validator.toggle.context.node.exception'),
+    'NodeDatabaseNullException': 'err.null.database.node.exception',
+    'NodeException': ('err.toolkit.node.exception', 'err.domain.structure.node.exception'),
+    'NodeIntegrityCheckerException': 'err.assurance.checker.model.node.exception',
+    'NodeMicroserviceException': 'err.microservice.node.exception',
+    'NodeNoValidationRouteException': 'err.route.validation.node.exception',
+    'NodeNullException': ('err.null.node.exception', 'err.null.model.state.node.exception'),
+    'NodePushPermitterException': 'err.permitter.push.node.exception',
+    'NodeQueryFullException': 'err.full.query.node.exception',
+    'NodeQueryNullException': 'err.null.query.node.exception',
+    'NodeQueryStackEmptyException': 'err.empty.query.node.exception',
+    'NodeQueryStackSizeException': 'err.size.query.node.exception',
+    'NodeRegisterCarrierException': 'err.domain.transit.register.node.exception',
+    'NodeSearchHitConflictException': 'err.search.conflict.node.exception',
+    'NodeSearchResultEmptyException': 'err.search.empty.node.exception',
+    'NodeSearchRouteException': 'err.route.search.node.exception',
+    'NodeSearcherException': 'err.search.node.exception',
+    'NodeStackEmptyException': 'err.empty.stack.node.exception',
+    'NodeStackFullException': 'err.full.stack.node.exception',
+    'NodeStackNullException': 'err.null.stack.node.exception',
+    'NodeStackServiceException': 'err.collection.stack.node.exception',
+    'NodeStackSizeException': 'err.size.stack.node.exception',
+    'NodeToggleBlueprintNullException': 'err.null.blueprint.toggle.node.exception',
+    'NodeToggleCheckerException': 'err.assurance.checker.toggle.node.exception',
+    'NodeTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.node.exception',
+    'NodeTokenOperationException': 'err.operation.token.node.exception',
+    'NodeTokenStateException': 'err.state.token.node.exception',
+    'NodeValidatorException': ('err.state.validation.node.exception', 'err.assurance.validator.model.state.node.exception'),
+    'NorthAxisBlueprintNullException': 'err.null.blueprint.space.axis.north.exception',
+    'NorthAxisBuilderException': 'err.builder.space.axis.north.exception',
+    'NorthAxisCarrierException': 'err.domain.transit.space.axis.north.exception',
+    'NorthAxisCarrierNullException': 'err.null.carrier.space.axis.north.exception',
+    'NorthAxisCheckerException': 'err.assurance.checker.space.axis.north.exception',
+    'NorthAxisException': 'err.space.axis.north.exception',
+    'NorthAxisMappingFunctionException': 'err.mapper.axis.north.exception',
+    'NorthAxisNullException': 'err.null.space.axis.north.exception',
+    'NorthAxisValidatorException': 'err.assurance.validator.space.axis.north.exception',
+    'NorthQuadrantRecurrenceBuilderException': 'err.builder.recurrence.axis.north.exception',
+    'NorthQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.axis.north.exception',
+    'NorthQuadrantRecurrenceException': 'err.recurrence.axis.north.exception',
+    'NorthQuadrantRecurrenceNullException': 'err.null.recurrence.axis.north.exception',
+    'NorthQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.axis.north.exception',
+    'NortheastQuadrantBlueprintNullException': 'err.null.blueprint.space.quadrant.northeast.exception',
+    'NortheastQuadrantBuilderException': 'err.builder.space.quadrant.northeast.exception',
+    'NortheastQuadrantCarrierException': 'err.domain.transit.space.quadrant.northeast.exception',
+    'NortheastQuadrantCarrierNullException': 'err.null.carrier.space.quadrant.northeast.exception',
+    'NortheastQuadrantCheckerException': 'err.assurance.checker.space.quadrant.northeast.exception',
+    'NortheastQuadrantException': 'err.space.quadrant.northeast.exception',
+    'NortheastQuadrantNullException': 'err.null.space.quadrant.northeast.exception',
+    'NortheastQuadrantRecurrenceBuilderException': 'err.builder.recurrence.quadrant.northeast.exception',
+    'NortheastQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.quadrant.northeast.exception',
+    'NortheastQuadrantRecurrenceException': 'err.recurrence.quadrant.northeast.exception',
+    'NortheastQuadrantRecurrenceNullException': 'err.null.recurrence.quadrant.northeast.exception',
+    'NortheastQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.quadrant.northeast.exception',
+    'NortheastQuadrantValidatorException': 'err.assurance.validator.space.quadrant.northeast.exception',
+    'NorthnortheastQuadrantMappingFunctionException': 'err.mapper.quadrant.northeast.exception',
+    'NorthwestQuadrantBlueprintNullException': 'err.null.blueprint.space.quadrant.northwest.exception',
+    'NorthwestQuadrantBuilderException': 'err.builder.space.quadrant.northwest.exception',
+    'NorthwestQuadrantCarrierException': 'err.domain.transit.space.quadrant.northwest.exception',
+    'NorthwestQuadrantCarrierNullException': 'err.null.carrier.space.quadrant.northwest.exception',
+    'NorthwestQuadrantCheckerException': 'err.assurance.checker.space.quadrant.northwest.exception',
+    'NorthwestQuadrantException': 'err.space.quadrant.northwest.exception',
+    'NorthwestQuadrantMappingFunctionException': 'err.mapper.quadrant.northwest.exception',
+    'NorthwestQuadrantNullException': 'err.null.space.quadrant.northwest.exception',
+    'NorthwestQuadrantRecurrenceBuilderException': 'err.builder.recurrence.quadrant.northwest.exception',
+    'NorthwestQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.quadrant.northwest.exception',
+    'NorthwestQuadrantRecurrenceException': 'err.recurrence.quadrant.northwest.exception',
+    'NorthwestQuadrantRecurrenceNullException': 'err.null.recurrence.quadrant.northwest.exception',
+    'NorthwestQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.quadrant.northwest.exception',
+    'NorthwestQuadrantValidatorException': 'err.assurance.validator.space.quadrant.northwest.exception',
+    'NullException': 'err.null.exception',
+    'NumberAboveBoundsException': 'err.number.above.exception',
+    'NumberBelowBoundsException': 'err.number.below.exception',
+    'NumberException': 'err.number.exception',
+    'NumberMicroserviceException': 'err.microservice.number.exception',
+    'NumberNullException': 'err.null.number.exception',
+    'NumberRegisterEmptyException': 'err.empty.register.model.number.exception',
+    'NumberRegisterNullException': 'err.null.register.model.number.exception',
+    'NumberRegisterSizeException': 'err.size.register.model.number.exception',
+    'NumberValidatorException': 'err.assurance.validator.number.exception',
+    'OffsetException': 'err.domain.schema.offset.exception',
+    'OffsetPatternBlueprintNullException': 'err.null.blueprint.movement.offset.exception',
+    'OffsetPatternBuilderException': 'err.builder.movement.offset.exception',
+    'OffsetPatternCarrierException': 'err.domain.transit.movement.offset.exception',
+    'OffsetPatternCarrierNullException': 'err.null.carrier.movement.offset.exception',
+    'OffsetPatternException': 'err.movement.offset.exception',
+    'OffsetSignatureNullException': 'err.null.pattern.offset.exception',
+    'OpeningAttackBasisEmptyException': 'err.empty.space.span.basis.pawn.attack.opening.exception',
+    'OpeningAttackBasisSizeException': 'err.size.space.span.basis.pawn.attack.opening.exception',
+    'OpeningAttackMovementSetEmptyException': 'err.empty.space.span.movement.pawn.attack.opening.exception',
+    'OpeningAttackMovementSetSizeException': 'err.size.space.span.movement.pawn.attack.opening.exception',
+    'OpeningAttackOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.pawn.attack.opening.exception',
+    'OpeningAttackOffsetPatternBuilderException': 'err.builder.movement.pawn.attack.opening.exception',
+    'OpeningAttackOffsetPatternCarrierException': 'err.domain.transit.movement.pawn.attack.opening.exception',
+    'OpeningAttackOffsetPatternCarrierNullException': 'err.null.carrier.movement.pawn.attack.opening.exception',
+    'OpeningAttackOffsetPatternException': 'err.movement.pawn.attack.opening.exception',
+    'OpeningAttackOffsetPatternNullException': 'err.null.pattern.pawn.attack.opening.exception',
+    'OpeningManeuverBasisEmptyException': 'err.empty.space.span.basis.pawn.maneuver.opening.exception',
+    'OpeningManeuverBasisSizeException': 'err.size.space.span.basis.pawn.maneuver.opening.exception',
+    'OpeningManeuverMovementSetEmptyException': 'err.empty.space.span.movement.pawn.maneuver.opening.exception',
+    'OpeningManeuverMovementSetSizeException': 'err.size.space.span.movement.pawn.maneuver.opening.exception',
+    'OpeningManeuverOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.pawn.maneuver.opening.exception',
+    'OpeningManeuverOffsetPatternBuilderException': 'err.builder.movement.pawn.maneuver.opening.exception',
+    'OpeningManeuverOffsetPatternCarrierException': 'err.domain.transit.movement.pawn.maneuver.opening.exception',
+    'OpeningManeuverOffsetPatternCarrierNullException': 'err.null.carrier.movement.pawn.maneuver.opening.exception',
+    'OpeningManeuverOffsetPatternException': 'err.movement.pawn.maneuver.opening.exception',
+    'OpeningManeuverOffsetPatternNullException': 'err.null.pattern.pawn.maneuver.opening.exception',
+    'OpeningSquareCollisionException': 'err.collider.attribute.token.square.exception',
+    'OpeningSquareConsistencyAuditorException': 'err.assurance.auditor.square.opening.exception',
+    'OpeningSquareConsistencyCheckerNullException': 'err.null.consistencey.square.opening.exception',
+    'OpeningSquareException': ('err.toolkit.square.opening.exception', 'err.domain.model.state.square.opening.exception', 'err.domain.transit.model.square.opening.exception', 'err.domain.transit.register.square.opening.exception'),
+    'OperationBootstrapperException': 'err.bootstrapper.operation.exception',
+    'OperationException': 'err.operation.exception',
+    'OperationListNullException': 'err.null.dependecy.operation.exception',
+    'OperationNullException': 'err.null.operation.exception',
+    'OrientationException': 'err.domain.schema.orientation.exception',
+    'OrientationToggleCarrierException': 'err.domain.transit.toggle.orientation.exception',
+    'OrientationToggleException': 'err.domain.structure.toggle.orientation.exception',
+    'OriginCertifierBootstrapperException': 'err.bootstrapper.validator.endpoint.origin.exception',
+    'OriginSearcherBootstrapperException': 'err.bootstrapper.searcher.origin.exception',
+    'PalyerStackServiceException': 'err.collection.stack.player.exception',
+    'PartialTokenDestinationRelationException': ('err.microservice.endpoint.destination.partial.exception', 'err.assurance.validator.endpoint.destination.partial.exception'),
+    'PathCarrierNullException': 'err.null.carrier.model.path.exception',
+    'PathConsistencyAuditorException': 'err.assurance.auditor.path.exception',
+    'PathConsistencyCheckerNullException': 'err.null.consistencey.path.exception',
+    'PathException': 'err.domain.model.state.path.exception',
+    'PathMicroserviceException': 'err.microservice.path.exception',
+    'PathNullException': 'err.null.model.state.path.exception',
+    'PathSearchHitConflictException': 'err.search.conflict.path.exception',
+    'PathSearchResultEmptyException': 'err.search.empty.path.exception',
+    'PathSearcherException': 'err.search.path.exception',
+    'PathValidatorException': 'err.assurance.validator.model.state.path.exception',
+    'PawnBasisEmptyException': 'err.empty.space.span.basis.pawn.exception',
+    'PawnBasisSizeException': 'err.size.space.span.basis.pawn.exception',
+    'PawnDoublePromotionException': 'err.analyzer.promotion.double.exception',
+    'PawnException': ('err.toolkit.rank.pawn.exception', 'err.domain.model.rank.pawn.exception'),
+    'PawnMicroserviceException': 'err.microservice.rank.pawn.exception',
+    'PawnMovementSetEmptyException': 'err.empty.space.span.movement.pawn.exception',
+    'PawnMovementSetSizeException': 'err.size.space.span.movement.pawn.exception',
+    'PawnOffsetPatternBlueprintNullException': 'err.null.blueprint.movement.pawn.exception',
+    'PawnOffsetPatternBuilderException': 'err.builder.movement.pawn.exception',
+    'PawnOffsetPatternCarrierException': 'err.domain.transit.movement.pawn.exception',
+    'PawnOffsetPatternCarrierNullException': 'err.null.carrier.movement.pawn.exception',
+    'PawnOffsetPatternException': 'err.movement.pawn.exception',
+    'PawnOffsetSignatureNullException': 'err.null.pattern.pawn.exception',
+    'PawnPromoterException': ('err.operation.token.promotion.exception', 'err.bootstrapper.operation.token.promotion.exception'),
+    'PawnPromotionRowException': 'err.analyzer.promotion.row.exception',
+    'PawnTokenConsistencyAuditorException': 'err.assurance.auditor.token.combatant.pawn.exception',
+    'PawnTokenConsistencyCheckerNullException': 'err.null.consistencey.token.combatant.pawn.exception',
+    'PawnTokenException': ('err.toolkit.token.combatant.pawn.exception', 'err.domain.model.state.token.combatant.pawn.exception'),
+    'PawnValidatorException': ('err.state.validation.rank.pawn.exception', 'err.assurance.validator.model.rank.pawn.exception'),
+    'PermitterBootstrapperException': 'err.bootstrapper.permitter.exception',
+    'PermitterException': 'err.permitter.exception',
+    'PersonaAssemblyBootstrapperException': 'err.state.bootstrap.assembly.persona.exception',
+    'PersonaAssemblyException': ('err.state.assembly.persona.exception', 'err.bootstrapper.operation.assembly.persona.exception', 'err.operation.assembly.persona.exception'),
+    'PersonaAssemblyPrimerException': ('err.operation.primer.assembly.persona.exception', 'err.bootstrapper.operation.primer.assembly.persona.exception'),
+    'PersonaBinderAssemblyException': ('err.state.assembly.binder.persona.exception', 'err.bootstrapper.operation.assembly.binder.persona.exception', 'err.operation.assembly.binder.persona.exception'),
+    'PersonaBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.persona.exception',
+    'PersonaBinderBuilderException': ('err.operation.build.binder.persona.exception', 'err.builder.model.binder.persona.exception'),
+    'PersonaBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.persona.exception',
+    'PersonaBinderTokenOperationException': 'err.operation.token.binder.persona.exception',
+    'PersonaBinderTokenStateException': 'err.state.token.binder.persona.exception',
+    'PersonaBuildRouteException': 'err.route.build.persona.exception',
+    'PersonaBuilderBootstrapperException': 'err.bootstrapper.builder.persona.exception',
+    'PersonaBuilderException': 'err.operation.build.persona.exception',
+    'PersonaColliderBootstrapperException': 'err.bootstrapper.detector.collider.persona.exception',
+    'PersonaColliderException': 'err.collider.persona.exception',
+    'PersonaCollisionDetectorException': 'err.detection.collision.persona.exception',
+    'PersonaContextAssemblyException': ('err.state.assembly.context.persona.exception', 'err.bootstrapper.operation.assembly.context.persona.exception', 'err.operation.assembly.context.persona.exception'),
+    'PersonaContextBuildPipelineException': 'err.pipeline.build.context.persona.exception',
+    'PersonaContextBuildRouteException': 'err.route.build.context.persona.exception',
+    'PersonaContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.persona.exception',
+    'PersonaContextBuilderException': ('err.operation.build.context.persona.exception', 'err.builder.context.persona.exception'),
+    'PersonaContextCollisionException': ('err.detection.collision.context.persona.exception', 'err.bootstrapper.detector.collider.context.persona.exception', 'err.collider.context.persona.exception'),
+    'PersonaContextException': ('err.toolkit.context.persona.exception', 'err.domain.search.context.persona.exception'),
+    'PersonaContextNullException': 'err.null.context.persona.exception',
+    'PersonaContextSearchRouteException': 'err.route.search.context.persona.exception',
+    'PersonaContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.persona.exception',
+    'PersonaContextTokenOperationException': 'err.operation.token.context.persona.exception',
+    'PersonaContextTokenStateException': 'err.state.token.context.persona.exception',
+    'PersonaContextValidationRouteException': 'err.route.validation.context.persona.exception',
+    'PersonaContextValidatorException': 'err.state.validation.context.persona.exception',
+    'PersonaException': ('err.toolkit.persona.exception', 'err.domain.schema.persona.exception'),
+    'PersonaFinalizeBuilderException': 'err.operation.finalize.build.persona.exception',
+    'PersonaMicroserviceException': 'err.microservice.persona.exception',
+    'PersonaNoValidationRouteException': 'err.route.validation.persona.exception',
+    'PersonaNullException': 'err.null.schema.persona.exception',
+    'PersonaQueryFullException': 'err.full.query.persona.exception',
+    'PersonaQueryNullException': 'err.null.query.persona.exception',
+    'PersonaQueryStackEmptyException': 'err.empty.query.persona.exception',
+    'PersonaQueryStackSizeException': 'err.size.query.persona.exception',
+    'PersonaSearchRouteException': 'err.route.search.persona.exception',
+    'PersonaTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.persona.exception',
+    'PersonaTokenOperationException': 'err.operation.token.persona.exception',
+    'PersonaTokenStateException': 'err.state.token.persona.exception',
+    'PersonaValidatorException': 'err.state.validation.persona.exception',
+    'PipelineException': 'err.pipeline.exception',
+    'PlayerAssemblyException': ('err.state.assembly.player.exception', 'err.bootstrapper.operation.assembly.player.exception', 'err.operation.assembly.player.exception'),
+    'PlayerBinderAssemblyException': ('err.state.assembly.binder.player.exception', 'err.bootstrapper.operation.assembly.binder.player.exception', 'err.operation.assembly.binder.player.exception'),
+    'PlayerBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.player.exception',
+    'PlayerBinderBuilderException': ('err.operation.build.binder.player.exception', 'err.builder.model.binder.player.exception'),
+    'PlayerBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.player.exception',
+    'PlayerBinderTokenOperationException': 'err.operation.token.binder.player.exception',
+    'PlayerBinderTokenStateException': 'err.state.token.binder.player.exception',
+    'PlayerBlueprintNullException': 'err.null.blueprint.model.player.exception',
+    'PlayerBoardRelationAnalyzerException': 'err.analyzer.relation.board.player.exception',
+    'PlayerBuildPipelineException': 'err.pipeline.build.player.exception',
+    'PlayerBuildRouteException': 'err.route.build.player.exception',
+    'PlayerBuilderBootstrapperException': 'err.bootstrapper.builder.player.exception',
+    'PlayerBuilderException': ('err.operation.build.player.exception', 'err.builder.model.player.exception'),
+    'PlayerCarrierException': 'err.domain.transit.model.player.exception',
+    'PlayerCarrierNullException': 'err.null.carrier.model.player.exception',
+    'PlayerCarrierValidatorException': 'err.assurance.validator.toggle.carrier.player.exception',
+    'PlayerColliderBootstrapperException': 'err.bootstrapper.detector.collider.player.exception',
+    'PlayerColliderException': 'err.collider.player.exception',
+    'PlayerCollisionDetectorException': 'err.detection.collision.player.exception',
+    'PlayerConsistencyAuditorException': 'err.assurance.auditor.player.exception',
+    'PlayerConsistencyCheckerNullException': 'err.null.consistencey.player.exception',
+    'PlayerContextAssemblyException': ('err.state.assembly.context.player.exception', 'err.bootstrapper.operation.assembly.context.player.exception', 'err.operation.assembly.context.player.exception'),
+    'PlayerContextBuildPipelineException': 'err.pipeline.build.context.player.exception',
+    'PlayerContextBuildRouteException': 'err.route.build.context.player.exception',
+    'PlayerContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.player.exception',
+    'PlayerContextBuilderException': ('err.operation.build.context.player.exception', 'err.builder.context.player.exception'),
+    'PlayerContextCollisionException': ('err.detection.collision.context.player.exception', 'err.bootstrapper.detector.collider.context.player.exception', 'err.collider.context.player.exception'),
+    'PlayerContextException': ('err.toolkit.context.player.exception', 'err.domain.search.context.player.exception'),
+    'PlayerContextNullException': 'err.null.context.player.exception',
+    'PlayerContextSearchRouteException': 'err.route.search.context.player.exception',
+    'PlayerContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.player.exception',
+    'PlayerContextTokenOperationException': 'err.operation.token.context.player.exception',
+    'PlayerContextTokenStateException': 'err.state.token.context.player.exception',
+    'PlayerContextValidationRouteException': 'err.route.validation.context.player.exception',
+    'PlayerContextValidatorException': ('err.state.validation.context.player.exception', 'err.assurance.validator.toggle.context.player.exception'),
+    'PlayerDatabaseNullException': 'err.null.database.player.exception',
+    'PlayerException': ('err.toolkit.player.exception', 'err.domain.model.state.player.exception'),
+    'PlayerIntegrityCheckerException': 'err.assurance.checker.model.player.exception',
+    'PlayerMicroserviceException': 'err.microservice.player.exception',
+    'PlayerNoValidationRouteException': 'err.route.validation.player.exception',
+    'PlayerNullException': 'err.null.model.state.player.exception',
+    'PlayerQueryFullException': 'err.full.query.player.exception',
+    'PlayerQueryNullException': 'err.null.query.player.exception',
+    'PlayerQueryStackEmptyException': 'err.empty.query.player.exception',
+    'PlayerQueryStackSizeException': 'err.size.query.player.exception',
+    'PlayerRegisterCarrierException': 'err.domain.transit.register.player.exception',
+    'PlayerSearchHitConflictException': 'err.search.conflict.player.exception',
+    'PlayerSearchResultEmptyException': 'err.search.empty.player.exception',
+    'PlayerSearchRouteException': 'err.route.search.player.exception',
+    'PlayerSearcherException': 'err.search.player.exception',
+    'PlayerStackEmptyException': 'err.empty.stack.player.exception',
+    'PlayerStackFullException': 'err.full.stack.player.exception',
+    'PlayerStackNullException': 'err.null.stack.player.exception',
+    'PlayerStackPushException': ('err.state.push.stack.player.exception', 'err.bootstrapper.operation.push.stack.player.exception', 'err.operation.push.stack.player.exception'),
+    'PlayerStackRegistrationException': ('err.state.registration.stack.player.exception', 'err.bootstrapper.operation.registration.stack.player.exception', 'err.operation.registration.stack.player.exception'),
+    'PlayerStackSizeException': 'err.size.stack.player.exception',
+    'PlayerTeamRelationAnalyzerException': 'err.analyzer.relation.team.player.exception',
+    'PlayerToggleBlueprintNullException': 'err.null.blueprint.toggle.player.exception',
+    'PlayerToggleCheckerException': 'err.assurance.checker.toggle.player.exception',
+    'PlayerTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.player.exception',
+    'PlayerTokenOperationException': 'err.operation.token.player.exception',
+    'PlayerTokenStateException': 'err.state.token.player.exception',
+    'PlayerValidatorException': ('err.state.validation.player.exception', 'err.assurance.validator.model.state.player.exception'),
+    'PopPermitterBootstrapperException': 'err.bootstrapper.permitter.pop.exception',
+    'PopRequestNullException': 'err.null.request.pop.exception',
+    'PopRequestTesterException': 'err.tester.request.pop.exception',
+    'PopperException': ('err.operation.pop.exception', 'err.bootstrapper.operation.pop.exception'),
+    'PopperPermitterException': 'err.permitter.pop.exception',
+    'PoppingEmptyStackException': ('err.operation.pop.empty.exception', 'err.bootstrapper.operation.pop.empty.exception'),
+    'PoppingEmptyTokenStackException': ('err.operation.pop.empty.token.exception', 'err.bootstrapper.operation.pop.empty.token.exception'),
+    'PrimersonaContextAssemblyException': ('err.operation.primer.assembly.context.persona.exception', 'err.bootstrapper.operation.primer.assembly.context.persona.exception'),
+    'PrimingArenaAssemblyException': ('err.operation.primer.assembly.arena.exception', 'err.bootstrapper.operation.primer.assembly.arena.exception'),
+    'PrimingArenaContextAssemblyException': ('err.operation.primer.assembly.context.arena.exception', 'err.bootstrapper.operation.primer.assembly.context.arena.exception'),
+    'PrimingBoardAssemblyException': ('err.operation.primer.assembly.board.exception', 'err.bootstrapper.operation.primer.assembly.board.exception'),
+    'PrimingBoardContextAssemblyException': ('err.operation.primer.assembly.context.board.exception', 'err.bootstrapper.operation.primer.assembly.context.board.exception'),
+    'PrimingContextAssemblyException': ('err.operation.primer.assembly.context.exception', 'err.bootstrapper.operation.primer.assembly.context.exception'),
+    'PrimingCoordAssemblyException': ('err.operation.primer.assembly.coord.exception', 'err.bootstrapper.operation.primer.assembly.coord.exception'),
+    'PrimingCoordContextAssemblyException': ('err.operation.primer.assembly.context.coord.exception', 'err.bootstrapper.operation.primer.assembly.context.coord.exception'),
+    'PrimingEdgeAssemblyException': ('err.operation.primer.assembly.edge.exception', 'err.bootstrapper.operation.primer.assembly.edge.exception'),
+    'PrimingEdgeContextAssemblyException': ('err.operation.primer.assembly.context.edge.exception', 'err.bootstrapper.operation.primer.assembly.context.edge.exception'),
+    'PrimingException': ('err.operation.primer.exception', 'err.bootstrapper.operation.primer.exception'),
+    'PrimingFormationContextAssemblyException': ('err.operation.primer.assembly.context.formation.exception', 'err.bootstrapper.operation.primer.assembly.context.formation.exception'),
+    'PrimingGameAssemblyException': ('err.operation.primer.assembly.game.exception', 'err.bootstrapper.operation.primer.assembly.game.exception'),
+    'PrimingGameContextAssemblyException': ('err.operation.primer.assembly.context.game.exception', 'err.bootstrapper.operation.primer.assembly.context.game.exception'),
+    'PrimingHostageContextAssemblyException': ('err.operation.primer.assembly.context.hostage.exception', 'err.bootstrapper.operation.primer.assembly.context.hostage.exception'),
+    'PrimingNodeAssemblyException': ('err.operation.primer.assembly.node.exception', 'err.bootstrapper.operation.primer.assembly.node.exception'),
+    'PrimingNodeContextAssemblyException': ('err.operation.primer.assembly.context.node.exception', 'err.bootstrapper.operation.primer.assembly.context.node.exception'),
+    'PrimingPlayerAssemblyException': ('err.operation.primer.assembly.player.exception', 'err.bootstrapper.operation.primer.assembly.player.exception'),
+    'PrimingPlayerContextAssemblyException': ('err.operation.primer.assembly.context.player.exception', 'err.bootstrapper.operation.primer.assembly.context.player.exception'),
+    'PrimingRankAssemblyException': ('err.operation.primer.assembly.rank.exception', 'err.bootstrapper.operation.primer.assembly.rank.exception'),
+    'PrimingRankContextAssemblyException': ('err.operation.primer.assembly.context.rank.exception', 'err.bootstrapper.operation.primer.assembly.context.rank.exception'),
+    'PrimingScalarAssemblyException': ('err.operation.primer.assembly.scalar.exception', 'err.bootstrapper.operation.primer.assembly.scalar.exception'),
+    'PrimingSchemaContextAssemblyException': ('err.operation.primer.assembly.context.schema.exception', 'err.bootstrapper.operation.primer.assembly.context.schema.exception'),
+    'PrimingSquareAssemblyException': ('err.operation.primer.assembly.square.exception', 'err.bootstrapper.operation.primer.assembly.square.exception'),
+    'PrimingSquareContextAssemblyException': ('err.operation.primer.assembly.context.square.exception', 'err.bootstrapper.operation.primer.assembly.context.square.exception'),
+    'PrimingTeamAssemblyException': ('err.operation.primer.assembly.team.exception', 'err.bootstrapper.operation.primer.assembly.team.exception'),
+    'PrimingTokenContextAssemblyException': ('err.operation.primer.assembly.context.token.exception', 'err.bootstrapper.operation.primer.assembly.context.token.exception'),
+    'PrimingValidatorException': 'err.bootstrapper.validator.priming.exception',
+    'PrisonSearchHitConflictException': 'err.search.conflict.prison.exception',
+    'PrisonSearchResultEmptyException': 'err.search.empty.prison.exception',
+    'PrisonSearcherException': 'err.search.prison.exception',
+    'PromoteInactivePawnException': 'err.analyzer.promotion.inactive.exception',
+    'PromoteToKingException': 'err.analyzer.promotion.rank.king.exception',
+    'PromoteToPawnException': 'err.analyzer.promotion.rank.pawn.exception',
+    'PromotionApprovalManagerException': 'err.analyzer.promotion.manager.exception',
+    'PromotionLevelAnalyzerException': 'err.analyzer.promotion.rank.exception',
+    'PromotionLevelTesterException': 'err.tester.promotion.rank.exception',
+    'PromotionPawnAdjudicatorException': 'err.tester.promotion.pawn.exception',
+    'PromotionPermitterBootstrapperException': 'err.bootstrapper.permitter.promotion.exception',
+    'PromotionPermitterException': 'err.permitter.promotion.exception',
+    'PromotionRequestNullException': 'err.null.request.promotion.exception',
+    'PromotionRequestTesterException': 'err.tester.request.promotion.exception',
+    'PushException': 'err.state.push.exception',
+    'PushPermitterBootstrapperException': 'err.bootstrapper.permitter.push.exception',
+    'PushRequestNullException': 'err.null.request.push.exception',
+    'PushRequestTesterException': 'err.tester.request.push.exception',
+    'PusherException': ('err.operation.push.exception', 'err.bootstrapper.operation.push.exception'),
+    'PusherPermitterException': 'err.permitter.push.exception',
+    'QuadrantBlueprintNullException': 'err.null.blueprint.space.quadrant.exception',
+    'QuadrantCarrierNullException': 'err.null.carrier.space.quadrant.exception',
+    'QuadrantCheckerException': 'err.assurance.checker.space.quadrant.exception',
+    'QuadrantEmptyException': 'err.empty.space.linear.quadrant.exception',
+    'QuadrantException': 'err.space.quadrant.exception',
+    'QuadrantLineSegmentEmptyException': 'err.empty.space.linear.segment.quadrant.exception',
+    'QuadrantLineSegmentSizeException': 'err.size.space.linear.segment.quadrant.exception',
+    'QuadrantMappingFunctionException': 'err.mapper.quadrant.exception',
+    'QuadrantMappingFunctionStreamException': 'err.mapper.stream.quadrant.exception',
+    'QuadrantNullException': 'err.null.space.quadrant.exception',
+    'QuadrantRecurrenceBuilderException': ('err.builder.recurrence.quadrant.exception', 'err.builder.recurrence.axis.exception'),
+    'QuadrantRecurrenceCarrierNullException': ('err.null.carrier.recurrence.quadrant.exception', 'err.null.carrier.recurrence.axis.exception'),
+    'QuadrantRecurrenceException': ('err.recurrence.quadrant.exception', 'err.recurrence.axis.exception'),
+    'QuadrantRecurrenceNullException': ('err.null.recurrence.quadrant.exception', 'err.null.recurrence.axis.exception'),
+    'QuadrantRecurrenceRegistryNullException': 'err.null.recurrence.registry.quadrant.exception',
+    'QuadrantRecurrenceTableException': ('err.recurrence.table.quadrant.exception', 'err.assurance.validator.recurrence.table.quadrant.exception', 'err.null.carrier.recurrence.table.quadrant.exception', 'err.builder.recurrence.table.quadrant.exception'),
+    'QuadrantRecurrenceValidatorException': ('err.assurance.validator.recurrence.quadrant.exception', 'err.assurance.validator.recurrence.axis.exception'),
+    'QuadrantReservoirBuilderException': 'err.builder.registry.space.quadrant.exception',
+    'QuadrantReservoirException': 'err.space.reservoir.quadrant.exception',
+    'QuadrantReservoirNullException': 'err.null.space.reservoir.quadrant.exception',
+    'QuadrantSizeException': 'err.size.space.linear.quadrant.exception',
+    'QuadrantSpaceBuilderException': 'err.builder.space.quadrant.exception',
+    'QuadrantSpaceCarrierException': 'err.domain.transit.space.quadrant.exception',
+    'QuadrantValidatorException': 'err.assurance.validator.space.quadrant.exception',
+    'QueenBasisEmptyException': 'err.empty.space.span.basis.queen.exception',
+    'QueenBasisSizeException': 'err.size.space.span.basis.queen.exception',
+    'QueenException': ('err.toolkit.rank.queen.exception', 'err.domain.model.rank.queen.exception'),
+    'QueenMicroserviceException': 'err.microservice.rank.queen.exception',
+    'QueenMovementSetEmptyException': 'err.empty.space.span.movement.queen.exception',
+    'QueenMovementSetSizeException': 'err.size.space.span.movement.queen.exception',
+    'QueenRecurrenceSeriesBuilderException': 'err.builder.recurrence.group.queen.exception',
+    'QueenRecurrenceSeriesNullException': 'err.null.recurrence.group.queen.exception',
+    'QueenRecurrenceSeriesValidatorException': 'err.assurance.validator.recurrence.group.queen.exception',
+    'QueenTraversalPatternBlueprintNullException': 'err.null.blueprint.movement.traversal.queen.exception',
+    'QueenTraversalPatternBuilderException': 'err.builder.movement.traversal.queen.exception',
+    'QueenTraversalPatternCarrierException': 'err.domain.transit.movement.traversal.queen.exception',
+    'QueenTraversalPatternCarrierNullException': 'err.null.carrier.movement.traversal.queen.exception',
+    'QueenTraversalPatternException': 'err.movement.traversal.queen.exception',
+    'QueenTraversalSignatureNullException': 'err.null.pattern.traversal.queen.exception',
+    'QueenValidatorException': ('err.state.validation.rank.queen.exception', 'err.assurance.validator.model.rank.queen.exception'),
+    'QueryException': 'err.query.exception',
+    'QueryFullException': 'err.full.query.exception',
+    'QueryMicroserviceException': 'err.microservice.query.exception',
+    'QueryNullException': 'err.null.query.exception',
+    'QueryStackEmptyException': 'err.empty.query.exception',
+    'QueryStackSizeException': 'err.size.query.exception',
+    'QueryValidatorException': 'err.assurance.validator.query.exception',
+    'RankAlreadyQuotaedException': 'err.analyzer.quota.exist.exception',
+    'RankAssemblyException': ('err.state.assembly.rank.exception', 'err.bootstrapper.operation.assembly.rank.exception', 'err.operation.assembly.rank.exception'),
+    'RankBinderAssemblyException': ('err.state.assembly.binder.rank.exception', 'err.bootstrapper.operation.assembly.binder.rank.exception', 'err.operation.assembly.binder.rank.exception'),
+    'RankBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.rank.exception',
+    'RankBinderBuilderException': ('err.operation.build.binder.rank.exception', 'err.builder.model.binder.rank.exception'),
+    'RankBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.rank.exception',
+    'RankBinderTokenOperationException': 'err.operation.token.binder.rank.exception',
+    'RankBinderTokenStateException': 'err.state.token.binder.rank.exception',
+    'RankBlueprintNullException': 'err.null.blueprint.model.rank.exception',
+    'RankBuildPipelineException': 'err.pipeline.build.rank.exception',
+    'RankBuildRouteException': 'err.route.build.rank.exception',
+    'RankBuilderBootstrapperException': 'err.bootstrapper.builder.rank.exception',
+    'RankBuilderException': ('err.operation.build.rank.exception', 'err.builder.model.rank.exception'),
+    'RankCarrierException': 'err.domain.transit.model.rank.exception',
+    'RankCarrierNullException': 'err.null.carrier.model.rank.exception',
+    'RankCarrierValidatorException': 'err.assurance.validator.toggle.carrier.rank.exception',
+    'RankColliderBootstrapperException': 'err.bootstrapper.detector.collider.rank.exception',
+    'RankColliderException': 'err.collider.rank.exception',
+    'RankCollisionDetectorException': 'err.detection.collision.rank.exception',
+    'RankContextAssemblyException': ('err.state.assembly.context.rank.exception', 'err.bootstrapper.operation.assembly.context.rank.exception', 'err.operation.assembly.context.rank.exception'),
+    'RankContextBuildPipelineException': 'err.pipeline.build.context.rank.exception',
+    'RankContextBuildRouteException': 'err.route.build.context.rank.exception',
+    'RankContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.rank.exception',
+    'RankContextBuilderException': ('err.operation.build.context.rank.exception', 'err.builder.context.rank.exception'),
+    'RankContextCollisionException': ('err.detection.collision.context.rank.exception', 'err.bootstrapper.detector.collider.context.rank.exception', 'err.collider.context.rank.exception'),
+    'RankContextException': ('err.toolkit.context.rank.exception', 'err.domain.search.context.rank.exception'),
+    'RankContextNullException': 'err.null.context.rank.exception',
+    'RankContextSearchRouteException': 'err.route.search.context.rank.exception',
+    'RankContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.rank.exception',
+    'RankContextTokenOperationException': 'err.operation.token.context.rank.exception',
+    'RankContextTokenStateException': 'err.state.token.context.rank.exception',
+    'RankContextValidationRouteException': 'err.route.validation.context.rank.exception',
+    'RankContextValidatorException': ('err.state.validation.context.rank.exception', 'err.assurance.validator.toggle.context.rank.exception'),
+    'RankException': ('err.toolkit.rank.exception', 'err.domain.model.rank.exception'),
+    'RankIntegrityCheckerException': 'err.assurance.checker.model.rank.exception',
+    'RankMicroserviceException': 'err.microservice.rank.exception',
+    'RankModelNullException': 'err.null.model.rank.exception',
+    'RankNoValidationRouteException': 'err.route.validation.rank.exception',
+    'RankQueryFullException': 'err.full.query.rank.exception',
+    'RankQueryNullException': 'err.null.query.rank.exception',
+    'RankQueryStackEmptyException': 'err.empty.query.rank.exception',
+    'RankQueryStackSizeException': 'err.size.query.rank.exception',
+    'RankQuotaAnalyzerException': 'err.analyzer.quota.exception',
+    'RankQuotaFullException': ('err.operation.push.token.quota.exception', 'err.bootstrapper.operation.push.token.quota.exception'),
+    'RankRegisterCarrierException': 'err.domain.transit.register.rank.exception',
+    'RankSearchHitConflictException': 'err.search.conflict.rank.exception',
+    'RankSearchResultEmptyException': 'err.search.empty.rank.exception',
+    'RankSearchRouteException': 'err.route.search.rank.exception',
+    'RankSearcherException': 'err.search.rank.exception',
+    'RankSlotPermitterException': 'err.permitter.slot.exception',
+    'RankSlotRequestNullException': 'err.null.request.slot.exception',
+    'RankToggleBlueprintNullException': 'err.null.blueprint.toggle.rank.exception',
+    'RankToggleCheckerException': 'err.assurance.checker.toggle.rank.exception',
+    'RankTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.rank.exception',
+    'RankTokenOperationException': 'err.operation.token.rank.exception',
+    'RankTokenStateException': 'err.state.token.rank.exception',
+    'RankValidatorException': ('err.state.validation.rank.exception', 'err.assurance.validator.model.rank.exception'),
+    'ReadinessAnalyzerBootstrapperException': ('err.bootstrapper.analyzer.readiness.exception', 'err.bootstrapper.analyzer.destination.exception'),
+    'RecurrenceBuilderException': 'err.builder.recurrence.exception',
+    'RecurrenceCarrierNullException': 'err.null.carrier.recurrence.exception',
+    'RecurrenceException': 'err.recurrence.exception',
+    'RecurrenceNullException': 'err.null.recurrence.exception',
+    'RecurrenceRegistryCollectionNullException': 'err.null.recurrence.group.exception',
+    'RecurrenceRegistryNullException': 'err.null.recurrence.registry.exception',
+    'RecurrenceTableException': ('err.recurrence.table.exception', 'err.assurance.validator.recurrence.table.exception', 'err.null.carrier.recurrence.table.exception', 'err.builder.recurrence.table.exception'),
+    'RecurrenceTableGroupBuilderException': 'err.builder.recurrence.group.exception',
+    'RecurrenceTableGroupException': 'err.recurrence.group.exception',
+    'RecurrenceTableGroupValidatorException': 'err.assurance.validator.recurrence.group.exception',
+    'RecurrenceValidatorException': 'err.assurance.validator.recurrence.exception',
+    'RegisterBlueprintNullException': 'err.null.blueprint.register.exception',
+    'RegisterBuilderException': 'err.builder.register.exception',
+    'RegisterCarrierException': 'err.domain.transit.register.exception',
+    'RegisterCarrierNullException': ('err.null.carrier.register.exception', 'err.null.carrier.container.register.exception'),
+    'RegisterConsistencyAuditorException': 'err.assurance.auditor.register.exception',
+    'RegisterConsistencyCheckerNullException': 'err.null.consistencey.register.exception',
+    'RegisterEmptyException': 'err.empty.register.exception',
+    'RegisterException': 'err.domain.structure.register.exception',
+    'RegisterIntegrityCheckerException': 'err.assurance.checker.register.exception',
+    'RegisterMicroserviceException': 'err.microservice.register.exception',
+    'RegisterNullException': 'err.null.register.exception',
+    'RegisterSetBuilderException': 'err.builder.container.register.exception',
+    'RegisterSetEmptyException': 'err.empty.container.register.exception',
+    'RegisterSetException': 'err.collection.register.exception',
+    'RegisterSetNullException': 'err.null.collection.register.exception',
+    'RegisterSetSizeException': 'err.size.container.register.exception',
+    'RegisterSizeException': 'err.size.register.exception',
+    'RegisterValidatorException': 'err.assurance.validator.register.exception',
+    'RegistrationException': ('err.state.registration.exception', 'err.bootstrapper.operation.registration.exception', 'err.operation.registration.exception'),
+    'RegistryBuilderException': 'err.builder.registry.exception',
+    'RegistryConsistencyAuditorException': 'err.assurance.auditor.registry.exception',
+    'RegistryConsistencyCheckerNullException': 'err.null.consistencey.registry.exception',
+    'RegistryControllerException': 'err.controller.registry.exception',
+    'RegistryDomainKeyCollisionConsistencyAuditorException': 'err.assurance.auditor.registry.key.collision.domain.exception',
+    'RegistryDomainKeyCollisionConsistencyCheckerNullException': 'err.null.consistencey.registry.key.collision.domain.exception',
+    'RegistryDomainKeyCollisionException': ('err.operand.registry.key.collision.domain.exception', 'err.domain.model.registry.key.collision.domain.exception'),
+    'RegistryEntryKeyStringMicroserviceException': 'err.microservice.string.registry.exception',
+    'RegistryEntryKeyStringValidatorException': ('err.state.validation.string.registry.exception', 'err.assurance.validator.string.registry.exception'),
+    'RegistryException': ('err.operand.registry.exception', 'err.domain.model.registry.exception'),
+    'RegistryKeyCollisionConsistencyAuditorException': 'err.assurance.auditor.registry.key.collision.exception',
+    'RegistryKeyCollisionConsistencyCheckerNullException': 'err.null.consistencey.registry.key.collision.exception',
+    'RegistryKeyCollisionException': ('err.operand.registry.key.collision.exception', 'err.domain.model.registry.key.collision.exception'),
+    'RegistryKeyConsistencyAuditorException': 'err.assurance.auditor.registry.key.exception',
+    'RegistryKeyConsistencyCheckerNullException': 'err.null.consistencey.registry.key.exception',
+    'RegistryKeyException': ('err.operand.registry.key.exception', 'err.domain.model.registry.key.exception'),
+    'RegistryOperationBootstrapperException': 'err.bootstrapper.operation.registry.exception',
+    'RegistryOperationException': 'err.operation.registry.exception',
+    'RegistryStateException': 'err.state.registry.exception',
+    'RelationAnalyzerException': 'err.analyzer.relation.exception',
+    'RelationNullException': 'err.null.relation.exception',
+    'RequestException': 'err.domain.exchange.request.exception',
+    'RequestNullException': 'err.null.request.exception',
+    'RequestTesterException': 'err.tester.request.exception',
+    'ResourceAvailabilityException': 'err.resource.exception',
+    'ResponseException': 'err.domain.exchange.response.exception',
+    'ResultStackServiceException': 'err.collection.stack.result.exception',
+    'RookBasisEmptyException': 'err.empty.space.span.basis.rook.exception',
+    'RookBasisSizeException': 'err.size.space.span.basis.rook.exception',
+    'RookException': ('err.toolkit.rank.rook.exception', 'err.domain.model.rank.rook.exception'),
+    'RookMicroserviceException': 'err.microservice.rank.rook.exception',
+    'RookMovementSetEmptyException': 'err.empty.space.span.movement.rook.exception',
+    'RookMovementSetSizeException': 'err.size.space.span.movement.rook.exception',
+    'RookRecurrenceSeriesBuilderException': 'err.builder.recurrence.group.rook.exception',
+    'RookRecurrenceSeriesNullException': 'err.null.recurrence.group.rook.exception',
+    'RookRecurrenceSeriesValidatorException': 'err.assurance.validator.recurrence.group.rook.exception',
+    'RookTraversalPatternBlueprintNullException': 'err.null.blueprint.movement.traversal.rook.exception',
+    'RookTraversalPatternBuilderException': 'err.builder.movement.traversal.rook.exception',
+    'RookTraversalPatternCarrierException': 'err.domain.transit.movement.traversal.rook.exception',
+    'RookTraversalPatternCarrierNullException': 'err.null.carrier.movement.traversal.rook.exception',
+    'RookTraversalPatternException': 'err.movement.traversal.rook.exception',
+    'RookTraversalSignatureNullException': 'err.null.pattern.traversal.rook.exception',
+    'RookValidatorException': ('err.state.validation.rank.rook.exception', 'err.assurance.validator.model.rank.rook.exception'),
+    'RulesetException': 'err.domain.schema.ruleset.exception',
+    'ScalarAssemblyException': ('err.state.assembly.scalar.exception', 'err.bootstrapper.operation.assembly.scalar.exception', 'err.operation.assembly.scalar.exception'),
+    'ScalarBuildPipelineException': 'err.pipeline.build.scalar.exception',
+    'ScalarBuildRouteException': 'err.route.build.scalar.exception',
+    'ScalarBuilderBootstrapperException': 'err.bootstrapper.builder.scalar.exception',
+    'ScalarBuilderException': ('err.operation.build.scalar.exception', 'err.builder.model.scalar.exception'),
+    'ScalarCarrierException': 'err.domain.transit.model.scalar.exception',
+    'ScalarCarrierNullException': 'err.null.carrier.model.scalar.exception',
+    'ScalarColliderBootstrapperException': 'err.bootstrapper.detector.collider.scalar.exception',
+    'ScalarColliderException': 'err.collider.scalar.exception',
+    'ScalarCollisionDetectorException': 'err.detection.collision.scalar.exception',
+    'ScalarConsistencyAuditorException': 'err.assurance.auditor.scalar.exception',
+    'ScalarConsistencyCheckerNullException': 'err.null.consistencey.scalar.exception',
+    'ScalarException': ('err.toolkit.scalar.exception', 'err.domain.model.scalar.exception'),
+    'ScalarMicroserviceException': 'err.microservice.scalar.exception',
+    'ScalarModelNullException': 'err.null.model.scalar.exception',
+    'ScalarNoValidationRouteException': 'err.route.validation.scalar.exception',
+    'ScalarProductException': ('err.state.math.product.exception', 'err.bootstrapper.operation.math.product.exception', 'err.operation.math.product.exception'),
+    'ScalarRegisterCarrierException': 'err.domain.transit.register.scalar.exception',
+    'ScalarSearchRouteException': 'err.route.search.scalar.exception',
+    'ScalarTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.scalar.exception',
+    'ScalarTokenOperationException': 'err.operation.token.scalar.exception',
+    'ScalarTokenStateException': 'err.state.token.scalar.exception',
+    'ScalarValidatorException': ('err.state.validation.scalar.exception', 'err.assurance.validator.model.scalar.exception'),
+    'SchemaAssemblyBootstrapperException': 'err.state.bootstrap.assembly.schema.exception',
+    'SchemaAssemblyException': ('err.state.assembly.schema.exception', 'err.bootstrapper.operation.assembly.schema.exception', 'err.operation.assembly.schema.exception'),
+    'SchemaAssemblyPrimerException': ('err.operation.primer.assembly.schema.exception', 'err.bootstrapper.operation.primer.assembly.schema.exception'),
+    'SchemaBinderAssemblyException': ('err.state.assembly.binder.schema.exception', 'err.bootstrapper.operation.assembly.binder.schema.exception', 'err.operation.assembly.binder.schema.exception'),
+    'SchemaBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.schema.exception',
+    'SchemaBinderBuilderException': ('err.operation.build.binder.schema.exception', 'err.builder.model.binder.schema.exception'),
+    'SchemaBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.schema.exception',
+    'SchemaBinderTokenOperationException': 'err.operation.token.binder.schema.exception',
+    'SchemaBinderTokenStateException': 'err.state.token.binder.schema.exception',
+    'SchemaBuildRouteException': 'err.route.build.schema.exception',
+    'SchemaBuilderBootstrapperException': 'err.bootstrapper.builder.schema.exception',
+    'SchemaBuilderException': 'err.operation.build.schema.exception',
+    'SchemaColliderBootstrapperException': 'err.bootstrapper.detector.collider.schema.exception',
+    'SchemaColliderException': 'err.collider.schema.exception',
+    'SchemaCollisionDetectorException': 'err.detection.collision.schema.exception',
+    'SchemaContextAssemblyException': ('err.state.assembly.context.schema.exception', 'err.bootstrapper.operation.assembly.context.schema.exception', 'err.operation.assembly.context.schema.exception'),
+    'SchemaContextBuildPipelineException': 'err.pipeline.build.context.schema.exception',
+    'SchemaContextBuildRouteException': 'err.route.build.context.schema.exception',
+    'SchemaContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.schema.exception',
+    'SchemaContextBuilderException': ('err.operation.build.context.schema.exception', 'err.builder.context.schema.exception'),
+    'SchemaContextCollisionException': ('err.detection.collision.context.schema.exception', 'err.bootstrapper.detector.collider.context.schema.exception', 'err.collider.context.schema.exception'),
+    'SchemaContextException': ('err.toolkit.context.schema.exception', 'err.domain.search.context.schema.exception'),
+    'SchemaContextNullException': 'err.null.context.schema.exception',
+    'SchemaContextSearchRouteException': 'err.route.search.context.schema.exception',
+    'SchemaContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.schema.exception',
+    'SchemaContextTokenOperationException': 'err.operation.token.context.schema.exception',
+    'SchemaContextTokenStateException': 'err.state.token.context.schema.exception',
+    'SchemaContextValidationRouteException': 'err.route.validation.context.schema.exception',
+    'SchemaContextValidatorException': 'err.state.validation.context.schema.exception',
+    'SchemaException': ('err.toolkit.schema.exception', 'err.domain.schema.exception'),
+    'SchemaFinalizeBuilderException': 'err.operation.finalize.build.schema.exception',
+    'SchemaHashtableConsistencyAuditorException': 'err.assurance.auditor.hashtable.schema.exception',
+    'SchemaHashtableConsistencyCheckerNullException': 'err.null.consistencey.hashtable.schema.exception',
+    'SchemaHashtableException': 'err.toolkit.hashtable.schema.exception',
+    'SchemaHashtableMicroserviceException': 'err.microservice.schema.table.exception',
+    'SchemaHashtableValidatorException': 'err.state.validation.schema.table.exception',
+    'SchemaMicroserviceException': 'err.microservice.schema.exception',
+    'SchemaNoValidationRouteException': 'err.route.validation.schema.exception',
+    'SchemaNullException': 'err.null.schema.exception',
+    'SchemaQueryFullException': 'err.full.query.schema.exception',
+    'SchemaQueryNullException': 'err.null.query.schema.exception',
+    'SchemaQueryStackEmptyException': 'err.empty.query.schema.exception',
+    'SchemaQueryStackSizeException': 'err.size.query.schema.exception',
+    'SchemaSearchRouteException': 'err.route.search.schema.exception',
+    'SchemaTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.schema.exception',
+    'SchemaTokenOperationException': 'err.operation.token.schema.exception',
+    'SchemaTokenStateException': 'err.state.token.schema.exception',
+    'SchemaValidatorException': 'err.state.validation.schema.exception',
+    'SearchHitConflictException': 'err.search.conflict.exception',
+    'SearchObjectException': 'err.domain.search.exception',
+    'SearchPermitterBootstrapperException': 'err.bootstrapper.permitter.search.exception',
+    'SearchRequestNullException': 'err.null.request.search.exception',
+    'SearchResultEmptyException': 'err.search.empty.exception',
+    'SearchRouteException': 'err.route.search.exception',
+    'SearchTransactionException': 'err.transaction.search.exception',
+    'SearcherBootstrapperException': 'err.bootstrapper.searcher.exception',
+    'SearcherException': 'err.search.exception',
+    'SearcherPermitterException': 'err.permitter.search.exception',
+    'ServiceListNullException': 'err.null.dependecy.service.exception',
+    'ServiceRegistryControllerException': 'err.controller.registry.service.exception',
+    'SignatureNullException': 'err.null.pattern.exception',
+    'SizeException': 'err.size.exception',
+    'SouthAxisBlueprintNullException': 'err.null.blueprint.space.axis.south.exception',
+    'SouthAxisBuilderException': 'err.builder.space.axis.south.exception',
+    'SouthAxisCarrierException': 'err.domain.transit.space.axis.south.exception',
+    'SouthAxisCarrierNullException': 'err.null.carrier.space.axis.south.exception',
+    'SouthAxisCheckerException': 'err.assurance.checker.space.axis.south.exception',
+    'SouthAxisException': 'err.space.axis.south.exception',
+    'SouthAxisMappingFunctionException': 'err.mapper.axis.south.exception',
+    'SouthAxisNullException': 'err.null.space.axis.south.exception',
+    'SouthAxisValidatorException': 'err.assurance.validator.space.axis.south.exception',
+    'SouthQuadrantRecurrenceBuilderException': 'err.builder.recurrence.axis.south.exception',
+    'SouthQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.axis.south.exception',
+    'SouthQuadrantRecurrenceException': 'err.recurrence.axis.south.exception',
+    'SouthQuadrantRecurrenceNullException': 'err.null.recurrence.axis.south.exception',
+    'SouthQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.axis.south.exception',
+    'SoutheastQuadrantBlueprintNullException': 'err.null.blueprint.space.quadrant.southeast.exception',
+    'SoutheastQuadrantBuilderException': 'err.builder.space.quadrant.southeast.exception',
+    'SoutheastQuadrantCarrierException': 'err.domain.transit.space.quadrant.southeast.exception',
+    'SoutheastQuadrantCarrierNullException': 'err.null.carrier.space.quadrant.southeast.exception',
+    'SoutheastQuadrantException': 'err.space.quadrant.southeast.exception',
+    'SoutheastQuadrantMappingFunctionException': 'err.mapper.quadrant.southeast.exception',
+    'SoutheastQuadrantNullException': 'err.null.space.quadrant.southeast.exception',
+    'SoutheastQuadrantRecurrenceBuilderException': 'err.builder.recurrence.quadrant.southeast.exception',
+    'SoutheastQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.quadrant.southeast.exception',
+    'SoutheastQuadrantRecurrenceException': 'err.recurrence.quadrant.southeast.exception',
+    'SoutheastQuadrantRecurrenceNullException': 'err.null.recurrence.quadrant.southeast.exception',
+    'SoutheastQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.quadrant.southeast.exception',
+    'SoutheastQuadrantValidatorException': 'err.assurance.validator.space.quadrant.southeast.exception',
+    'SouthwestQuadrantBlueprintNullException': 'err.null.blueprint.space.quadrant.southwest.exception',
+    'SouthwestQuadrantBuilderException': 'err.builder.space.quadrant.southwest.exception',
+    'SouthwestQuadrantCarrierException': 'err.domain.transit.space.quadrant.southwest.exception',
+    'SouthwestQuadrantCarrierNullException': 'err.null.carrier.space.quadrant.southwest.exception',
+    'SouthwestQuadrantException': 'err.space.quadrant.southwest.exception',
+    'SouthwestQuadrantMappingFunctionException': 'err.mapper.quadrant.southwest.exception',
+    'SouthwestQuadrantNullException': 'err.null.space.quadrant.southwest.exception',
+    'SouthwestQuadrantRecurrenceBuilderException': 'err.builder.recurrence.quadrant.southwest.exception',
+    'SouthwestQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.quadrant.southwest.exception',
+    'SouthwestQuadrantRecurrenceException': 'err.recurrence.quadrant.southwest.exception',
+    'SouthwestQuadrantRecurrenceNullException': 'err.null.recurrence.quadrant.southwest.exception',
+    'SouthwestQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.quadrant.southwest.exception',
+    'SouthwestQuadrantValidatorException': 'err.assurance.validator.space.quadrant.southwest.exception',
+    'SoutwestQuadrantCheckerException': ('err.assurance.checker.space.quadrant.southwest.exception', 'err.assurance.checker.space.quadrant.south.exception'),
+    'SpaceBlueprintNullException': 'err.null.blueprint.space.exception',
+    'SpaceBuilderException': 'err.builder.space.exception',
+    'SpaceCarrierException': 'err.domain.transit.space.exception',
+    'SpaceCarrierNullException': 'err.null.carrier.space.exception',
+    'SpaceEmptyException': 'err.empty.space.exception',
+    'SpaceException': 'err.space.exception',
+    'SpaceIntegrityCheckerException': 'err.assurance.checker.space.exception',
+    'SpaceNullException': 'err.null.space.exception',
+    'SpaceReservoirBuilderException': 'err.builder.registry.space.exception',
+    'SpaceReservoirException': 'err.space.reservoir.exception',
+    'SpaceReservoirNullException': 'err.null.space.reservoir.exception',
+    'SpaceSizeException': 'err.size.space.exception',
+    'SpaceValidatorException': 'err.assurance.validator.space.exception',
+    'SpanEmptyException': 'err.empty.space.span.exception',
+    'SpanSizeException': 'err.size.space.span.exception',
+    'SquareAssemblyException': ('err.state.assembly.square.exception', 'err.bootstrapper.operation.assembly.square.exception', 'err.operation.assembly.square.exception'),
+    'SquareBinderAssemblyException': ('err.state.assembly.binder.square.exception', 'err.bootstrapper.operation.assembly.binder.square.exception', 'err.operation.assembly.binder.square.exception'),
+    'SquareBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.square.exception',
+    'SquareBinderBuilderException': ('err.operation.build.binder.square.exception', 'err.builder.model.binder.square.exception'),
+    'SquareBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.square.exception',
+    'SquareBinderTokenOperationException': 'err.operation.token.binder.square.exception',
+    'SquareBinderTokenStateException': 'err.state.token.binder.square.exception',
+    'SquareBlueprintNullException': 'err.null.blueprint.model.square.exception',
+    'SquareBuildPipelineException': 'err.pipeline.build.square.exception',
+    'SquareBuildRouteException': 'err.route.build.square.exception',
+    'SquareBuilderBootstrapperException': 'err.bootstrapper.builder.square.exception',
+    'SquareBuilderException': ('err.operation.build.square.exception', 'err.builder.model.square.exception'),
+    'SquareCarrierException': 'err.domain.transit.model.square.exception',
+    'SquareCarrierNullException': 'err.null.carrier.model.square.exception',
+    'SquareCarrierValidatorException': 'err.assurance.validator.toggle.carrier.square.exception',
+    'SquareColliderBootstrapperException': 'err.bootstrapper.detector.collider.square.exception',
+    'SquareColliderException': 'err.collider.square.exception',
+    'SquareCollisionDetectorException': 'err.detection.collision.square.exception',
+    'SquareConsistencyAuditorException': 'err.assurance.auditor.square.exception',
+    'SquareConsistencyCheckerNullException': 'err.null.consistencey.square.exception',
+    'SquareContextAssemblyException': ('err.state.assembly.context.square.exception', 'err.bootstrapper.operation.assembly.context.square.exception', 'err.operation.assembly.context.square.exception'),
+    'SquareContextBuildPipelineException': 'err.pipeline.build.context.square.exception',
+    'SquareContextBuildRouteException': 'err.route.build.context.square.exception',
+    'SquareContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.square.exception',
+    'SquareContextBuilderException': ('err.operation.build.context.square.exception', 'err.builder.context.square.exception'),
+    'SquareContextCollisionException': ('err.detection.collision.context.square.exception', 'err.bootstrapper.detector.collider.context.square.exception', 'err.collider.context.square.exception'),
+    'SquareContextException': ('err.toolkit.context.square.exception', 'err.domain.search.context.square.exception'),
+    'SquareContextNullException': 'err.null.context.square.exception',
+    'SquareContextSearchRouteException': 'err.route.search.context.square.exception',
+    'SquareContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.square.exception',
+    'SquareContextTokenOperationException': 'err.operation.token.context.square.exception',
+    'SquareContextTokenStateException': 'err.state.token.context.square.exception',
+    'SquareContextValidationRouteException': 'err.route.validation.context.square.exception',
+    'SquareContextValidatorException': ('err.state.validation.context.square.exception', 'err.assurance.validator.toggle.context.square.exception'),
+    'SquareCoordCollisionException': 'err.collider.attribute.coord.square.exception',
+    'SquareDatabaseNullException': 'err.null.database.square.exception',
+    'SquareEmptyException': 'err.empty.model.square.exception',
+    'SquareException': ('err.toolkit.square.exception', 'err.domain.model.state.square.exception'),
+    'SquareFullException': 'err.full.square.exception',
+    'SquareIdCollisionException': 'err.collider.attribute.id.square.exception',
+    'SquareIntegrityCheckerException': 'err.assurance.checker.model.square.exception',
+    'SquareMicroserviceException': 'err.microservice.square.exception',
+    'SquareNameCollisionException': ('err.detection.collision.name.square.exception', 'err.bootstrapper.detector.collider.name.square.exception', 'err.collider.attribute.name.square.exception', 'err.collider.name.square.exception'),
+    'SquareNoValidationRouteException': 'err.route.validation.square.exception',
+    'SquareNullException': 'err.null.model.state.square.exception',
+    'SquareOccupiedException': ('err.operation.visit.occupied.exception', 'err.bootstrapper.operation.visit.occupied.exception'),
+    'SquarePushPermitterException': 'err.permitter.push.square.exception',
+    'SquareQueryFullException': 'err.full.query.square.exception',
+    'SquareQueryNullException': 'err.null.query.square.exception',
+    'SquareQueryStackEmptyException': 'err.empty.query.square.exception',
+    'SquareQueryStackSizeException': 'err.size.query.square.exception',
+    'SquareRegisterBlueprintNullException': 'err.null.blueprint.register.square.exception',
+    'SquareRegisterBuilderException': 'err.builder.register.square.exception',
+    'SquareRegisterCarrierException': 'err.domain.transit.register.square.exception',
+    'SquareRegisterCarrierNullException': 'err.null.carrier.register.square.exception',
+    'SquareRegisterCheckerException': 'err.assurance.checker.register.square.exception',
+    'SquareRegisterConsistencyAuditorException': 'err.assurance.auditor.register.square.exception',
+    'SquareRegisterConsistencyCheckerNullException': 'err.null.consistencey.register.square.exception',
+    'SquareRegisterEmptyException': 'err.empty.register.model.square.exception',
+    'SquareRegisterException': 'err.domain.structure.register.square.exception',
+    'SquareRegisterMicroserviceException': 'err.microservice.register.square.exception',
+    'SquareRegisterNullException': 'err.null.register.model.square.exception',
+    'SquareRegisterSizeException': 'err.size.register.model.square.exception',
+    'SquareRegisterValidatorException': 'err.assurance.validator.register.square.exception',
+    'SquareSearchHitConflictException': 'err.search.conflict.square.exception',
+    'SquareSearchResultEmptyException': 'err.search.empty.square.exception',
+    'SquareSearchRouteException': 'err.route.search.square.exception',
+    'SquareSearcherException': 'err.search.square.exception',
+    'SquareSizeException': 'err.size.model.square.exception',
+    'SquareStackEmptyException': 'err.empty.stack.square.exception',
+    'SquareStackFullException': 'err.full.stack.square.exception',
+    'SquareStackNullException': 'err.null.stack.square.exception',
+    'SquareStackServiceException': 'err.collection.stack.square.exception',
+    'SquareStackSizeException': 'err.size.stack.square.exception',
+    'SquareToggleBlueprintNullException': 'err.null.blueprint.toggle.square.exception',
+    'SquareToggleCheckerException': 'err.assurance.checker.toggle.square.exception',
+    'SquareTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.square.exception',
+    'SquareTokenOperationException': 'err.operation.token.square.exception',
+    'SquareTokenRelationAnalyzerException': 'err.analyzer.relation.token.square.exception',
+    'SquareTokenStateException': 'err.state.token.square.exception',
+    'SquareValidatorException': ('err.state.validation.square.exception', 'err.assurance.validator.model.state.square.exception'),
+    'SquareVisitException': ('err.operation.visit.exception', 'err.bootstrapper.operation.visit.exception'),
+    'SquareVisitorBoardException': 'err.analyzer.itinerary.board.exception',
+    'StackEmptyException': 'err.empty.stack.exception',
+    'StackFullException': 'err.full.stack.exception',
+    'StackNullException': 'err.null.stack.exception',
+    'StackPushException': ('err.state.push.stack.exception', 'err.bootstrapper.operation.push.stack.exception', 'err.operation.push.stack.exception'),
+    'StackRegistrationException': ('err.state.registration.stack.exception', 'err.bootstrapper.operation.registration.stack.exception', 'err.operation.registration.stack.exception'),
+    'StackServiceException': 'err.collection.stack.exception',
+    'StackSizeException': 'err.size.stack.exception',
+    'StaleLinkException': 'err.bidirectional.stale.exception',
+    'StaleSquareLinkException': 'err.bidirectional.stale.square.exception',
+    'StaleTokenLinkException': 'err.bidirectional.stale.token.exception',
+    'StateException': 'err.state.exception',
+    'StateModelNullException': 'err.null.model.state.exception',
+    'StateModelValidatorException': 'err.assurance.validator.model.state.exception',
+    'StationException': 'err.domain.graph.station.exception',
+    'StepperException': 'err.domain.schema.stepper.exception',
+    'StringBlankException': 'err.string.blank.exception',
+    'StringEmptyException': 'err.string.empty.exception',
+    'StringException': 'err.string.exception',
+    'StringMicroserviceException': 'err.microservice.string.exception',
+    'StringNullException': 'err.null.string.exception',
+    'StringValidatorException': ('err.state.validation.string.exception', 'err.assurance.validator.string.exception'),
+    'StructuralWrapperException': 'err.domain.structure.exception',
+    'TargetVectorSetEmptyException': 'err.empty.space.destination.exception',
+    'TargetVectorSetSizeException': 'err.size.space.destination.exception',
+    'TeamAssemblyException': ('err.state.assembly.team.exception', 'err.bootstrapper.operation.assembly.team.exception', 'err.operation.assembly.team.exception'),
+    'TeamBlueprintNullException': 'err.null.blueprint.model.team.exception',
+    'TeamBuildPipelineException': 'err.pipeline.build.team.exception',
+    'TeamBuildRouteException': 'err.route.build.team.exception',
+    'TeamBuilderBootstrapperException': 'err.bootstrapper.builder.team.exception',
+    'TeamBuilderException': ('err.operation.build.team.exception', 'err.builder.model.team.exception'),
+    'TeamCarrierException': 'err.domain.transit.model.team.exception',
+    'TeamCarrierValidatorException': 'err.assurance.validator.toggle.carrier.team.exception',
+    'TeamColliderBootstrapperException': 'err.bootstrapper.detector.collider.team.exception',
+    'TeamColliderException': 'err.collider.team.exception',
+    'TeamCollisionDetectorException': 'err.detection.collision.team.exception',
+    'TeamConsistencyAuditorException': 'err.assurance.auditor.team.exception',
+    'TeamConsistencyCheckerNullException': 'err.null.consistencey.team.exception',
+    'TeamContextNullException': 'err.null.context.team.exception',
+    'TeamContextValidationRouteException': 'err.route.validation.context.team.exception',
+    'TeamContextValidatorException': 'err.assurance.validator.toggle.context.team.exception',
+    'TeamDatabaseNullException': 'err.null.database.team.exception',
+    'TeamException': ('err.toolkit.team.exception', 'err.domain.model.state.team.exception'),
+    'TeamIdCollisionException': 'err.collider.attribute.id.team.exception',
+    'TeamIntegrityCheckerException': 'err.assurance.checker.model.team.exception',
+    'TeamMicroserviceException': 'err.microservice.team.exception',
+    'TeamNameCollisionException': 'err.collider.attribute.name.team.exception',
+    'TeamNoValidationRouteException': 'err.route.validation.team.exception',
+    'TeamNullException': 'err.null.model.state.team.exception',
+    'TeamPushPermitterException': 'err.permitter.push.team.exception',
+    'TeamRegisterCarrierException': 'err.domain.transit.register.team.exception',
+    'TeamSearchHitConflictException': 'err.search.conflict.team.exception',
+    'TeamSearchResultEmptyException': 'err.search.empty.team.exception',
+    'TeamSearchRouteException': 'err.route.search.team.exception',
+    'TeamSearcherException': 'err.search.team.exception',
+    'TeamStackEmptyException': 'err.empty.stack.team.exception',
+    'TeamStackNullException': 'err.null.stack.team.exception',
+    'TeamStackServiceException': 'err.collection.stack.team.exception',
+    'TeamStackSizeException': 'err.size.stack.team.exception',
+    'TeamToggleBlueprintNullException': 'err.null.blueprint.toggle.team.exception',
+    'TeamToggleCheckerException': 'err.assurance.checker.toggle.team.exception',
+    'TeamTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.team.exception',
+    'TeamTokenOperationException': 'err.operation.token.team.exception',
+    'TeamTokenRelationAnalyzerException': 'err.analyzer.relation.token.team.exception',
+    'TeamTokenStateException': 'err.state.token.team.exception',
+    'TeamValidatorException': ('err.state.validation.team.exception', 'err.assurance.validator.model.state.team.exception'),
+    'TerminusException': 'err.domain.schema.terminus.exception',
+    'TesterException': 'err.tester.exception',
+    'TimeoutException': 'err.timeout.exception',
+    'ToggleBlueprintNullException': 'err.null.blueprint.toggle.exception',
+    'ToggleBuilderException': 'err.builder.toggle.exception',
+    'ToggleCarrierException': 'err.domain.transit.toggle.exception',
+    'ToggleCarrierNullException': 'err.null.carrier.toggle.exception',
+    'ToggleException': 'err.domain.structure.toggle.exception',
+    'ToggleIntegrityCheckerException': 'err.assurance.checker.toggle.exception',
+    'ToggleNullException': ('err.operand.exception', 'err.null.toggle.exception'),
+    'ToggleValidatorException': 'err.bootstrapper.validator.priming.context.exception',
+    'TokenAlreadyAtDestinationException': ('err.microservice.endpoint.destination.circular.exception', 'err.assurance.validator.endpoint.destination.circular.exception'),
+    'TokenAssemblyException': ('err.state.assembly.token.exception', 'err.bootstrapper.operation.assembly.token.exception', 'err.operation.assembly.token.exception'),
+    'TokenAssemblyPrimerException': ('err.operation.primer.assembly.token.exception', 'err.bootstrapper.operation.primer.assembly.token.exception'),
+    'TokenAuditorException': 'err.assurance.auditor.token.exception',
+    'TokenBinderAssemblyException': ('err.state.assembly.binder.token.exception', 'err.bootstrapper.operation.assembly.binder.token.exception', 'err.operation.assembly.binder.token.exception'),
+    'TokenBinderBuilderBootstrapperException': 'err.bootstrapper.builder.binder.token.exception',
+    'TokenBinderBuilderException': ('err.operation.build.binder.token.exception', 'err.builder.model.binder.token.exception'),
+    'TokenBinderTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.binder.token.exception',
+    'TokenBinderTokenOperationException': 'err.operation.token.binder.token.exception',
+    'TokenBinderTokenStateException': 'err.state.token.binder.token.exception',
+    'TokenBlueprintNullException': 'err.null.blueprint.model.token.exception',
+    'TokenBoardConsistencyStateException': 'err.state.token.board.exception',
+    'TokenBuildPipelineException': 'err.pipeline.build.token.exception',
+    'TokenBuildRouteException': 'err.route.build.token.exception',
+    'TokenBuilderBootstrapperException': 'err.bootstrapper.builder.token.exception',
+    'TokenBuilderException': ('err.operation.build.token.exception', 'err.builder.model.token.exception'),
+    'TokenCarrierException': 'err.domain.transit.model.token.exception',
+    'TokenCarrierNullException': 'err.null.carrier.model.token.exception',
+    'TokenCarrierValidatorException': 'err.assurance.validator.toggle.carrier.token.exception',
+    'TokenColliderException': 'err.collider.token.exception',
+    'TokenCollisionBootstrapperException': 'err.bootstrapper.collision.token.exception',
+    'TokenCollisionDetectorBootstrapperException': 'err.bootstrapper.detector.token.exception',
+    'TokenCollisionDetectorException': 'err.detection.token.exception',
+    'TokenCollisionException': 'err.collider.attribute.token.exception',
+    'TokenConsistencyCheckerNullException': 'err.null.consistencey.token.exception',
+    'TokenContextAssemblyException': ('err.state.assembly.context.token.exception', 'err.bootstrapper.operation.assembly.context.token.exception', 'err.operation.assembly.context.token.exception'),
+    'TokenContextBuildPipelineException': 'err.pipeline.build.context.token.exception',
+    'TokenContextBuildRouteException': 'err.route.build.context.token.exception',
+    'TokenContextBuilderBootstrapperException': 'err.bootstrapper.builder.context.token.exception',
+    'TokenContextBuilderException': ('err.operation.build.context.token.exception', 'err.builder.context.token.exception'),
+    'TokenContextCollisionException': ('err.detection.collision.context.token.exception', 'err.bootstrapper.detector.collider.context.token.exception', 'err.collider.context.token.exception'),
+    'TokenContextException': ('err.toolkit.context.token.exception', 'err.domain.search.context.token.exception'),
+    'TokenContextNullException': 'err.null.context.token.exception',
+    'TokenContextSearchRouteException': 'err.route.search.context.token.exception',
+    'TokenContextTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.context.token.exception',
+    'TokenContextTokenOperationException': 'err.operation.token.context.token.exception',
+    'TokenContextTokenStateException': 'err.state.token.context.token.exception',
+    'TokenContextValidationRouteException': 'err.route.validation.context.token.exception',
+    'TokenContextValidatorException': ('err.state.validation.context.token.exception', 'err.assurance.validator.toggle.context.token.exception'),
+    'TokenCoordCollisionException': 'err.collider.attribute.coord.token.exception',
+    'TokenDatabaseNullException': 'err.null.database.token.exception',
+    'TokenDeletePermitterException': 'err.permitter.delete.token.exception',
+    'TokenDeleterException': ('err.operation.deletion.token.exception', 'err.bootstrapper.operation.deletion.token.exception'),
+    'TokenDeploymentException': ('err.state.token.deployment.exception', 'err.bootstrapper.operation.token.deployment.exception', 'err.operation.token.deployment.exception'),
+    'TokenDesignationCollisionException': ('err.detection.collision.name.token.exception', 'err.bootstrapper.detector.collider.name.token.exception', 'err.collider.name.token.exception'),
+    'TokenDestinationCertifierException': ('err.microservice.endpoint.destination.exception', 'err.assurance.validator.endpoint.destination.exception'),
+    'TokenException': ('err.toolkit.token.exception', 'err.domain.model.state.token.exception'),
+    'TokenHomeContextNullException': 'err.null.context.home.exception',
+    'TokenHomeSquareContextException': 'err.domain.search.context.home.exception',
+    'TokenIdCollisionException': ('err.detection.collision.id.token.exception', 'err.bootstrapper.detector.collider.id.token.exception', 'err.collider.attribute.id.token.exception', 'err.collider.id.token.exception'),
+    'TokenIntegrityCheckerException': 'err.assurance.checker.model.token.exception',
+    'TokenMicroserviceException': 'err.microservice.token.exception',
+    'TokenNameCollisionException': 'err.collider.attribute.name.token.exception',
+    'TokenNoValidationRouteException': 'err.route.validation.token.exception',
+    'TokenNullException': 'err.null.model.state.token.exception',
+    'TokenOperationBootstrapperException': 'err.bootstrapper.operation.token.exception',
+    'TokenOperationException': 'err.operation.token.exception',
+    'TokenOriginCertifierException': ('err.microservice.endpoint.origin.exception', 'err.assurance.validator.endpoint.origin.exception'),
+    'TokenOriginRelationNullException': 'err.null.relation.origin.exception',
+    'TokenOriginSearchHitConflictException': 'err.search.conflict.origin.exception',
+    'TokenOriginSearchResultEmptyException': 'err.search.empty.origin.exception',
+    'TokenOriginSearcherException': 'err.search.origin.exception',
+    'TokenPathDtoBuilderBootstrapperException': 'err.bootstrapper.builder.dto.path.exception',
+    'TokenPathDtoBuilderException': 'err.builder.dto.path.exception',
+    'TokenPopPermitterException': 'err.permitter.pop.token.exception',
+    'TokenPopperException': 'err.bootstrapper.operation.pop.token.exception',
+    'TokenPushPermitterException': ('err.permitter.push.token.exception', 'err.permitter.push.maneuver.exception'),
+    'TokenPusherException': 'err.bootstrapper.operation.push.token.exception',
+    'TokenQueryFullException': 'err.full.query.token.exception',
+    'TokenQueryMicroserviceException': 'err.microservice.query.token.exception',
+    'TokenQueryNullException': 'err.null.query.token.exception',
+    'TokenQueryStackEmptyException': 'err.empty.query.token.exception',
+    'TokenQueryStackSizeException': 'err.size.query.token.exception',
+    'TokenQueryValidatorException': 'err.assurance.validator.query.token.exception',
+    'TokenReadinessAnalyzerException': 'err.analyzer.readiness.exception',
+    'TokenRegisterCarrierException': 'err.domain.transit.register.token.exception',
+    'TokenSearchHitConflictException': 'err.search.conflict.token.exception',
+    'TokenSearchPermitterException': 'err.permitter.search.token.exception',
+    'TokenSearchResultEmptyException': 'err.search.empty.token.exception',
+    'TokenSearchRouteException': 'err.route.search.token.exception',
+    'TokenSearcherException': 'err.search.token.exception',
+    'TokenStackEmptyException': 'err.empty.stack.token.exception',
+    'TokenStackFullException': ('err.full.stack.token.exception', 'err.full.stack.team.exception'),
+    'TokenStackNullException': 'err.null.stack.token.exception',
+    'TokenStackPopException': 'err.operation.pop.token.exception',
+    'TokenStackPushException': 'err.operation.push.token.exception',
+    'TokenStackServiceException': 'err.collection.stack.token.exception',
+    'TokenStackSizeException': 'err.size.stack.token.exception',
+    'TokenStateException': 'err.state.token.exception',
+    'TokenToggleBlueprintNullException': 'err.null.blueprint.toggle.token.exception',
+    'TokenToggleCheckerException': 'err.assurance.checker.toggle.token.exception',
+    'TokenTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.token.exception',
+    'TokenTokenOperationException': 'err.operation.token.token.exception',
+    'TokenUndoMovePermitterException': 'err.permitter.maneuver.undo.exception',
+    'TokenValidatorException': ('err.state.validation.token.exception', 'err.assurance.validator.model.state.token.exception'),
+    'TokenWorkerRegistrationException': ('err.state.registration.register.token.exception', 'err.bootstrapper.operation.registration.register.token.exception', 'err.operation.registration.register.token.exception'),
+    'ToolkitException': 'err.toolkit.exception',
+    'ToolkitFactoryException': 'err.factory.toolkit.exception',
+    'TopologyGeneratorException': 'err.movement.generator.exception',
+    'TransactionException': 'err.transaction.exception',
+    'TraversalPatternBlueprintNullException': 'err.null.blueprint.movement.traversal.exception',
+    'TraversalPatternBuilderException': 'err.builder.movement.traversal.exception',
+    'TraversalPatternCarrierException': 'err.domain.transit.movement.traversal.exception',
+    'TraversalPatternCarrierNullException': 'err.null.carrier.movement.traversal.exception',
+    'TraversalPatternException': 'err.movement.traversal.exception',
+    'TraversalSignatureNullException': 'err.null.pattern.traversal.exception',
+    'TupleEmptyException': 'err.empty.container.tuple.exception',
+    'TupleException': 'err.collection.tuple.exception',
+    'TupleNullException': 'err.null.collection.tuple.exception',
+    'TupleSizeException': 'err.size.container.tuple.exception',
+    'UtilException': 'err.util.exception',
+    'ValidationBootstrapException': 'err.state.validation.bootstrap.exception',
+    'ValidatorBootstrapperException': 'err.bootstrapper.validator.exception',
+    'ValidatorException': ('err.state.validation.exception', 'err.assurance.validator.exception'),
+    'VectorAdditionException': ('err.state.math.addition.exception', 'err.bootstrapper.operation.math.addition.exception', 'err.operation.math.addition.exception'),
+    'VectorAssemblyBootstrapperException': 'err.state.bootstrap.assembly.vector.exception',
+    'VectorAssemblyException': ('err.state.assembly.vector.exception', 'err.bootstrapper.operation.assembly.vector.exception', 'err.operation.assembly.vector.exception'),
+    'VectorAssemblyPrimerException': ('err.operation.primer.assembly.vector.exception', 'err.bootstrapper.operation.primer.assembly.vector.exception'),
+    'VectorBlueprintNullException': 'err.null.blueprint.model.vector.exception',
+    'VectorBuildPipelineException': 'err.pipeline.build.vector.exception',
+    'VectorBuildRouteException': 'err.route.build.vector.exception',
+    'VectorBuilderBootstrapperException': 'err.bootstrapper.builder.vector.exception',
+    'VectorBuilderException': ('err.operation.build.vector.exception', 'err.builder.model.vector.exception'),
+    'VectorCarrierException': 'err.domain.transit.model.vector.exception',
+    'VectorCarrierNullException': 'err.null.carrier.model.vector.exception',
+    'VectorChainException': 'err.collection.chain.vector.exception',
+    'VectorChainNullException': 'err.null.collection.chain.vector.exception',
+    'VectorEuclideanException': ('err.state.math.euclidean.exception', 'err.bootstrapper.operation.math.euclidean.exception', 'err.operation.math.euclidean.exception'),
+    'VectorException': ('err.toolkit.vector.exception', 'err.domain.model.cartesian.vector.exception'),
+    'VectorIdentityRegisterBuilderException': 'err.builder.register.identity.exception',
+    'VectorIdentityRegisterConsistencyAuditorException': 'err.assurance.auditor.register.identity.exception',
+    'VectorIdentityRegisterConsistencyCheckerNullException': 'err.null.consistencey.register.identity.exception',
+    'VectorIdentityRegisterMismatchException': 'err.builder.register.identity.mismatch.exception',
+    'VectorIntegrityCheckerException': 'err.assurance.checker.model.vector.exception',
+    'VectorMicroserviceException': 'err.microservice.vector.exception',
+    'VectorNoValidationRouteException': 'err.route.validation.vector.exception',
+    'VectorNodeBlueprintNullException': 'err.null.blueprint.node.vector.exception',
+    'VectorNodeCarrierNullException': 'err.null.carrier.node.vector.exception',
+    'VectorNodeException': 'err.domain.structure.node.vector.exception',
+    'VectorNodeNullException': 'err.null.node.vector.exception',
+    'VectorNullException': 'err.null.model.vector.exception',
+    'VectorOperationBootstrapperException': 'err.bootstrapper.operation.math.exception',
+    'VectorOperationException': 'err.operation.math.exception',
+    'VectorRegisterBlueprintNullException': 'err.null.blueprint.register.vector.exception',
+    'VectorRegisterBuilderException': 'err.builder.register.vector.exception',
+    'VectorRegisterCarrierException': 'err.domain.transit.register.vector.exception',
+    'VectorRegisterCarrierNullException': 'err.null.carrier.register.vector.exception',
+    'VectorRegisterCheckerException': 'err.assurance.checker.register.vector.exception',
+    'VectorRegisterEmptyException': 'err.empty.register.model.vector.exception',
+    'VectorRegisterException': 'err.toolkit.vector.register.exception',
+    'VectorRegisterMicroserviceException': 'err.microservice.vector.register.exception',
+    'VectorRegisterMismatchException': 'err.toolkit.vector.register.mismatch.exception',
+    'VectorRegisterNullException': 'err.null.register.model.vector.exception',
+    'VectorRegisterSizeException': 'err.size.register.model.vector.exception',
+    'VectorRegisterValidatorException': 'err.assurance.validator.register.vector.exception',
+    'VectorSearchRouteException': 'err.route.search.vector.exception',
+    'VectorSetBuilderException': 'err.builder.container.vector.exception',
+    'VectorSetCarrierNullException': 'err.null.carrier.container.vectorset.exception',
+    'VectorSetEmptyException': 'err.empty.container.vector.exception',
+    'VectorSetException': 'err.collection.vector.exception',
+    'VectorSetNullException': 'err.null.collection.vector.exception',
+    'VectorSetSizeException': 'err.size.container.vector.exception',
+    'VectorStateException': 'err.state.math.exception',
+    'VectorToggleBlueprintNullException': 'err.null.blueprint.toggle.vector.exception',
+    'VectorToggleBuilderException': 'err.builder.toggle.vector.exception',
+    'VectorToggleCarrierNullException': 'err.null.carrier.toggle.vector.exception',
+    'VectorToggleCheckerException': 'err.assurance.checker.toggle.vector.exception',
+    'VectorToggleConsistencyAuditorException': 'err.assurance.auditor.operand.exception',
+    'VectorToggleConsistencyCheckerNullException': 'err.null.consistencey.operand.exception',
+    'VectorToggleException': 'err.toolkit.operand.exception',
+    'VectorToggleMicroserviceException': 'err.microservice.operand.exception',
+    'VectorToggleNullException': 'err.null.toggle.vector.exception',
+    'VectorToggleRegisterBlueprintNullException': 'err.null.blueprint.register.vectortogle.exception',
+    'VectorToggleRegisterBuilderException': 'err.builder.register.toggle.exception',
+    'VectorToggleRegisterCarrierNullException': 'err.null.carrier.register.vectortoggle.exception',
+    'VectorToggleRegisterCertifierException': 'err.assurance.checker.register.toggle.exception',
+    'VectorToggleRegisterConsistencyAuditorException': 'err.assurance.auditor.register.operand.exception',
+    'VectorToggleRegisterConsistencyCheckerNullException': 'err.null.consistencey.register.operand.exception',
+    'VectorToggleRegisterEmptyException': 'err.empty.register.model.cartesian.exception',
+    'VectorToggleRegisterMicroserviceException': 'err.microservice.register.operand.exception',
+    'VectorToggleRegisterMismatchException': ('err.microservice.register.operand.mismatch.exception', 'err.assurance.validator.register.toggle.mismatch.exception', 'err.builder.register.toggle.mismatch.exception'),
+    'VectorToggleRegisterNullException': 'err.null.register.model.cartesian.exception',
+    'VectorToggleRegisterSizeException': 'err.size.register.model.cartesian.exception',
+    'VectorToggleRegisterValidatorException': 'err.assurance.validator.register.toggle.exception',
+    'VectorToggleValidatorException': ('err.state.validation.operand.exception', 'err.assurance.validator.operand.exception'),
+    'VectorTokenOperationBootstrapperException': 'err.bootstrapper.operation.token.vector.exception',
+    'VectorTokenOperationException': 'err.operation.token.vector.exception',
+    'VectorTransformException': ('err.state.math.transform.exception', 'err.bootstrapper.operation.math.transform.exception', 'err.operation.math.transform.exception'),
+    'VectorValidatorException': 'err.assurance.validator.model.vector.exception',
+    'WestAxisBlueprintNullException': 'err.null.blueprint.space.axis.west.exception',
+    'WestAxisBuilderException': 'err.builder.space.axis.west.exception',
+    'WestAxisCarrierException': 'err.domain.transit.space.axis.west.exception',
+    'WestAxisCarrierNullException': 'err.null.carrier.space.axis.west.exception',
+    'WestAxisCheckerException': 'err.assurance.checker.space.axis.west.exception',
+    'WestAxisException': 'err.space.axis.west.exception',
+    'WestAxisMappingFunctionException': 'err.mapper.axis.west.exception',
+    'WestAxisNullException': 'err.null.space.axis.west.exception',
+    'WestAxisValidatorException': 'err.assurance.validator.space.axis.west.exception',
+    'WestQuadrantRecurrenceBuilderException': 'err.builder.recurrence.axis.west.exception',
+    'WestQuadrantRecurrenceCarrierNullException': 'err.null.carrier.recurrence.axis.west.exception',
+    'WestQuadrantRecurrenceException': 'err.recurrence.axis.west.exception',
+    'WestQuadrantRecurrenceNullException': 'err.null.recurrence.axis.west.exception',
+    'WestQuadrantRecurrenceValidatorException': 'err.assurance.validator.recurrence.axis.west.exception',
+    'WorkerOpNameColliderBootstrapperException': 'err.bootstrapper.detector.collider.registration.exception',
+    'WorkerOpNameColliderException': 'err.collider.registration.exception',
+    'WorkerOpNameCollisionDetectorException': 'err.detection.collision.registration.exception',
+    'WorkerRegistrationException': ('err.state.registration.register.exception', 'err.bootstrapper.operation.registration.register.exception', 'err.operation.registration.register.exception'),
+    'WorkerRegistryControllerException': 'err.controller.registry.worker.exception',
+    'ZeroArenaBlueprintFlagsException': 'err.assurance.checker.zero.arena.exception',
+    'ZeroBlueprintFlagsException': 'err.assurance.checker.zero.exception',
+    'ZeroBoardBlueprintFlagsException': 'err.assurance.checker.zero.board.exception',
+    'ZeroContextFlagsException': 'err.state.validation.context.zero.exception',
+    'ZeroCoordBlueprintFlagsException': 'err.assurance.checker.zero.coord.exception',
+    'ZeroEdgeBlueprintFlagsException': 'err.assurance.checker.zero.edge.exception',
+    'ZeroFormationBlueprintFlagsException': 'err.assurance.checker.zero.formation.exception',
+    'ZeroGameBlueprintFlagsException': 'err.assurance.checker.zero.game.exception',
+    'ZeroHostageBlueprintFlagsException': 'err.assurance.checker.zero.hostage.exception',
+    'ZeroNodeBlueprintFlagsException': 'err.assurance.checker.zero.node.exception',
+    'ZeroOrientationToggleActivationException': 'err.assurance.validator.toggle.zero.orientation.exception',
+    'ZeroPersonaBlueprintFlagsException': 'err.assurance.checker.zero.persona.exception',
+    'ZeroPlayerBlueprintFlagsException': 'err.assurance.checker.zero.player.exception',
+    'ZeroRankBlueprintFlagsException': 'err.assurance.checker.zero.rank.exception',
+    'ZeroSchemaBlueprintFlagsException': 'err.assurance.checker.zero.schema.exception',
+    'ZeroSquareBlueprintFlagsException': 'err.assurance.checker.zero.square.exception',
+    'ZeroTeamBlueprintFlagsException': 'err.assurance.checker.zero.team.exception',
+    'ZeroToggleActivationException': 'err.assurance.validator.toggle.zero.exception',
+    'ZeroTokenBlueprintFlagsException': 'err.assurance.checker.zero.token.exception',
+    'ZeroVectorToggleActivationException': 'err.assurance.validator.toggle.zero.vector.exception',
+    'ZeroVectorToggleFlagsException': ('err.state.validation.context.zero.operand.exception', 'err.assurance.checker.zero.operand.exception'),
+}
+
+OVERRIDES: Dict[str, Dict[str, str]] = {
+    'err.assurance.checker.model': {
+        'BlueprintHomeSquareExtractorException': 'err.assurance.checker.model.vector.home.exception',
+        'BlueprintRankExtractorException': 'err.assurance.checker.model.vector.rank.exception',
+    },
+    'err.bootstrapper': {
+        'ArenaStackPushException': 'err.bootstrapper.operation.push.stack.team.exception',
+        'ArenaStackRegistrationException': 'err.bootstrapper.operation.registration.stack.token.exception',
+    },
+    'err.bootstrapper.operation': {
+        'ArenaStackPushException': 'err.bootstrapper.operation.push.stack.team.exception',
+        'ArenaStackRegistrationException': 'err.bootstrapper.operation.registration.stack.token.exception',
+    },
+    'err.bootstrapper.operation.push': {
+        'ArenaStackPushException': 'err.bootstrapper.operation.push.stack.team.exception',
+    },
+    'err.bootstrapper.operation.push.stack': {
+        'ArenaStackPushException': 'err.bootstrapper.operation.push.stack.team.exception',
+    },
+    'err.bootstrapper.operation.registration': {
+        'ArenaStackRegistrationException': 'err.bootstrapper.operation.registration.stack.token.exception',
+    },
+    'err.bootstrapper.operation.registration.stack': {
+        'ArenaStackRegistrationException': 'err.bootstrapper.operation.registration.stack.token.exception',
+    },
+    'err.collider': {
+        'SquareNameCollisionException': 'err.collider.name.square.exception',
+        'TokenIdCollisionException': 'err.collider.id.token.exception',
+    },
+    'err.domain': {
+        'HumanPlayerException': 'err.domain.transit.register.player.human.exception',
+        'MachinePlayerException': 'err.domain.transit.register.player.machine.exception',
+        'OpeningSquareException': 'err.domain.transit.register.square.opening.exception',
+    },
+    'err.domain.transit': {
+        'HumanPlayerException': 'err.domain.transit.register.player.human.exception',
+        'MachinePlayerException': 'err.domain.transit.register.player.machine.exception',
+        'OpeningSquareException': 'err.domain.transit.register.square.opening.exception',
+    },
+    'err.operation': {
+        'ArenaStackPushException': 'err.operation.push.stack.team.exception',
+        'ArenaStackRegistrationException': 'err.operation.registration.stack.token.exception',
+    },
+    'err.operation.push': {
+        'ArenaStackPushException': 'err.operation.push.stack.team.exception',
+    },
+    'err.operation.push.stack': {
+        'ArenaStackPushException': 'err.operation.push.stack.team.exception',
+    },
+    'err.operation.registration': {
+        'ArenaStackRegistrationException': 'err.operation.registration.stack.token.exception',
+    },
+    'err.operation.registration.stack': {
+        'ArenaStackRegistrationException': 'err.operation.registration.stack.token.exception',
+    },
+}
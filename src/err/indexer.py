@@ -0,0 +1,260 @@
+# src/err/indexer.py
+
+"""
+Module: err.indexer
+Author: Banji Lawal
+Created: 2026-04-04
+version: 0.0.2
+
+Regenerates err/index.py. Run from src after adding, moving or renaming an exception:
+
+    python -m err.indexer
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class ErrIndexBuilder:
+    """
+    Role:
+        -   Code Generation
+
+    Responsibilities:
+        1.  Work out what every err package exports by reading its __init__ imports
+            with ast, without importing anything.
+        2.  Write the name -> module index that err.loader resolves lazy attributes from.
+
+    Attributes:
+        ROOT_PACKAGE = err
+        INDEX_MODULE = index
+
+    Provides:
+        -   def build() -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Dict[str, str]], List[str]]
+        -   def write(path: str, exports, overrides, skipped) -> None
+
+    Super Class:
+    """
+    ROOT_PACKAGE: str = "err"
+    INDEX_MODULE: str = "index"
+
+    _root: str
+    _resolved: Dict[str, Dict[str, str]]
+    _trees: Dict[str, Optional[ast.Module]]
+    _skipped: List[str]
+    _in_progress: Set[str]
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: str. The directory holding the err package, i.e. src.
+        """
+        self._root = root
+        self._resolved = {}
+        self._trees = {}
+        self._skipped = []
+        self._in_progress = set()
+
+    def build(self) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Dict[str, str]], List[str]]:
+        """
+        Returns:
+            exports: For each name, its candidate modules. The first is what `err` exports.
+                For a subpackage the first candidate inside that subpackage wins.
+            overrides: Per-package answers for the few names the candidate order can't express.
+            skipped: Files that could not be parsed or found.
+        """
+        root_exports = self._resolve(self.ROOT_PACKAGE)
+
+        # Winning module of every name in every package.
+        winners: Dict[str, Dict[str, str]] = {}
+        for package, names in self._resolved.items():
+            for name, module in names.items():
+                winners.setdefault(name, {})[package] = module
+
+        exports: Dict[str, Tuple[str, ...]] = {}
+        overrides: Dict[str, Dict[str, str]] = {}
+        for name in sorted(winners):
+            by_package = winners[name]
+            ordered: List[str] = []
+            if name in root_exports:
+                ordered.append(root_exports[name])
+            # Deeper packages first, so a subpackage finds its own winner before an ancestor's.
+            for package in sorted(by_package, key=lambda p: (-p.count("."), p)):
+                if by_package[package] not in ordered:
+                    ordered.append(by_package[package])
+            exports[name] = tuple(ordered)
+            for package, module in by_package.items():
+                if self._first_in(package, ordered) != module:
+                    overrides.setdefault(package, {})[name] = module
+        return exports, overrides, sorted(set(self._skipped))
+
+    @staticmethod
+    def _first_in(package: str, candidates: List[str]) -> Optional[str]:
+        prefix = package + "."
+        for module in candidates:
+            if package == ErrIndexBuilder.ROOT_PACKAGE or module.startswith(prefix):
+                return module
+        return None
+
+    def _path(self, dotted: str) -> Tuple[Optional[str], bool]:
+        """The file behind a dotted name and whether it is a package."""
+        base = os.path.join(self._root, *dotted.split("."))
+        if os.path.isfile(os.path.join(base, "__init__.py")):
+            return os.path.join(base, "__init__.py"), True
+        if os.path.isfile(base + ".py"):
+            return base + ".py", False
+        return None, False
+
+    def _tree(self, path: str) -> Optional[ast.Module]:
+        if path not in self._trees:
+            try:
+                with open(path, encoding="utf-8") as file:
+                    self._trees[path] = ast.parse(file.read(), filename=path)
+            except (SyntaxError, UnicodeDecodeError):
+                self._trees[path] = None
+                self._skipped.append(os.path.relpath(path, self._root))
+        return self._trees[path]
+
+    def _resolve(self, dotted: str) -> Dict[str, str]:
+        """Names a package or module exports, mapped to the module that defines them."""
+        if dotted in self._resolved:
+            return self._resolved[dotted]
+        path, is_package = self._path(dotted)
+        if path is None:
+            self._skipped.append(dotted)
+            return {}
+        tree = self._tree(path)
+        if tree is None:
+            return {}
+        if not is_package:
+            return {name: dotted for name in self._module_names(tree)}
+        if dotted in self._in_progress:
+            return {}
+
+        self._in_progress.add(dotted)
+        names: Dict[str, str] = {}
+        for node in self._import_nodes(tree):
+            source = self._absolute(dotted, node)
+            if source is None:
+                continue
+            if any(alias.name == "*" for alias in node.names):
+                names.update(self._resolve(source))
+                continue
+            source_path, source_is_package = self._path(source)
+            if source_path is None:
+                # `from .pkg import module` style imports name submodules, not exports.
+                continue
+            exported = self._resolve(source) if source_is_package else None
+            for alias in node.names:
+                if exported is None:
+                    names[alias.asname or alias.name] = source
+                elif alias.name in exported:
+                    names[alias.asname or alias.name] = exported[alias.name]
+        self._in_progress.discard(dotted)
+        self._resolved[dotted] = names
+        return names
+
+    @staticmethod
+    def _import_nodes(tree: ast.Module) -> List[ast.ImportFrom]:
+        """
+        The `from ... import` statements that declare a package's exports. Lazy packages
+        keep them under `if TYPE_CHECKING:`; anything else is a plain top-level import.
+        """
+        for node in tree.body:
+            if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+                return [child for child in node.body if isinstance(child, ast.ImportFrom)]
+        return [node for node in tree.body if isinstance(node, ast.ImportFrom)]
+
+    @staticmethod
+    def _absolute(package: str, node: ast.ImportFrom) -> Optional[str]:
+        if node.level == 0:
+            return node.module if node.module and node.module.split(".")[0] == ErrIndexBuilder.ROOT_PACKAGE else None
+        parts = package.split(".")
+        base = parts[:len(parts) - node.level + 1]
+        return ".".join(base + ([node.module] if node.module else []))
+
+    @staticmethod
+    def _module_names(tree: ast.Module) -> List[str]:
+        """What `from module import *` would bind: __all__ if present, else public definitions."""
+        for node in tree.body:
+            if (
+                    isinstance(node, ast.Assign)
+                    and any(isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets)
+                    and isinstance(node.value, (ast.List, ast.Tuple))
+            ):
+                return [element.value for element in node.value.elts if isinstance(element, ast.Constant)]
+        names: List[str] = []
+        for node in tree.body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                names.append(node.name)
+            elif isinstance(node, ast.Assign):
+                names.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+        return [name for name in names if not name.startswith("_")]
+
+    @classmethod
+    def write(
+            cls,
+            path: str,
+            exports: Dict[str, Tuple[str, ...]],
+            overrides: Dict[str, Dict[str, str]],
+            skipped: List[str],
+    ) -> None:
+        lines = [
+            "# src/err/index.py",
+            "",
+            '"""',
+            "Module: err.index",
+            "Author: Banji Lawal",
+            "Created: 2026-04-04",
+            "version: 0.0.2",
+            "",
+            "GENERATED by `python -m err.indexer`. Do not edit by hand.",
+            "",
+            "EXPORTS maps every exported name to its candidate modules. `err` takes the first;",
+            "a subpackage takes the first candidate inside itself. OVERRIDES holds the",
+            "per-package exceptions to that rule.",
+            '"""',
+            "",
+            "from typing import Dict, Tuple, Union",
+            "",
+        ]
+        if skipped:
+            lines.append("# Not indexed because they could not be parsed or found:")
+            lines.extend(f"#   {entry}" for entry in skipped)
+            lines.append("")
+        lines.append("EXPORTS: Dict[str, Union[str, Tuple[str, ...]]] = {")
+        for name, modules in exports.items():
+            value = repr(modules[0]) if len(modules) == 1 else repr(modules)
+            lines.append(f"    {name!r}: {value},")
+        lines.append("}")
+        lines.append("")
+        lines.append("OVERRIDES: Dict[str, Dict[str, str]] = {")
+        for package in sorted(overrides):
+            lines.append(f"    {package!r}: {{")
+            for name in sorted(overrides[package]):
+                lines.append(f"        {name!r}: {overrides[package][name]!r},")
+            lines.append("    },")
+        lines.append("}")
+        lines.append("")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines))
+
+
+def main() -> None:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    exports, overrides, skipped = ErrIndexBuilder(root).build()
+    path = os.path.join(root, ErrIndexBuilder.ROOT_PACKAGE, f"{ErrIndexBuilder.INDEX_MODULE}.py")
+    ErrIndexBuilder.write(path, exports, overrides, skipped)
+    print(
+        f"Indexed {len(exports)} names, {sum(len(v) for v in overrides.values())} overrides, "
+        f"{len(skipped)} skipped -> {os.path.relpath(path, root)}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,19 @@ Created: 2025-10-03
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.SYSTEM.ERR.BOUNDS PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .base import BoundsException
-from .below import BoundsException
-from .above import AboveBoundsException
\ No newline at end of file
+    # Modules
+    from .base import BoundsException
+    from .below import BoundsException
+    from .above import AboveBoundsException
@@ -7,10 +7,18 @@ Created: 2026-02-25
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.SYSTEM.ERR.DEBUG PACKAGE ===========#
 
-# Packages
-from .child import *
-from .root import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .child import *
+    from .root import *
 
-# Modules
+    # Modules
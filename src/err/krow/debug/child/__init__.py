@@ -7,12 +7,20 @@ Created: 2026-02-25
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.SYSTEM.ERR.DEBUG.CHILD PACKAGE ===========#
 
-# Packages
-from .method import *
-from .unique import *
-from .invariant import *
-from .inconsistent import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .method import *
+    from .unique import *
+    from .invariant import *
+    from .inconsistent import *
 
-# Modules
\ No newline at end of file
+    # Modules
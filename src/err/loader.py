@@ -0,0 +1,102 @@
+# src/err/loader.py
+
+"""
+Module: err.loader
+Author: Banji Lawal
+Created: 2026-04-04
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, List, Optional, Tuple
+
+from err.index import EXPORTS, OVERRIDES
+
+
+class LazyExportLoader:
+    """
+    Role:
+        -   Module Loader
+
+    Responsibilities:
+        1.  Give err and its subpackages a module __getattr__ that imports an exception's
+            module the first time the exception is referenced.
+        2.  Find the module through err.index instead of importing the package tree.
+
+    Attributes:
+        package: str
+
+    Provides:
+        -   def attach(package: str) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]
+        -   def locate(name: str) -> Optional[str]
+
+    Super Class:
+    """
+    ROOT_PACKAGE: str = "err"
+
+    _package: str
+    _prefix: str
+
+    def __init__(self, package: str):
+        """
+        Args:
+            package: str. Dotted name of the package being made lazy.
+        """
+        self._package = package
+        self._prefix = package + "."
+
+    @property
+    def package(self) -> str:
+        return self._package
+
+    @classmethod
+    def attach(cls, package: str) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+        """
+        Usage, in a package __init__:
+            __getattr__, __dir__ = LazyExportLoader.attach(__name__)
+        """
+        loader = cls(package)
+        return loader.load, loader.names
+
+    def locate(self, name: str) -> Optional[str]:
+        """The module this package exports `name` from, or None."""
+        override = OVERRIDES.get(self._package)
+        if override is not None and name in override:
+            return override[name]
+        candidates = EXPORTS.get(name)
+        if candidates is None:
+            return None
+        if isinstance(candidates, str):
+            candidates = (candidates,)
+        if self._package == self.ROOT_PACKAGE:
+            return candidates[0]
+        for module in candidates:
+            if module.startswith(self._prefix):
+                return module
+        return None
+
+    def load(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(f"module {self._package!r} has no attribute {name!r}")
+        module_name = self.locate(name)
+        if module_name is not None:
+            value = getattr(import_module(module_name), name)
+        else:
+            # Not an export, but possibly a subpackage or submodule, e.g. `err.analyzer`.
+            try:
+                value = import_module(self._prefix + name)
+            except ModuleNotFoundError as e:
+                if e.name != self._prefix + name:
+                    raise
+                raise AttributeError(f"module {self._package!r} has no attribute {name!r}") from None
+        # Bind it on the package so the next lookup is a plain attribute hit.
+        setattr(sys.modules[self._package], name, value)
+        return value
+
+    def names(self) -> List[str]:
+        package = sys.modules[self._package]
+        exported = {name for name in EXPORTS if self.locate(name) is not None}
+        return sorted(exported | set(vars(package)))
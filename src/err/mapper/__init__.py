@@ -7,14 +7,20 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
-# =========== ERR.MAPPING PACKAGE ===========#
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
 
-# Packages
-from .axis import *
-from .quadrant import *
-from .stream import *
+# =========== ERR.MAPPING PACKAGE ===========#
 
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
+    from .axis import *
+    from .quadrant import *
+    from .stream import *
 
-# Modules
-from .exception import MappingFunctionException
\ No newline at end of file
+    # Modules
+    from .exception import MappingFunctionException
@@ -7,12 +7,19 @@ Created: 2025-11-22
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.BOARD.DATABASE.CORE.EXCEPTION.DELETION PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .work import BoardDeletionException
-from. emptty import PoppingEmptyBoardStackException
-from .unfound import BoardDoesNotExistForRemovalException
\ No newline at end of file
+    # Modules
+    from .work import BoardDeletionException
+    from. emptty import PoppingEmptyBoardStackException
+    from .unfound import BoardDoesNotExistForRemovalException
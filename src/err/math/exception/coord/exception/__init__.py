@@ -7,10 +7,17 @@ Created: 2026-03-14
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.COORD.DATABASE.CORE.EXCEPTION PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .anchor import CoordStackServiceException
\ No newline at end of file
+    # Modules
+    from .anchor import CoordStackServiceException
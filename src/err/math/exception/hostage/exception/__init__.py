@@ -7,12 +7,20 @@ Created: 2025-10-01
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.HOSTAGE.DATABASE.CORE.EXCEPTION PACKAGE ===========#
 
-# Packages
-from .search import *
-from .deletion import *
-from .insertion import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .search import *
+    from .deletion import *
+    from .insertion import *
 
-# Modules
-from .anchor import HostageStackServiceException
\ No newline at end of file
+    # Modules
+    from .anchor import HostageStackServiceException
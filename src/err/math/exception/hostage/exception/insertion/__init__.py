@@ -7,11 +7,18 @@ Created: 2025-10-01
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.HOSTAGE.DATABASE.CORE.EXCEPTION.INSERTION PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .work import HostageInsertionException
-from .direct import AppendingHostageDirectlyIntoItemsFailedException
\ No newline at end of file
+    # Modules
+    from .work import HostageInsertionException
+    from .direct import AppendingHostageDirectlyIntoItemsFailedException
@@ -7,11 +7,19 @@ Created: 2025-11-24
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.TEAM.DATABASE.CORE.EXCEPTION PACKAGE ===========#
 
-# Packages
-from .pop import *
-from .push import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .pop import *
+    from .push import *
 
-# Modules
-from .anchor import TeamStackServiceException
+    # Modules
+    from .anchor import TeamStackServiceException
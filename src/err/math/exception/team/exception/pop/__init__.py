@@ -8,12 +8,19 @@ Created: 2025-11-24
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.TEAM.DATABASE.CORE.EXCEPTION.POP PACKAGE ===========#
 
-# Packages
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
-# Modules
-from .work import PoppingTeamStackFailedException
-from .empty import PoppingEmptyTeamStackException
-from .unfound import TeamDoesNotExistForRemovalException
\ No newline at end of file
+    # Modules
+    from .work import PoppingTeamStackFailedException
+    from .empty import PoppingEmptyTeamStackException
+    from .unfound import TeamDoesNotExistForRemovalException
@@ -7,12 +7,20 @@ Created: 2025-11-19
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.TOKEN.DATABASE.KERNEL.EXCEPTION PACKAGE ===========#
 
-# Packages
-from .pop import *
-from .push import *
-from .query import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .pop import *
+    from .push import *
+    from .query import *
 
-# Modules
-from .anchor import TokenStackServiceException
\ No newline at end of file
+    # Modules
+    from .anchor import TokenStackServiceException
@@ -7,37 +7,45 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.NULL PACKAGE ===========#
 
-# Packages
-from .array import *
-from .blueprint import *
-from .carrier import *
-from .collection import *
-from .color import *
-from .consistencey import *
-from .collection import *
-from .context import *
-from .database import *
-from .dependecy import *
-from .toggle import *
-from .identifier import *
-from .microservice import *
-from .model import *
-from .pattern import *
-from .toggle import *
-from .node import *
-from .number import *
-from .operation import *
-from .query import *
-from .recurrence import *
-from .register import *
-from .relation import *
-from .request import *
-from .schema import *
-from .space import *
-from .stack import *
-from .string import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .array import *
+    from .blueprint import *
+    from .carrier import *
+    from .collection import *
+    from .color import *
+    from .consistencey import *
+    from .collection import *
+    from .context import *
+    from .database import *
+    from .dependecy import *
+    from .toggle import *
+    from .identifier import *
+    from .microservice import *
+    from .model import *
+    from .pattern import *
+    from .toggle import *
+    from .node import *
+    from .number import *
+    from .operation import *
+    from .query import *
+    from .recurrence import *
+    from .register import *
+    from .relation import *
+    from .request import *
+    from .schema import *
+    from .space import *
+    from .stack import *
+    from .string import *
 
-# Modules
-from .exception import NullException
\ No newline at end of file
+    # Modules
+    from .exception import NullException
@@ -7,15 +7,23 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.NULL.BLUEPRINT PACKAGE ===========#
 
-# Packages
-from .model import *
-from .node import *
-from .movement import *
-from .register import *
-from .space import *
-from .toggle import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .model import *
+    from .node import *
+    from .movement import *
+    from .register import *
+    from .space import *
+    from .toggle import *
 
-# Modules
-from .exception import BlueprintNullException
\ No newline at end of file
+    # Modules
+    from .exception import BlueprintNullException
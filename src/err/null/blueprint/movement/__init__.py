@@ -7,13 +7,20 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.NULL.BLUEPRINT.MOVEMENT PACKAGE ===========#
 
-# Packages
-from .offset import *
-from .pawn import *
-from .traversal import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
+    from .offset import *
+    from .pawn import *
+    from .traversal import *
 
-# Modules
-from .exception import MovementPatternBlueprintNullException
\ No newline at end of file
+    # Modules
+    from .exception import MovementPatternBlueprintNullException
@@ -7,11 +7,19 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.NULL.BLUEPRINT.MOVEMENT.OFFSET PACKAGE ===========#
 
-# Packages
-from .king import *
-from .knight import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .king import *
+    from .knight import *
 
-# Modules
-from .exception import OffsetPatternBlueprintNullException
+    # Modules
+    from .exception import OffsetPatternBlueprintNullException
@@ -7,13 +7,21 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.NULL.BLUEPRINT.REGISTER PACKAGE ===========#
 
-# Packages
-from .identity import *
-from .square import *
-from .vector import *
-from .vectortogle import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .identity import *
+    from .square import *
+    from .vector import *
+    from .vectortogle import *
 
-# Modules
-from .exception import RegisterBlueprintNullException
\ No newline at end of file
+    # Modules
+    from .exception import RegisterBlueprintNullException
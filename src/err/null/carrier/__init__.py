@@ -7,17 +7,25 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.NULL.CARRIER PACKAGE ===========#
 
-# Packages
-from .container import *
-from .model import *
-from .movement import *
-from .node import *
-from .recurrence import *
-from .register import *
-from .space import *
-from .toggle import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .container import *
+    from .model import *
+    from .movement import *
+    from .node import *
+    from .recurrence import *
+    from .register import *
+    from .space import *
+    from .toggle import *
 
-# Modules
-from .exception import EntityCarrierNullException
\ No newline at end of file
+    # Modules
+    from .exception import EntityCarrierNullException
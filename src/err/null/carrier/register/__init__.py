@@ -7,13 +7,21 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.NULL.CARRIER.REGISTER PACKAGE ===========#
 
-# Packages
-from .identity import *
-from .square import *
-from .vector import *
-from .vectortoggle import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .identity import *
+    from .square import *
+    from .vector import *
+    from .vectortoggle import *
 
-# Modules
-from .exception import RegisterCarrierNullException
+    # Modules
+    from .exception import RegisterCarrierNullException
@@ -7,12 +7,20 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.NULL.CONSISTENCY.TOKEN.DISABLED PACKAGE ===========#
 
-# Packages
-from .attack import *
-from .maneuver import *
-from .pawn import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .attack import *
+    from .maneuver import *
+    from .pawn import *
 
-# Modules
-from .exception import DisabledTokenConsistencyCheckerNullException
\ No newline at end of file
+    # Modules
+    from .exception import DisabledTokenConsistencyCheckerNullException
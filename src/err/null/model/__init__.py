@@ -7,15 +7,23 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.NULL.MODEL PACKAGE ===========#
 
-# Packages
-from .binder import *
-from .coord import *
-from .rank import *
-from .scalar import *
-from .state import *
-from .vector import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .binder import *
+    from .coord import *
+    from .rank import *
+    from .scalar import *
+    from .state import *
+    from .vector import *
 
-# Modules
-from .exception import ModelNullException
\ No newline at end of file
+    # Modules
+    from .exception import ModelNullException
@@ -7,17 +7,25 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.NULL.REQUEST PACKAGE ===========#
 
-# Packages
-from .deletion import *
-from .insertion import *
-from .maneuver import *
-from .promotion import *
-from .pop import *
-from .push import *
-from .search import *
-from .slot import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .deletion import *
+    from .insertion import *
+    from .maneuver import *
+    from .promotion import *
+    from .pop import *
+    from .push import *
+    from .search import *
+    from .slot import *
 
-# Modules
-from .exception import RequestNullException
\ No newline at end of file
+    # Modules
+    from .exception import RequestNullException
@@ -7,12 +7,20 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.NULL.SPACE PACKAGE ===========#
 
-# Packages
-from .axis import *
-from .quadrant import *
-from .reservoir import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .axis import *
+    from .quadrant import *
+    from .reservoir import *
 
-# Modules
-from .exception import SpaceNullException
+    # Modules
+    from .exception import SpaceNullException
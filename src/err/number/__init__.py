@@ -7,12 +7,20 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.NUMBER PACKAGE ===========#
 
-# Packages
-from .above import *
-from .below import *
-from .negative import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .above import *
+    from .below import *
+    from .negative import *
 
-# Modules
-from .exception import NumberException
\ No newline at end of file
+    # Modules
+    from .exception import NumberException
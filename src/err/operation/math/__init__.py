@@ -7,14 +7,22 @@ Created: 2026-04-07
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.VECTOR PACKAGE ===========#
 
-# Packages
-from .transform import *
-from .euclidean import *
-from .exception import *
-from .product import *
-from .addition import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .transform import *
+    from .euclidean import *
+    from .exception import *
+    from .product import *
+    from .addition import *
 
-# Modules
-from .exception import VectorOperationException
\ No newline at end of file
+    # Modules
+    from .exception import VectorOperationException
@@ -7,16 +7,24 @@ Created: 2026-04-07
 version: 1.0.0
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.PERMITTER PACKAGE ===========#
 
-# Packages
-from .delete import *
-from .maneuver import *
-from .pop import *
-from .promotion import *
-from .push import *
-from .search import *
-from .slot import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .delete import *
+    from .maneuver import *
+    from .pop import *
+    from .promotion import *
+    from .push import *
+    from .search import *
+    from .slot import *
 
-# Modules
-from .exception import PermitterException
\ No newline at end of file
+    # Modules
+    from .exception import PermitterException
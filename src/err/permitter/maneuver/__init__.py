@@ -7,11 +7,19 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.PERMITTER.MANEUVER PACKAGE ===========#
 
-# Packages
-from .deployed import *
-from .undo import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .deployed import *
+    from .undo import *
 
-# Modules
-from .exception import ManeuverPermitterException
\ No newline at end of file
+    # Modules
+    from .exception import ManeuverPermitterException
@@ -7,12 +7,20 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.ROUTE PACKAGE ===========#
 
-# Packages
-from .build import *
-from .search import *
-from .validation import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .build import *
+    from .search import *
+    from .validation import *
 
-# Modules
-from .exception import ExecutionRouteException
\ No newline at end of file
+    # Modules
+    from .exception import ExecutionRouteException
@@ -83,11 +83,10 @@ class SearchRouteException(ExecutionRouteException):
             cls_mthd=cls_mthd,
            mthd_rslt_type=mthd_rslt_type,
         )
-        self._mthd_rslt_type = mthd_rslt
     
     @property
     def mthd_rslt(self) -> Optional[str]:
-        return self._mthd_rslt
+        return self._mthd_rslt_type
     
     def __str__(self):
-        return f"{super().__str__()},  mthd_rslt_type:{self._mthd_rslt}"
\ No newline at end of file
+        return f"{super().__str__()},  mthd_rslt_type:{self._mthd_rslt_type}"
\ No newline at end of file
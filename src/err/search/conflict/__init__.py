@@ -7,26 +7,33 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.SEARCH.EMPTY PACKAGE ===========#
 
-# Packages
-from .arena import *
-from .attack import *
-from .board import *
-from .coord import *
-from .edge import *
-from .game import *
-from .graph import *
-from .node import *
-from .origin import *
-from .path import *
-from .player import *
-from .prison import *
-from .rank import *
-from .square import *
-from .team import *
-from .token import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
+    from .attack import *
+    from .board import *
+    from .coord import *
+    from .edge import *
+    from .game import *
+    from .graph import *
+    from .node import *
+    from .origin import *
+    from .path import *
+    from .player import *
+    from .prison import *
+    from .rank import *
+    from .square import *
+    from .team import *
+    from .token import *
 
-# Modules
-from .exception import SearchHitConflictException
\ No newline at end of file
+    # Modules
+    from .exception import SearchHitConflictException
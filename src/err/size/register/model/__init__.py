@@ -7,14 +7,21 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.SIZE.REGISTER.MODEL PACKAGE ===========#
 
-# Packages
-from .cartesian import *
-from .square import *
-from .number import *
-from .vector import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
+    from .cartesian import *
+    from .square import *
+    from .number import *
+    from .vector import *
 
-# Modules
-from .exception import ModelRegisterSizeException
\ No newline at end of file
+    # Modules
+    from .exception import ModelRegisterSizeException
@@ -7,15 +7,21 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
-# ============ ERR.SIZE.SPACE PACKAGE ===========#
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
 
-# Packages
+# ============ ERR.SIZE.SPACE PACKAGE ===========#
 
-from .destination import *
-from .linear import *
-from .span import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
 
+    from .destination import *
+    from .linear import *
+    from .span import *
 
-# Modules
-from .exception import SpaceSizeException
\ No newline at end of file
+    # Modules
+    from .exception import SpaceSizeException
@@ -7,13 +7,21 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.SIZE.SPACE.SEGMENT.SEGMENT PACKAGE ===========#
 
-# Packages
-from .axis import *
-from .origin import *
-from .quadrant import *
-from .terminus import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .axis import *
+    from .origin import *
+    from .quadrant import *
+    from .terminus import *
 
-# Modules
-from .exception import LineSegmentSizeException
\ No newline at end of file
+    # Modules
+    from .exception import LineSegmentSizeException
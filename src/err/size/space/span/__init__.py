@@ -7,13 +7,19 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
-# ============ ERR.SIZE.SPACE.SPAN PACKAGE ===========#
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
 
-# Packages
-from .basis import *
-from .movement import *
+# ============ ERR.SIZE.SPACE.SPAN PACKAGE ===========#
 
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
+if TYPE_CHECKING:
+    # Packages
+    from .basis import *
+    from .movement import *
 
-# Modules
-from .exception import SpanSizeException
\ No newline at end of file
+    # Modules
+    from .exception import SpanSizeException
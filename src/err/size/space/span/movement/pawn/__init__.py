@@ -7,11 +7,19 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.SIZE.SPACE.SPAN.MOVEMENT.PAWN PACKAGE ===========#
 
-# Packages
-from .maneuver import *
-from .attack import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .maneuver import *
+    from .attack import *
 
-# Modules
-from .exception import PawnMovementSetSizeException
+    # Modules
+    from .exception import PawnMovementSetSizeException
@@ -6,6 +6,10 @@ Author: Banji Lawal
 Created: 2026-04-04
 version: 0.0.2
 """
+
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
 # src/err/state/validation/__init__.py
 
 """
@@ -17,23 +21,27 @@ version: 0.0.2
 
 # =========== ERR.STATE.VALIDATION.CONTEXT.CONTEXT PACKAGE ===========#
 
-# Packages
-from .arena import *
-from .board import *
-from .coord import *
-from .edge import *
-from .excess import *
-from .formation import *
-from .game import *
-from .hostage import *
-from .node import *
-from .persona import *
-from .player import *
-from .rank import *
-from .schema import *
-from .square import *
-from .token import *
-from .zero import *
-
-# Modules
-from .exception import ContextValidatorException
\ No newline at end of file
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .arena import *
+    from .board import *
+    from .coord import *
+    from .edge import *
+    from .excess import *
+    from .formation import *
+    from .game import *
+    from .hostage import *
+    from .node import *
+    from .persona import *
+    from .player import *
+    from .rank import *
+    from .schema import *
+    from .square import *
+    from .token import *
+    from .zero import *
+
+    # Modules
+    from .exception import ContextValidatorException
@@ -7,27 +7,34 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
 
-# Packages
-# =========== ERR.STATE.VALIDATION.CONTEXT.EXCESS PACKAGE ===========#
+from err.loader import LazyExportLoader
 
-# Packages
-from .arena import *
-from .board import *
-from .coord import *
-from .edge import *
-from .formation import *
-from .game import *
-from .hostage import *
-from .operand import *
-from .node import *
-from .persona import *
-from .player import *
-from .rank import *
-from .schema import *
-from .square import *
-from .team import *
-from .token import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
 
-# Modules
-from .exception import ExcessContextFlagsException
\ No newline at end of file
+if TYPE_CHECKING:
+    # Packages
+    # =========== ERR.STATE.VALIDATION.CONTEXT.EXCESS PACKAGE ===========#
+
+    # Packages
+    from .arena import *
+    from .board import *
+    from .coord import *
+    from .edge import *
+    from .formation import *
+    from .game import *
+    from .hostage import *
+    from .operand import *
+    from .node import *
+    from .persona import *
+    from .player import *
+    from .rank import *
+    from .schema import *
+    from .square import *
+    from .team import *
+    from .token import *
+
+    # Modules
+    from .exception import ExcessContextFlagsException
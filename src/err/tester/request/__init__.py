@@ -7,14 +7,22 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # ============ ERR.TESTER.REQUEST PACKAGE ===========#
 
-# Packages
-from .deletion import *
-from .maneuver import *
-from .push import *
-from .pop import *
-from .promotion import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .deletion import *
+    from .maneuver import *
+    from .push import *
+    from .pop import *
+    from .promotion import *
 
-# Modules
-from .exception import RequestTesterException
+    # Modules
+    from .exception import RequestTesterException
@@ -7,14 +7,22 @@ Created: 2026-04-04
 version: 0.0.2
 """
 
+from typing import TYPE_CHECKING
+
+from err.loader import LazyExportLoader
+
 # =========== ERR.TRANSACTION PACKAGE ===========#
 
-# Packages
-from .compuation import *
-from .deletion import *
-from .insertion import *
-from .search import *
-from .update import *
+# Exports are imported on first access through err.index. See err.loader.
+__getattr__, __dir__ = LazyExportLoader.attach(__name__)
+
+if TYPE_CHECKING:
+    # Packages
+    from .compuation import *
+    from .deletion import *
+    from .insertion import *
+    from .search import *
+    from .update import *
 
-# Modules
-from .exception import TransactionException
\ No newline at end of file
+    # Modules
+    from .exception import TransactionException
@@ -13,7 +13,7 @@ from domain.metadata.blueprint import CoordBlueprint
 from result import BuildResult
 from fabrication.assembler import ModelAssembler
 from util import LoggingLevelRouter
-from domain.model import Coord
+from domain.model import Coord, CoordTable
 
 class CoordAssembler(ModelAssembler[Coord]):
     """
@@ -45,7 +45,7 @@ class CoordAssembler(ModelAssembler[Coord]):
         """
         method = f"{self.__class__.__name__}.execute"
         return BuildResult.success(
-            Coord(row=blueprint.row, column=blueprint.column,)
+            CoordTable.get(row=blueprint.row, column=blueprint.column)
         )
         
         
@@ -10,7 +10,7 @@ version: 0.0.2
 from __future__ import annotations
 
 from domain.metadata.blueprint import VectorBlueprint
-from domain.model import Vector
+from domain.model import Vector, VectorTable
 from result import BuildResult
 from fabrication.assembler import ModelAssembler
 from util import  LoggingLevelRouter
@@ -45,6 +45,8 @@ class VectorAssembler(ModelAssembler[Vector]):
         Raises:
         """
         method = f"{self.__class__.__name__}.execute"
-        return BuildResult.success(Vector(x=blueprint.x, y=blueprint.y))
+        return BuildResult.success(
+            VectorTable.get(x=blueprint.x, y=blueprint.y) or Vector(x=blueprint.x, y=blueprint.y)
+        )
         
         
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 
 from fabrication.assembler import RegisterAssembler
-from domain.model import Coord
+from domain.model import Coord, CoordTable
 from domain.structure.register import CoordRegister
 from result import BuildResult
 from util import LoggingLevelRouter
@@ -51,7 +51,7 @@ class CoordRegisterAssembler(RegisterAssembler[CoordRegister]):
         """
         method = f"{self.__class__.__name__}.execute"
         return BuildResult.success(
-            Coord(row=blueprint.row, column=blueprint.column,)
+            CoordTable.get(row=blueprint.row, column=blueprint.column)
         )
 
         
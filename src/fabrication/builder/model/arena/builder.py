@@ -17,7 +17,7 @@ from err import ArenaBuilderException
 from domain.model import Arena
 from result import BuildResult, MethodResultType
 from toolkit import ArenaBuilderToolkit
-from util import LoggingLevelRouter
+from util import LoggingLevelRouter, ServiceContainer
 
 
 class ArenaBuilder(ModelBuilder[Arena]):
@@ -75,6 +75,12 @@ class ArenaBuilder(ModelBuilder[Arena]):
         """
         method = f"{self.__class__.__name__}.build"
         
+        # Each arena gets its own game scope. The Arena adopts it, so GAME-scoped services
+        # resolved while it is assembled are not shared with other games.
+        with ServiceContainer.game_scope():
+            return self._execute(blueprint=blueprint, method=method)
+    
+    def _execute(self, blueprint: ArenaBlueprint, method: str) -> BuildResult[Arena]:
         # Handle the case that, the blueprint is not certified safe.
         blueprint_validation = self.builder_toolkit.root_certifier.execute(
             candidate=blueprint
@@ -56,6 +56,9 @@ class SquareBuilderFinalizer(BuilderFinalizer[Square]):
                     ex=insertion_result.exception,
                 )
             )
+        # Give the board's mailbox direct access to the new square.
+        board.place_square(product)
+        
         # --- Forward the work product to the caller. ---#
         return BuildResult.success(product)
 
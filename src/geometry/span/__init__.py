@@ -14,6 +14,7 @@ from .root import *
 from .coord import *
 from .square import *
 from .service import *
+from .table import *
 from .spanner import *
 
 # Modules
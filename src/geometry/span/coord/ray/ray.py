@@ -10,8 +10,8 @@ version: 1.0.0
 from __future__ import annotations
 from typing import List, cast
 
-from math.span import Ray
 from domain.model import Coord
+from geometry.span.root import Ray
 
 class CoordRay(Ray[Coord]):
     """
@@ -50,8 +50,8 @@ class CoordRay(Ray[Coord]):
         
     @property
     def origin(self) -> Coord:
-        return cast(Coord, self.origin)
+        return cast(Coord, self._origin)
     
     @property
     def members(self) -> List[Coord]:
-        return cast(List[Coord], self.members)
\ No newline at end of file
+        return cast(List[Coord], self._members)
\ No newline at end of file
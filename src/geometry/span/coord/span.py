@@ -11,8 +11,8 @@ from __future__ import annotations
 from typing import List, cast
 
 from domain.model import Coord
-from math.span import Span
-from math.span.coord import CoordRay
+from geometry.span.coord.ray.ray import CoordRay
+from geometry.span.root import Span
 
 
 class CoordSpan(Span[Coord]):
@@ -47,19 +47,20 @@ class CoordSpan(Span[Coord]):
         Args:
             origin: Coord
             rays: List[CoordRay]
+            sub_span_roots: List[Coord]
         """
-        super().__init__(origin=origin, rays=rays)
+        super().__init__(origin=origin, rays=rays, sub_span_roots=sub_span_roots)
         
     @property
     def origin(self) -> Coord:
-        return cast(Coord, self.origin)
+        return cast(Coord, self._origin)
     
     @property
     def rays(self) -> List[CoordRay]:
-        return cast(List[CoordRay], self.rays)
+        return cast(List[CoordRay], self._rays)
     
     @property
     def sub_span_roots(self) -> List[Coord]:
-        return cast(List[Coord], self.sub_span_roots)
+        return cast(List[Coord], self._sub_span_roots)
         
     
\ No newline at end of file
@@ -12,7 +12,7 @@ from __future__ import annotations
 from abc import ABC
 from typing import Generic, List, TypeVar
 
-from math.span import Ray
+from geometry.span.root.ray import Ray
 
 T = TypeVar("T")
 
@@ -51,7 +51,7 @@ class Span(ABC, Generic[T]):
     
     def __init__(self, origin: T, rays: List[Ray[T]], sub_span_roots: List[T]):
         self._origin = origin
-        self._rays = [Ray[T]]
+        self._rays = rays
         self._sub_span_roots = sub_span_roots
         
     @property
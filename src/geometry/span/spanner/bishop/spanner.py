@@ -8,7 +8,7 @@ version: 1.0.0
 """
 
 from __future__ import annotations
-from typing import Dict
+from typing import Dict, Optional
 
 from system import ComputationResult
 from domain.model import Coord, CoordService
@@ -39,6 +39,7 @@ class BishopSpanner(Spanner):
             engine: SpannerEngine = SpannerEngine(),
             coord_service: CoordService = CoordService(),
             diagonal_ray_provider: DiagonalRayProvider = DiagonalRayProvider(),
+            occupied: Optional[int] = None,
     ) -> ComputationResult[Dict[str, CoordSpan]]:
         """
         Action:
@@ -50,6 +51,8 @@ class BishopSpanner(Spanner):
             engine: SpannerEngine
             coord_service: CoordService
             diagonal_ray_provider: DiagonalRayProvider
+            occupied: Optional[int]. The board's occupied bitboard. Rays stop at the first
+                blocker when given.
             
         Raises:
             BishopSpannerException
@@ -63,6 +66,7 @@ class BishopSpanner(Spanner):
             origin=origin,
             coord_service=coord_service,
             diagonal_ray_provider=diagonal_ray_provider,
+            occupied=occupied,
         )
         # Handle the case that the span arithmetic does not produce a result.
         if span_result.is_failure:
@@ -12,11 +12,15 @@ from typing import Optional
 
 from domain.model import VectorService
 from domain.model import Coord, CoordService
+from domain.schema import Archetype, Persona
+from geometry.span.table import RayTable, SliderTable
 from math.span import (
     DiagonalRayProvider, NoRayProviderException, PerpendicularRayProvider, CoordSpan, SpanComputationException,
     SpanComputationRouteException, SpannerEngineException
 )
+from err import DeferredChessException
 from system import ComputationResult, LoggingLevelRouter
+from util import ServiceContainer
 
 
 class SpannerEngine:
@@ -26,26 +30,33 @@ class SpannerEngine:
     def compute(
             cls,
             origin: Coord,
-            coord_service: CoordService = CoordService(),
-            vector_service: VectorService = VectorService(),
+            coord_service: Optional[CoordService] = None,
+            vector_service: Optional[VectorService] = None,
             diagonal_ray_provider: Optional[DiagonalRayProvider] = None,
             perpendicular_ray_provider: Optional[PerpendicularRayProvider] = None,
+            use_table: bool = True,
+            occupied: Optional[int] = None,
     ):
         """
         Action:
             1.  Send an exception chain in the ComputationResult if
                     *   The origin is not certified as a safe coord.
                     *   No ray provider is included.
-            2.  If both diagonal and perpendicular ray providers are included route production to
-                _compute_queen_span.
-            3.  Otherwise, route to either _compute_rook_span or _compute_bishop_span.
+            2.  Unless use_table is False, send the span for the providers' persona from the
+                RayTable, or from the SliderTable with each ray cut at its first blocker if
+                occupied is given.
+            3.  Otherwise, if both diagonal and perpendicular ray providers are included route
+                production to _compute_queen_span.
+            4.  Otherwise, route to either _compute_rook_span or _compute_bishop_span.
             
         Args:
             origin: Coord
-            coord_service: CoordService
-            vector_service: VectorService
+            coord_service: Optional[CoordService]. The shared CoordService when None.
+            vector_service: Optional[VectorService]. The shared VectorService when None.
             diagonal_ray_provider: Optional[DiagonalRayProvider]
             perpendicular_ray_provider: Optional[PerpendicularRayProvider]
+            use_table: bool. Compute the span on demand when False.
+            occupied: Optional[int]. The board's occupied bitboard. The open-board span when None.
             
         Returns:
             ComputationResult[CoordSpan]
@@ -56,28 +67,17 @@ class SpannerEngine:
             NoRayProviderException
         """
         method = f"{cls.__name__}.compute"
+        coord_service = coord_service or ServiceContainer.resolve(CoordService)
+        vector_service = vector_service or ServiceContainer.resolve(VectorService)
         
         # Handle the case that, no ray_provider is included.
-        providers = (diagonal_ray_provider, perpendicular_ray_provider)
-        if len(providers) == 0:
+        if diagonal_ray_provider is None and perpendicular_ray_provider is None:
             # Send the exception on failure.
             return ComputationResult.failure(
-                SpannerEngineException(
-                    cls_mthd=method,
+                DeferredChessException(
+                    links=(SpannerEngineException, SpanComputationException, NoRayProviderException),
                     cls_name=cls.__name__,
-                    msg=SpannerEngineException.MSG,
-                    err_code=SpannerEngineException.ERR_CODE,
-                    ex=SpanComputationException(
-                        cls_mthd=method,
-                        op=SpanComputationException.OP,
-                        msg=SpanComputationException.MSG,
-                        err_code=SpanComputationException.ERR_CODE,
-                        mthd_rslt_type=SpanComputationException.MTHD_RSLT,
-                        ex=NoRayProviderException(
-                        msg=NoRayProviderException.MSG,
-                        err_code=NoRayProviderException.ERR_CODE
-                        )
-                    )
+                    cls_mthd=method,
                 )
             )
         # Handle the case that, the origin is not certified as a safe coord.
@@ -85,21 +85,25 @@ class SpannerEngine:
         if origin_validation.is_failure:
             # Send the exception chain on failure.
             return ComputationResult.failure(
-                SpannerEngineException(
-                    cls_mthd=method,
+                DeferredChessException(
+                    links=(SpannerEngineException, SpanComputationException),
                     cls_name=cls.__name__,
-                    msg=SpanComputationException.MSG,
-                    err_code=SpannerEngineException.ERR_CODE,
-                    ex=SpanComputationException(
-                        cls_mthd=method,
-                        op=SpanComputationException.OP,
-                        msg=SpanComputationException.MSG,
-                        err_code=SpanComputationException.ERR_CODE,
-                        mthd_rslt_type=SpanComputationException.MTHD_RSLT,
-                        ex=origin_validation.exception
-                    )
+                    cls_mthd=method,
+                    ex=origin_validation.exception,
                 )
             )
+        # --- Serve the span from the precomputed table. Sliders span the same for either archetype. ---#
+        if use_table:
+            if diagonal_ray_provider is not None and perpendicular_ray_provider is not None:
+                persona = Persona.QUEEN
+            elif diagonal_ray_provider is not None:
+                persona = Persona.BISHOP
+            else:
+                persona = Persona.ROOK
+            if occupied is not None:
+                return ComputationResult.success(SliderTable.span(persona, origin, occupied))
+            return ComputationResult.success(RayTable.span(persona, Archetype.WHITE, origin))
+        
         # --- Route to the appropriate arithmetic geometry. ---#
         
         # Get a queen's span if perpendicular and diagonal providers are included.
@@ -127,22 +131,10 @@ class SpannerEngine:
             )
         # Handle the default case that no solution geometry exists for a provider combination.
         return ComputationResult.failure(
-            SpannerEngineException(
-                cls_mthd=method,
+            DeferredChessException(
+                links=(SpannerEngineException, SpanComputationException, SpanComputationRouteException),
                 cls_name=cls.__name__,
-                msg=SpanComputationException.MSG,
-                err_code=SpannerEngineException.ERR_CODE,
-                ex=SpanComputationException(
-                    cls_mthd=method,
-                    op=SpanComputationException.OP,
-                    msg=SpanComputationException.MSG,
-                    err_code=SpanComputationException.ERR_CODE,
-                    mthd_rslt_type=SpanComputationException.MTHD_RSLT,
-                    ex=SpanComputationRouteException(
-                        msg=SpanComputationRouteException.MSG,
-                        err_code=SpanComputationRouteException.ERR_CODE,
-                    )
-                )
+                cls_mthd=method,
             )
         )
         
@@ -189,19 +181,11 @@ class SpannerEngine:
         if diagonal_span_result.is_failure:
             # Send the exception chain on failure.
             return ComputationResult.failure(
-                SpannerEngineException(
-                    cls_mthd=method,
+                DeferredChessException(
+                    links=(SpannerEngineException, SpanComputationException),
                     cls_name=cls.__name__,
-                    msg=SpanComputationException.MSG,
-                    err_code=SpannerEngineException.ERR_CODE,
-                    ex=SpanComputationException(
-                        cls_mthd=method,
-                        op=SpanComputationException.OP,
-                        msg=SpanComputationException.MSG,
-                        err_code=SpanComputationException.ERR_CODE,
-                        mthd_rslt_type=SpanComputationException.MTHD_RSLT,
-                        ex=diagonal_span_result.exception
-                    )
+                    cls_mthd=method,
+                    ex=diagonal_span_result.exception,
                 )
             )
         # --- ComputationWorker the queen's perpendicular span. ---#
@@ -214,19 +198,11 @@ class SpannerEngine:
         if perpendicular_span_result.is_failure:
             # Send the exception chain on failure.
             return ComputationResult.failure(
-                SpannerEngineException(
-                    cls_mthd=method,
+                DeferredChessException(
+                    links=(SpannerEngineException, SpanComputationException),
                     cls_name=cls.__name__,
-                    msg=SpanComputationException.MSG,
-                    err_code=SpannerEngineException.ERR_CODE,
-                    ex=SpanComputationException(
-                        cls_mthd=method,
-                        op=SpanComputationException.OP,
-                        msg=SpanComputationException.MSG,
-                        err_code=SpanComputationException.ERR_CODE,
-                        mthd_rslt_type=SpanComputationException.MTHD_RSLT,
-                        ex=perpendicular_span_result.exception
-                    )
+                    cls_mthd=method,
+                    ex=perpendicular_span_result.exception,
                 )
             )
         # --- Add the perpendicular and diagonal components to ge the queen's entire span. ---#
@@ -280,19 +256,11 @@ class SpannerEngine:
             if ray_result.is_failure:
                 # Send the exception chain on failure.
                 return ComputationResult.failure(
-                    SpannerEngineException(
-                        cls_mthd=method,
+                    DeferredChessException(
+                        links=(SpannerEngineException, SpanComputationException),
                         cls_name=cls.__name__,
-                        msg=SpanComputationException.MSG,
-                        err_code=SpannerEngineException.ERR_CODE,
-                        ex=SpanComputationException(
-                            cls_mthd=method,
-                            op=SpanComputationException.OP,
-                            msg=SpanComputationException.MSG,
-                            err_code=SpanComputationException.ERR_CODE,
-                            mthd_rslt_type=SpanComputationException.MTHD_RSLT,
-                            ex=ray_result.exception
-                        )
+                        cls_mthd=method,
+                        ex=ray_result.exception,
                     )
                 )
             # Add the ray to its span.
@@ -345,19 +313,11 @@ class SpannerEngine:
             if ray_result.is_failure:
                 # Send the exception chain on failure.
                 return ComputationResult.failure(
-                    SpannerEngineException(
-                        cls_mthd=method,
+                    DeferredChessException(
+                        links=(SpannerEngineException, SpanComputationException),
                         cls_name=cls.__name__,
-                        msg=SpanComputationException.MSG,
-                        err_code=SpannerEngineException.ERR_CODE,
-                        ex=SpanComputationException(
-                            cls_mthd=method,
-                            op=SpanComputationException.OP,
-                            msg=SpanComputationException.MSG,
-                            err_code=SpanComputationException.ERR_CODE,
-                            mthd_rslt_type=SpanComputationException.MTHD_RSLT,
-                            ex=ray_result.exception
-                        )
+                        cls_mthd=method,
+                        ex=ray_result.exception,
                     )
                 )
             # Add the ray to its span.
@@ -8,11 +8,13 @@ version: 1.0.0
 """
 
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from system import ComputationResult
 from domain.model import Coord, CoordService
 from domain.model import Vector, VectorService
+from domain.schema import Archetype, Persona
+from geometry.span.table import RayTable
 from math.span import KingSpannerException, CoordRay, CoordSpan, Spanner
 
 
@@ -39,7 +41,7 @@ class KingSpanner(Spanner):
     def compute(
             cls,
             origin: Coord,
-            vectors: List[Vector],
+            vectors: Optional[List[Vector]] = None,
             coord_service: CoordService = CoordService(),
             vector_service: VectorService = VectorService(),
     ) -> ComputationResult[Dict[str, CoordSpan]]:
@@ -47,13 +49,14 @@ class KingSpanner(Spanner):
         Action:
             1.  If the origin does not pass a validation check. send and exception chain in the arithmetic
                 result.
-            2.  Iterate through the vectors to get rays from the origin. If any ray derivation fails
+            2.  If no vectors are given send the king's span from the RayTable.
+            3.  Otherwise, iterate through the vectors to get rays from the origin. If any ray derivation fails
                 send an exception chain in the arithmetic result. Else append to the span.
-            3.  After the loop is finished send the span in the success result.
+            4.  After the loop is finished send the span in the success result.
 
         Args:
             origin: Coord
-            vectors: List[Vector]
+            vectors: Optional[List[Vector]]. Served from the RayTable when None.
             coord_service: CoordService
             vector_service: VectorService
             
@@ -77,6 +80,10 @@ class KingSpanner(Spanner):
                     ex=validation_result.exception
                 )
             )
+        # --- Serve the standard king span from the precomputed table. ---#
+        if vectors is None:
+            return ComputationResult.success({"king": RayTable.span(Persona.KING, Archetype.WHITE, origin)})
+        
         # --- Iterate through vectors to get the king's spanning set. ---#
         span = CoordSpan(origin=origin, rays=[])
         for vector in vectors:
@@ -9,7 +9,7 @@ version: 1.0.0
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
 from system import ComputationResult
 from domain.model import Coord, CoordService
@@ -43,7 +43,8 @@ class QueenSpanner(Spanner):
             engine: SpannerEngine = SpannerEngine(),
             coord_service: CoordService = CoordService(),
             diagonal_ray_provider: DiagonalRayProvider = DiagonalRayProvider(),
-            perpendicular_ray_provider: PerpendicularRayProvider = PerpendicularRayProvider()
+            perpendicular_ray_provider: PerpendicularRayProvider = PerpendicularRayProvider(),
+            occupied: Optional[int] = None,
     ) -> ComputationResult[Dict[str, CoordSpan]]:
         """
         Action:
@@ -56,6 +57,8 @@ class QueenSpanner(Spanner):
             coord_service: CoordService
             diagonal_ray_provider: DiagonalRayProvider
             perpendicular_ray_provider: PerpendicularRayProvider
+            occupied: Optional[int]. The board's occupied bitboard. Rays stop at the first
+                blocker when given.
             
         Raises:
             QueenSpannerException
@@ -70,6 +73,7 @@ class QueenSpanner(Spanner):
             coord_service=coord_service,
             diagonal_ray_provider=diagonal_ray_provider,
             perpendicular_ray_provider=perpendicular_ray_provider,
+            occupied=occupied,
         )
         # Handle the case that the span arithmetic does not produce a result.
         if span_result.is_failure:
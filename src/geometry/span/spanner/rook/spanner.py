@@ -9,7 +9,7 @@ version: 1.0.0
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
 from system import ComputationResult
 from domain.model import Coord, CoordService
@@ -41,6 +41,7 @@ class RookSpanner(Spanner):
             engine: SpannerEngine = SpannerEngine(),
             coord_service: CoordService = CoordService(),
             perpendicular_ray_provider: PerpendicularRayProvider = PerpendicularRayProvider(),
+            occupied: Optional[int] = None,
     ) -> ComputationResult[Dict[str, CoordSpan]]:
         """
         Action:
@@ -52,6 +53,8 @@ class RookSpanner(Spanner):
             engine: SpannerEngine
             coord_service: CoordService
             perpendicular_ray_provider: PerpendicularRayProvider
+            occupied: Optional[int]. The board's occupied bitboard. Rays stop at the first
+                blocker when given.
             
         Raises:
             RookSpannerException
@@ -65,6 +68,7 @@ class RookSpanner(Spanner):
             origin=origin,
             coord_service=coord_service,
             perpendicular_ray_provider=perpendicular_ray_provider,
+            occupied=occupied,
         )
         # Handle the case that the span arithmetic does not produce a result.
         if span_result.is_failure:
@@ -0,0 +1,18 @@
+# src/geometry/span/table/__init__.py
+
+"""
+Module: geometry.span.table.__init__
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+# =========== SPAN.TABLE PACKAGE ===========#
+
+# Packages
+
+
+# Modules
+from .generator import RayGenerator
+from .table import RayTable
+from .slider import SliderTable
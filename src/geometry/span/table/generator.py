@@ -0,0 +1,139 @@
+# src/geometry/span/table/generator.py
+
+"""
+Module: geometry.span.table.generator
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Set, Tuple
+
+from domain.model import Coord, CoordTable
+from geometry.span.coord import CoordRay, CoordSpan
+from setting.board.dimension.config import number_of_columns, number_of_rows
+
+Step = Tuple[int, int]
+IndexRays = Tuple[Tuple[int, ...], ...]
+
+
+class RayGenerator:
+    """
+    Role:
+        -   Computation
+        -   Table Builder
+
+    Responsibilities:
+        1.  Produce the rays along a set of steps for every origin on the board in one pass,
+            without stepping a cursor or validating a Coord per square.
+        2.  Work for any board dimensions, so tables can be built for larger boards.
+
+    Attributes:
+
+    Provides:
+        -   def indices(steps: Tuple[Step, ...], limit: Optional[int], rows: int, columns: int)
+                -> Tuple[IndexRays, ...]
+        -   def rays(steps: Tuple[Step, ...], limit: Optional[int]) -> Tuple[Tuple[Tuple[Coord, ...], ...], ...]
+        -   def spans(steps: Tuple[Step, ...], limit: Optional[int]) -> Tuple[CoordSpan, ...]
+
+    Notes:
+        Every square on the board lies on exactly one line per step: an arithmetic run of
+        board indices, index + k * (row_step * columns + column_step), whose length follows
+        from where it starts and which edge it heads for. A step with no row or no column
+        component never meets the edges on that axis, so only the other one bounds the
+        line. Lines start on the edge rows and columns the step leaves from. Each line is
+        built once with range(), and every origin's ray is a slice of the line it lies on,
+        so no square is tested for being on the board. A step whose first square is off the
+        board gives no ray, like the on-demand computers.
+
+        indices() works in bare indices for any rows and columns. rays() and spans() map
+        them onto the shared CoordTable coords, which only exist for the board in
+        setting.board.dimension.
+
+        Results come back per origin in CoordTable index order, and per origin in the
+        order of steps, nearest square first.
+
+    Super Class:
+    """
+
+    @classmethod
+    def indices(
+            cls,
+            steps: Tuple[Step, ...],
+            limit: Optional[int] = None,
+            rows: int = number_of_rows,
+            columns: int = number_of_columns,
+    ) -> Tuple[IndexRays, ...]:
+        """Every origin's non-empty rays along steps, as board indices."""
+        size = rows * columns
+        cap = max(rows, columns) if limit is None else limit
+        per_step: List[List[Tuple[int, ...]]] = []
+        for row_step, column_step in steps:
+            delta = row_step * columns + column_step
+            rays: List[Tuple[int, ...]] = [()] * size
+            for start in cls._starts(row_step, column_step, rows, columns):
+                row, column = divmod(start, columns)
+                length = 1 + min(
+                    room for room in (cls._room(row, row_step, rows), cls._room(column, column_step, columns))
+                    if room is not None
+                )
+                if length < 2:
+                    continue
+                line = tuple(range(start, start + delta * length, delta))
+                for position in range(1, length):
+                    rays[line[position - 1]] = line[position:position + cap]
+            per_step.append(rays)
+        return tuple(tuple(filter(None, rays)) for rays in zip(*per_step))
+
+    @classmethod
+    def rays(
+            cls,
+            steps: Tuple[Step, ...],
+            limit: Optional[int] = None,
+    ) -> Tuple[Tuple[Tuple[Coord, ...], ...], ...]:
+        """Every origin's non-empty rays along steps, as the shared CoordTable coords."""
+        coords = CoordTable.all()
+        return tuple(
+            tuple(tuple(coords[index] for index in ray) for ray in rays)
+            for rays in cls.indices(steps, limit, CoordTable.ROWS, CoordTable.COLUMNS)
+        )
+
+    @classmethod
+    def spans(cls, steps: Tuple[Step, ...], limit: Optional[int] = None) -> Tuple[CoordSpan, ...]:
+        """Every origin's rays wrapped in a CoordSpan, as the spanners send them."""
+        coords = CoordTable.all()
+        return tuple(
+            CoordSpan(
+                origin=coords[origin],
+                rays=[CoordRay(origin=coords[origin], members=list(ray)) for ray in rays],
+                sub_span_roots=[],
+            )
+            for origin, rays in enumerate(cls.rays(steps, limit))
+        )
+
+    @classmethod
+    def _starts(cls, row_step: int, column_step: int, rows: int, columns: int) -> Set[int]:
+        """The squares whose predecessor along the step is off the board: where its lines start."""
+        starts = {row * columns + column for row in cls._edge(row_step, rows) for column in range(columns)}
+        starts.update(row * columns + column for row in range(rows) for column in cls._edge(column_step, columns))
+        return starts
+
+    @classmethod
+    def _edge(cls, step: int, size: int) -> range:
+        """The rows or columns a step cannot be taken into from the board."""
+        if step > 0:
+            return range(min(step, size))
+        if step < 0:
+            return range(max(size + step, 0), size)
+        return range(0)
+
+    @classmethod
+    def _room(cls, position: int, step: int, size: int) -> Optional[int]:
+        """How many steps fit between position and the edge step heads for. None if step never reaches one."""
+        if step > 0:
+            return (size - 1 - position) // step
+        if step < 0:
+            return position // -step
+        return None
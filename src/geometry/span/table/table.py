@@ -0,0 +1,131 @@
+# src/geometry/span/table/table.py
+
+"""
+Module: geometry.span.table.table
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from domain.model import Coord, CoordTable
+from domain.schema import Archetype, Persona
+from geometry.span.coord import CoordRay, CoordSpan
+from geometry.span.table.generator import RayGenerator, Step
+
+Rays = Tuple[Tuple[Coord, ...], ...]
+
+
+class RayTable:
+    """
+    Role:
+        -   Lookup Table
+        -   Span Provider
+
+    Responsibilities:
+        1.  Hold, for every (persona, archetype, origin), the rays a token of that persona
+            moves along and the rays it attacks along, nearest square first.
+        2.  Serve spans to the spanners without recomputing them.
+
+    Attributes:
+        STEPS: Dict[Persona, Tuple[Step, ...]]. (row, column) steps of each persona.
+        SLIDERS: Tuple[Persona, ...]. Personas whose rays run to the edge of the board.
+
+    Provides:
+        -   def build() -> None
+        -   def rays(persona: Persona, archetype: Archetype, origin: Coord) -> Rays
+        -   def attack_rays(persona: Persona, archetype: Archetype, origin: Coord) -> Rays
+        -   def reach(persona: Persona, archetype: Archetype, origin: Coord) -> int
+        -   def span(persona: Persona, archetype: Archetype, origin: Coord) -> CoordSpan
+
+    Notes:
+        Reach only depends on the origin, persona and archetype, so the whole table is built
+        once by RayGenerator, on first use or by an explicit build() at startup, and never
+        changes. Rays are tuples of the shared CoordTable coords. reach() is the same
+        squares as a bitboard indexed like BoardOccupancy.
+
+        Archetype only matters for pawns: it sets the forward direction and the row a pawn's
+        double step starts from. A pawn's rays are its pushes, its attack rays its two
+        diagonal captures. Every other persona attacks along the rays it moves on.
+
+    Super Class:
+    """
+    STEPS: Dict[Persona, Tuple[Step, ...]] = {
+        Persona.BISHOP: ((1, 1), (1, -1), (-1, 1), (-1, -1)),
+        Persona.ROOK: ((1, 0), (-1, 0), (0, 1), (0, -1)),
+        Persona.QUEEN: ((1, 1), (1, -1), (-1, 1), (-1, -1), (1, 0), (-1, 0), (0, 1), (0, -1)),
+        Persona.KING: ((1, 1), (1, -1), (-1, 1), (-1, -1), (1, 0), (-1, 0), (0, 1), (0, -1)),
+        Persona.KNIGHT: ((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2)),
+    }
+    SLIDERS: Tuple[Persona, ...] = (Persona.BISHOP, Persona.ROOK, Persona.QUEEN)
+
+    _moves: Optional[Dict[Tuple[Persona, Archetype], Tuple[Rays, ...]]] = None
+    _attacks: Dict[Tuple[Persona, Archetype], Tuple[Rays, ...]] = {}
+    _reach: Dict[Tuple[Persona, Archetype], Tuple[int, ...]] = {}
+
+    @classmethod
+    def build(cls) -> None:
+        """Fill the table for every persona, archetype and origin. Later calls do nothing."""
+        if cls._moves is not None:
+            return
+        moves: Dict[Tuple[Persona, Archetype], Tuple[Rays, ...]] = {}
+        for persona, steps in cls.STEPS.items():
+            rows = RayGenerator.rays(steps, None if persona in cls.SLIDERS else 1)
+            for archetype in Archetype:
+                moves[(persona, archetype)] = rows
+                cls._attacks[(persona, archetype)] = rows
+        for archetype in Archetype:
+            forward = archetype.advancing_step.magnitude
+            single = RayGenerator.rays(((forward, 0),), 1)
+            double = RayGenerator.rays(((forward, 0),), 2)
+            moves[(Persona.PAWN, archetype)] = tuple(
+                double[index] if origin.row == archetype.pawn_row else single[index]
+                for index, origin in enumerate(CoordTable.all())
+            )
+            cls._attacks[(Persona.PAWN, archetype)] = RayGenerator.rays(((forward, 1), (forward, -1)), 1)
+        for key, rows in cls._attacks.items():
+            cls._reach[key] = tuple(
+                sum(1 << coord.index for ray in rays for coord in ray) for rays in rows
+            )
+        cls._moves = moves
+
+    @classmethod
+    def rays(cls, persona: Persona, archetype: Archetype, origin: Coord) -> Rays:
+        """
+        Raises:
+            IndexError if origin is not on the board.
+        """
+        if cls._moves is None:
+            cls.build()
+        return cls._moves[(persona, archetype)][cls._index(origin)]
+
+    @classmethod
+    def attack_rays(cls, persona: Persona, archetype: Archetype, origin: Coord) -> Rays:
+        if cls._moves is None:
+            cls.build()
+        return cls._attacks[(persona, archetype)][cls._index(origin)]
+
+    @classmethod
+    def reach(cls, persona: Persona, archetype: Archetype, origin: Coord) -> int:
+        """Every square on an attack ray from origin, as a bitboard."""
+        if cls._moves is None:
+            cls.build()
+        return cls._reach[(persona, archetype)][cls._index(origin)]
+
+    @classmethod
+    def span(cls, persona: Persona, archetype: Archetype, origin: Coord) -> CoordSpan:
+        """The persona's rays from origin wrapped in a CoordSpan, as the spanners send them."""
+        rays: List[CoordRay] = [
+            CoordRay(origin=origin, members=list(ray)) for ray in cls.rays(persona, archetype, origin)
+        ]
+        return CoordSpan(origin=origin, rays=rays, sub_span_roots=[])
+
+    @classmethod
+    def _index(cls, origin: Coord) -> int:
+        index = origin.index
+        if index is None:
+            raise IndexError(f"{cls.__name__}: {origin} is not on the board.")
+        return index
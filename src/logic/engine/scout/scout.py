@@ -15,6 +15,7 @@ Contains:
 from typing import List
 
 from fabrication.builder import Board
+from domain.model import BoardOccupancy
 from logic.square import Square
 from system import id_emitter
 from domain.model.state.token import Piece
@@ -42,13 +43,17 @@ class Scout:
   def survey(self, board: Board) -> ScoutReport:
     squares: List[Square] = []
     origin = self._scout.positions.current_coord()
+    # One integer test per step instead of reading each square's occupant.
+    occupied = board.occupancy.occupied
+    bit = BoardOccupancy.bit
 
     for territory in self._scout.rank_level.quadrants:
-      for square in chess_board.iterator(origin, territory.vector):
+      for square in board.iterator(origin, territory.vector):
         if not self._scout.rank_level.walk.is_walkable(self._scout, square.position):
           break
-        if square.occupant is not None and square not in squares:
-          squares.append(square)
+        if occupied & bit(square.coord):
+          if square not in squares:
+            squares.append(square)
           break
         squares.append(square)
 
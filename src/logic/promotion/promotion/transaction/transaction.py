@@ -29,7 +29,7 @@ class OldPromotionTransaction(TravelTransaction[PromotionEvent]):
             if event_validation.failure():
                 return TransactionResult.errored(event_update=self.event, exception=event_validation.exception)
             
-            self.event.actor.previous_rank = self.event.actor.rank_name
+            self.event.actor.record_previous_rank()
             if self.event.actor.previous_rank is None:
                 return TransactionResult.rolled_back(
                     event_update=self.event,
@@ -38,10 +38,10 @@ class OldPromotionTransaction(TravelTransaction[PromotionEvent]):
                     )
                 )
         
+            previous_persona = self.event.actor.rank.persona
             self.event.actor.set_new_rank(self.event.new_rank)
-            if not isinstance(self.event.actor.rank_name, self.event.new_rank):
-                self.event.actor._set_rank(self.event.actor.previous_rank)
-                self.event.actor.previous_rank = None
+            if self.event.actor.rank is not self.event.new_rank:
+                self.event.actor.restore_previous_rank()
                 
                 return TransactionResult.rolled_back(
                     event_update=self.event,
@@ -50,6 +50,10 @@ class OldPromotionTransaction(TravelTransaction[PromotionEvent]):
                     )
                 )
             
+            # Re-key the promoted token on its board's bitboards and position key.
+            self.event.actor.team.board.change_rank(
+                self.event.actor.current_position, self.event.actor, previous_persona
+            )
             return TransactionResult.success(event_update=self.event)
         except Exception as e:
             return TransactionResult.errored(event_update=self.event, exception=e)
@@ -3,4 +3,4 @@ from system import Result
 
 
 class VisitationResult(Result[Square]):
-    pass
\ No newline at end of file
+    __slots__ = ()
@@ -9,7 +9,10 @@ version: 1.0.0
 
 from __future__ import annotations
 
+from typing import Optional
+
 from system import IdFactory, IntegrityMicroservice
+from util import ServiceContainer, ServiceScope
 from logic.zone import Zone, ZoneBuilder, ZoneOpsController, ZoneTable, ZoneValidator
 
 
@@ -45,18 +48,18 @@ class ZoneService(IntegrityMicroservice[Zone]):
     def __init__(
             self,
             name: str = SERVICE_NAME,
-            id: int = IdFactory.next_id(class_name="ZoneService"),
-            ops_controller: ZoneOpsController = ZoneOpsController(),
+            id: Optional[int] = None,
+            ops_controller: Optional[ZoneOpsController] = None,
     ):
         """
         Args:
-            id: int
+            id: Optional[int]. A fresh id is issued when None.
             name: str
-            ops_controller: ZoneOpsController
+            ops_controller: Optional[ZoneOpsController]. The game's controller when None.
         """
-        super().__init__(id=id, name=name)
+        super().__init__(id=id if id is not None else IdFactory.next_id(class_name="ZoneService"), name=name)
         self._table = ZoneTable()
-        self._ops_controller = ops_controller
+        self._ops_controller = ops_controller or ServiceContainer.resolve(ZoneOpsController, ServiceScope.GAME)
 
     @property
     def builder(self) -> ZoneBuilder:
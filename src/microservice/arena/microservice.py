@@ -9,6 +9,9 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from typing import Optional
+
+from util import ServiceContainer
 
 
 class ArenaService(Microservice[Arena]):
@@ -31,15 +34,17 @@ class ArenaService(Microservice[Arena]):
         *   See Microservice for inherited attributes.
     """
     DEFAULT_NAME = "ArenaService"
-    _arena_team_relation_analyzer: ArenaTeamRelationAnalysis
+    _builder: Optional[ArenaBuilder]
+    _validator: Optional[ArenaValidator]
+    _arena_team_relation_analyzer: Optional[ArenaTeamRelationAnalysis]
     
     def __init__(
             self,
             name: str = DEFAULT_NAME,
             id: int = id_emitter.service_id,
-            builder: ArenaBuilder = ArenaBuilder(),
-            validator: ArenaValidator = ArenaValidator(),
-            team_relation_tester: ArenaTeamRelationAnalysis = ArenaTeamRelationAnalysis(),
+            builder: Optional[ArenaBuilder] = None,
+            validator: Optional[ArenaValidator] = None,
+            team_relation_tester: Optional[ArenaTeamRelationAnalysis] = None,
     ):
         """
         # ACTION:
@@ -49,33 +54,43 @@ class ArenaService(Microservice[Arena]):
             *   schema (str)
             *   build (ArenaFactory)
             *   validation (ArenaValidator)
+            Missing collaborators are resolved through ServiceContainer the first time
+            they are used.
         # RETURNS:
             None
         Raises:
             None
         """
-        super().__init__(id=id, name=name, builder=builder, validator=validator)
+        super().__init__(id=id, name=name)
+        self._builder = builder
+        self._validator = validator
         self._arena_team_relation_analyzer = team_relation_tester
     
     @property
     def builder(self) -> ArenaBuilder:
         """get ArenaBuilder"""
-        return cast(ArenaBuilder, self.entity_builder)
+        if self._builder is None:
+            self._builder = ServiceContainer.resolve(ArenaBuilder)
+        return self._builder
     
     @property
     def validator(self) -> ArenaValidator:
         """get ArenaValidator"""
-        return cast(ArenaValidator, self.entity_validator)
+        if self._validator is None:
+            self._validator = ServiceContainer.resolve(ArenaValidator)
+        return self._validator
     
     @property
     def arena_team_relation_analyzer(self) -> ArenaTeamRelationAnalysis:
+        if self._arena_team_relation_analyzer is None:
+            self._arena_team_relation_analyzer = ServiceContainer.resolve(ArenaTeamRelationAnalysis)
         return self._arena_team_relation_analyzer
     
     
     @LoggingLevelRouter.monitor
     def add_team(self, arena: Arena, team: Team, team_service: TeamService = ()) -> InsertionResult[Team]:
         method = "ArenaService.add_team"
-        relation = self._arena_team_relation_analyzer.execute(
+        relation = self.arena_team_relation_analyzer.execute(
             candidate_primary=arena,
             candidate_satellite=team,
             arena_validator=self.validator,
@@ -11,6 +11,7 @@ version: 0.0.2
 
 # Packages
 from .addition import *
+from .batch import *
 from .distance import *
 from .product import *
 from .transform import *
@@ -0,0 +1,16 @@
+# src/operation/computation/vector/batch/__init__.py
+
+"""
+Module: operation.computation.vector.batch.__init__
+Author: Banji Lawal
+Created: 2026-04-05
+version: 0.0.2
+"""
+
+# =========== OPERATION.COMPUTATION.VECTOR.BATCH CONTENTS ===========#
+
+# Packages
+
+
+# Modules
+from .operation import VectorBatch
@@ -0,0 +1,95 @@
+# src/operation/computation/vector/batch/operation.py
+
+"""
+Module: operation.computation.vector.batch.operation
+Author: Banji Lawal
+Created: 2026-04-05
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Optional, Tuple
+
+from domain.model import Vector, VectorTable
+
+
+class VectorBatch:
+    """
+    Role:
+        -   Computation
+
+    Responsibilities:
+        1.  Run vector arithmetic over many vectors at once, on array-backed x and y columns.
+        2.  Return interned vectors from VectorTable so a batch allocates no Vectors and
+            its results need no revalidation.
+
+    Attributes:
+
+    Provides:
+        -   def unpack(vectors: Iterable[Vector]) -> Tuple[array, array]
+        -   def pack(xs: array, ys: array) -> Tuple[Optional[Vector], ...]
+        -   def translate(xs: array, ys: array, dx: int, dy: int) -> Tuple[array, array]
+        -   def scale(xs: array, ys: array, scalar: int) -> Tuple[array, array]
+        -   def add(vectors: Iterable[Vector], delta: Vector) -> Tuple[Optional[Vector], ...]
+        -   def walk(origin: Vector, delta: Vector) -> Tuple[Vector, ...]
+
+    Notes:
+        pack() and add() put None wherever a result does not fit the board, keeping each
+        result at its input's position. walk() stops at the first step that does not fit.
+
+    Super Class:
+    """
+    # Signed int columns. Every in-table component and every single step fits.
+    TYPECODE: str = "i"
+
+    @classmethod
+    def unpack(cls, vectors: Iterable[Vector]) -> Tuple[array, array]:
+        xs, ys = array(cls.TYPECODE), array(cls.TYPECODE)
+        for vector in vectors:
+            xs.append(vector.x)
+            ys.append(vector.y)
+        return xs, ys
+
+    @classmethod
+    def pack(cls, xs: array, ys: array) -> Tuple[Optional[Vector], ...]:
+        get = VectorTable.get
+        return tuple(get(x, y) for x, y in zip(xs, ys))
+
+    @classmethod
+    def translate(cls, xs: array, ys: array, dx: int, dy: int) -> Tuple[array, array]:
+        return (
+            array(cls.TYPECODE, (x + dx for x in xs)),
+            array(cls.TYPECODE, (y + dy for y in ys)),
+        )
+
+    @classmethod
+    def scale(cls, xs: array, ys: array, scalar: int) -> Tuple[array, array]:
+        return (
+            array(cls.TYPECODE, (x * scalar for x in xs)),
+            array(cls.TYPECODE, (y * scalar for y in ys)),
+        )
+
+    @classmethod
+    def add(cls, vectors: Iterable[Vector], delta: Vector) -> Tuple[Optional[Vector], ...]:
+        get, dx, dy = VectorTable.get, delta.x, delta.y
+        return tuple(get(vector.x + dx, vector.y + dy) for vector in vectors)
+
+    @classmethod
+    def walk(cls, origin: Vector, delta: Vector) -> Tuple[Vector, ...]:
+        """
+        origin + delta, origin + 2 * delta, ... for as long as the sum fits the board.
+        Empty for a zero delta, which would never leave the board.
+        """
+        dx, dy = delta.x, delta.y
+        if dx == 0 and dy == 0:
+            return ()
+        get, steps = VectorTable.get, []
+        x, y = origin.x + dx, origin.y + dy
+        vector = get(x, y)
+        while vector is not None:
+            steps.append(vector)
+            x, y = x + dx, y + dy
+            vector = get(x, y)
+        return tuple(steps)
@@ -11,7 +11,8 @@ from __future__ import annotations
 from typing import cast
 
 from system import QueryService, id_emitter
-from logic.square import SquareContext, SquareContextBuilder, SquareContextValidator, SquareFinder
+from logic.square import SquareContext, SquareContextBuilder, SquareContextValidator
+from route import SquareSearchRouter
 
 
 class SquareQueryService(QueryService[SquareContext]):
@@ -41,7 +42,7 @@ class SquareQueryService(QueryService[SquareContext]):
             self,
             name: str = SERVICE_NAME,
             id: int = id_emitter.service_id,
-            finder: SquareFinder = SquareFinder(),
+            finder: SquareSearchRouter = SquareSearchRouter(),
             builder: SquareContextBuilder = SquareContextBuilder(),
             validator: SquareContextValidator = SquareContextValidator(),
     ):
@@ -51,7 +52,7 @@ class SquareQueryService(QueryService[SquareContext]):
         # PARAMETERS:
             *   schema (str)
             *   id (int)
-            *   route (SquareFinder)
+            *   finder (SquareSearchRouter)
             *   build (SquareContextBuilder)
             *   validation (SquareContextValidator)
         # RETURNS:
@@ -63,9 +64,9 @@ class SquareQueryService(QueryService[SquareContext]):
         super().__init__(id=id, name=name, builder=builder, validator=validator, finder=finder)
     
     @property
-    def finder(self) -> SquareFinder:
-        """Get SquareFinder instance."""
-        return cast(SquareFinder, self.entity_finder)
+    def finder(self) -> SquareSearchRouter:
+        """Get the SquareSearchRouter which answers route and route_batch."""
+        return cast(SquareSearchRouter, self.entity_finder)
     
     @property
     def build(self) -> SquareContextBuilder:
@@ -10,7 +10,8 @@ version: 1.0.0
 from typing import cast
 
 from system import QueryService, id_emitter
-from logic.team import TeamContext, TeamContextBuilder, TeamContextValidator, TeamFinder
+from logic.team import TeamContext, TeamContextBuilder, TeamContextValidator
+from route import TeamSearchRouter
 
 
 class TeamQueryService(QueryService[TeamContext]):
@@ -39,7 +40,7 @@ class TeamQueryService(QueryService[TeamContext]):
             self,
             name: str = SERVICE_NAME,
             id: int = id_emitter.service_id,
-            finder: TeamFinder = TeamFinder(),
+            finder: TeamSearchRouter = TeamSearchRouter(),
             builder: TeamContextBuilder = TeamContextBuilder(),
             validator: TeamContextValidator = TeamContextValidator(),
     ):
@@ -50,7 +51,7 @@ class TeamQueryService(QueryService[TeamContext]):
         # PARAMETERS:
             *   schema (str): Default value - SERVICE_NAME
             *   id (int): Default value - id_emitter.service_id
-            *   route (TeamFinder): Default value - TeamFinder()
+            *   finder (TeamSearchRouter): Default value - TeamSearchRouter()
             *   build (TeamContextBuilder): Default value - TeamContextBuilder()
             *   validation (TeamContextValidator): Default value - TeamContextValidator()
 
@@ -63,9 +64,9 @@ class TeamQueryService(QueryService[TeamContext]):
         super().__init__(id=id, name=name, builder=builder, validator=validator, finder=finder)
     
     @property
-    def finder(self) -> TeamFinder:
-        """Get TeamFinder instance."""
-        return cast(TeamFinder, self.entity_finder)
+    def finder(self) -> TeamSearchRouter:
+        """Get the TeamSearchRouter which answers route."""
+        return cast(TeamSearchRouter, self.entity_finder)
     
     @property
     def build(self) -> TeamContextBuilder:
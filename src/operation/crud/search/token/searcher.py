@@ -9,6 +9,8 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, List
+
 from err import TokenSearcherException
 from authorization.permitter import TokenSearchPermitter
 from domain.exchange.request import SearchRequest
@@ -16,6 +18,11 @@ from result import SearchResult
 from route import TokenSearchRouter
 from util import LoggingLevelRouter
 
+if TYPE_CHECKING:
+    from collection.stack import TokenStackService
+    from domain.model import Token
+    from domain.search import TokenContext
+
 
 class TokenSearcher:
     _permitter: TokenSearchPermitter
@@ -56,4 +63,22 @@ class TokenSearcher:
                     ex=search_result.exception,
                 )
             )
-        return search_result
\ No newline at end of file
+        return search_result
+    
+    @LoggingLevelRouter.monitor
+    def execute_batch(self, stack: TokenStackService, contexts: List[TokenContext]) -> SearchResult[List[List[Token]]]:
+        """Route many contexts against one stack. The router certifies each context once."""
+        method = f"{self.__class__.__name__}.execute_batch"
+        
+        search_result = self._router.route_batch(stack=stack, contexts=contexts)
+        if search_result.is_failure:
+            return SearchResult.failure(
+                TokenSearcherException(
+                    cls_mthd=method,
+                    cls_name=self.__class__.__name__,
+                    msg=TokenSearcherException.MSG,
+                    err_code=TokenSearcherException.ERR_CODE,
+                    ex=search_result.exception,
+                )
+            )
+        return search_result
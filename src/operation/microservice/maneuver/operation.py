@@ -104,11 +104,15 @@ class ManeuverLauncher:
         maneuver = report.maneuver
 
         token = report.maneuver.token
-        maneuver.path.endpoints.destination.occupant = token
-        maneuver.path.endpoints.destination.state = SquareState.OCCUPIED
+        origin = maneuver.path.endpoints.origin
+        destination = maneuver.path.endpoints.destination
         
-        maneuver.path.endpoints.origin.occupant = None
-        maneuver.path.endpoints.origin.state = SquareState.EMPTY
+        # Move through the board so the squares, bitboards and position key change together.
+        board = destination.board
+        board.vacate(origin.coord)
+        board.occupy(destination.coord, token)
+        destination.state = SquareState.OCCUPIED
+        origin.state = SquareState.EMPTY
         
         maneuver.state = ManeuverState.COMPLETED
         
@@ -108,4 +108,4 @@ class SquareDepartureProcess:
         square.state = SquareState.EMPTY
         
         # --- Send the work product. ---#
-        DeletionResult.success(payload=token)
+        return DeletionResult.success(payload=token)
@@ -14,6 +14,7 @@ from logic.square import (
     Square, SquareEntryException, SquareOccupiedException, SquareState, SquareValidator, SquareVisitorBoardException,
     SquareVisitorDisabledException, WrongOpeningSquareException
 )
+from err import DeferredChessException
 from util import LoggingLevelRouter, UpdateResult
 from domain.model.state.token import Token, DeploymentState, TokenFreedomAnalyzer
 
@@ -160,6 +161,9 @@ class SquareEntry:
                     ex=coord_insertion_result.exception,
                 )
             )
+        # --- Keep the roster's indexes in step with the square. ---#
+        token.team.reindex(token)
+        
         # --- Update the token's deployment state. ---#
         if token.deployment_state == DeploymentState.NOT_DEPLOYED:
             token.deployment_state = DeploymentState.DEPLOYED
@@ -215,16 +219,9 @@ class SquareEntry:
             # Send the exception chain on failure.
             return UpdateResult.update_failure(
                 original=square,
-                exception=SquareEntryException(
+                exception=DeferredChessException(
+                    links=(SquareEntryException, SquareVisitorBoardException),
                     cls_mthd=method,
-                    op=SquareEntryException.OP,
-                    msg=SquareEntryException.MSG,
-                    err_code=SquareEntryException.ERR_CODE,
-                    mthd_rslt_type=SquareEntryException.MTHD_RSLT,
-                    ex=SquareVisitorBoardException(
-                        msg=SquareVisitorBoardException.MSG,
-                        err_code=SquareVisitorBoardException.ERR_CODE,
-                    )
                 )
             )
         # Handle the case that, the occupant is disabled
@@ -232,16 +229,9 @@ class SquareEntry:
             # Send the exception chain on failure.
             return UpdateResult.update_failure(
                 original=square,
-                exception=SquareEntryException(
+                exception=DeferredChessException(
+                    links=(SquareEntryException, SquareVisitorDisabledException),
                     cls_mthd=method,
-                    op=SquareEntryException.OP,
-                    msg=SquareEntryException.MSG,
-                    err_code=SquareEntryException.ERR_CODE,
-                    mthd_rslt_type=SquareEntryException.MTHD_RSLT,
-                    ex=SquareVisitorDisabledException(
-                        msg=SquareVisitorDisabledException.MSG,
-                        err_code=SquareVisitorDisabledException.ERR_CODE,
-                    )
                 )
             )
         # --- Forward the work product to the caller. ---#
@@ -293,16 +283,9 @@ class SquareEntry:
             # Send the exception chain on failure.
             return UpdateResult.update_failure(
                 original=square,
-                exception=SquareEntryException(
+                exception=DeferredChessException(
+                    links=(SquareEntryException, SquareOccupiedException),
                     cls_mthd=method,
-                    op=SquareEntryException.OP,
-                    msg=SquareEntryException.MSG,
-                    err_code=SquareEntryException.ERR_CODE,
-                    mthd_rslt_type=SquareEntryException.MTHD_RSLT,
-                    ex=SquareOccupiedException(
-                        msg=SquareOccupiedException.MSG,
-                        err_code=SquareOccupiedException.ERR_CODE,
-                    ),
                 )
             )
         # --- Forward the work product to the caller. ---#
@@ -343,16 +326,9 @@ class SquareEntry:
             # Send the exception chain on failure.
             return UpdateResult.update_failure(
                 original=square,
-                exception=SquareEntryException(
+                exception=DeferredChessException(
+                    links=(SquareEntryException, WrongOpeningSquareException),
                     cls_mthd=method,
-                    op=SquareEntryException.OP,
-                    msg=SquareEntryException.MSG,
-                    err_code=SquareEntryException.ERR_CODE,
-                    mthd_rslt_type=SquareEntryException.MTHD_RSLT,
-                    ex=WrongOpeningSquareException(
-                        msg=WrongOpeningSquareException.MSG,
-                        err_code=WrongOpeningSquareException.ERR_CODE
-                    )
                 )
             )
         # --- Forward the work product to the caller. ---#
@@ -10,27 +10,55 @@ version: 0.0.2
 from __future__ import annotations
 
 from abc import ABC
-from typing import Generic, TypeVar
+from typing import Generic, Optional, Type, TypeVar
 
 
 from domain.model import Model
-from suite import OperationSuite, SensorSuite
+from suite import OperationSuite, SensorSuite, Suite
 
 T = TypeVar("T", bound="Model")
 
 class Registry(ABC, Generic[T]):
-    _operations: OperationSuite
-    _sensors: SensorSuite
+    """
+    Role:
+        -   Dependency Container
+
+    Responsibilities:
+        1.  Pair a model's OperationSuite and SensorSuite. Either one is resolved through
+            the Suite container on first use when it isn't passed in.
+
+    Attributes:
+        OPERATIONS: Type[OperationSuite]
+        SENSORS: Type[SensorSuite]
+
+        operations: OperationSuite
+        sensors: SensorSuite
+
+    Notes:
+        Subclasses declare OPERATIONS and SENSORS. Reading a suite that was neither
+        declared nor passed in raises NotImplementedError naming the missing attribute.
+
+    Super Class:
+    """
+    OPERATIONS: Optional[Type[OperationSuite]] = None
+    SENSORS: Optional[Type[SensorSuite]] = None
+    
+    _operations: Optional[OperationSuite]
+    _sensors: Optional[SensorSuite]
     
-    def __init__(self, operations: OperationSuite, sensors: SensorSuite):
+    def __init__(self, operations: Optional[OperationSuite] = None, sensors: Optional[SensorSuite] = None):
         self._operations = operations
         self._sensors = sensors
         
     @property
     def operations(self) -> OperationSuite:
+        if self._operations is None:
+            self._operations = Suite.resolve_declared(self, "OPERATIONS")
         return self._operations
     
     @property
     def sensors(self) -> SensorSuite:
+        if self._sensors is None:
+            self._sensors = Suite.resolve_declared(self, "SENSORS")
         return self._sensors
     
\ No newline at end of file
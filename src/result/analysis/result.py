@@ -69,7 +69,9 @@ class AnalysisResult(Result[Report]):
             aborting because of an error or producing a negative result.
         -   Despite wrapping abort(), avoid using AnalysisResult's failure method.
     """
-    _state = AnalysisState
+    __slots__ = ("_state",)
+
+    _state: AnalysisState
     
     def __init__(
             self,
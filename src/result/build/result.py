@@ -41,6 +41,8 @@ class BuildResult(Result[T], Generic[T]):
     Super Class:
         Result
     """
+    __slots__ = ("_state",)
+
     _state: BuildState
     
     def __init__(
@@ -39,6 +39,8 @@ class ComputationResult(Result[T], Generic[T]):
     Super Class:
         Result
     """
+    __slots__ = ("_state",)
+
     _state: ComputationState
     
     def __init__(
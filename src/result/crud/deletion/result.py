@@ -42,7 +42,9 @@ class DeletionResult(CrudResult[T], Generic[T]):
     Super Class:
         Result
     """
-    _state = DeletionState
+    __slots__ = ("_state",)
+
+    _state: DeletionState
     
     def __init__(
             self,
@@ -130,9 +132,8 @@ class DeletionResult(CrudResult[T], Generic[T]):
     
     @classmethod
     def nothing_to_delete(cls) -> DeletionResult:
-        return cls(
-            payload=None,
-            exception=None,
-            state=DeletionState.NOTHING_TO_DELETE,
+        return cls._shared(
+            "nothing_to_delete",
+            lambda: cls(payload=None, exception=None, state=DeletionState.NOTHING_TO_DELETE),
         )
 
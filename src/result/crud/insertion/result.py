@@ -10,7 +10,7 @@ version: 0.0.2
 from __future__ import annotations
 from typing import Optional, cast
 
-from result import InsertionState
+from result import CrudResult, InsertionState
 
 
 class InsertionResult(CrudResult[bool]):
@@ -38,7 +38,9 @@ class InsertionResult(CrudResult[bool]):
     Super Class:
         Result
     """
-    _self: InsertionState
+    __slots__ = ("_state",)
+
+    _state: InsertionState
     
     def __init__(
             self,
@@ -90,10 +92,9 @@ class InsertionResult(CrudResult[bool]):
     
     @classmethod
     def success(cls, payload: bool = True) -> InsertionResult:
-        return cls(
-            payload=True,
-            exception=None,
-            state=InsertionState.SUCCESS,
+        return cls._shared(
+            "success",
+            lambda: cls(payload=True, exception=None, state=InsertionState.SUCCESS),
         )
     
     @classmethod
@@ -114,9 +115,8 @@ class InsertionResult(CrudResult[bool]):
     
     @classmethod
     def already_inserted(cls) -> InsertionResult:
-        return cls(
-            payload=True,
-            exception=None,
-            state=InsertionState.ALREADY_INSERTED,
+        return cls._shared(
+            "already_inserted",
+            lambda: cls(payload=True, exception=None, state=InsertionState.ALREADY_INSERTED),
         )
 
@@ -41,8 +41,9 @@ class SearchResult(CrudResult[T], Generic[T]):
     Super Class:
         Result
     """
+    __slots__ = ("_state",)
+
     _state: SearchState
-    _payload: Optional[List[T]] = None
     
     
     def __init__(
@@ -135,9 +136,8 @@ class SearchResult(CrudResult[T], Generic[T]):
     
     @classmethod
     def empty(cls) -> SearchResult:
-        return cls(
-            payload=None,
-            exception=None,
-            state=SearchState.NOTHING_FOUND,
+        return cls._shared(
+            "empty",
+            lambda: cls(payload=None, exception=None, state=SearchState.NOTHING_FOUND),
         )
 
@@ -40,6 +40,8 @@ class EventResult(Result[Event]):
     Super Class:
         Result
     """
+    __slots__ = ("_state",)
+
     _state: EventState
     
     def __init__(
@@ -9,11 +9,13 @@ version: 0.0.2
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, TypeVar, Generic
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
+# One instance per (result class, outcome) for outcomes that carry nothing unique.
+_SHARED: Dict[Tuple[type, str], Result] = {}
+
 
 class Result(Generic[T]):
     """
@@ -33,9 +35,17 @@ class Result(Generic[T]):
     Provides:
         -   def success(payload: T) -> Result
         -   def failure(exception: Exception) -> Result
+
+    Notes:
+        -   Every layer returns a Result, so the hierarchy uses __slots__. Subclasses
+            must declare __slots__ too, or each instance gets a __dict__ back.
+        -   Results are never mutated after construction. Payload-less outcomes such as
+            SearchResult.empty() are shared instances built once through _shared().
         
     Super Class:
     """
+    __slots__ = ("_payload", "_exception")
+
     _payload: Optional[T]
     _exception: Optional[Exception]
     
@@ -75,4 +85,15 @@ class Result(Generic[T]):
     @classmethod
     def failure(cls, exception: Exception) -> Result:
         return cls(exception=exception)
-    
+
+    @classmethod
+    def _shared(cls, outcome: str, factory: Callable[[], Result]) -> Result:
+        """
+        Return the single instance of cls for an outcome with no payload or exception
+        specific to the call, building it with factory on first use.
+        """
+        key = (cls, outcome)
+        result = _SHARED.get(key)
+        if result is None:
+            result = _SHARED[key] = factory()
+        return result
@@ -43,7 +43,9 @@ class InterpretationResult(ShellResult[T], Generic[T]):
     Super Class:
         Result
     """
-    _state = InterpretationState
+    __slots__ = ("_state",)
+
+    _state: InterpretationState
     
     def __init__(
             self,
@@ -115,10 +117,9 @@ class InterpretationResult(ShellResult[T], Generic[T]):
     
     @classmethod
     def nothing(cls, ) -> InterpretationResult:
-        return cls(
-            payload=None,
-            exception=None,
-            state=InterpretationState.NOTHING_TO_INTERPRET,
+        return cls._shared(
+            "nothing",
+            lambda: cls(payload=None, exception=None, state=InterpretationState.NOTHING_TO_INTERPRET),
         )
     
     @classmethod
@@ -42,7 +42,9 @@ class ParseResult(ShellResult[Command]):
     Super Class:
         ShellResult
     """
-    _state = ParseState
+    __slots__ = ("_state",)
+
+    _state: ParseState
     
     def __init__(
             self,
@@ -114,10 +116,9 @@ class ParseResult(ShellResult[Command]):
     
     @classmethod
     def nothing(cls,) -> ParseResult:
-        return cls(
-            payload=None,
-            exception=None,
-            state=ParseState.NOTHING_TO_PARSE,
+        return cls._shared(
+            "nothing",
+            lambda: cls(payload=None, exception=None, state=ParseState.NOTHING_TO_PARSE),
         )
     
     @classmethod
@@ -39,6 +39,8 @@ class ShellResult(Result, ABC, Generic[T]):
     Super Class:
         Result
     """
+    __slots__ = ()
+
     
     def __init__(
             self,
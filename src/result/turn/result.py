@@ -41,6 +41,8 @@ class TurnResult(Result[T], Generic[T]):
     Super Class:
         Result
     """
+    __slots__ = ("_state",)
+
     _state: ManeuverState
     
     def __init__(
@@ -42,9 +42,9 @@ class UpdateResult(Result[Response]):
     Super Class:
         Result
     """
+    __slots__ = ("_state",)
+
     _state: UpdateState
-    _response: Optional[Response]
-    _exception: Optional[Exception]
 
     def __init__(
             self,
@@ -75,7 +75,7 @@ class UpdateResult(Result[Response]):
     @property
     def is_failure(self) -> bool:
         return (
-                self._response is None and
+                self.response is None and
                 self.exception is not None and
                 self.state ==  UpdateState.FAILURE or
                 self.state ==  UpdateState.TIMED_OUT
@@ -92,7 +92,7 @@ class UpdateResult(Result[Response]):
     @property
     def is_timed_out(self) -> bool:
         return (
-                self._response is None and
+                self.response is None and
                 self.exception is not None and
                 self.state ==  UpdateState.TIMED_OUT
         )
@@ -123,11 +123,9 @@ class UpdateResult(Result[Response]):
     
     @classmethod
     def nothing_to_update(cls, ) -> UpdateResult:
-        method = f"{cls.__name__}.nothing_to_update"
-        return cls(
-            response=None,
-            exception=None,
-            state=UpdateState.NOTHING_TO_UPDATE,
+        return cls._shared(
+            "nothing_to_update",
+            lambda: cls(response=None, exception=None, state=UpdateState.NOTHING_TO_UPDATE),
         )
 
     
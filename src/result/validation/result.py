@@ -40,6 +40,8 @@ class ValidationResult(Result[T], Generic[T]):
     Super Class:
         Result
     """
+    __slots__ = ("_state",)
+
     _state: ValidationState
     
     def __init__(
@@ -10,13 +10,16 @@ Version: 1.0.0
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import List, TypeVar, Generic
+from typing import TYPE_CHECKING, Any, Callable, List, Mapping, Optional, TypeVar, Generic
 
 from operation import Validator
 from domain.model import Query
 from result import SearchResult
 from route import Router
 
+if TYPE_CHECKING:
+    from collection.index import ModelIndex
+
 T = TypeVar("T")
 
 
@@ -40,6 +43,10 @@ class SearchRouter(Router, Generic[T]):
                     query_validator: Validator[Query[T]]
             ) -> SearchResult[List[T]]
 
+    Notes:
+        Routers whose dataset owner keeps a ModelIndex call _route_by_index before scanning.
+        Routers with a batch entry point hand their validated criteria to _route_batch.
+
      Super Class:
          Builder
      """
@@ -51,4 +58,67 @@ class SearchRouter(Router, Generic[T]):
             query: Query[T],
             query_validator: Validator[Query[T]]
     ) -> SearchResult[List[T]]:
-        pass
\ No newline at end of file
+        pass
+    
+    @classmethod
+    def _route_by_index(
+            cls,
+            index: Optional[ModelIndex[T]],
+            criteria: Mapping[str, Any],
+    ) -> Optional[SearchResult[List[T]]]:
+        """
+        Answer a search from the dataset owner's index.
+        
+        Args:
+            index: Optional[ModelIndex[T]]
+            criteria: Mapping[str, Any]. Index name to the value searched for.
+        Returns:
+            Optional[SearchResult[List[T]]]. None when there is no index, no criteria or a
+            criterion the index does not cover, so the caller scans instead.
+        """
+        if index is None or not criteria or not index.covers(criteria):
+            return None
+        matches = index.intersect(criteria)
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
+    
+    @classmethod
+    def _route_batch(
+            cls,
+            dataset: List[T],
+            batch: List[Optional[Mapping[str, Any]]],
+            keys: Mapping[str, Callable[[T], Any]],
+            index: Optional[ModelIndex[T]] = None,
+    ) -> List[List[T]]:
+        """
+        Answer every criteria mapping in a batch together.
+        
+        Criteria the index covers are intersected there. The rest are all matched in one
+        scan of the dataset, so a batch costs at most one pass however many it holds.
+        
+        Args:
+            dataset: List[T]
+            batch: List[Optional[Mapping[str, Any]]]. None matches nothing.
+            keys: Mapping[str, Callable[[T], Any]]. Criteria name to the item's value for it.
+            index: Optional[ModelIndex[T]]
+        Returns:
+            List[List[T]]. The matches for each criteria mapping, in batch order.
+        """
+        matches: List[List[T]] = [[] for _ in batch]
+        scans = []
+        for position, criteria in enumerate(batch):
+            if not criteria:
+                continue
+            if index is not None and index.covers(criteria):
+                matches[position] = index.intersect(criteria)
+            else:
+                scans.append((matches[position], [(keys[name], value) for name, value in criteria.items()]))
+        if scans:
+            for item in dataset:
+                for found, tests in scans:
+                    if all(extract(item) == value for extract, value in tests):
+                        found.append(item)
+        return matches
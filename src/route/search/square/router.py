@@ -9,11 +9,13 @@ version: 0.0.2
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from err import SquareSearchException
+from err import SquareSearcherException, SquareSearchRouteException
 from domain.model import Board, Coord, Formation, HomeSquare, Square, SquareState, Token
-from domain.model import SquareQuery
+from domain.search import SquareContext
+from assurance.validator import SquareContextValidator
+from collection.stack.square.index import SquareIndex
 from result import SearchResult
 from route import SearchRouter
 from util import LoggingLevelRouter
@@ -39,197 +41,360 @@ class SquareSearchRouter(SearchRouter[Square]):
     # INHERITED ATTRIBUTES:
     None
     """
+    # Square values route_batch can scan for, keyed like the criteria from _criteria.
+    SCAN_KEYS = {
+        **SquareIndex.KEYS,
+        "board": lambda square: square.board,
+        "state": lambda square: square.state,
+    }
+    
     @classmethod
     @LoggingLevelRouter.monitor
     def route(
             cls,
-            query: SquareQuery,
-            query_validator: SquareQueryValidator | None = None,
+            context: SquareContext,
+            dataset: List[Square],
+            index: Optional[SquareIndex] = None,
+            board: Optional[Board] = None,
+            context_validator: SquareContextValidator | None = None,
     ) -> SearchResult[List[Square]]:
-            """
-            # ACTION:
-            1.  If the collider_candidates is null or the wrong type send the exception in the SearchResult.
-            2.  If the context fails validation send the exception in the SearchResult. Else, route to the
-                search method which matches the context key.
-            3.  The search method returns either an empty result or a list of squares. Any exceptions were caught earlier
-                by the search router.
-           # PARAMETERS:
-                *   collider_candidates (List[Square]):
-                *   context: SquareContext
-                *   context_validator: SquareContextValidator
-            # RETURNS:
-                *   SearchResult[List[Square]] containing either:
-                        - On error: Exception , payload null
-                        - On finding a match: List[Tokem] in the payload.
-                        - On no matches found: Exception null, payload null
-            Raises:
-                *   TypeError
-                *   SquareNullDatasetException
-                *   SquareSearchException
-            """
-            method = "SquareFinder.find"
-            
-            if query_validator is None:
-                query_validator = SquareQueryValidator()
-            
-            # Handle the case that, the collider_candidates is null.
-            if dataset is None:
+        """
+        Find squares with an attribute that fits the context.
+        
+        Action:
+            1.  Send an exception chain in the SearchResult if the dataset is not a list, the
+                context fails validation or the context has no search route.
+            2.  Otherwise, answer from the index when the dataset's owner sends one, or route to
+                the search method which matches the context key.
+        Args:
+            context: SquareContext
+            dataset: List[Square]
+            index: Optional[SquareIndex]. When the dataset's owner sends its index the id,
+                name, coord and occupant searches are hash lookups instead of scans.
+            board: Optional[Board]. The board when the dataset is its whole square set, so a
+                coord search reads the board's mailbox.
+            context_validator: Optional[SquareContextValidator]
+        Returns:
+            SearchResult[List[Square]] containing either:
+                -   On error: Exception, payload null
+                -   On finding a match: List[Square] in the payload.
+                -   On no matches found: Exception null, payload null
+        Raises:
+            TypeError
+            SquareSearcherException
+            SquareSearchRouteException
+        """
+        method = f"{cls.__name__}.route"
+        
+        if context_validator is None:
+            context_validator = SquareContextValidator()
+        
+        # Handle the case that, the dataset is null or the wrong type.
+        if not isinstance(dataset, list):
+            # Send the exception chain on failure.
+            return SearchResult.failure(
+                SquareSearcherException(
+                    cls_mthd=method,
+                    cls_name=cls.__name__,
+                    msg=SquareSearcherException.MSG,
+                    err_code=SquareSearcherException.ERR_CODE,
+                    ex=TypeError(f"{method}: Expected List[Square], got {type(dataset).__name__} instead.")
+                )
+            )
+        # Handle the case that, the context is not safe.
+        validation = context_validator.execute(candidate=context)
+        if validation.is_failure:
+            # Send the exception chain on failure.
+            return SearchResult.failure(
+                SquareSearcherException(
+                    cls_mthd=method,
+                    cls_name=cls.__name__,
+                    msg=SquareSearcherException.MSG,
+                    err_code=SquareSearcherException.ERR_CODE,
+                    ex=validation.exception
+                )
+            )
+        
+        # --- Answer from the index when the dataset's owner maintains one. ---#
+        if index is not None:
+            indexed_result = cls._find_by_index(index=index, context=context)
+            if indexed_result is not None:
+                return indexed_result
+        
+        # --- Route to the search method which matches the context key. ---#
+        
+        # Entry point into searching by square's id.
+        if context.id is not None:
+            return cls._find_by_id(dataset=dataset, id=context.id)
+        
+        # Entry point into searching by square's name.
+        if context.name is not None:
+            return cls._find_by_name(dataset=dataset, name=context.name)
+        
+        # Entry point into searching by square's board.
+        if context.board is not None:
+            return cls._find_by_board(dataset=dataset, board=context.board)
+        
+        # Entry point into searching by square's coord.
+        if context.coord is not None:
+            return cls._find_by_coord(dataset=dataset, coord=context.coord, board=board)
+        
+        # Entry point into searching by square's occupant.
+        if context.occupant is not None:
+            return cls._find_by_occupant(dataset=dataset, occupant=context.occupant)
+        
+        # Entry point into searching by square's state.
+        if context.state is not None:
+            return cls._find_by_state(dataset=dataset, state=context.state)
+        
+        # The default path is only reached when a context.key does not have a search route. Return
+        # the exception chain.
+        return SearchResult.failure(
+            SquareSearcherException(
+                cls_mthd=method,
+                cls_name=cls.__name__,
+                msg=SquareSearcherException.MSG,
+                err_code=SquareSearcherException.ERR_CODE,
+                ex=SquareSearchRouteException(f"{method}: {SquareSearchRouteException.ERR_CODE}")
+            )
+        )
+    
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def route_batch(
+            cls,
+            dataset: List[Square],
+            contexts: List[SquareContext],
+            index: Optional[SquareIndex] = None,
+            board: Optional[Board] = None,
+            context_validator: SquareContextValidator | None = None,
+    ) -> SearchResult[List[List[Square]]]:
+        """
+        Answer many square searches in one round trip.
+        
+        Action:
+            1.  Send an exception chain in the SearchResult if the dataset or contexts are
+                not lists, a context fails validation or a context has no search route.
+            2.  Otherwise, certify every context once, then answer the indexed ones from the
+                index, coord searches the index does not cover from the board's mailbox and the
+                rest in a single scan of the dataset. Each context gets what route() sends it.
+        Args:
+            dataset: List[Square]
+            contexts: List[SquareContext]
+            index: Optional[SquareIndex]
+            board: Optional[Board]. The board when the dataset is its whole square set, as in
+                route().
+            context_validator: Optional[SquareContextValidator]
+        Returns:
+            SearchResult[List[List[Square]]]. On success the payload holds each context's
+            matches, in context order. A context with no matches gets an empty list.
+        Raises:
+            TypeError
+            SquareSearcherException
+            SquareSearchRouteException
+        """
+        method = f"{cls.__name__}.route_batch"
+        
+        if context_validator is None:
+            context_validator = SquareContextValidator()
+        
+        # Handle the case that, the dataset or contexts are not lists.
+        for name, value in (("dataset", dataset), ("contexts", contexts)):
+            if not isinstance(value, list):
                 # Send the exception chain on failure.
                 return SearchResult.failure(
-                    SquareSearchException(
-                        msg=f"{method}: {SquareSearchException.ERR_CODE}",
-                        ex=SquareSearchDatasetNullException(f"{method}: {SquareSearchDatasetNullException.MSG}")
+                    SquareSearcherException(
+                        cls_mthd=method,
+                        cls_name=cls.__name__,
+                        msg=SquareSearcherException.MSG,
+                        err_code=SquareSearcherException.ERR_CODE,
+                        ex=TypeError(f"{method}: Expected a list for {name}, got {type(value).__name__} instead.")
                     )
                 )
-            # Handle the case that, collider_candidates is the wrong type
-            if not isinstance(dataset, List):
+        batch = []
+        for context in contexts:
+            # Handle the case that, a context is not safe.
+            validation = context_validator.execute(candidate=context)
+            if validation.is_failure:
                 # Send the exception chain on failure.
                 return SearchResult.failure(
-                    SquareSearchException(
-                        msg=f"{method}: {SquareSearchException.ERR_CODE}",
-                        ex=TypeError(f"{method}: Expected List[Square], got {type(dataset).__name__} instead.")
+                    SquareSearcherException(
+                        cls_mthd=method,
+                        cls_name=cls.__name__,
+                        msg=SquareSearcherException.MSG,
+                        err_code=SquareSearcherException.ERR_CODE,
+                        ex=validation.exception
                     )
                 )
-            
-            # --- Route to the search method which matches the context key. ---#
-            
-            # Entry point into searching by square's id.
-            if query.context.id is not None:
-                return cls._find_by_id(dataset=query.token_stack, id=query.context.id)
-            
-            # Entry point into searching by arena square is playing in.
-            if query.context.name is not None:
-                return cls._find_by_name(dataset=query.token_stack, name=query.context.name)
-            
-            # Entry point into searching by square's board.
-            if query.context.board is not None:
-                return cls._find_by_board(dataset=query.token_stack, board=query.context.board)
-            
-            # Entry point into searching by square's coord.
-            if query.context.coord is not None:
-                return cls._find_by_coord(dataset=query.token_stack, coord=query.context.coord)
-            
-            # Entry point into searching by square's occupant.
-            if query.context.occupant is not None:
-                return cls._find_by_occupant(dataset=query.token_stack, occupant=query.context.occupant)
-            
-            # Entry point into searching by opening square's formation.
-            if query.context.formation is not None:
-                return cls._find_by_formation(dataset=query.token_stack, coord=query.context.formation)
-            
-            # Entry point into searching by opening square's state.
-            if query.context.state is not None:
-                return cls._find_by_formation(dataset=query.token_stack, coord=query.context.state)
-            
-            # The default path is only reached when a context.key does not have a search route. Return
-            # the exception chain.
-            return SearchResult.failure(
-                SquareSearchException(
-                    cls_mthd=method,
-                    cls_name=cls.__name__,
-                    msg=SquareSearchException.MSG,
-                    err_code=SquareSearchException.ERR_CODE,
-                    ex=SquareSearchRouteException(f"{method}: {SquareSearchRouteException.ERR_CODE}")
+            # Handle the case that, a context has no search route.
+            criteria = cls._criteria(context)
+            if not criteria:
+                # Send the exception chain on failure.
+                return SearchResult.failure(
+                    SquareSearcherException(
+                        cls_mthd=method,
+                        cls_name=cls.__name__,
+                        msg=SquareSearcherException.MSG,
+                        err_code=SquareSearcherException.ERR_CODE,
+                        ex=SquareSearchRouteException(f"{method}: {SquareSearchRouteException.ERR_CODE}")
+                    )
                 )
-            )
+            batch.append(criteria)
         
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_id(cls, dataset: List[Square], id: int) -> SearchResult[List[Square]]:
-            """
-            Find squares which match the id. There should only be one.
-            """
-            matches = [square for square in dataset if square.id == id]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
-        
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_name(cls, dataset: List[Square], name: str) -> SearchResult[List[Square]]:
-            """
-            Find squares which match the name. There should only be one.
-            """
-            matches = [square for square in dataset if square.name.upper()== name.upper()]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
-        
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_board(cls, dataset: List[Square], board: Board) -> SearchResult[List[Square]]:
-            """
-            Find squares which match the board.
-            """
-            matches = [square for square in dataset if square.board == board]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
-        
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_coord(cls, dataset: List[Square], coord: Coord) -> SearchResult[List[Square]]:
-            """
-            Find squares which match the coord. There should only be one.
-            """
-            matches = [square for square in dataset if square.coord == coord]
-            # Handle the nothing found case.
-            if len(matches) == 0:
+        # --- Take the coord searches route() would send to the board's mailbox out of the scan. ---#
+        mailbox: Dict[int, List[Square]] = {}
+        if board is not None:
+            for position, criteria in enumerate(batch):
+                if "coord" in criteria and (index is None or not index.covers(criteria)):
+                    square = board.square_at(criteria["coord"])
+                    mailbox[position] = [] if square is None else [square]
+                    batch[position] = None
+        
+        # --- Answer the rest of the batch in one pass and forward the work product. ---#
+        matches = cls._route_batch(dataset=dataset, batch=batch, keys=cls.SCAN_KEYS, index=index)
+        for position, found in mailbox.items():
+            matches[position] = found
+        return SearchResult.success(payload=matches)
+    
+    @classmethod
+    def _criteria(cls, context: SquareContext) -> Dict[str, Any]:
+        """The context key route() would search on, in the same order. Empty if none is set."""
+        if context.id is not None:
+            return {"id": context.id}
+        if context.name is not None:
+            return {"name": context.name.upper()}
+        if context.board is not None:
+            return {"board": context.board}
+        if context.coord is not None:
+            return {"coord": context.coord}
+        if context.occupant is not None:
+            return {"occupant": context.occupant}
+        if context.state is not None:
+            return {"state": context.state}
+        return {}
+    
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_index(cls, index: SquareIndex, context: SquareContext) -> Optional[SearchResult[List[Square]]]:
+        """
+        Look the context key up in the index. None if the key has no index, so the caller
+        falls back to a scan.
+        """
+        return cls._route_by_index(index, cls._criteria(context))
+    
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_id(cls, dataset: List[Square], id: int) -> SearchResult[List[Square]]:
+        """
+        Find squares which match the id. There should only be one.
+        """
+        matches = [square for square in dataset if square.id == id]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
+    
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_name(cls, dataset: List[Square], name: str) -> SearchResult[List[Square]]:
+        """
+        Find squares which match the name. There should only be one.
+        """
+        # Upper-case the target once, not on every comparison.
+        target = name.upper()
+        matches = [square for square in dataset if square.name.upper() == target]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
+    
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_board(cls, dataset: List[Square], board: Board) -> SearchResult[List[Square]]:
+        """
+        Find squares which match the board.
+        """
+        matches = [square for square in dataset if square.board == board]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
+    
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_coord(
+            cls,
+            dataset: List[Square],
+            coord: Coord,
+            board: Optional[Board] = None,
+    ) -> SearchResult[List[Square]]:
+        """
+        Find squares which match the coord. There should only be one.
+        
+        When the caller sends the board whose square set the dataset is, the board's mailbox
+        answers in O(1). Any other dataset is scanned.
+        """
+        if board is not None:
+            square = board.square_at(coord)
+            if square is None:
                 return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
+            return SearchResult.success(payload=[square])
+        
+        matches = [square for square in dataset if square.coord == coord]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
 
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_occupant(cls, dataset: List[Square], occupant: Token) -> SearchResult[List[Square]]:
-            """
-            Find squares containing the occupant. There should only be one.
-            """
-            matches = [square for square in dataset if square.occupant == occupant]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_occupant(cls, dataset: List[Square], occupant: Token) -> SearchResult[List[Square]]:
+        """
+        Find squares containing the occupant. There should only be one.
+        """
+        matches = [square for square in dataset if square.occupant == occupant]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
 
 
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_state(cls, dataset: List[Square], state: SquareState) -> SearchResult[List[Square]]:
-            """
-            Find squares containing the occupant. There should only be one.
-            """
-            matches = [square for square in dataset if square.state == state]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_state(cls, dataset: List[Square], state: SquareState) -> SearchResult[List[Square]]:
+        """
+        Find squares containing the occupant. There should only be one.
+        """
+        matches = [square for square in dataset if square.state == state]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
 
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_formation(
-                cls,
-                dataset: List[Square],
-                formation: Formation
-        ) -> SearchResult[List[HomeSquare]]:
-            """
-            Find OpeningSquare instances which match the formation. There should only be one.
-            """
-            matches = [
-                square for square in dataset if (
-                        isinstance(square, HomeSquare) and
-                        square.formation == formation
-                )
-            ]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
\ No newline at end of file
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_formation(
+            cls,
+            dataset: List[Square],
+            formation: Formation
+    ) -> SearchResult[List[HomeSquare]]:
+        """
+        Find OpeningSquare instances which match the formation. There should only be one.
+        """
+        matches = [
+            square for square in dataset if (
+                    isinstance(square, HomeSquare) and
+                    square.formation == formation
+            )
+        ]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
\ No newline at end of file
@@ -1,16 +1,16 @@
-# src/route/search/token/__init__.py
+# src/route/search/team/__init__.py
 
 """
-Module: route.search.token.__init__
+Module: route.search.team.__init__
 Author: Banji Lawal
 Created: 2026-04-03
 version: 0.0.2
 """
 
-# =========== ROUTE.SEARCH.TOKEN PACKAGE ===========#
+# =========== ROUTE.SEARCH.TEAM PACKAGE ===========#
 
 # Packages
 
 
 # Modules
-from .router import TokenSearchRouter
+from .router import TeamSearchRouter
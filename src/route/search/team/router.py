@@ -1,7 +1,7 @@
-# src/route/search/token/orange.py
+# src/route/search/team/router.py
 
 """
-Module: route.search.token.orange
+Module: route.search.team.router
 Author: Banji Lawal
 Created: 2026-04-03
 version: 0.0.2
@@ -9,25 +9,29 @@ version: 0.0.2
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from domain.model import Token
-from domain.model import TeamQuery
+from err import TeamSearcherException, TeamSearchRouteException
+from domain.model import Board, Player, Team
+from domain.search import TeamContext
+from assurance.validator import TeamContextValidator
+from collection.stack.team.index import TeamIndex
 from result import SearchResult
 from route import SearchRouter
-from system import LoggingLevelRouter
+from setting import GameColor
+from util import LoggingLevelRouter
 
 
-class TokenSearchRouter(SearchRouter[Token]):
+class TeamSearchRouter(SearchRouter[Team]):
     """
     Role:SearchRouter
 
     Responsibilities:
-    1.  Send bag in a TokenList whose attribute value match the context.key value to the caller.
+    1.  Send back the teams whose attribute value matches the context.key value to the caller.
     2.  If a search does not complete forward the exception chain to the caller for debugging.
-    
+
     # LIMITATIONS:
-    1.  TokenSearchRouter sends the raw list of matches. Resolving id collisions is the caller's responsibility.
+    1.  TeamSearchRouter sends the raw list of matches. Resolving id collisions is the caller's responsibility.
 
     # PARENT
         *   SearchRouter
@@ -38,180 +42,166 @@ class TokenSearchRouter(SearchRouter[Token]):
     # INHERITED ATTRIBUTES:
     None
     """
+
     @classmethod
     @LoggingLevelRouter.monitor
     def route(
             cls,
-            query: TeamQuery,
-            query_validator: TeamQueryValidator | None = None,
-    ) -> SearchResult[List[Token]]:
-            """
-            # ACTION:
-            1.  If the collider_candidates is null or the wrong type send the exception in the SearchResult.
-            2.  If the context fails validation send the exception in the SearchResult. Else, route to the
-                search method which matches the context key.
-            3.  The search method returns either an empty result or a list of teams. Any exceptions were caught earlier
-                by the search router.
-           # PARAMETERS:
-                *   collider_candidates (List[Team]):
-                *   context: TeamContext
-                *   context_validator: TeamContextValidator
-            # RETURNS:
-                *   SearchResult[List[Team]] containing either:
-                        - On error: Exception , payload null
-                        - On finding a match: List[Tokem] in the payload.
-                        - On no matches found: Exception null, payload null
-            Raises:
-                *   TypeError
-                *   TeamNullDatasetException
-                *   TeamSearchException
-            """
-            method = "TeamFinder.find"
-            
-            if query_validator is None:
-                query_validator = TeamQueryValidator()
-            
-            # Handle the case that, the collider_candidates is null.
-            if dataset is None:
-                # Send the exception chain on failure.
-                return SearchResult.failure(
-                    TeamSearchException(
-                        msg=f"{method}: {TeamSearchException.ERR_CODE}",
-                        ex=TeamSearchDatasetNullException(f"{method}: {TeamSearchDatasetNullException.MSG}")
-                    )
-                )
-            # Handle the case that, collider_candidates is the wrong type
-            if not isinstance(dataset, List):
-                # Send the exception chain on failure.
-                return SearchResult.failure(
-                    TeamSearchException(
-                        msg=f"{method}: {TeamSearchException.ERR_CODE}",
-                        ex=TypeError(f"{method}: Expected List[Team], got {type(dataset).__name__} instead.")
-                    )
+            context: TeamContext,
+            dataset: List[Team],
+            index: Optional[TeamIndex] = None,
+            context_validator: TeamContextValidator | None = None,
+    ) -> SearchResult[List[Team]]:
+        """
+        Find teams with an attribute that fits the context.
+
+        Action:
+            1.  Send an exception chain in the SearchResult if the dataset is not a list, the
+                context fails validation or the context has no search route.
+            2.  Otherwise, answer from the index when the dataset's owner sends one, or route to
+                the search method which matches the context key.
+        Args:
+            context: TeamContext
+            dataset: List[Team]
+            index: Optional[TeamIndex]. When the dataset's owner sends its index the id, board
+                and owner searches are hash lookups instead of scans.
+            context_validator: Optional[TeamContextValidator]
+        Returns:
+            SearchResult[List[Team]] containing either:
+                -   On error: Exception, payload null
+                -   On finding a match: List[Team] in the payload.
+                -   On no matches found: Exception null, payload null
+        Raises:
+            TypeError
+            TeamSearcherException
+            TeamSearchRouteException
+        """
+        method = f"{cls.__name__}.route"
+
+        if context_validator is None:
+            context_validator = TeamContextValidator()
+
+        # Handle the case that, the dataset is null or the wrong type.
+        if not isinstance(dataset, list):
+            # Send the exception chain on failure.
+            return SearchResult.failure(
+                TeamSearcherException(
+                    cls_mthd=method,
+                    cls_name=cls.__name__,
+                    msg=TeamSearcherException.MSG,
+                    err_code=TeamSearcherException.ERR_CODE,
+                    ex=TypeError(f"{method}: Expected List[Team], got {type(dataset).__name__} instead.")
                 )
-            
-            # --- Route to the search method which matches the context key. ---#
-            
-            # Entry point into searching by team's id.
-            if context.id is not None:
-                return cls._find_by_id(dataset, context.id)
-            # Entry point into searching by arena team is playing in.
-            if context.arena is not None:
-                return cls._find_by_arena(dataset=dataset, arena=context.arena)
-            # Entry point into searching by team's owner.
-            if context.model_class is not None:
-                return cls._find_by_player(dataset, context.model_class)
-            # Entry point into searching by team's color.
-            if context.color is not None:
-                return cls._find_by_color(dataset=dataset, team=context.color)
-            
-            # The default path is only reached when a context.key does not have a search route. Return
-            # the exception chain.
+            )
+        # Handle the case that, the context is not safe.
+        validation = context_validator.execute(candidate=context)
+        if validation.is_failure:
+            # Send the exception chain on failure.
             return SearchResult.failure(
-                TeamSearchException(
-                    msg=f"{method}: {TeamSearchException.ERR_CODE}",
-                    ex=TeamSearchRouteException(f"{method}: {TeamSearchRouteException.ERR_CODE}")
+                TeamSearcherException(
+                    cls_mthd=method,
+                    cls_name=cls.__name__,
+                    msg=TeamSearcherException.MSG,
+                    err_code=TeamSearcherException.ERR_CODE,
+                    ex=validation.exception
                 )
             )
-        
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_id(cls, dataset: List[Team], id: int) -> SearchResult[List[Team]]:
-            """
-            # ACTION:
-                1.  Get the Team with the matching id if it exists
-                2.  Multiple, unique matches in the result indicate that  a problem.
-            # PARAMETERS:
-                *   id (int)
-                *   collider_candidates (List[Player])
-            # RETURNS:
-                *   SearchResult[List[Team]] containing either:
-                        - On error: Exception , payload null
-                        - On searching a match: List[Team] in the payload.
-                        - On no matches found: Exception null, payload null
-            Raises:
-                *   TeamSearchException
-            """
-            method = "TeamFinder._find_by_id"
-            
-            matches = [team for team in dataset if team.id == id]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
-        
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_arena(cls, dataset: [Team], arena: Arena) -> SearchResult[List[Team]]:
-            """
-            # ACTION:
-                1.  Get any teams which have entered the arena
-            # PARAMETERS:
-                *   arena (Arena)
-                *   collider_candidates (List[Player])
-            # RETURNS:
-                *   SearchResult[List[Team]] containing either:
-                        - On error: Exception , payload null
-                        - On searching a match: List[Team] in the payload.
-                        - On no matches found: Exception null, payload null
-            Raises:
-                *   TeamSearchException
-            """
-            method = "TeamFinder._find_by_arena"
-            matches = [team for team in dataset if team.arena == arena]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
-        
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_player(cls, dataset: [Team], player: Player) -> SearchResult[List[Team]]:
-            """
-            # ACTION:
-                1.  Get any teams which have been played by the owner,
-            # PARAMETERS:
-                *   arena (Arena)
-                *   collider_candidates (List[Player])
-            # RETURNS:
-                *   SearchResult[List[Team]] containing either:
-                        - On error: Exception , payload null
-                        - On searching a match: List[Team] in the payload.
-                        - On no matches found: Exception null, payload null
-            Raises:
-                *   TeamSearchException
-            """
-            method = "TeamFinder._find_by_player"
-            matches = [team for team in dataset if team.model_class == player]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
-        
-        @classmethod
-        @LoggingLevelRouter.monitor
-        def _find_by_color(cls, dataset: List[Team], color: GameColor) -> SearchResult[List[Team]]:
-            """
-            # ACTION:
-                1.  Get any teams which have been assigned the targeted color
-            # PARAMETERS:
-                *   arena (Arena)
-                *   collider_candidates (List[Player])
-            # RETURNS:
-                *   SearchResult[List[Team]] containing either:
-                        - On error: Exception , payload null
-                        - On searching a match: List[Team] in the payload.
-                        - On no matches found: Exception null, payload null
-            Raises:
-                *   TeamSearchException
-            """
-            method = "TeamFinder._find_by_color"
-            matches = [team for team in dataset if team.schema.color == color]
-            # Handle the nothing found case.
-            if len(matches) == 0:
-                return SearchResult.empty()
-            # Only other case
-            return SearchResult.success(payload=matches)
\ No newline at end of file
+
+        # --- Answer from the index when the dataset's owner maintains one. ---#
+        if index is not None:
+            indexed_result = cls._route_by_index(index, cls._criteria(context))
+            if indexed_result is not None:
+                return indexed_result
+
+        # --- Route to the search method which matches the context key. ---#
+
+        # Entry point into searching by team's id.
+        if context.id is not None:
+            return cls._find_by_id(dataset=dataset, id=context.id)
+
+        # Entry point into searching by team's board.
+        if context.board is not None:
+            return cls._find_by_board(dataset=dataset, board=context.board)
+
+        # Entry point into searching by team's owner.
+        if context.owner is not None:
+            return cls._find_by_owner(dataset=dataset, owner=context.owner)
+
+        # Entry point into searching by team's color.
+        if context.color is not None:
+            return cls._find_by_color(dataset=dataset, color=context.color)
+
+        # The default path is only reached when a context.key does not have a search route. Return
+        # the exception chain.
+        return SearchResult.failure(
+            TeamSearcherException(
+                cls_mthd=method,
+                cls_name=cls.__name__,
+                msg=TeamSearcherException.MSG,
+                err_code=TeamSearcherException.ERR_CODE,
+                ex=TeamSearchRouteException(f"{method}: {TeamSearchRouteException.ERR_CODE}")
+            )
+        )
+
+    @classmethod
+    def _criteria(cls, context: TeamContext) -> Dict[str, Any]:
+        """The context key route() would search on, in the same order. Empty if none is set."""
+        if context.id is not None:
+            return {"id": context.id}
+        if context.board is not None:
+            return {"board": context.board}
+        if context.owner is not None:
+            return {"owner": context.owner}
+        return {}
+
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_id(cls, dataset: List[Team], id: int) -> SearchResult[List[Team]]:
+        """
+        Find teams which match the id. There should only be one.
+        """
+        matches = [team for team in dataset if team.id == id]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
+
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_board(cls, dataset: List[Team], board: Board) -> SearchResult[List[Team]]:
+        """
+        Find the teams playing on the board.
+        """
+        matches = [team for team in dataset if team.board == board]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
+
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_owner(cls, dataset: List[Team], owner: Player) -> SearchResult[List[Team]]:
+        """
+        Find the teams the player owns.
+        """
+        matches = [team for team in dataset if team.owner == owner]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
+
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_color(cls, dataset: List[Team], color: GameColor) -> SearchResult[List[Team]]:
+        """
+        Find the teams whose archetype has the color.
+        """
+        matches = [team for team in dataset if team.archetype.color == color]
+        # Handle the nothing found case.
+        if len(matches) == 0:
+            return SearchResult.empty()
+        # Only other case
+        return SearchResult.success(payload=matches)
@@ -9,15 +9,21 @@ version: 0.0.2
 
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional
 
 from err import TokenSearcherException, TokenSearchRouteException
 from domain.model import Coord, HomeSquare, Rank, Team, Token
 from domain.model import TokenQuery
+from domain.search import TokenContext
+from assurance.validator import TokenContextValidator
+from collection.stack.token.index import TokenIndex
 from result import SearchResult
 from route import SearchRouter
 from system import LoggingLevelRouter
 
+if TYPE_CHECKING:
+    from collection.stack import TokenStackService
+
 
 class TokenSearchRouter(SearchRouter[Token]):
     """
@@ -39,6 +45,15 @@ class TokenSearchRouter(SearchRouter[Token]):
     # INHERITED ATTRIBUTES:
     None
     """
+    # Token values route_batch can scan for, keyed like the criteria from _criteria.
+    SCAN_KEYS = {
+        **TokenIndex.KEYS,
+        "name": lambda token: token.name.upper(),
+        "home_square": lambda token: token.home_square,
+        "ransom": lambda token: token.rank.persona.ransom,
+        "color": lambda token: token.team.archetype.color,
+    }
+    
     @classmethod
     @LoggingLevelRouter.monitor
     def route(
@@ -63,6 +78,12 @@ class TokenSearchRouter(SearchRouter[Token]):
             MissingTokenSearchRouteException
         """
         method = f"{cls.__name__}.route"
+        
+        # --- Intersect the stack's indexes when every key in the context is indexed. ---#
+        indexed_result = cls._find_by_index(query)
+        if indexed_result is not None:
+            return indexed_result
+        
         # --- Route to the search method which matches the context key. ---#
         
         # token.id search entry point.
@@ -129,6 +150,142 @@ class TokenSearchRouter(SearchRouter[Token]):
             )
         )
         
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def route_batch(
+            cls,
+            stack: TokenStackService,
+            contexts: List[TokenContext],
+            context_validator: TokenContextValidator | None = None,
+    ) -> SearchResult[List[List[Token]]]:
+        """
+        Answer many token searches against one stack in one round trip.
+        
+        Action:
+            1.  Send an exception chain in the SearchResult if contexts is not a list, a
+                context fails validation or a context sets no key.
+            2.  Otherwise, certify every context once, then intersect the stack's indexes for
+                the contexts they cover and answer the rest in a single scan of the stack.
+        Args:
+            stack: TokenStackService
+            contexts: List[TokenContext]
+            context_validator: Optional[TokenContextValidator]
+        Returns:
+            SearchResult[List[List[Token]]]. On success the payload holds each context's
+            matches, in context order. A context with no matches gets an empty list.
+        Raises:
+            TypeError
+            TokenSearcherException
+            TokenSearchRouteException
+        """
+        method = f"{cls.__name__}.route_batch"
+        
+        if context_validator is None:
+            context_validator = TokenContextValidator()
+        
+        # Handle the case that, contexts is not a list.
+        if not isinstance(contexts, list):
+            # Send the exception chain on failure.
+            return SearchResult.failure(
+                TokenSearcherException(
+                    cls_mthd=method,
+                    cls_name=cls.__name__,
+                    msg=TokenSearcherException.MSG,
+                    err_code=TokenSearcherException.ERR_CODE,
+                    ex=TypeError(f"{method}: Expected a list of contexts, got {type(contexts).__name__} instead.")
+                )
+            )
+        batch = []
+        for context in contexts:
+            # Handle the case that, a context is not safe.
+            validation = context_validator.execute(candidate=context)
+            if validation.is_failure:
+                # Send the exception chain on failure.
+                return SearchResult.failure(
+                    TokenSearcherException(
+                        cls_mthd=method,
+                        cls_name=cls.__name__,
+                        msg=TokenSearcherException.MSG,
+                        err_code=TokenSearcherException.ERR_CODE,
+                        ex=validation.exception
+                    )
+                )
+            criteria = cls._criteria(context)
+            # Handle the case that, a context sets no key.
+            if criteria is not None and not criteria:
+                # Send the exception chain on failure.
+                return SearchResult.failure(
+                    TokenSearcherException(
+                        cls_mthd=method,
+                        cls_name=cls.__name__,
+                        msg=TokenSearcherException.MSG,
+                        err_code=TokenSearcherException.ERR_CODE,
+                        ex=TokenSearchRouteException(
+                            msg=TokenSearchRouteException.MSG,
+                            err_code=TokenSearchRouteException.ERR_CODE,
+                        )
+                    )
+                )
+            batch.append(criteria)
+        # --- Answer the whole batch in one pass and forward the work product. ---#
+        return SearchResult.success(
+            payload=cls._route_batch(dataset=stack.items, batch=batch, keys=cls.SCAN_KEYS, index=stack.index)
+        )
+    
+    @classmethod
+    def _criteria(cls, context: TokenContext) -> Optional[Dict[str, Hashable]]:
+        """
+        Every key the context sets, named as in SCAN_KEYS. A rank is looked up by its
+        persona. None if the context's rank and persona disagree, so nothing can match.
+        """
+        criteria: Dict[str, Hashable] = {}
+        if context.id is not None:
+            criteria["id"] = context.id
+        if context.name is not None:
+            criteria["name"] = context.name.upper()
+        if context.home_square is not None:
+            criteria["home_square"] = context.home_square
+        if context.team is not None:
+            criteria["team"] = context.team
+        if context.rank is not None:
+            criteria["persona"] = context.rank.persona
+        if context.persona is not None:
+            if criteria.setdefault("persona", context.persona) != context.persona:
+                return None
+        if context.ransom is not None:
+            criteria["ransom"] = context.ransom
+        if context.color is not None:
+            criteria["color"] = context.color
+        if context.current_position is not None:
+            criteria["coord"] = context.current_position
+        if context.readiness_state is not None:
+            criteria["readiness_state"] = context.readiness_state
+        if context.deployment_state is not None:
+            criteria["deployment_state"] = context.deployment_state
+        return criteria
+    
+    @classmethod
+    @LoggingLevelRouter.monitor
+    def _find_by_index(cls, query: TokenQuery) -> Optional[SearchResult[List[Token]]]:
+        """
+        Answer the query from the stack's TokenIndex.
+
+        Every key set in the context must have an index. The keys are combined, so a context
+        with team, persona and readiness_state set finds that team's active tokens of that
+        persona. A rank is looked up by its persona.
+        
+        Args:
+            query: TokenQuery
+        Returns:
+            Optional[SearchResult[List[Token]]]. None when the context sets a key without an
+            index or sets none, so the caller scans instead.
+        """
+        criteria = cls._criteria(query.context)
+        # A rank and a persona that disagree can match nothing.
+        if criteria is None:
+            return SearchResult.empty()
+        return cls._route_by_index(query.stack.index, criteria)
+    
     @classmethod
     @LoggingLevelRouter.monitor
     def _find_by_id(
@@ -298,7 +455,7 @@ class TokenSearchRouter(SearchRouter[Token]):
         Raises
         """
         matches = [
-            token for token in stack if token.team.schema.color == color
+            token for token in stack if token.team.archetype.color == color
         ]
         # Handle the nothing found case.
         if len(matches) == 0:
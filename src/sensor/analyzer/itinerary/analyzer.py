@@ -15,7 +15,7 @@ from util import LoggingLevelRouter
 from assurance.validator import ItineraryValidator
 from err import ItineraryAnalyzerException
 from result import AnalysisResult, MethodResultType
-from domain.model import CombatantToken, Itinerary, KingToken
+from domain.model import BoardOccupancy, CombatantToken, Itinerary, KingToken
 from report import (
     AttackApproval, BlockingReport, KingAttackApproval, ItineraryReport,
     ManeuverApproval
@@ -88,7 +88,8 @@ class ItineraryAnalyzer:
                 )
             )
         # Handle the case that, the destination is not occupied.
-        if itinerary.destination.no_recurrences_exist:
+        destination = itinerary.destination
+        if not destination.board.occupancy.is_occupied(destination.coord):
             return AnalysisResult.completed(
                 ManeuverApproval(
                     recipient=itinerary.token,
@@ -119,9 +120,11 @@ class ItineraryAnalyzer:
         """
         method = f"{cls.__name__}._occupied_destination_analyzer"
         
-        destination_occupant = itinerary.destination.occupant
+        destination = itinerary.destination
+        destination_occupant = destination.occupant
+        friendly_squares = destination.board.occupancy.team(itinerary.token.team)
         # --- If the occupant is a friend send a BlockingReport. ---#
-        if itinerary.token.is_friend(destination_occupant):
+        if friendly_squares & BoardOccupancy.bit(destination.coord):
             return AnalysisResult.completed(
                 BlockingReport(
                     id=itinerary.id,
@@ -13,5 +13,5 @@ version: 0.0.2
 
 
 # Modules
-from .config import BoardDimensionProperty
-from .property import BoardProperty
\ No newline at end of file
+from .property import BoardProperty
+from .config import BoardDimensionProperty
\ No newline at end of file
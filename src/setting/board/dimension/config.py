@@ -17,7 +17,7 @@ __all__ = [
     "BoardDimensionProperty",
 ]
 
-from setting import BoardProperty
+from setting.board.dimension.property import BoardProperty
 
 __all__ = [
     # ======================# BOARD_DIMENSION_PROPERTY #======================#
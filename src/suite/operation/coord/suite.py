@@ -40,6 +40,9 @@ class CoordOperationSuite(OperationSuite[Coord]):
         -   Suite for an empty class which makes managing toolkits easier.
         -   Any toolkits for a suite should be a Suite subclass.
     """
+    TOOLKIT = CoordToolkit
+    BUILDER = CoordBuilder
+    VALIDATOR = CoordValidator
     
     def __init__(
             self,
@@ -53,15 +56,11 @@ class CoordOperationSuite(OperationSuite[Coord]):
             builder: Optional[CoordBuilder]
             validator: Optional[CoordValidator]
         """
-        super().__init__(
-            toolkit=toolkit or CoordToolkit(),
-            builder=builder or CoordBuilder(),
-            validator=validator or CoordValidator(),
-        )
+        super().__init__(toolkit=toolkit, builder=builder, validator=validator)
     
     @property
     def toolkit(self) -> CoordToolkit:
-        return cast(CoordToolkit, super().bundle)
+        return cast(CoordToolkit, super().toolkit)
     
     @property
     def builder(self) -> CoordBuilder:
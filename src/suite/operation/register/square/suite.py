@@ -35,6 +35,9 @@ class SquareRegisterSuite(RegisterOperationSuite[SquareRegister]):
     Super Class:
         RegisterOperationSuite
     """
+    TOOLKIT = SquareRegisterToolkit
+    BUILDER = SquareRegisterBuilder
+    VALIDATOR = SquareRegisterValidator
     
     def __init__(
             self,
@@ -48,15 +51,11 @@ class SquareRegisterSuite(RegisterOperationSuite[SquareRegister]):
             builder: Optional[SquareRegisterBuilder]
             validator: Optional[SquareRegisterValidator]
         """
-        super().__init__(
-            toolkit=toolkit or SquareRegisterToolkit(),
-            builder=builder or SquareRegisterBuilder(),
-            validator=validator or SquareRegisterValidator(),
-        )
+        super().__init__(toolkit=toolkit, builder=builder, validator=validator)
     
     @property
     def toolkit(self) -> SquareRegisterToolkit:
-        return cast(SquareRegisterToolkit, super().bundle)
+        return cast(SquareRegisterToolkit, super().toolkit)
     
     @property
     def builder(self) -> SquareRegisterBuilder:
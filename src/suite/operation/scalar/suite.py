@@ -40,6 +40,9 @@ class ScalarOperationSuite(OperationSuite[Scalar]):
         -   Suite for an empty class which makes managing toolkits easier.
         -   Any toolkits for a suite should be a Suite subclass.
     """
+    TOOLKIT = ScalarToolkit
+    BUILDER = ScalarBuilder
+    VALIDATOR = ScalarValidator
     
     def __init__(
             self,
@@ -53,15 +56,11 @@ class ScalarOperationSuite(OperationSuite[Scalar]):
             builder: Optional[ScalarBuilder]
             validator: Optional[ScalarValidator]
         """
-        super().__init__(
-            toolkit=toolkit or ScalarToolkit(),
-            builder=builder or ScalarBuilder(),
-            validator=validator or ScalarValidator(),
-        )
+        super().__init__(toolkit=toolkit, builder=builder, validator=validator)
     
     @property
     def toolkit(self) -> ScalarToolkit:
-        return cast(ScalarToolkit, super().bundle)
+        return cast(ScalarToolkit, super().toolkit)
     
     @property
     def builder(self) -> ScalarBuilder:
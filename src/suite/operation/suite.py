@@ -10,7 +10,7 @@ version: 0.0.2
 from __future__ import annotations
 
 
-from typing import Any, Generic, TypeVar
+from typing import Generic, Optional, Type, TypeVar
 
 from assurance import Validator
 from fabrication import Builder
@@ -29,6 +29,10 @@ class OperationSuite(Suite, Generic[T]):
         1.  Contains the operations that can be performed on a model.
 
     Attributes:
+            TOOLKIT: Type[ModelToolkit[T]]
+            BUILDER: Type[Builder[T]]
+            VALIDATOR: Type[Validator[T]]
+            
             builder: Builder[T]
             validator: Validator[T]
             toolkit: ModelToolkit[T]
@@ -40,36 +44,47 @@ class OperationSuite(Suite, Generic[T]):
     Notes:
         -   Suite for an empty class which makes managing toolkits easier.
         -   Any toolkits for a suite should be a Suite subclass.
+        -   A member whose class attribute is unset and which was not passed in raises
+            NotImplementedError on first access.
     """
-    _builder: Builder[T]
-    _validator: Validator[T]
-    _toolkit: ModelToolkit[T]
-    _entries: dict[str, Any] = {}
+    TOOLKIT: Optional[Type[ModelToolkit[T]]] = None
+    BUILDER: Optional[Type[Builder[T]]] = None
+    VALIDATOR: Optional[Type[Validator[T]]] = None
     
-    def __init__(self, toolkit: ModelToolkit[T], validator: Validator[T], builder: Builder[T]):
+    _builder: Optional[Builder[T]]
+    _validator: Optional[Validator[T]]
+    _toolkit: Optional[ModelToolkit[T]]
+    
+    def __init__(
+            self,
+            toolkit: Optional[ModelToolkit[T]] = None,
+            validator: Optional[Validator[T]] = None,
+            builder: Optional[Builder[T]] = None,
+    ):
         """
         Args:
-            builder: Builder[T]
-            validator: Validator[T]
-            toolkit: ModelToolkit[T]
+            builder: Optional[Builder[T]]. Resolved from BUILDER on first use if None.
+            validator: Optional[Validator[T]]. Resolved from VALIDATOR on first use if None.
+            toolkit: Optional[ModelToolkit[T]]. Resolved from TOOLKIT on first use if None.
         """
-        self._entries = {
-            "builder": builder,
-            "validator": validator,
-            "toolkit": toolkit,
-        }
         self._toolkit = toolkit
         self._builder = builder
         self._validator = validator
     
     @property
     def toolkit(self) -> ModelToolkit[T]:
+        if self._toolkit is None:
+            self._toolkit = self.resolve_declared(self, "TOOLKIT")
         return self._toolkit
     
     @property
     def builder(self) -> Builder[T]:
+        if self._builder is None:
+            self._builder = self.resolve_declared(self, "BUILDER")
         return self._builder
     
     @property
     def validator(self) -> Validator[T]:
+        if self._validator is None:
+            self._validator = self.resolve_declared(self, "VALIDATOR")
         return self._validator
@@ -36,6 +36,9 @@ class VectorToggleSuite(ToggleOperationSuite[CartesianToggle]):
     Super Class:
         ToggleOperationSuite
     """
+    TOOLKIT = VectorToggleToolkit
+    BUILDER = VectorToggleBuilder
+    VALIDATOR = VectorToggleValidator
 
     def __init__(
             self,
@@ -49,15 +52,11 @@ class VectorToggleSuite(ToggleOperationSuite[CartesianToggle]):
             builder: Optional[VectorToggleBuilder]
             validator: Optional[VectorToggleValidator]
         """
-        super().__init__(
-            toolkit=toolkit or VectorToggleToolkit(),
-            builder=builder or VectorToggleBuilder(),
-            validator=validator or VectorToggleValidator(),
-        )
+        super().__init__(toolkit=toolkit, builder=builder, validator=validator)
     
     @property
     def toolkit(self) -> VectorToggleToolkit:
-        return cast(VectorToggleToolkit, super().bundle)
+        return cast(VectorToggleToolkit, super().toolkit)
     
     @property
     def builder(self) -> VectorToggleBuilder:
@@ -9,6 +9,8 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from typing import Optional
+
 from assurance import TokenValidator
 from fabrication import TokenBuilder
 from kit import OperationSuite, TokenSensorSuite, TokenToolkit
@@ -29,6 +31,8 @@ class TokenOperationSuite(OperationSuite[Token]):
         toolkit: TokenToolkit
         builder: TokenBuilder
         validator: TokenValidator
+        promoter: PawnPromoter
+        sensor: TokenSensorSuite
 
     Provides:
 
@@ -39,10 +43,42 @@ class TokenOperationSuite(OperationSuite[Token]):
         -   Suite for an empty class which makes managing toolkits easier.
         -   Any toolkits for a suite should be a Suite subclass.
     """
-    toolkit: TokenToolkit = TokenToolkit()
-    builder: TokenBuilder = TokenBuilder()
-    validator: TokenValidator = TokenValidator()
+    TOOLKIT = TokenToolkit
+    BUILDER = TokenBuilder
+    VALIDATOR = TokenValidator
+    
+    _promoter: Optional[PawnPromoter]
+    _sensor: Optional[TokenSensorSuite]
+    
+    def __init__(
+            self,
+            toolkit: Optional[TokenToolkit] = None,
+            builder: Optional[TokenBuilder] = None,
+            validator: Optional[TokenValidator] = None,
+            promoter: Optional[PawnPromoter] = None,
+            sensor: Optional[TokenSensorSuite] = None,
+    ):
+        """
+        Args:
+            toolkit: Optional[TokenToolkit]
+            builder: Optional[TokenBuilder]
+            validator: Optional[TokenValidator]
+            promoter: Optional[PawnPromoter]
+            sensor: Optional[TokenSensorSuite]
+        """
+        super().__init__(toolkit=toolkit, builder=builder, validator=validator)
+        self._promoter = promoter
+        self._sensor = sensor
+    
+    @property
+    def promoter(self) -> PawnPromoter:
+        if self._promoter is None:
+            self._promoter = self.resolve(PawnPromoter)
+        return self._promoter
     
-    promoter: PawnPromoter = PawnPromoter()
-    sensor: TokenSensorSuite = TokenSensorSuite()
+    @property
+    def sensor(self) -> TokenSensorSuite:
+        if self._sensor is None:
+            self._sensor = self.resolve(TokenSensorSuite)
+        return self._sensor
 
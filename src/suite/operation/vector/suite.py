@@ -40,6 +40,9 @@ class VectorOperationSuite(OperationSuite[Vector]):
         -   Suite for an empty class which makes managing toolkits easier.
         -   Any toolkits for a suite should be a Suite subclass.
     """
+    TOOLKIT = VectorToolkit
+    BUILDER = VectorBuilder
+    VALIDATOR = VectorValidator
     
     def __init__(
             self,
@@ -53,15 +56,11 @@ class VectorOperationSuite(OperationSuite[Vector]):
             builder: Optional[VectorBuilder]
             validator: Optional[VectorValidator]
         """
-        super().__init__(
-            toolkit=toolkit or VectorToolkit(),
-            builder=builder or VectorBuilder(),
-            validator=validator or VectorValidator(),
-        )
+        super().__init__(toolkit=toolkit, builder=builder, validator=validator)
     
     @property
     def toolkit(self) -> VectorToolkit:
-        return cast(VectorToolkit, super().bundle)
+        return cast(VectorToolkit, super().toolkit)
     
     @property
     def builder(self) -> VectorBuilder:
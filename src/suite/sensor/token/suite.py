@@ -55,24 +55,32 @@ class TokenSensorSuite(SensorSuite[Token]):
             friendship: Optional[FriendshipAnalyzer]
             readiness: Optional[TokenReadinessAnalyzer]
         """
-        self._collider = collider or TokenCollider()
-        self._home = home or TokenHomeReporter()
-        self._friendship = friendship or FriendshipAnalyzer()
-        self._readiness = readiness or TokenReadinessAnalyzer()
+        self._collider = collider
+        self._home = home
+        self._friendship = friendship
+        self._readiness = readiness
         
     @property
     def home(self) -> TokenHomeReporter:
+        if self._home is None:
+            self._home = self.resolve(TokenHomeReporter)
         return self._home
     
     @property
     def collider(self) -> TokenCollider:
+        if self._collider is None:
+            self._collider = self.resolve(TokenCollider)
         return self._collider
     
     @property
     def friendship(self) -> FriendshipAnalyzer:
+        if self._friendship is None:
+            self._friendship = self.resolve(FriendshipAnalyzer)
         return self._friendship
     
     @property
     def readiness(self) -> TokenReadinessAnalyzer:
+        if self._readiness is None:
+            self._readiness = self.resolve(TokenReadinessAnalyzer)
         return self._readiness
 
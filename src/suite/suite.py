@@ -10,13 +10,12 @@ version: 0.0.2
 from __future__ import annotations
 
 from abc import ABC
-from typing import Generic, TypeVar
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Type, TypeVar
 
-from assurance import Validator
-from fabrication import Builder
-from kit import ModelToolkit, Toolkit
+from util.container import ServiceContainer, ServiceScope
 
-T = TypeVar("T", bound="Model")
+T = TypeVar("T")
 
 
 
@@ -27,14 +26,64 @@ class Suite(ABC):
         -   Dynamic Dependency Provider
         
     Responsibilities:
+        1.  Lazy, scoped access to services through ServiceContainer. Nothing is built
+            until a suite member or caller asks for it.
 
     Attributes:
     
     Provides:
+        -   def register(key: Any, factory: Optional[Callable[[], T]], scope: ServiceScope) -> None
+        -   def resolve(key: Type[T], scope: Optional[ServiceScope]) -> T
+        -   def resolve_declared(owner: object, attribute: str, scope: Optional[ServiceScope]) -> Any
+        -   def game_scope(cache: Optional[Dict[Any, Any]]) -> Iterator[Dict[Any, Any]]
+        -   def search_scope() -> Iterator[Dict[Any, Any]]
         
     Super Class:
         
     Notes:
         -   Suite for an empty class which makes managing toolkits easier.
         -   Any toolkits for a suite should be a Suite subclass.
+        -   Services low in the import graph call ServiceContainer directly. Importing
+            suite from there would create import cycles.
     """
+    
+    @classmethod
+    def register(
+            cls,
+            key: Any,
+            factory: Optional[Callable[[], T]] = None,
+            scope: ServiceScope = ServiceScope.PROCESS,
+    ) -> None:
+        ServiceContainer.register(key=key, factory=factory, scope=scope)
+    
+    @classmethod
+    def resolve(cls, key: Type[T], scope: Optional[ServiceScope] = None) -> T:
+        return ServiceContainer.resolve(key=key, scope=scope)
+    
+    @classmethod
+    def resolve_declared(cls, owner: object, attribute: str, scope: Optional[ServiceScope] = None) -> Any:
+        """
+        Resolve the class owner declares in a class attribute such as BUILDER or OPERATIONS.
+
+        Raises:
+            NotImplementedError if owner's class leaves the attribute unset.
+        """
+        key = getattr(type(owner), attribute, None)
+        if key is None:
+            raise NotImplementedError(
+                f"{type(owner).__name__}.{attribute} is not set. Declare it on the subclass "
+                f"or pass the instance to {type(owner).__name__}()."
+            )
+        return ServiceContainer.resolve(key=key, scope=scope)
+    
+    @classmethod
+    @contextmanager
+    def game_scope(cls, cache: Optional[Dict[Any, Any]] = None) -> Iterator[Dict[Any, Any]]:
+        with ServiceContainer.game_scope(cache) as scope_cache:
+            yield scope_cache
+    
+    @classmethod
+    @contextmanager
+    def search_scope(cls) -> Iterator[Dict[Any, Any]]:
+        with ServiceContainer.search_scope() as scope_cache:
+            yield scope_cache
@@ -16,6 +16,8 @@ from system import (
 
 class TransactionResult(Result[Event]):
     """"""
+    __slots__ = ("_state",)
+    
     _checkpoint: Event
     _state: TransactionState
     _exception: Optional[Exception]
@@ -12,7 +12,7 @@ from __future__ import annotations
 from typing import Iterator, List, Optional, Tuple, cast
 
 from collection import SetCollection
-from domain.model import Coord, Vector
+from domain.model import Coord, CoordTable, Vector
 
 
 class VectorSet(SetCollection[Vector]):
@@ -53,11 +53,11 @@ class VectorSet(SetCollection[Vector]):
         return [item for item in self._items]
     
     def to_coord_tuple(self) -> Tuple[Coord, ...]:
-        return tuple(Coord(column=item.x, row=item.y) for item in self._items)
+        return tuple(CoordTable.get(row=item.y, column=item.x) for item in self._items)
     
     @property
     def to_coord_list(self) -> List[Coord]:
-        return [Coord(column=item.x, row=item.y) for item in self.to_list]
+        return [CoordTable.get(row=item.y, column=item.x) for item in self.to_list]
 
         
         
\ No newline at end of file
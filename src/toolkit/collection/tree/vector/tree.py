@@ -12,7 +12,7 @@ from __future__ import annotations
 from typing import List, cast
 
 from collection import CoordSet, VectorSet
-from domain.model import Coord, Vector
+from domain.model import Coord, CoordTable, Vector
 from tree import CoordTree, Tree
 
 
@@ -54,7 +54,7 @@ class VectorTree(Tree[Vector]):
         coord_branches = []
         for branch in self.branches:
             coord_branches.append(CoordSet(branch.to_coord_tuple()))
-        origin = Coord(column=self._root.x, row=self._root.y)
+        origin = CoordTable.get(row=self._root.y, column=self._root.x)
         return CoordTree(root=origin, branches=coord_branches)
         
         
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from operation import AddVector, EuclideanDistance, ScalarProduct, VectorTransform
+from operation import AddVector, EuclideanDistance, ScalarProduct, VectorBatch, VectorTransform
 from suite import CoordOperationSuite, ScalarOperationSuite, VectorOperationSuite
 from toolkit.math.toolkit import Toolkit
 from assurance.validator import NumberValidator
@@ -33,6 +33,7 @@ class MathToolkit(Toolkit):
         scalar: ScalarOperationSuite
         vector: VectorOperationSuite
         number_validator: NumberValidator
+        vector_batch: VectorBatch. Array-backed operations over many vectors.
     Provides:
     
     Super Class:
@@ -49,4 +50,5 @@ class MathToolkit(Toolkit):
     scalar_product: ScalarProduct = ScalarProduct()
     transform: VectorTransform = VectorTransform()
     euclidean_distance: EuclideanDistance = EuclideanDistance()
+    vector_batch: VectorBatch = VectorBatch()
 
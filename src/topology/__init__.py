@@ -11,6 +11,7 @@ version: 0.0.2
 
 # Packages
 from .basis import *
+from .cache import *
 from .generator import *
 from .mapper import *
 from .rank import *
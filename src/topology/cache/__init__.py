@@ -0,0 +1,16 @@
+# src/topology/cache/__init__.py
+
+"""
+Module: topology.cache.__init__
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+# =========== TOPOLOGY.CACHE PACKAGE ===========#
+
+# Packages
+
+
+# Modules
+from .cache import TopologyCache
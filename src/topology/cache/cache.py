@@ -0,0 +1,314 @@
+# src/topology/cache/cache.py
+
+"""
+Module: topology.cache.cache
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import struct
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from collection import VectorSet, VectorTree
+from domain.model import Vector, VectorTable
+from setting.board.dimension.config import number_of_columns, number_of_rows
+from topology.topology import Topology
+
+if TYPE_CHECKING:
+    from geometry import RecurrenceRegistryCollection
+
+
+class TopologyCache:
+    """
+    Role:
+        -   Persistence
+        -   Startup Accelerator
+
+    Responsibilities:
+        1.  Write each generated Topology to a versioned file keyed by the board dimensions
+            and a fingerprint of the recurrences that generated it.
+        2.  Load the Topology back on later process starts so the generator can skip the
+            recurrences.
+        3.  Report a miss, never an error, when the file is missing, unreadable or stale.
+
+    Attributes:
+        DIR_ENV_VAR = CHESSBOT_TOPOLOGY_CACHE
+        DEFAULT_DIR = ~/.cache/chessbot/topology. Used when CHESSBOT_TOPOLOGY_CACHE is "on".
+        FORMAT_VERSION: int. Advanced whenever the file layout or the meaning of a
+            recurrence changes, which invalidates every existing file.
+        directory: Optional[str]. None when the cache is turned off.
+        is_enabled: bool
+        hits: int
+        misses: int
+
+    Provides:
+        -   def fingerprint(collection: RecurrenceRegistryCollection) -> str
+        -   def path(fingerprint: str) -> Optional[str]
+        -   def load(fingerprint: str) -> Optional[Topology]
+        -   def store(fingerprint: str, topology: Topology) -> bool
+
+    Notes:
+        A file is a fixed header followed by two arrays. The header holds the magic bytes,
+        FORMAT_VERSION, the board's rows and columns and the full fingerprint digest. The
+        first array holds the tree's shape as 32-bit ints: the root, then the number of
+        registries and for each the number of vector sets and each set's length. The second
+        holds every vector's x and y in order as 16-bit ints. Both are little-endian like the
+        header, so a file reads back the same on any machine. Vectors are read back through
+        the VectorTable so cached topologies share the interned instances.
+
+        The fingerprint covers every registry, recurrence, space and mapping function: its
+        class, the source of each class in its MRO, and its own fields, which hold the
+        space's origin and terminus and the mapping function's delta, x_step and slope.
+        Editing or re-parameterising any of them misses the cache. Changes outside those
+        classes that alter the topology, in the transformers for example, still need a
+        FORMAT_VERSION bump.
+
+        Files are written to a temporary name and renamed into place, so a reader never
+        sees half a file.
+
+        The cache is off unless asked for, so runs and tests leave nothing in the home
+        directory. Set CHESSBOT_TOPOLOGY_CACHE to "on" to use DEFAULT_DIR or to a directory
+        to use that one. A directory passed to the constructor wins over the variable.
+
+    Super Class:
+    """
+    DIR_ENV_VAR: str = "CHESSBOT_TOPOLOGY_CACHE"
+    DEFAULT_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "chessbot", "topology")
+    FORMAT_VERSION: int = 1
+
+    _MAGIC: bytes = b"CBTOPO"
+    _HEADER: struct.Struct = struct.Struct("<6sHHH32sII")
+    _SHAPE_ITEM: str = "i"
+    _VECTOR_ITEM: str = "h"
+    _OFF: tuple = ("", "0", "off", "false", "no")
+    _ON: tuple = ("1", "on", "true", "yes")
+    _SUFFIX: str = ".topo"
+
+    _sources: Dict[type, str] = {}
+
+    _directory: Optional[str]
+    _hits: int
+    _misses: int
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Optional[str]. Read from CHESSBOT_TOPOLOGY_CACHE when None. "off" turns
+                the cache off.
+        """
+        if directory is None:
+            directory = self._configured_directory()
+        self._directory = None if directory is None or directory.lower() in self._OFF else directory
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def _configured_directory(cls) -> Optional[str]:
+        """The directory CHESSBOT_TOPOLOGY_CACHE asks for. None when it is unset or off."""
+        setting = os.environ.get(cls.DIR_ENV_VAR, "").strip()
+        if setting.lower() in cls._OFF:
+            return None
+        if setting.lower() in cls._ON:
+            return cls.DEFAULT_DIR
+        return setting
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._directory is not None
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @classmethod
+    def fingerprint(cls, collection: RecurrenceRegistryCollection) -> str:
+        """A sha256 hex digest of the board dimensions and the recurrences in collection."""
+        parts: List[str] = [f"v{cls.FORMAT_VERSION}", f"{number_of_rows}x{number_of_columns}"]
+        for registry in collection.recurrence_registry_type_dict.values():
+            parts.append(cls._describe(registry))
+            for recurrence in registry.type_recurrence_dict.values():
+                parts.append(cls._describe(recurrence))
+                parts.append(cls._describe(recurrence.space))
+                parts.append(cls._describe(recurrence.space_mapping_function))
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def path(self, fingerprint: str) -> Optional[str]:
+        if self._directory is None:
+            return None
+        return os.path.join(
+            self._directory, f"{number_of_rows}x{number_of_columns}-{fingerprint[:16]}{self._SUFFIX}"
+        )
+
+    def load(self, fingerprint: str) -> Optional[Topology]:
+        """The cached Topology, or None if there is no current file for fingerprint."""
+        path = self.path(fingerprint)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            topology = self._decode(data, fingerprint)
+        except (OSError, ValueError, IndexError, struct.error):
+            topology = None
+        if topology is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return topology
+
+    def store(self, fingerprint: str, topology: Topology) -> bool:
+        """Write topology under fingerprint. Returns False if it could not be written."""
+        path = self.path(fingerprint)
+        if path is None:
+            return False
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(self._encode(topology, fingerprint))
+            os.replace(temporary, path)
+        except OSError:
+            # Handle the case that, the directory is read-only. The next start regenerates.
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return False
+        return True
+
+    @classmethod
+    def _encode(cls, topology: Topology, fingerprint: str) -> bytes:
+        tree = topology.tree
+        root = tree.root
+        shape: List[int] = [0, 0, 0] if root is None else [1, root.x, root.y]
+        vectors: List[int] = []
+        shape.append(len(tree.branches))
+        for branch in tree.branches:
+            shape.append(len(branch))
+            for vector_set in branch:
+                shape.append(len(vector_set.items))
+                for vector in vector_set.items:
+                    vectors.append(vector.x)
+                    vectors.append(vector.y)
+        header = cls._HEADER.pack(
+            cls._MAGIC,
+            cls.FORMAT_VERSION,
+            number_of_rows,
+            number_of_columns,
+            bytes.fromhex(fingerprint),
+            len(shape),
+            len(vectors),
+        )
+        return (
+            header
+            + struct.pack(f"<{len(shape)}{cls._SHAPE_ITEM}", *shape)
+            + struct.pack(f"<{len(vectors)}{cls._VECTOR_ITEM}", *vectors)
+        )
+
+    @classmethod
+    def _decode(cls, data: bytes, fingerprint: str) -> Optional[Topology]:
+        """The Topology in data, or None if data is from another version, board or basis."""
+        magic, version, rows, columns, digest, shape_size, vector_size = cls._HEADER.unpack_from(data)
+        if (
+                magic != cls._MAGIC
+                or version != cls.FORMAT_VERSION
+                or (rows, columns) != (number_of_rows, number_of_columns)
+                or digest != bytes.fromhex(fingerprint)
+        ):
+            return None
+        shape_format = struct.Struct(f"<{shape_size}{cls._SHAPE_ITEM}")
+        vector_format = struct.Struct(f"<{vector_size}{cls._VECTOR_ITEM}")
+        # Handle the case that, the file was cut short or has trailing bytes.
+        if cls._HEADER.size + shape_format.size + vector_format.size != len(data) or shape_size < 4:
+            return None
+        shape = shape_format.unpack_from(data, cls._HEADER.size)
+        vectors = vector_format.unpack_from(data, cls._HEADER.size + shape_format.size)
+
+        root = cls._build_vector(shape[1], shape[2]) if shape[0] else None
+        cursor, offset = 4, 0
+        branches: List[List[VectorSet]] = []
+        for _ in range(shape[3]):
+            branch: List[VectorSet] = []
+            sets = shape[cursor]
+            cursor += 1
+            for length in shape[cursor:cursor + sets]:
+                branch.append(
+                    VectorSet(
+                        items=tuple(
+                            cls._build_vector(vectors[index], vectors[index + 1])
+                            for index in range(offset, offset + 2 * length, 2)
+                        )
+                    )
+                )
+                offset += 2 * length
+            cursor += sets
+            branches.append(branch)
+        if cursor != len(shape) or offset != len(vectors):
+            return None
+        return Topology(tree=VectorTree(root=root, branches=branches))
+
+    @classmethod
+    def _build_vector(cls, x: int, y: int) -> Vector:
+        return VectorTable.get(x, y) or Vector(x=x, y=y)
+
+    @classmethod
+    def _describe(cls, model: object) -> str:
+        """The model's class, the source of every class it inherits from and its own fields."""
+        fields = ",".join(f"{name}={cls._value(value)}" for name, value in sorted(cls._fields(model).items()))
+        sources = ",".join(cls._source(model_type) for model_type in type(model).__mro__)
+        return f"{cls._name(type(model))}({fields})#{sources}"
+
+    @classmethod
+    def _fields(cls, model: object) -> Dict[str, object]:
+        fields = dict(getattr(model, "__dict__", {}))
+        for model_type in type(model).__mro__:
+            for name in getattr(model_type, "__slots__", ()):
+                if hasattr(model, name):
+                    fields.setdefault(name, getattr(model, name))
+        return fields
+
+    @classmethod
+    def _value(cls, value: object) -> str:
+        """Scalars and vectors by value. Collaborators by class, their arithmetic is in _source."""
+        if isinstance(value, Vector):
+            return cls._vector(value)
+        if value is None or isinstance(value, (bool, int, float, str, Enum)):
+            return repr(value)
+        if isinstance(value, (list, tuple)):
+            return f"({','.join(cls._value(item) for item in value)})"
+        return cls._name(type(value))
+
+    @classmethod
+    def _source(cls, model: type) -> str:
+        """A digest of the class body, so editing a recurrence or mapping function misses the cache."""
+        if model not in cls._sources:
+            try:
+                source = inspect.getsource(model)
+            except (OSError, TypeError):
+                # Handle the case that, the class is builtin or its source is not shipped. Its name stands in.
+                source = cls._name(model)
+            cls._sources[model] = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+        return cls._sources[model]
+
+    @classmethod
+    def _name(cls, model: type) -> str:
+        return f"{model.__module__}.{model.__qualname__}"
+
+    @classmethod
+    def _vector(cls, vector: Optional[Vector]) -> str:
+        return "-" if vector is None else f"{vector.x},{vector.y}"
@@ -12,7 +12,7 @@ from __future__ import annotations
 from typing import List, Optional, cast
 
 from collection import VectorSet
-from domain.model import Vector
+from domain.model import Vector, VectorTable
 from topology.recurrence import Recurrence
 from result import ComputationResult
 
@@ -94,13 +94,21 @@ class VectorSequenceGenerator:
         # --- Cast the validation product and setup for the iteration. ---#
         recur  = cast(Recurrence, validation.payload)
         sequence: List[Vector] = []
-        cursor = recur.space.origin
+        cursor = VectorTable.intern(recur.space.origin)
+        mapping_function = recur.space_mapping_function
         
         while cursor != recur.space.terminus:
             sequence.append(cursor)
             
+            # Interned vectors step through the VectorTable without a result per step.
+            if VectorTable.is_interned(cursor):
+                following = mapping_function.step(cursor)
+                if following is not None:
+                    cursor = following
+                    continue
+            
             # Request that the update for the cursor.
-            step = recur.space_mapping_function.next(cursor)
+            step = mapping_function.next(cursor)
             
             # Handle the case that, the request is not satisfied.
             if step.is_failure:
@@ -19,6 +19,7 @@ from topology import TransformerRunner
 from result import ComputationResult, MethodResultType
 
 from topology import Topology
+from topology.cache import TopologyCache
 from util import LoggingLevelRouter
 from assurance.validator import PrimingValidator
 
@@ -35,6 +36,7 @@ class TraversalTopologyGenerator:
     Attributes:
         math_toolkit: Optional[MathToolkit]
         transformer_runner: Optional[TransformerRunner]
+        cache: TopologyCache
 
     Provides:
         def execute(recurrence_table: QuadrantRecurrenceTable) -> ComputationResult[List[VectorSet]]
@@ -44,19 +46,24 @@ class TraversalTopologyGenerator:
     """
     _priming_validator: PrimingValidator
     _transformer_runner: TransformerRunner
+    _cache: TopologyCache
     
     def __init__(
             self,
             priming_validator: Optional[PrimingValidator] | None = PrimingValidator(),
             transformer_runner: Optional[TransformerRunner] | None = TransformerRunner(),
+            cache: Optional[TopologyCache] = None,
     ):
         """
         Args:
             priming_validator: Optional[PrimingValidator]
             transformer_runner: Optional[TransformerRunner]
+            cache: Optional[TopologyCache]. A TopologyCache configured from
+                CHESSBOT_TOPOLOGY_CACHE when None, which is off unless the variable is set.
         """
         self._priming_validator = priming_validator
         self._transformer_runner =transformer_runner
+        self._cache = cache or TopologyCache()
         
     @property
     def priming_validator(self) -> PrimingValidator:
@@ -66,6 +73,10 @@ class TraversalTopologyGenerator:
     def transformer_runner(self) -> TransformerRunner:
         return self._transformer_runner
     
+    @property
+    def cache(self) -> TopologyCache:
+        return self._cache
+    
     @LoggingLevelRouter.monitor
     def execute(
             self,
@@ -78,7 +89,9 @@ class TraversalTopologyGenerator:
             1.  Send an exception chain in the ComputationResult if either.
                     -   The recurrence_table fails a validation check,
                     -   A computation fails.
-            2.  Otherwise, send the solutions in the success result.
+            2.  If the cache holds a current topology for the collection, send it in the
+                success result.
+            3.  Otherwise, send the solutions in the success result and write them to the cache.
         Args:
              collection: RecurrenceTableGroup
         Returns:
@@ -107,6 +120,15 @@ class TraversalTopologyGenerator:
                 ),
             )
         collection = cast(RecurrenceRegistryCollection, validation.payload)
+        
+        # --- Load the topology from the cache when a current one exists. ---#
+        fingerprint = None
+        if self._cache.is_enabled:
+            fingerprint = self._cache.fingerprint(collection)
+            cached = self._cache.load(fingerprint)
+            if cached is not None:
+                return ComputationResult.success(cached)
+        
         registry_dict = collection.recurrence_registry_type_dict
         
         solution_sets = []
@@ -133,7 +155,11 @@ class TraversalTopologyGenerator:
             solution_sets.append(cast([VectorSet], computation.payload))
         origin = collection.origin
         tree = VectorTree(root=origin, branches=solution_sets)
+        topology = Topology(tree=tree)
+        # Save it for the next start. A failed write only costs the next start a regeneration.
+        if fingerprint is not None:
+            self._cache.store(fingerprint, topology)
         # --- Send the work product. ---#
-        return ComputationResult.success(Topology(tree=tree))
+        return ComputationResult.success(topology)
         
             
\ No newline at end of file
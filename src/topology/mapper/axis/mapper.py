@@ -9,11 +9,11 @@ version: 0.0.2
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar, cast
+from typing import Generic, Optional, TypeVar, cast
 
 from err import AxisMappingFunctionException
 from topology.mapper import SpaceMappingFunction
-from domain.model import Vector
+from domain.model import Vector, VectorTable
 from result import ComputationResult, MethodResultType
 from util import LoggingLevelRouter
 
@@ -34,6 +34,7 @@ class AxisMappingFunction(SpaceMappingFunction, Generic[T]):
 
     Provides:
         def next(self, vector: Vector) -> ComputationResult[Vector]
+        def step(self, vector: Vector) -> Optional[Vector]
 
     Super Class:
         SpaceMappingFunction
@@ -52,6 +53,9 @@ class AxisMappingFunction(SpaceMappingFunction, Generic[T]):
     def delta(self) -> Vector:
         return self._delta
     
+    def step(self, vector: Vector) -> Optional[Vector]:
+        return VectorTable.get(vector.x + self._delta.x, vector.y + self._delta.y)
+    
     @LoggingLevelRouter.monitor
     def next(self, vector: Vector) -> ComputationResult[Vector]:
         """
@@ -73,6 +77,12 @@ class AxisMappingFunction(SpaceMappingFunction, Generic[T]):
         """
         method = f"{self.__class__.__name__}.next"
         
+        # Interned vectors were validated when VectorTable was built, so skip straight to the step.
+        if VectorTable.is_interned(vector):
+            following = self.step(vector)
+            if following is not None:
+                return ComputationResult.success(following)
+        
         # Handle the case that, the argument is not safe to use.
         validation = self.math.vector.validator.execute(vector)
         if validation.is_failure:
@@ -33,6 +33,7 @@ class SpaceMappingFunction(ABC, Generic[T]):
 
     Provides:
         def next(self, vector: Vector) -> ComputationResult[Vector]
+        def step(self, vector: Vector) -> Optional[Vector]
 
     Super Class:
     """
@@ -55,3 +56,11 @@ class SpaceMappingFunction(ABC, Generic[T]):
     @LoggingLevelRouter.monitor
     def next(self, vector: Vector) -> ComputationResult[Vector]:
         pass
+    
+    @abstractmethod
+    def step(self, vector: Vector) -> Optional[Vector]:
+        """
+        The interned vector after an interned vector, or None if it does not fit the board.
+        No validation and no result, so generating a Topology allocates nothing per step.
+        """
+        pass
@@ -9,11 +9,11 @@ version: 0.0.2
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar, cast
+from typing import Generic, Optional, TypeVar, cast
 
 from err import QuadrantMappingFunctionException
 from topology.mapper import SpaceMappingFunction
-from domain.model import Vector
+from domain.model import Vector, VectorTable
 from result import ComputationResult, MethodResultType
 
 from util import LoggingLevelRouter
@@ -36,6 +36,7 @@ class QuadrantMappingFunction(SpaceMappingFunction, Generic[T]):
 
     Provides:
         def next(self, vector: Vector) -> ComputationResult[Vector]
+        def step(self, vector: Vector) -> Optional[Vector]
 
     Super Class:
         SpaceMappingFunction
@@ -61,6 +62,9 @@ class QuadrantMappingFunction(SpaceMappingFunction, Generic[T]):
     def slope(self) -> int:
         return self._slope
     
+    def step(self, vector: Vector) -> Optional[Vector]:
+        return VectorTable.get(vector.x + self._x_step, (2 * vector.y * self._slope) + self._slope)
+    
     @LoggingLevelRouter.monitor
     def next(self, vector: Vector) -> ComputationResult[Vector]:
         """
@@ -82,6 +86,12 @@ class QuadrantMappingFunction(SpaceMappingFunction, Generic[T]):
         """
         method = f"{self.__class__.__name__}.next"
         
+        # Interned vectors were validated when VectorTable was built, so skip straight to the step.
+        if VectorTable.is_interned(vector):
+            following = self.step(vector)
+            if following is not None:
+                return ComputationResult.success(following)
+        
         # Handle the case that, the argument is not safe to use.
         validation = self.math.vector.validator.execute(vector)
         if validation.is_failure:
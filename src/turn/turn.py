@@ -9,11 +9,12 @@ version: 0.0.2
 
 from __future__ import annotations
 
+from assurance.validator.trust import TrustedValidation
 from domain.model import Graph, Player
 from operation import ManeuverLauncher
 from report import ManeuverRequestDecision
 from result import TurnResult
-from util import LoggingLevelRouter
+from util import LoggingLevelRouter, ServiceContainer
 
 
 class Turn:
@@ -43,6 +44,13 @@ class Turn:
     @LoggingLevelRouter.monitor
     def execute(self, ) -> TurnResult:
         
-        approval = self._player.adviser.advice(graph=self._graph)
-        return self._maneuver_launcher.execute(approval)
+        # Certify each coord, context and model once per move decision, not once per layer.
+        # SEARCH-scoped services are fresh for each decision and dropped after it.
+        with ServiceContainer.search_scope(), TrustedValidation.trusted():
+            approval = self._player.adviser.advice(graph=self._graph)
+        turn_result = self._maneuver_launcher.execute(approval)
+        # Hand the move to the other side in the board's position key.
+        if turn_result.is_success:
+            approval.origin.board.pass_turn()
+        return turn_result
     
\ No newline at end of file
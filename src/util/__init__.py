@@ -10,6 +10,7 @@ version: 0.0.2
 # =========== UTIL PACKAGE ===========#
 
 # Packages
+from .container import *
 from .decorator import *
 from .identifier import *
 from .logging import *
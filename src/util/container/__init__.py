@@ -0,0 +1,17 @@
+# src/util/container/__init__.py
+
+"""
+Module: util.container.__init__
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+# =========== UTIL.CONTAINER PACKAGE ===========#
+
+# Packages
+
+
+# Modules
+from .scope import ServiceScope
+from .util import ServiceContainer
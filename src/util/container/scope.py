@@ -0,0 +1,33 @@
+# src/util/container/scope.py
+
+"""
+Module: util.container.scope
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+from enum import Enum, auto
+
+
+class ServiceScope(Enum):
+    """
+    Role:
+        -   Configuration
+
+    Responsibilities:
+        1.  Say how widely a ServiceContainer instance is shared.
+
+    Attributes:
+        PROCESS:    One instance for the whole process. For stateless services and validators.
+        GAME:       One instance per ServiceContainer.game_scope(). Outside a game scope it
+                    falls back to the process-wide instance.
+        SEARCH:     One instance per thread, renewed by ServiceContainer.search_scope().
+
+    Super Class:
+        Enum
+    """
+    PROCESS = auto()
+    GAME = auto()
+    SEARCH = auto()
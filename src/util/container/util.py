@@ -0,0 +1,150 @@
+# src/util/container/util.py
+
+"""
+Module: util.container.util
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+from util.container.scope import ServiceScope
+
+T = TypeVar("T")
+
+
+class ServiceContainer:
+    """
+    Role:
+        -   Dependency Container
+        -   Lazy Service Provider
+
+    Responsibilities:
+        1.  Build a service the first time it is asked for, not when a module is imported.
+        2.  Cache services per ServiceScope so games and search threads don't share state
+            by accident.
+
+    Attributes:
+        None
+
+    Provides:
+        -   def register(key: Any, factory: Optional[Callable[[], T]], scope: ServiceScope) -> None
+        -   def resolve(key: Type[T], scope: Optional[ServiceScope]) -> T
+        -   def game_scope(cache: Optional[Dict[Any, Any]]) -> Iterator[Dict[Any, Any]]
+        -   def search_scope() -> Iterator[Dict[Any, Any]]
+        -   def current_game_scope() -> Optional[Dict[Any, Any]]
+        -   def reset(scope: Optional[ServiceScope]) -> None
+
+    Super Class:
+
+    Notes:
+        -   An unregistered class is its own factory, so `resolve(CoordService)` works
+            without any setup.
+        -   Search threads do not inherit the game scope of the thread that started them.
+            Pass the dict yielded by game_scope() to game_scope() in the new thread to join it.
+    """
+    _providers: Dict[Any, Tuple[Callable[[], Any], ServiceScope]] = {}
+    _process: Dict[Any, Any] = {}
+    _game: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("service_container_game", default=None)
+    _search: threading.local = threading.local()
+    _lock: threading.RLock = threading.RLock()
+    
+    @classmethod
+    def register(
+            cls,
+            key: Any,
+            factory: Optional[Callable[[], T]] = None,
+            scope: ServiceScope = ServiceScope.PROCESS,
+    ) -> None:
+        """
+        Args:
+            key: Any. Usually the service class.
+            factory: Optional[Callable[[], T]]. Builds the service. Defaults to calling key.
+            scope: ServiceScope. Overrides any scope a caller passes to resolve.
+        """
+        with cls._lock:
+            cls._providers[key] = (factory or key, scope)
+    
+    @classmethod
+    def resolve(cls, key: Type[T], scope: Optional[ServiceScope] = None) -> T:
+        """
+        Action:
+            Return the cached instance for key in the scope that applies, building it on
+            first use. A registered scope wins over the `scope` argument, which wins over
+            PROCESS.
+        Args:
+            key: Type[T]
+            scope: Optional[ServiceScope]
+        Returns:
+            T
+        """
+        provider = cls._providers.get(key)
+        if provider is not None:
+            factory, scope = provider
+        else:
+            factory, scope = key, scope or ServiceScope.PROCESS
+        
+        cache = cls._cache(scope)
+        instance = cache.get(key)
+        if instance is not None:
+            return instance
+        with cls._lock:
+            instance = cache.get(key)
+            if instance is None:
+                instance = factory()
+                cache[key] = instance
+        return instance
+    
+    @classmethod
+    @contextmanager
+    def game_scope(cls, cache: Optional[Dict[Any, Any]] = None) -> Iterator[Dict[Any, Any]]:
+        """
+        Everything GAME-scoped that is resolved inside the block is private to the block.
+        Pass the yielded dict to another game_scope() to share it, e.g. from a search thread.
+        """
+        cache = cache if cache is not None else {}
+        token = cls._game.set(cache)
+        try:
+            yield cache
+        finally:
+            cls._game.reset(token)
+    
+    @classmethod
+    @contextmanager
+    def search_scope(cls) -> Iterator[Dict[Any, Any]]:
+        """SEARCH-scoped services resolved inside the block are fresh and dropped on exit."""
+        previous = getattr(cls._search, "cache", None)
+        cls._search.cache = {}
+        try:
+            yield cls._search.cache
+        finally:
+            cls._search.cache = previous
+    
+    @classmethod
+    def current_game_scope(cls) -> Optional[Dict[Any, Any]]:
+        """The cache of the innermost open game_scope(), or None outside one."""
+        return cls._game.get()
+    
+    @classmethod
+    def reset(cls, scope: Optional[ServiceScope] = None) -> None:
+        """Drop cached instances for one scope, or every scope the caller can see."""
+        with cls._lock:
+            for current in ([scope] if scope is not None else list(ServiceScope)):
+                cls._cache(current).clear()
+    
+    @classmethod
+    def _cache(cls, scope: ServiceScope) -> Dict[Any, Any]:
+        if scope is ServiceScope.GAME:
+            game = cls._game.get()
+            return game if game is not None else cls._process
+        if scope is ServiceScope.SEARCH:
+            cache = getattr(cls._search, "cache", None)
+            if cache is None:
+                cache = cls._search.cache = {}
+            return cache
+        return cls._process
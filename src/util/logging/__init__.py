@@ -10,9 +10,11 @@ version: 0.0.2
 # =========== UTIL.LOGGING PACKAGE ===========#
 
 # Packages
-from .default import *
-from .router import *
 from .setup import *
+from .backend import *
 from .writer import *
+from .metric import *
+from .router import *
+from .default import *
 
 # Modules
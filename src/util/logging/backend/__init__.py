@@ -0,0 +1,19 @@
+# src/util/logging/backend/__init__.py
+
+"""
+Module: util.logging.backend.__init__
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+# =========== UTIL.LOGGING.BACKEND PACKAGE ===========#
+
+# Packages
+
+
+# Modules
+from .policy import OverflowPolicy
+from .handler import BoundedQueueHandler
+from .listener import DrainingQueueListener
+from .util import QueuedLogBackend
@@ -0,0 +1,91 @@
+# src/util/logging/backend/handler.py
+
+"""
+Module: util.logging.backend.handler
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+import logging
+import queue
+from logging.handlers import QueueHandler
+from threading import Lock
+
+from util.logging.backend.policy import OverflowPolicy
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Role:
+        -   Logging Handler
+
+    Responsibilities:
+        1.  Put records on a bounded queue without formatting them.
+        2.  Apply the OverflowPolicy when the queue is full and count what was dropped.
+
+    Attributes:
+        policy: OverflowPolicy
+        dropped: int
+
+    Super Class:
+        QueueHandler
+    """
+    _policy: OverflowPolicy
+    _dropped: int
+    _dropped_lock: Lock
+    
+    def __init__(self, log_queue: queue.Queue, policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST):
+        """
+        Args:
+            log_queue: queue.Queue. Should be bounded.
+            policy: OverflowPolicy
+        """
+        super().__init__(log_queue)
+        self._policy = policy
+        self._dropped = 0
+        self._dropped_lock = Lock()
+    
+    @property
+    def policy(self) -> OverflowPolicy:
+        return self._policy
+    
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record can cross the queue
+        # as-is. Formatting and traceback rendering happen on the listener thread.
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._policy is OverflowPolicy.BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if self._policy is OverflowPolicy.DROP_NEWEST:
+                self._count_drop()
+                return
+        # DROP_OLDEST: evict from the head until the new record fits.
+        while True:
+            try:
+                self.queue.get_nowait()
+                if hasattr(self.queue, "task_done"):
+                    self.queue.task_done()
+                self._count_drop()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+    
+    def _count_drop(self) -> None:
+        with self._dropped_lock:
+            self._dropped += 1
@@ -0,0 +1,28 @@
+# src/util/logging/backend/listener.py
+
+"""
+Module: util.logging.backend.listener
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+from logging.handlers import QueueListener
+
+
+class DrainingQueueListener(QueueListener):
+    """
+    Role:
+        -   Logging Listener
+
+    Responsibilities:
+        1.  Same as QueueListener, except stop() waits for room on a full queue
+            instead of failing, so shutdown always drains every queued record.
+
+    Super Class:
+        QueueListener
+    """
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
@@ -0,0 +1,32 @@
+# src/util/logging/backend/policy.py
+
+"""
+Module: util.logging.backend.policy
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+from enum import Enum, auto
+
+
+class OverflowPolicy(Enum):
+    """
+    Role:
+        -   Configuration
+
+    Responsibilities:
+        1.  Decide what happens to a log record when the queue is full.
+
+    Attributes:
+        DROP_NEWEST:    Discard the incoming record. The caller never waits.
+        DROP_OLDEST:    Discard the oldest queued record to make room. The caller never waits.
+        BLOCK:          Wait for the listener to make room. Nothing is lost.
+
+    Super Class:
+        Enum
+    """
+    DROP_NEWEST = auto()
+    DROP_OLDEST = auto()
+    BLOCK = auto()
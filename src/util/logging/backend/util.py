@@ -0,0 +1,140 @@
+# src/util/logging/backend/util.py
+
+"""
+Module: util.logging.backend.util
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+import atexit
+import logging
+import queue
+from threading import Lock
+from typing import List, Optional, Sequence
+
+from util.logging.backend.handler import BoundedQueueHandler
+from util.logging.backend.listener import DrainingQueueListener
+from util.logging.backend.policy import OverflowPolicy
+
+
+class QueuedLogBackend:
+    """
+    Role:
+        -   Logging Backend
+
+    Responsibilities:
+        1.  Move a logger's handlers behind a bounded queue so LogWriter callers only
+            enqueue a record.
+        2.  Run the formatting and file I/O on a background QueueListener thread.
+        3.  Drain the queue and restore the original handlers at shutdown.
+
+    Attributes:
+        DEFAULT_CAPACITY = 10_000
+        DEFAULT_POLICY = OverflowPolicy.DROP_NEWEST
+
+        is_running: bool
+        dropped: int
+
+    Provides:
+        -   def start(logger, capacity, policy, handlers) -> None
+        -   def stop() -> None
+        -   def is_running() -> bool
+        -   def dropped() -> int
+
+    Super Class:
+    """
+    DEFAULT_CAPACITY: int = 10_000
+    DEFAULT_POLICY: OverflowPolicy = OverflowPolicy.DROP_NEWEST
+    
+    _lock: Lock = Lock()
+    _logger: Optional[logging.Logger] = None
+    _handler: Optional[BoundedQueueHandler] = None
+    _listener: Optional[DrainingQueueListener] = None
+    _original_handlers: List[logging.Handler] = []
+    _atexit_registered: bool = False
+    
+    @classmethod
+    def start(
+            cls,
+            logger: Optional[logging.Logger] = None,
+            capacity: int = DEFAULT_CAPACITY,
+            policy: OverflowPolicy = DEFAULT_POLICY,
+            handlers: Optional[Sequence[logging.Handler]] = None,
+    ) -> None:
+        """
+        Action:
+            Replace the logger's handlers with a BoundedQueueHandler and start a
+            listener that feeds the records to the replaced handlers. Calling it
+            while already running does nothing.
+        Args:
+            logger: Optional[logging.Logger]. Defaults to the root logger.
+            capacity: int. Maximum queued records.
+            policy: OverflowPolicy. What to do when the queue is full.
+            handlers: Optional[Sequence[logging.Handler]]. Handlers for the listener.
+                Defaults to the logger's current handlers.
+        Returns:
+            None
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        with cls._lock:
+            if cls._listener is not None:
+                return
+            target = logger if logger is not None else logging.getLogger()
+            original = list(target.handlers)
+            downstream = list(handlers) if handlers is not None else original
+            
+            log_queue: queue.Queue = queue.Queue(maxsize=capacity)
+            handler = BoundedQueueHandler(log_queue, policy=policy)
+            listener = DrainingQueueListener(log_queue, *downstream, respect_handler_level=True)
+            
+            for existing in original:
+                target.removeHandler(existing)
+            target.addHandler(handler)
+            listener.start()
+            
+            cls._logger = target
+            cls._handler = handler
+            cls._listener = listener
+            cls._original_handlers = original
+            if not cls._atexit_registered:
+                atexit.register(cls.stop)
+                cls._atexit_registered = True
+    
+    @classmethod
+    def stop(cls) -> None:
+        """
+        Action:
+            Stop accepting records, let the listener drain everything already
+            queued, flush the handlers and put the original handlers back.
+        Returns:
+            None
+        """
+        with cls._lock:
+            if cls._listener is None:
+                return
+            cls._logger.removeHandler(cls._handler)
+            # The listener handles everything ahead of its sentinel before joining.
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.flush()
+            for handler in cls._original_handlers:
+                cls._logger.addHandler(handler)
+            cls._handler.close()
+            
+            cls._logger = None
+            cls._handler = None
+            cls._listener = None
+            cls._original_handlers = []
+    
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._listener is not None
+    
+    @classmethod
+    def dropped(cls) -> int:
+        return cls._handler.dropped if cls._handler is not None else 0
@@ -9,7 +9,7 @@ version: 0.0.2
 
 import logging
 
-from util import LogLevelMode
+from util.logging.setup import LogLevelMode
 
 # =========== UTIL.LOGGING.ROUTER PACKAGE ===========#
 
@@ -0,0 +1,17 @@
+# src/util/logging/metric/__init__.py
+
+"""
+Module: util.logging.metric.__init__
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+# =========== UTIL.LOGGING.METRIC PACKAGE ===========#
+
+# Packages
+
+
+# Modules
+from .metric import MethodMetric
+from .util import MetricRegistry
@@ -0,0 +1,117 @@
+# src/util/logging/metric/metric.py
+
+"""
+Module: util.logging.metric.metric
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class MethodMetric:
+    """
+    Role:
+        -   Data Holder
+        -   Profiling
+
+    Responsibilities:
+        1.  Accumulate call counts, latencies and failures for one monitored method.
+
+    Attributes:
+        name: str
+        calls: int
+        errors: int
+        failures: int
+        total_ns: int
+        min_ns: int
+        max_ns: int
+        mean_ns: float
+        samples: Deque[int]
+
+    Provides:
+        -   def record(elapsed_ns: int, failed: bool, raised: bool) -> None
+        -   def percentile(fraction: float) -> Optional[int]
+        -   def to_dict() -> Dict[str, object]
+
+    Super Class:
+    """
+    __slots__ = ("name", "calls", "errors", "failures", "total_ns", "min_ns", "max_ns", "samples",)
+    
+    name: str
+    calls: int
+    errors: int
+    failures: int
+    total_ns: int
+    min_ns: int
+    max_ns: int
+    samples: Deque[int]
+    
+    def __init__(self, name: str, sample_size: int):
+        """
+        Args:
+            name: str
+            sample_size: int. How many of the most recent latencies are kept for percentiles.
+        """
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.samples = deque(maxlen=sample_size)
+    
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+    
+    def record(self, elapsed_ns: int, failed: bool, raised: bool) -> None:
+        """
+        Args:
+            elapsed_ns: int
+            failed: bool. The method returned a failed Result.
+            raised: bool. The method raised an exception.
+        """
+        if self.calls == 0 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.samples.append(elapsed_ns)
+        if failed:
+            self.failures += 1
+        if raised:
+            self.errors += 1
+    
+    def percentile(self, fraction: float) -> Optional[int]:
+        """
+        Nearest-rank percentile over the retained samples. `fraction` is in [0, 1].
+        Returns None before the first call.
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        # Ceiling division without the math module, which src/math shadows.
+        rank = int(-(-fraction * len(ordered) // 1))
+        index = min(len(ordered) - 1, max(0, rank - 1))
+        return ordered[index]
+    
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "failures": self.failures,
+            "total_ns": self.total_ns,
+            "mean_ns": round(self.mean_ns, 1),
+            "min_ns": self.min_ns,
+            "p50_ns": self.percentile(0.50),
+            "p90_ns": self.percentile(0.90),
+            "p99_ns": self.percentile(0.99),
+            "max_ns": self.max_ns,
+        }
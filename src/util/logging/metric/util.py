@@ -0,0 +1,140 @@
+# src/util/logging/metric/util.py
+
+"""
+Module: util.logging.metric.util
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+import csv
+import json
+import os
+from threading import Lock
+from typing import Dict, List, Optional
+
+from util.logging.metric.metric import MethodMetric
+
+
+class MetricRegistry:
+    """
+    Role:
+        -   Profiling
+        -   Registry
+
+    Responsibilities:
+        1.  In-process store of per-method latency, call and failure counts fed by
+            LoggingLevelRouter.monitor.
+        2.  Export the hot-path map to JSON or CSV under logs/.
+
+    Attributes:
+        ENABLE_ENV_VAR = CHESSBOT_PROFILE
+        DEFAULT_SAMPLE_SIZE = 1024
+        DEFAULT_DIRECTORY = logs
+
+        enabled: bool
+        sample_size: int
+
+    Provides:
+        -   def enable(sample_size: Optional[int]) -> None
+        -   def disable() -> None
+        -   def is_enabled() -> bool
+        -   def record(name: str, elapsed_ns: int, failed: bool, raised: bool) -> None
+        -   def get(name: str) -> Optional[MethodMetric]
+        -   def snapshot() -> List[Dict[str, object]]
+        -   def hottest(limit: int, key: str) -> List[Dict[str, object]]
+        -   def reset() -> None
+        -   def dump_json(path: Optional[str]) -> str
+        -   def dump_csv(path: Optional[str]) -> str
+
+    Super Class:
+    """
+    ENABLE_ENV_VAR: str = "CHESSBOT_PROFILE"
+    DEFAULT_SAMPLE_SIZE: int = 1024
+    DEFAULT_DIRECTORY: str = "logs"
+    JSON_FILE_NAME: str = "method_metrics.json"
+    CSV_FILE_NAME: str = "method_metrics.csv"
+    
+    _enabled: bool = os.environ.get(ENABLE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+    _sample_size: int = DEFAULT_SAMPLE_SIZE
+    _metrics: Dict[str, MethodMetric] = {}
+    _lock: Lock = Lock()
+    
+    @classmethod
+    def enable(cls, sample_size: Optional[int] = None) -> None:
+        """
+        Start recording. `sample_size` bounds how many recent latencies each method
+        keeps for its percentiles. It only applies to methods first seen after the call.
+        """
+        if sample_size is not None:
+            if sample_size < 1:
+                raise ValueError("sample_size must be at least 1.")
+            cls._sample_size = sample_size
+        cls._enabled = True
+    
+    @classmethod
+    def disable(cls) -> None:
+        cls._enabled = False
+    
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._enabled
+    
+    @classmethod
+    def record(cls, name: str, elapsed_ns: int, failed: bool = False, raised: bool = False) -> None:
+        with cls._lock:
+            metric = cls._metrics.get(name)
+            if metric is None:
+                metric = MethodMetric(name=name, sample_size=cls._sample_size)
+                cls._metrics[name] = metric
+            metric.record(elapsed_ns=elapsed_ns, failed=failed, raised=raised)
+    
+    @classmethod
+    def get(cls, name: str) -> Optional[MethodMetric]:
+        return cls._metrics.get(name)
+    
+    @classmethod
+    def snapshot(cls) -> List[Dict[str, object]]:
+        with cls._lock:
+            return [metric.to_dict() for metric in cls._metrics.values()]
+    
+    @classmethod
+    def hottest(cls, limit: int = 20, key: str = "total_ns") -> List[Dict[str, object]]:
+        """The `limit` methods with the largest `key`, e.g. total_ns, calls or p99_ns."""
+        rows = cls.snapshot()
+        rows.sort(key=lambda row: row.get(key) or 0, reverse=True)
+        return rows[:limit]
+    
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._metrics.clear()
+    
+    @classmethod
+    def dump_json(cls, path: Optional[str] = None) -> str:
+        """Write the snapshot as JSON. Returns the path written."""
+        path = path or os.path.join(cls.DEFAULT_DIRECTORY, cls.JSON_FILE_NAME)
+        rows = cls.hottest(limit=len(cls._metrics))
+        cls._ensure_directory(path)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(rows, file, indent=2)
+        return path
+    
+    @classmethod
+    def dump_csv(cls, path: Optional[str] = None) -> str:
+        """Write the snapshot as CSV. Returns the path written."""
+        path = path or os.path.join(cls.DEFAULT_DIRECTORY, cls.CSV_FILE_NAME)
+        rows = cls.hottest(limit=len(cls._metrics))
+        cls._ensure_directory(path)
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(MethodMetric("", 1).to_dict().keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+    
+    @staticmethod
+    def _ensure_directory(path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
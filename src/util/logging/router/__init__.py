@@ -13,4 +13,5 @@ version: 0.0.2
 
 
 # Modules
-from .util import LoggingLevelRouter
\ No newline at end of file
+from .mode import MonitorMode
+from .util import LoggingLevelRouter
@@ -0,0 +1,48 @@
+# src/util/logging/router/mode.py
+
+"""
+Module: util.logging.router.mode
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+from enum import Enum, auto
+from typing import Optional
+
+
+class MonitorMode(Enum):
+    """
+    Role:
+        -   Configuration
+
+    Responsibilities:
+        1.  Select how much work LoggingLevelRouter.monitor does around a call.
+
+    Attributes:
+        OFF:            Call straight through. Nothing is logged.
+        ERRORS_ONLY:    Only failures are logged.
+        SAMPLED:        Failures are logged. One in every sample_interval successes is logged.
+        FULL:           Every success and failure is logged.
+
+    Provides:
+        -   def resolve(name: Optional[str], default: MonitorMode) -> MonitorMode
+
+    Super Class:
+        Enum
+    """
+    OFF = auto()
+    ERRORS_ONLY = auto()
+    SAMPLED = auto()
+    FULL = auto()
+    
+    @classmethod
+    def resolve(cls, name: Optional[str], default: MonitorMode) -> MonitorMode:
+        """
+        Map a setting like "errors-only" or "FULL" to its MonitorMode. Unknown or
+        empty names fall back to the default.
+        """
+        if not name:
+            return default
+        return cls.__members__.get(name.strip().upper().replace("-", "_"), default)
@@ -7,13 +7,24 @@ Created: 2025-10-03
 version: 1.0.0
 """
 
+import inspect
+import os
 from functools import wraps
+from itertools import count
+from time import perf_counter_ns
 from typing import Any, Callable, Optional, TypeVar
 
-from util import LogWriter
+from util.logging.metric import MetricRegistry
+from util.logging.router.mode import MonitorMode
+from util.logging.writer import LogWriter
 
 T = TypeVar("T")
 
+# Enum member lookups are slow enough to show up in the wrapper, so it compares against these.
+_OFF = MonitorMode.OFF
+_ERRORS_ONLY = MonitorMode.ERRORS_ONLY
+_FULL = MonitorMode.FULL
+
 
 class LoggingLevelRouter:
     """
@@ -28,8 +39,55 @@ class LoggingLevelRouter:
     
     ATTRIBUTES:
     ----------
-    None
+    MODE_ENV_VAR = CHESSBOT_MONITOR_MODE
+    SAMPLE_INTERVAL_ENV_VAR = CHESSBOT_MONITOR_SAMPLE_INTERVAL
+    DEFAULT_MODE = MonitorMode.FULL
+    DEFAULT_SAMPLE_INTERVAL = 100
+    
+    mode: MonitorMode
+    sample_interval: int
     """
+    MODE_ENV_VAR: str = "CHESSBOT_MONITOR_MODE"
+    SAMPLE_INTERVAL_ENV_VAR: str = "CHESSBOT_MONITOR_SAMPLE_INTERVAL"
+    DEFAULT_MODE: MonitorMode = MonitorMode.FULL
+    DEFAULT_SAMPLE_INTERVAL: int = 100
+    
+    # Startup values come from the environment. Both can be changed at runtime with configure.
+    _mode: MonitorMode = MonitorMode.resolve(os.environ.get(MODE_ENV_VAR), DEFAULT_MODE)
+    _sample_interval: int = max(1, int(os.environ.get(SAMPLE_INTERVAL_ENV_VAR) or DEFAULT_SAMPLE_INTERVAL))
+    
+    @classmethod
+    def get_mode(cls) -> MonitorMode:
+        return cls._mode
+    
+    @classmethod
+    def get_sample_interval(cls) -> int:
+        return cls._sample_interval
+    
+    @classmethod
+    def configure(
+            cls,
+            mode: Optional[MonitorMode] = None,
+            sample_interval: Optional[int] = None,
+    ) -> None:
+        """
+        Switch the monitoring mode for every decorated method. Takes effect on the
+        next call, so it can be toggled while a game is running.
+        Arguments:
+          * `mode`: The new MonitorMode. Unchanged if None.
+          * `sample_interval`: In SAMPLED mode, log one of every `sample_interval`
+            successes. Unchanged if None.
+        Returns:
+          `void`
+        Raises:
+          ValueError: If `sample_interval` is less than 1.
+        """
+        if sample_interval is not None:
+            if sample_interval < 1:
+                raise ValueError("sample_interval must be at least 1.")
+            cls._sample_interval = sample_interval
+        if mode is not None:
+            cls._mode = mode
     
     @staticmethod
     def log_success(context: Any, message: str) -> None:
@@ -75,26 +133,58 @@ class LoggingLevelRouter:
     Decorator that automatically logs:
      - success as info
      - errors as error
-    Works on instance/class methods or free functions.
+    Works on instance/class methods or free functions. Can be applied bare,
+    `@LoggingLevelRouter.monitor`, or called, `@LoggingLevelRouter.monitor(context)`.
+    
+    How much gets logged depends on the current MonitorMode:
+     - OFF: the call passes straight through.
+     - ERRORS_ONLY: only exceptions are logged. Successes cost one mode check.
+     - SAMPLED: exceptions are logged, and one of every sample_interval successes.
+     - FULL: everything is logged.
+    
+    While MetricRegistry is enabled every call is also timed and recorded under
+    the function's qualified name, whatever the MonitorMode.
     """
+        # Bare usage hands the decorated function in as the context.
+        if inspect.isfunction(context):
+            return LoggingLevelRouter.monitor()(context)
         
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
+            method_name = func.__name__
+            qualified_name = f"{func.__module__}.{func.__qualname__}"
+            calls = count(1)
+            
+            def timed(*args: Any, **kwargs: Any) -> T:
+                start = perf_counter_ns()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception:
+                    MetricRegistry.record(qualified_name, perf_counter_ns() - start, raised=True)
+                    raise
+                MetricRegistry.record(
+                    qualified_name,
+                    perf_counter_ns() - start,
+                    failed=getattr(result, "is_failure", False) is True,
+                )
+                return result
             
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> T:
-                actual_context = context or (args[0] if args else func)
-                method_name = func.__name__
+                mode = LoggingLevelRouter._mode
+                call = timed if MetricRegistry._enabled else func
+                if mode is _OFF:
+                    return call(*args, **kwargs)
                 try:
-                    result = func(*args, **kwargs)
-                    LogWriter.log_info(actual_context, f"{method_name} succeeded")
-                
+                    result = call(*args, **kwargs)
                 except Exception as e:
-                    LogWriter.log_exception(actual_context, e)
+                    LogWriter.log_exception(context or (args[0] if args else func), e, func)
                     raise
-                return wrapper
+                if mode is _ERRORS_ONLY:
+                    return result
+                if mode is _FULL or next(calls) % LoggingLevelRouter._sample_interval == 0:
+                    LogWriter.log_info(context or (args[0] if args else func), f"{method_name} succeeded", func)
+                return result
+            
+            return wrapper
         
         return decorator
-
-    
-
-    
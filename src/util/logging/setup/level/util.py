@@ -10,7 +10,7 @@ version: 0.0.2
 from __future__ import annotations
 import logging
 
-from util.logging.setup import LogLevelMode
+from util.logging.setup.level.mode import LogLevelMode
 
 
 class LogLevelSetter:
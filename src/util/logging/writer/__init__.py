@@ -13,4 +13,6 @@ version: 0.0.2
 
 
 # Modules
+from .record import ContextRecord
+from .cache import ContextCache
 from .util import LogWriter
\ No newline at end of file
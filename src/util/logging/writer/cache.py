@@ -0,0 +1,116 @@
+# src/util/logging/writer/cache.py
+
+"""
+Module: util.logging.writer.cache
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+import logging
+import sys
+from threading import Lock
+from types import FunctionType, MethodType, ModuleType
+from typing import Any, Dict
+from weakref import WeakKeyDictionary
+
+from util.logging.writer.record import ContextRecord
+
+
+class ContextCache:
+    """
+    Role:
+        -   Cache
+
+    Responsibilities:
+        1.  Resolve a logging context to its ContextRecord once per class, function
+            or module instead of on every logged call.
+        2.  Hold owners weakly, so records of dynamically created classes disappear
+            with the class and a new class can never pick up a stale record.
+
+    Attributes:
+        size: int
+
+    Provides:
+        -   def resolve(context: Any) -> ContextRecord
+        -   def invalidate(context: Any) -> None
+        -   def clear() -> None
+
+    Super Class:
+    """
+    UNKNOWN: str = "unknown"
+    
+    _records: WeakKeyDictionary = WeakKeyDictionary()
+    # Owners that cannot be weakly referenced are rare, so they are kept strongly.
+    _strong_records: Dict[Any, ContextRecord] = {}
+    _lock: Lock = Lock()
+    
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._records) + len(cls._strong_records)
+    
+    @classmethod
+    def resolve(cls, context: Any) -> ContextRecord:
+        owner = cls._owner(context)
+        record = cls._records.get(owner) if owner is not None else None
+        if record is None:
+            record = cls._strong_records.get(owner)
+        if record is not None:
+            return record
+        
+        record = cls._build(owner)
+        with cls._lock:
+            try:
+                cls._records[owner] = record
+            except TypeError:
+                cls._strong_records[owner] = record
+        return record
+    
+    @classmethod
+    def invalidate(cls, context: Any) -> None:
+        """Forget the record for a context, e.g. after renaming or re-homing a class."""
+        owner = cls._owner(context)
+        with cls._lock:
+            try:
+                cls._records.pop(owner, None)
+            except TypeError:
+                pass
+            cls._strong_records.pop(owner, None)
+    
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._records.clear()
+            cls._strong_records.clear()
+    
+    @staticmethod
+    def _owner(context: Any) -> Any:
+        # Classes, functions and modules describe themselves. Instances share their class's record.
+        if context is None or isinstance(context, (type, FunctionType, ModuleType)):
+            return context
+        if isinstance(context, MethodType):
+            return context.__func__
+        return type(context)
+    
+    @classmethod
+    def _build(cls, owner: Any) -> ContextRecord:
+        if owner is None:
+            module_name, class_name = cls.UNKNOWN, "module"
+        elif isinstance(owner, ModuleType):
+            module_name, class_name = owner.__name__, "module"
+        elif isinstance(owner, FunctionType):
+            module_name = owner.__module__ or cls.UNKNOWN
+            qualified = owner.__qualname__.rsplit(".", 1)
+            class_name = qualified[0] if len(qualified) > 1 else "module"
+        else:
+            module_name, class_name = owner.__module__ or cls.UNKNOWN, owner.__name__
+        
+        module = owner if isinstance(owner, ModuleType) else sys.modules.get(module_name)
+        file_name = getattr(module, "__file__", None) or cls.UNKNOWN
+        return ContextRecord(
+            file=file_name,
+            module=module_name,
+            class_name=class_name,
+            logger=logging.getLogger(module_name),
+        )
@@ -0,0 +1,36 @@
+# src/util/logging/writer/record.py
+
+"""
+Module: util.logging.writer.record
+Author: Banji Lawal
+Created: 2026-04-03
+version: 0.0.2
+"""
+
+from __future__ import annotations
+import logging
+from typing import NamedTuple
+
+
+class ContextRecord(NamedTuple):
+    """
+    Role:
+        -   Data Holder
+
+    Responsibilities:
+        1.  The resolved logging metadata of one class, function or module, and
+            the Logger its records go to.
+
+    Attributes:
+        file: str
+        module: str
+        class_name: str
+        logger: logging.Logger
+
+    Super Class:
+        NamedTuple
+    """
+    file: str
+    module: str
+    class_name: str
+    logger: logging.Logger
@@ -7,10 +7,11 @@ Created: 2026-04-03
 version: 0.0.2
 """
 
-import inspect
 import logging
 from typing import Callable, TypeVar, Any, Optional, Dict
 
+from util.logging.writer.cache import ContextCache
+
 T = TypeVar('V')
 
 
@@ -22,6 +23,8 @@ class LogWriter:
 
     Responsibilities:
         1.  Centralizing logger access for info and error reporting.
+        2.  Records go to whatever handlers the logger has. When QueuedLogBackend is
+            running that is a queue, and the file I/O happens on its listener thread.
 
     Attributes:
 
@@ -48,6 +51,8 @@ class LogWriter:
             - module visitor_name
             - class visitor_name
             - function visitor_name when its available
+          Everything except the function comes from ContextCache, so it is only
+          worked out once per class, function or module.
   
         PARAMETERS:
           * `map (`Any`)`:
@@ -59,37 +64,20 @@ class LogWriter:
         RAISES:
           None
         """
-        method = "LogWriter.resolve_context_info"
-        
-        frame = inspect.currentframe()
-        caller_frame = frame.f_back if frame and frame.f_back else None
-        
-        module = inspect.getmodule(caller_frame)
-        module_name = module.__name__ if module is not None else "unknown"
-        file_name = getattr(module, "__file__", "unknown")
-        
-        # Resolve the class visitor_name
-        if inspect.isclass(context):
-            class_name = context.__name__
-        elif hasattr(context, "__name__"):
-            class_name = context.__class__.__name__
-        else:
-            class_name = "module"
-        
-        function_name = function.__name__ if hasattr(function, "__name__") else "unknown"
-        
+        record = ContextCache.resolve(context)
         return {
-            "file": file_name,
-            "module": module_name,
-            "class": class_name,
-            "function": function_name
+            "file": record.file,
+            "module": record.module,
+            "class": record.class_name,
+            "function": getattr(function, "__name__", "unknown"),
         }
     
     @classmethod
     def get_logger_for_context(cls, context: Any) -> logging.Logger:
         """
         ACTION:
-          Create and return a logger named for either the class, instance, module,
+          Return the logger named for the module of the class, instance, function
+          or module. The Logger handle is cached with the context's metadata.
         PARAMETERS:
             * `map` `Any`: The item to get a logger for.
         RETURNS:
@@ -97,44 +85,32 @@ class LogWriter:
         RAISES:
           No errors
         """
-        
-        log_info = cls.resolve_context_info(context)
-        return logging.getLogger(log_info["module"])
-        
-        #
-        # # If it's class, use its visitor_name
-        # if inspect.isclass(map):
-        #   return logging.getLogger(map.__name__)
-        #
-        # # If it's an instance, use the instance's visitor_name
-        # if hasattr(map, '__class__'):
-        #   return logging.getLogger(map.__class__.__name__)
-        #
-        # # Otherwise get the module(file) visitor_name
-        # frame = inspect.currentframe()
-        # caller_frame = frame.f_back
-        # module = inspect.getmodule(caller_frame)
-        # module_name = module.__name__ if module else "unknown"
-        #
-        # return logging.getLogger(module_name)
+        return ContextCache.resolve(context).logger
     
     @classmethod
-    def log_info(cls, context: Any, msg: str) -> None:
+    def log_info(cls, context: Any, msg: str, function: Optional[Callable] = None) -> None:
         """
         ACTION:
           Log informational msgs for the map
         PARAMETERS:
             * `map` `Any`: The item to write into the info log.
             * `msg` `str`: Information about the map
+            * `function` `Callable`: The function the message is about.
         RETURNS:
             `void`
         RAISES:
           No errors
         """
-        
-        context_info = cls.resolve_context_info(context)
-        logger = cls.get_logger_for_context(context)
-        logger.info("[%s.%s:%s] %s", context_info["class"], context_info["function"], context_info["file"])
+        record = ContextCache.resolve(context)
+        if not record.logger.isEnabledFor(logging.INFO):
+            return
+        record.logger.info(
+            "[%s.%s:%s] %s",
+            record.class_name,
+            getattr(function, "__name__", "unknown"),
+            record.file,
+            msg,
+        )
     
     @classmethod
     def log_exception(cls, context: Any, exception: Exception, function: Optional[Callable] = None) -> None:
@@ -149,15 +125,13 @@ class LogWriter:
         RAISES:
           No errors
         """
-        
-        context_info = cls.resolve_context_info(context)
-        logger = cls.get_logger_for_context(context)
-        logger.error(
+        record = ContextCache.resolve(context)
+        record.logger.error(
             "[%s.%s:%s] %s: %s",
-            context_info["class"],
-            context_info["function"],
-            context_info["file"],
+            record.class_name,
+            getattr(function, "__name__", "unknown"),
+            record.file,
             exception.__class__.__name__,
             str(exception),
             exc_info=exception
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,172 @@
+# tests/benchmark/arena_memory_benchmark.py
+
+"""
+Module: tests.benchmark.arena_memory_benchmark
+Author: Banji Lawal
+Created: 2026-04-05
+version: 0.0.2
+
+Bytes per bootstrapped Arena: the arena, its board and 64 squares, two players,
+two teams and their 32 tokens, measured with tracemalloc. Each arena is built twice:
+once from the slotted models and once from the same model source with every __slots__
+removed, as the models were before they were slotted.
+
+Run from the repository root:
+    python tests/benchmark/arena_memory_benchmark.py [--arenas N]
+
+The model modules are run through SourceLoader.isolate. Their databases, binders and
+controllers are built lazily and are never touched here, so the neighbours that do not
+import yet (the player microservice among them) are left out. The rank classes do not
+import yet either: each token's rank is an empty stand-in, so rank objects are not counted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from collections import Counter
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import CoordTable
+from domain.schema import Archetype
+from util import IdFactory
+
+COLUMNS = "ABCDEFGH"
+RANKS = ("Bishop", "King", "Knight", "Pawn", "Queen", "Rook")
+
+
+class RankStandIn:
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def load_models(slots: bool) -> SimpleNamespace:
+    """The state models, run from their own source, slotted or not."""
+    def isolate(module: str, **names):
+        return SourceLoader.isolate(f"domain.model.{module}", slots=slots, **names)
+
+    ranks = {name: type(name, (RankStandIn,), {"__slots__": ()}) for name in RANKS}
+    formation = SourceLoader.isolate("domain.schema.formation.schema", Rank=RankStandIn, **ranks).Formation
+    domain = SourceLoader.isolate("domain.domain", slots=slots)
+    model = isolate("model", DomainObject=domain.DomainObject).Model
+    state = isolate("state.model", Model=model).StateModel
+    arena = isolate("state.arena.model", StateModel=state).Arena
+    board = isolate("state.board.model", StateModel=state, Arena=arena).Board
+    square = isolate("state.square.model", StateModel=state, Board=board).Square
+    home = isolate("state.square.home.model", Square=square, Board=board, Formation=formation).HomeSquare
+    player = isolate("state.player.model", StateModel=state).Player
+    team = isolate("state.team.model", StateModel=state, Board=board, Player=player).Team
+    token = isolate(
+        "state.token.model", StateModel=state, HomeSquare=home, Team=team, Formation=formation,
+    ).Token
+    combatant = isolate(
+        "state.token.combatant.model", Token=token, HomeSquare=home, Team=team, Formation=formation,
+    ).CombatantToken
+    pawn = isolate(
+        "state.token.combatant.pawn.model",
+        CombatantToken=combatant, HomeSquare=home, Team=team, Formation=formation, Pawn=ranks["Pawn"],
+    ).PawnToken
+    king = isolate(
+        "state.token.king.model",
+        Token=token, HomeSquare=home, Team=team, Formation=formation, King=ranks["King"],
+    ).KingToken
+    return SimpleNamespace(
+        Arena=arena, Board=board, Square=square, HomeSquare=home, Player=player, Team=team,
+        CombatantToken=combatant, PawnToken=pawn, KingToken=king, Formation=formation, ranks=ranks,
+    )
+
+
+def bootstrap_arena(models: SimpleNamespace, adviser: object) -> Tuple[object, Dict[str, object], List[object]]:
+    """
+    Every stateful model a game holds. The arena's player binder is left out: it is
+    bookkeeping over the players, which are counted here directly.
+    """
+    arena = models.Arena(id=IdFactory.next_id(class_name="Arena"), arena_player_binder=None)
+    board = models.Board(id=IdFactory.next_id(class_name="Board"), arena=arena)
+    homes = {formation.home_square_name: formation for formation in models.Formation}
+
+    squares: Dict[str, object] = {}
+    for coord in CoordTable.all():
+        name = f"{COLUMNS[coord.column]}{coord.row + 1}"
+        square_id = IdFactory.next_id(class_name="Square")
+        if name in homes:
+            squares[name] = models.HomeSquare(
+                id=square_id, name=name, coord=coord, board=board, formation=homes[name]
+            )
+        else:
+            squares[name] = models.Square(id=square_id, name=name, coord=coord, board=board)
+        board.place_square(squares[name])
+
+    tokens: List[object] = []
+    for archetype in Archetype:
+        player = models.Player(id=IdFactory.next_id(class_name="Player"), name=archetype.name, adviser=adviser)
+        team = models.Team(id=IdFactory.next_id(class_name="Team"), board=board, owner=player, archetype=archetype)
+        for formation in models.Formation:
+            if formation.color != archetype.color:
+                continue
+            token_id = IdFactory.next_id(class_name="Token")
+            home = squares[formation.home_square_name]
+            if formation.rank is models.ranks["King"]:
+                token = models.KingToken(id=token_id, team=team, formation=formation, home_square=home)
+            elif formation.rank is models.ranks["Pawn"]:
+                token = models.PawnToken(id=token_id, team=team, formation=formation, home_square=home)
+            else:
+                token = models.CombatantToken(
+                    id=token_id, rank=formation.rank(), team=team, formation=formation, home_square=home
+                )
+            tokens.append(token)
+    return arena, squares, tokens
+
+
+def measure(models: SimpleNamespace, arenas: int) -> Dict[str, float]:
+    adviser = object()
+    kept = []
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(arenas):
+        kept.append(bootstrap_arena(models, adviser))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    instances = Counter(type(obj).__name__ for _, squares, tokens in kept for obj in (*squares.values(), *tokens))
+    return {
+        "bytes_per_arena": size / arenas,
+        "squares": (instances["Square"] + instances["HomeSquare"]) / arenas,
+        "tokens": sum(count for name, count in instances.items() if name.endswith("Token")) / arenas,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--arenas", type=int, default=1_000)
+    args = parser.parse_args()
+
+    slotted = measure(load_models(slots=True), args.arenas)
+    unslotted = measure(load_models(slots=False), args.arenas)
+    print(f"{'arenas':<24}{args.arenas:>14,}")
+    print(f"{'squares, tokens / arena':<24}{slotted['squares']:>7,.0f}{slotted['tokens']:>7,.0f}")
+    print(f"{'':<24}{'unslotted':>14}{'slotted':>14}")
+    print(f"{'bytes per arena':<24}{unslotted['bytes_per_arena']:>14,.0f}{slotted['bytes_per_arena']:>14,.0f}")
+    print(
+        f"{'MiB per 1,000 arenas':<24}"
+        f"{unslotted['bytes_per_arena'] * 1_000 / 2 ** 20:>14.2f}{slotted['bytes_per_arena'] * 1_000 / 2 ** 20:>14.2f}"
+    )
+    print(f"{'saved':<24}{1 - slotted['bytes_per_arena'] / unslotted['bytes_per_arena']:>28.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# tests/benchmark/import_benchmark.py
+
+"""
+Module: tests.benchmark.import_benchmark
+Author: Banji Lawal
+Created: 2026-04-04
+version: 0.0.2
+
+Cold-import time and imported-module count for each top-level package, checked
+against the budgets in import_budget.json. Every measurement runs in a fresh
+interpreter. Exits with status 1 when a package fails to import or goes over budget.
+
+Run from the repository root:
+    python tests/benchmark/import_benchmark.py [--budget FILE] [--report FILE] [package ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SRC = os.path.join(ROOT, "src")
+DEFAULT_BUDGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budget.json")
+DEFAULT_REPORT = os.path.join(ROOT, "logs", "import_report.json")
+
+# Runs in the child interpreter. src is appended, not prepended, so src/math
+# cannot shadow the stdlib math module.
+PROBE = """
+import json, sys, time
+sys.path.append({src!r})
+before = set(sys.modules)
+start = time.perf_counter()
+error = None
+try:
+    import {package}
+except BaseException as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(json.dumps({{
+    "ms": elapsed * 1000.0,
+    "modules": len(loaded),
+    "project_modules": sum(1 for name in loaded if (getattr(sys.modules.get(name), "__file__", None) or "").startswith({src!r})),
+    "error": error,
+}}))
+"""
+
+
+def measure(package: str, repeats: int) -> Dict[str, object]:
+    """Best of `repeats` cold imports of `package`."""
+    runs: List[Dict[str, object]] = []
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, "-c", PROBE.format(src=SRC, package=package)],
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+        )
+        lines = completed.stdout.strip().splitlines()
+        if completed.returncode != 0 or not lines:
+            return {"ms": None, "modules": None, "project_modules": None, "error": completed.stderr.strip()[-500:]}
+        runs.append(json.loads(lines[-1]))
+        if runs[-1]["error"]:
+            return runs[-1]
+    return min(runs, key=lambda run: run["ms"])
+
+
+def check(package: str, result: Dict[str, object], budget: Dict[str, float]) -> List[str]:
+    if result["error"]:
+        return [f"{package}: import failed ({str(result['error']).splitlines()[-1]})"]
+    problems = []
+    if result["ms"] > budget["max_ms"]:
+        problems.append(f"{package}: {result['ms']:.1f} ms > {budget['max_ms']:.1f} ms budget")
+    if result["modules"] > budget["max_modules"]:
+        problems.append(f"{package}: {result['modules']} modules > {budget['max_modules']} module budget")
+    return problems
+
+
+def run(budget_path: str, report_path: str, only: Optional[List[str]] = None) -> int:
+    with open(budget_path, encoding="utf-8") as file:
+        config = json.load(file)
+    repeats = int(config.get("repeats", 3))
+    packages = only or list(config["packages"])
+    
+    report = {"python": sys.version.split()[0], "repeats": repeats, "packages": {}}
+    problems: List[str] = []
+    for package in packages:
+        budget = {**config["default"], **config["packages"].get(package, {})}
+        result = measure(package, repeats)
+        failures = check(package, result, budget)
+        problems.extend(failures)
+        report["packages"][package] = {**result, "budget": budget, "passed": not failures}
+        ms = f"{result['ms']:.1f}" if result["ms"] is not None else "-"
+        modules = result["modules"] if result["modules"] is not None else "-"
+        print(f"{package:<16}{ms:>10} ms{modules:>8} modules  {'ok' if not failures else 'FAIL'}")
+    
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"report: {os.path.relpath(report_path, ROOT)}")
+    
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("packages", nargs="*", help="Subset of the packages in the budget file.")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET)
+    parser.add_argument("--report", default=DEFAULT_REPORT)
+    args = parser.parse_args()
+    sys.exit(run(args.budget, args.report, args.packages or None))
+
+
+if __name__ == "__main__":
+    main()
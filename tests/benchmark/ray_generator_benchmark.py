@@ -0,0 +1,88 @@
+# tests/benchmark/ray_generator_benchmark.py
+
+"""
+Module: tests.benchmark.ray_generator_benchmark
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+
+Milliseconds to generate every queen ray for every origin with RayGenerator against
+stepping a cursor from each origin and checking each square is on the board, as the ray
+computers do. Boards larger than the configured one are compared in bare indices.
+
+Run from the repository root:
+    python tests/benchmark/ray_generator_benchmark.py [--sizes 8 16 32]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from typing import Dict, List, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+# The src packages re-export modules that do not all import yet; load only the ones used here.
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.schema import Persona
+from geometry.span.table import RayGenerator, RayTable
+
+STEPS = RayTable.STEPS[Persona.QUEEN]
+
+
+def walk(size: int) -> List[Tuple[Tuple[int, ...], ...]]:
+    """Every origin's queen rays, one validated step at a time."""
+    table = []
+    for row in range(size):
+        for column in range(size):
+            rays = []
+            for row_step, column_step in STEPS:
+                ray = []
+                cursor_row, cursor_column = row + row_step, column + column_step
+                while 0 <= cursor_row < size and 0 <= cursor_column < size:
+                    ray.append(cursor_row * size + cursor_column)
+                    cursor_row, cursor_column = cursor_row + row_step, cursor_column + column_step
+                if ray:
+                    rays.append(tuple(ray))
+            table.append(tuple(rays))
+    return table
+
+
+def best(action, repeat: int) -> float:
+    """Best of five runs, in milliseconds per run."""
+    return min(timeit.repeat(action, number=repeat, repeat=5)) / repeat * 1e3
+
+
+def measure(sizes: List[int], repeat: int) -> Dict[int, Dict[str, float]]:
+    report: Dict[int, Dict[str, float]] = {}
+    for size in sizes:
+        assert list(RayGenerator.indices(STEPS, None, size, size)) == walk(size)
+        report[size] = {
+            "walk": best(lambda: walk(size), repeat),
+            "generator": best(lambda: RayGenerator.indices(STEPS, None, size, size), repeat),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    report = measure(args.sizes, args.repeat)
+    print(f"{'board':<10}{'walk ms':>10}{'generator ms':>15}{'speedup':>10}")
+    for size, row in report.items():
+        board = f"{size}x{size}"
+        print(f"{board:<10}{row['walk']:>10.3f}{row['generator']:>15.3f}{row['walk'] / row['generator']:>9.1f}x")
+    coords = RayGenerator.rays(STEPS)
+    print(f"{'coords':<10}{'':>10}{best(lambda: RayGenerator.rays(STEPS), args.repeat):>15.3f}  ({len(coords)} origins)")
+
+
+if __name__ == "__main__":
+    main()
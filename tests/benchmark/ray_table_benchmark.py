@@ -0,0 +1,104 @@
+# tests/benchmark/ray_table_benchmark.py
+
+"""
+Module: tests.benchmark.ray_table_benchmark
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+
+Microseconds per ray lookup from the precomputed RayTable against walking the same rays
+on demand, for every persona over all 64 origins. The on-demand walk steps a cursor and
+checks each square is on the board: a lower bound for the ray computers, which also build
+a Result per step.
+
+Run from the repository root:
+    python tests/benchmark/ray_table_benchmark.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from typing import Callable, Dict, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+# The src packages re-export modules that do not all import yet; load only the ones used here.
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import CoordTable
+from domain.schema import Archetype, Persona
+from geometry.span.table import RayTable
+
+
+def walk(origin, steps: Tuple[Tuple[int, int], ...], limit: int) -> tuple:
+    """One ray per step that stays on the board, at most limit squares long."""
+    rays = []
+    for row_step, column_step in steps:
+        ray = []
+        row, column = origin.row + row_step, origin.column + column_step
+        while len(ray) < limit and CoordTable.contains(row, column):
+            ray.append(CoordTable.get(row, column))
+            row, column = row + row_step, column + column_step
+        if ray:
+            rays.append(tuple(ray))
+    return tuple(rays)
+
+
+def on_demand(persona: Persona, archetype: Archetype) -> Callable[[], object]:
+    """Walk every origin's rays from scratch, as the spanners did before the table."""
+    if persona is Persona.PAWN:
+        forward = archetype.advancing_step.magnitude
+        return lambda: [
+            walk(origin, ((forward, 0),), 2 if origin.row == archetype.pawn_row else 1)
+            for origin in CoordTable.all()
+        ]
+    steps = RayTable.STEPS[persona]
+    limit = max(CoordTable.ROWS, CoordTable.COLUMNS) if persona in RayTable.SLIDERS else 1
+    return lambda: [walk(origin, steps, limit) for origin in CoordTable.all()]
+
+
+def per_origin(search: Callable[[], object], repeat: int) -> float:
+    """Best of five runs, in microseconds per origin."""
+    return min(timeit.repeat(search, number=repeat, repeat=5)) / repeat / CoordTable.SIZE * 1e6
+
+
+def measure(repeat: int) -> Dict[str, Dict[str, float]]:
+    report: Dict[str, Dict[str, float]] = {}
+    report["build"] = {"ms": timeit.timeit(RayTable.build, number=1) * 1e3}
+    archetype = Archetype.WHITE
+    for persona in Persona:
+        report[persona.name] = {
+            "on_demand": per_origin(on_demand(persona, archetype), repeat),
+            "table": per_origin(
+                lambda: [RayTable.rays(persona, archetype, origin) for origin in CoordTable.all()], repeat
+            ),
+            "span": per_origin(
+                lambda: [RayTable.span(persona, archetype, origin) for origin in CoordTable.all()], repeat
+            ),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    report = measure(args.repeat)
+    print(f"{'table build ms':<16}{report['build']['ms']:>10.2f}")
+    print(f"{'persona':<16}{'on demand us':>14}{'table us':>12}{'span us':>12}{'speedup':>10}")
+    for persona in Persona:
+        row = report[persona.name]
+        print(
+            f"{persona.name:<16}{row['on_demand']:>14.3f}{row['table']:>12.3f}{row['span']:>12.3f}"
+            f"{row['on_demand'] / row['table']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
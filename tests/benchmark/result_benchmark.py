@@ -0,0 +1,99 @@
+# tests/benchmark/result_benchmark.py
+
+"""
+Module: tests.benchmark.result_benchmark
+Author: Banji Lawal
+Created: 2026-04-05
+version: 0.0.2
+
+Allocations and memory per million Result constructions, slotted against the same class
+with an instance __dict__, and shared sentinels against fresh instances.
+
+Run from the repository root:
+    python tests/benchmark/result_benchmark.py [--calls N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+# The src packages re-export modules that do not all import yet; load only the ones used here.
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from result import InsertionResult, InsertionState, Result, SearchResult, SearchState
+
+PER = 1_000_000
+
+
+def _with_dict(cls: type) -> type:
+    """The same class with an instance __dict__, i.e. the layout before __slots__."""
+    return type(f"{cls.__name__}WithDict", (cls,), {})
+
+
+def measure(factory: Callable[[], object], calls: int) -> Dict[str, float]:
+    """Blocks and bytes still allocated after `calls` results are built and kept alive."""
+    kept: List[object] = []
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(calls):
+        kept.append(factory())
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    # The list holding the results is not what is being measured.
+    size -= sys.getsizeof(kept)
+    scale = PER / calls
+    return {
+        "allocations": blocks * scale,
+        "bytes": size * scale,
+        "distinct": len({id(item) for item in kept}),
+    }
+
+
+def run(calls: int) -> Dict[str, Dict[str, float]]:
+    payload = ["a1"]
+    dict_result = _with_dict(Result)
+    dict_search = _with_dict(SearchResult)
+    cases: Dict[str, Callable[[], object]] = {
+        "Result (__dict__)": lambda: dict_result(payload=payload),
+        "Result (__slots__)": lambda: Result(payload=payload),
+        "SearchResult (__dict__)": lambda: dict_search(state=SearchState.SUCCESS, payload=payload),
+        "SearchResult (__slots__)": lambda: SearchResult.success(payload),
+        "empty() fresh": lambda: SearchResult(state=SearchState.NOTHING_FOUND),
+        "empty() shared": SearchResult.empty,
+        "insert success fresh": lambda: InsertionResult(state=InsertionState.SUCCESS, payload=True),
+        "insert success shared": InsertionResult.success,
+    }
+    return {name: measure(factory, calls) for name, factory in cases.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    report = run(args.calls)
+
+    print(f"{'per million calls':<26}{'allocations':>14}{'MiB':>10}{'instances':>12}")
+    for name, row in report.items():
+        print(
+            f"{name:<26}{row['allocations']:>14,.0f}"
+            f"{row['bytes'] / 2 ** 20:>10.1f}{row['distinct']:>12,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+# tests/support/__init__.py
+
+"""
+Module: tests.support.__init__
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+"""
+
+# =========== TESTS.SUPPORT PACKAGE ===========#
+
+# Modules
+from .loader import PackageShell, SourceLoader
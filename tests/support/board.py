@@ -0,0 +1,165 @@
+# tests/support/board.py
+
+"""
+Module: tests.support.board
+Author: Banji Lawal
+Created: 2026-04-08
+version: 0.0.2
+
+A Board and its Squares run from their own source, for tests of the board's views.
+
+The model modules are loaded through SourceLoader.isolate. Their databases, binders and
+arena do not import yet, so the board gets a small SquareDatabase holding only the real
+SquareIndex, and tokens, teams and ranks are stand-ins carrying the attributes the board
+reads: token.team.archetype, token.rank.persona and touch().
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from collection.index import ModelIndex
+from domain.model import Coord, CoordTable
+from domain.schema import Archetype, Persona
+
+COLUMNS = "ABCDEFGH"
+
+
+class RankStandIn:
+    __slots__ = ("persona",)
+
+    def __init__(self, persona: Persona):
+        self.persona = persona
+
+
+class TeamStandIn:
+    __slots__ = ("archetype",)
+
+    def __init__(self, archetype: Archetype):
+        self.archetype = archetype
+
+
+class TokenStandIn:
+    __slots__ = ("name", "team", "rank", "touches")
+
+    def __init__(self, name: str, team: TeamStandIn, persona: Persona):
+        self.name = name
+        self.team = team
+        self.rank = RankStandIn(persona)
+        self.touches = 0
+
+    def touch(self) -> None:
+        self.touches += 1
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class PositionsStandIn:
+    """A token's CoordDatabase, down to the current coord."""
+
+    def __init__(self):
+        self.current_item = None
+
+
+class FormationStandIn:
+
+    def __init__(self, designation: str):
+        self.designation = designation
+
+
+class SquareDatabaseStandIn:
+    """What Board reads from its SquareDatabase: the query cache it shares and the index."""
+
+    def __init__(self, query_cache, board, index: Optional[ModelIndex] = None):
+        self.query_cache = query_cache
+        self.board = board
+        self.index = index
+
+
+def load_state_model() -> type:
+    domain = SourceLoader.isolate("domain.domain")
+    model = SourceLoader.isolate("domain.model.model", DomainObject=domain.DomainObject).Model
+    return SourceLoader.isolate("domain.model.state.model", Model=model).StateModel
+
+
+def load_models(square_database: Optional[type] = None) -> SimpleNamespace:
+    """Board, Square and SquareIndex from their own source."""
+    state = load_state_model()
+    board = SourceLoader.isolate(
+        "domain.model.state.board.model",
+        StateModel=state,
+        Arena=object,
+        BoardTeamBinderController=object,
+        HostageDatabase=object,
+        SquareDatabase=square_database or SquareDatabaseStandIn,
+    ).Board
+    square = SourceLoader.isolate("domain.model.state.square.model", StateModel=state, Board=board).Square
+    index = SourceLoader.isolate(
+        "collection.stack.square.index", Square=square, Token=TokenStandIn,
+    ).SquareIndex
+    return SimpleNamespace(Board=board, Square=square, SquareIndex=index)
+
+
+def load_team_models() -> SimpleNamespace:
+    """Team, a concrete Token and TokenIndex from their own source. A team's roster is its index."""
+    state = load_state_model()
+    index = SourceLoader.isolate("collection.stack.token.index", Token=object).TokenIndex
+
+    class RosterStandIn:
+        # TokenDatabase.reindex hands the token to its stack's index.
+        def __init__(self):
+            self.index = index()
+
+        def reindex(self, token) -> None:
+            self.index.refresh(token)
+
+    team = SourceLoader.isolate(
+        "domain.model.state.team.model",
+        StateModel=state, TokenDatabase=RosterStandIn, Board=object, Player=object,
+    ).Team
+    token = SourceLoader.isolate(
+        "domain.model.state.token.model",
+        StateModel=state, CoordDatabase=PositionsStandIn,
+        HomeSquare=object, KingToken=object, Rank=object, Team=team, Formation=object,
+    ).Token
+
+    class PlainToken(token):
+        __slots__ = ()
+        is_active = True
+        is_disabled = False
+
+    return SimpleNamespace(Team=team, Token=PlainToken, TokenIndex=index)
+
+
+def make_token(models: SimpleNamespace, id: int, team, persona: Persona, designation: str):
+    """A token filed in its team's roster."""
+    token = models.Token(
+        id=id, rank=RankStandIn(persona), team=team, formation=FormationStandIn(designation), home_square=None,
+    )
+    team.roster.index.add(token)
+    return token
+
+
+def square_name(coord: Coord) -> str:
+    return f"{COLUMNS[coord.column]}{coord.row + 1}"
+
+
+def coord_of(name: str) -> Coord:
+    return CoordTable.get(row=int(name[1:]) - 1, column=COLUMNS.index(name[0].upper()))
+
+
+def build_board(models: SimpleNamespace, board_id: int = 1):
+    """A board with every square placed. Returns the board and its squares by name."""
+    board = models.Board(id=board_id, arena=None)
+    squares: Dict[str, object] = {}
+    for coord in CoordTable.all():
+        square = models.Square(id=coord.index + 1, name=square_name(coord), coord=coord, board=board)
+        board.place_square(square)
+        squares[square.name] = square
+    return board, squares
@@ -0,0 +1,171 @@
+# tests/support/database.py
+
+"""
+Module: tests.support.database
+Author: Banji Lawal
+Created: 2026-04-08
+version: 0.0.2
+
+SquareDatabase over a real SquareStackService and SquareSearchRouter, run from their own
+source, for tests of the square search and write paths.
+
+The stack's controllers and integrity services do not import yet. The controller stand-in
+files pushed squares and seats visitors the way the real operations do; everything the
+search path touches is the repo's own code.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Generic, Optional, TypeVar
+
+from support.loader import SourceLoader
+from support.route import SearchContextStandIn, ValidatorStandIn, load_search_router
+
+SourceLoader.install()
+
+from result import DeletionResult, InsertionResult, SearchResult, UpdateResult
+from util import IdFactory, LoggingLevelRouter
+
+T = TypeVar("T")
+
+
+class ExceptionStandIn(Exception):
+    """SquareDatabaseException and SquareStackException are not defined anywhere in err yet."""
+    MSG = "stand-in"
+    ERR_CODE = "STAND_IN"
+
+    def __init__(self, msg: Optional[str] = None, ex: Optional[Exception] = None, **kwargs):
+        super().__init__(msg)
+        self.ex = ex
+
+
+class CollectionStandIn:
+
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+
+class DatabaseStandIn(CollectionStandIn, Generic[T]):
+    pass
+
+
+class ServiceStandIn:
+    pass
+
+
+class PusherStandIn:
+
+    def execute(self, stack, item) -> InsertionResult:
+        stack.items.append(item)
+        stack._indexed(item)
+        return InsertionResult.success()
+
+
+class ClaimantStandIn:
+    """Seats and unseats visitors through the square's occupant setter, as the operations do."""
+
+    def occupy_stack_square(self, token, square, square_stack, token_service) -> UpdateResult:
+        square.occupant = token
+        return UpdateResult.success(payload=square)
+
+    def remove_occupant_from_stack(self, occupant, square_stack, token_service) -> DeletionResult:
+        for square in square_stack.items:
+            if square.occupant is occupant:
+                square.occupant = None
+        return DeletionResult.success(occupant)
+
+
+class ControllerStandIn:
+
+    def __init__(self):
+        self.crud = SimpleNamespace(pusher=PusherStandIn())
+        self.claimant = ClaimantStandIn()
+
+
+class CountingFinder:
+    """Forwards to the real router and counts the round trips, so cache hits show."""
+
+    def __init__(self, router: type):
+        self.router = router
+        self.routes = 0
+        self.batches = 0
+
+    def route(self, **kwargs):
+        self.routes += 1
+        return self.router.route(context_validator=ValidatorStandIn(), **kwargs)
+
+    def route_batch(self, **kwargs):
+        self.batches += 1
+        return self.router.route_batch(context_validator=ValidatorStandIn(), **kwargs)
+
+
+def load_square_context() -> type:
+    return SourceLoader.isolate(
+        "domain.search.context.stack.square.context", SearchContext=SearchContextStandIn, Square=object,
+    ).SquareContext
+
+
+def load_square_router(square_index: type, search_router: Optional[type] = None) -> type:
+    return SourceLoader.isolate(
+        "route.search.square.router",
+        SearchRouter=search_router or load_search_router(),
+        SquareIndex=square_index,
+        SquareContext=object,
+        SquareContextValidator=ValidatorStandIn,
+        LoggingLevelRouter=LoggingLevelRouter,
+        Board=object, Coord=object, Formation=object, HomeSquare=object, Square=object, Token=object,
+    ).SquareSearchRouter
+
+
+def load_square_database(square_index: type, finder: CountingFinder) -> SimpleNamespace:
+    """SquareDatabase and SquareStackService. Every stack built searches through finder."""
+    # Neither module imports the names it uses, so they are all provided.
+    shared = dict(
+        IdFactory=IdFactory,
+        LoggingLevelRouter=LoggingLevelRouter,
+        SearchResult=SearchResult,
+        InsertionResult=InsertionResult,
+        DeletionResult=DeletionResult,
+        UpdateResult=UpdateResult,
+    )
+    stack = SourceLoader.isolate(
+        "collection.stack.stack",
+        DomainObjectCollection=CollectionStandIn,
+        IdentityService=ServiceStandIn,
+        Microservice=ServiceStandIn,
+        LoggingLevelRouter=LoggingLevelRouter,
+    ).StackService
+    square_stack = SourceLoader.isolate(
+        "collection.stack.square.stack",
+        StackService=stack,
+        SquareIndex=square_index,
+        Square=object, Token=object,
+        SquareService=ServiceStandIn,
+        SquareStackOpsController=ControllerStandIn,
+        SquareQueryService=lambda: SimpleNamespace(finder=finder),
+        IdentityService=ServiceStandIn,
+        TokenService=ServiceStandIn,
+        NUMBER_OF_ROWS=8,
+        NUMBER_OF_COLUMNS=8,
+        SquareStackException=ExceptionStandIn,
+        **shared,
+    ).SquareStackService
+
+    class ConcreteSquareStack(square_stack):
+        # StackService declares these abstract; SquareStackService does not implement them yet.
+        iterator = None
+        microservice = None
+
+    database = SourceLoader.isolate(
+        "database.square.database",
+        Database=DatabaseStandIn,
+        Square=object, Token=object,
+        SquareStackService=ConcreteSquareStack,
+        SquareService=ServiceStandIn,
+        TokenService=ServiceStandIn,
+        SquareDatabaseException=ExceptionStandIn,
+        **shared,
+    ).SquareDatabase
+    return SimpleNamespace(SquareDatabase=database, SquareStackService=ConcreteSquareStack)
@@ -0,0 +1,230 @@
+# tests/support/loader.py
+
+"""
+Module: tests.support.loader
+Author: Banji Lawal
+Created: 2026-04-06
+version: 0.0.2
+
+Imports src modules for tests and benchmarks without running the package __init__ files
+above them. Those re-export whole subtrees with star imports, and some of the modules they
+pull in do not import yet, so importing any leaf through its packages fails on the
+first broken neighbour. With the loader installed, a src package is an empty shell; a
+name asked of it is traced through the package's own __init__ re-exports to the module
+that defines it, and only that module is imported. The modules under test, and
+everything they import, are the real ones.
+
+Some modules under test import a neighbour that does not import yet, or use a name they
+never import. SourceLoader.isolate runs such a module's own source with stand-ins for
+those names only; the rest of its imports are still the real ones.
+
+Usage, before the first src import:
+    from support.loader import SourceLoader
+    SourceLoader.install()
+"""
+
+from __future__ import annotations
+
+import __future__
+import ast
+import copy
+import importlib
+import os
+import sys
+import types
+from importlib.machinery import ModuleSpec
+from typing import Any, Dict, Optional, Tuple
+
+SRC = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+
+class PackageShell(types.ModuleType):
+    """
+    Role:
+        -   Lazy Package
+
+    Responsibilities:
+        1.  Stand in for a src package without running its __init__.
+        2.  Resolve a re-exported name to its defining module, or a submodule by its name,
+            on first access.
+
+    Notes:
+        Resolution reads the package's __init__ as source and follows its relative imports,
+        recursing through sub-packages, so a broken sibling is never executed.
+    """
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        found = SourceLoader.locate(self.__name__, self.__path__[0], name)
+        if found is not None:
+            module, attribute = found
+            value = getattr(importlib.import_module(module), attribute)
+        elif SourceLoader.is_submodule(self.__path__[0], name):
+            # Not an export, but a submodule reached by attribute, e.g. setting.board.dimension.config.
+            value = importlib.import_module(f"{self.__name__}.{name}")
+        else:
+            raise AttributeError(f"module {self.__name__!r} does not export {name!r}")
+        setattr(self, name, value)
+        return value
+
+
+class SourceLoader:
+    """
+    Role:
+        -   Import Hook
+
+    Responsibilities:
+        1.  Serve every package under src as a PackageShell.
+        2.  Leave plain modules, and everything outside src, to the normal import system.
+
+    Provides:
+        -   def install() -> None
+        -   def locate(package: str, directory: str, name: str) -> Optional[Tuple[str, str]]
+        -   def is_submodule(directory: str, name: str) -> bool
+        -   def isolate(module: str, slots: bool, **names: Any) -> types.ModuleType
+
+    Notes:
+        sys.path gets src appended rather than prepended: src/math would otherwise shadow
+        the stdlib math module. For the same reason the math package is never shelled.
+        Neither is err: its __init__ only attaches err.loader, which already imports each
+        exception's module on first access through err.index.
+    """
+    UNSHELLED: Tuple[str, ...] = ("math", "err")
+
+    _trees: Dict[str, ast.Module] = {}
+    _installed: bool = False
+
+    @classmethod
+    def install(cls) -> None:
+        if cls._installed:
+            return
+        if SRC not in sys.path:
+            sys.path.append(SRC)
+        sys.meta_path.insert(0, cls())
+        cls._installed = True
+
+    @classmethod
+    def locate(cls, package: str, directory: str, name: str) -> Optional[Tuple[str, str]]:
+        """The dotted module defining name and its name there, following package re-exports."""
+        for node in cls._tree(os.path.join(directory, "__init__.py")).body:
+            if not (isinstance(node, ast.ImportFrom) and node.level == 1 and node.module):
+                continue
+            target = os.path.join(directory, *node.module.split("."))
+            dotted = f"{package}.{node.module}"
+            for alias in node.names:
+                if alias.name == "*":
+                    if os.path.isdir(target):
+                        found = cls.locate(dotted, target, name)
+                        if found is not None:
+                            return found
+                    elif cls._defines(f"{target}.py", name):
+                        return dotted, name
+                elif (alias.asname or alias.name) == name:
+                    if os.path.isdir(target):
+                        return cls.locate(dotted, target, alias.name)
+                    return dotted, alias.name
+        return None
+
+    @classmethod
+    def isolate(cls, module: str, slots: bool = True, **names: Any) -> types.ModuleType:
+        """
+        A fresh copy of module, run from its source with names standing in for its imports.
+
+        Each name the module imports is imported on its own, so one broken neighbour does
+        not take the others with it. A name in names is never imported. A name that does not
+        import in this tree is left unbound, and using it fails where it is used. The copy is
+        not put in sys.modules. With slots False the module's classes are built without their
+        __slots__, as they were before the models were slotted.
+        """
+        cls.install()
+        path = os.path.join(SRC, *module.split(".")) + ".py"
+        isolated = types.ModuleType(module)
+        isolated.__file__ = path
+        isolated.__package__ = module.rpartition(".")[0]
+        isolated.__dict__.update(names)
+        flags = 0
+        for node in cls._tree(path).body:
+            if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+                for alias in node.names:
+                    flags |= getattr(__future__, alias.name).compiler_flag
+                continue
+            if not isinstance(node, (ast.Import, ast.ImportFrom)):
+                cls._run(node if slots else cls._unslotted(node), path, flags, isolated)
+                continue
+            for alias in node.names:
+                if (alias.asname or alias.name.split(".")[0]) in names:
+                    continue
+                single = copy.copy(node)
+                single.names = [alias]
+                try:
+                    cls._run(single, path, flags, isolated)
+                except Exception:
+                    # Handle the case that, the name does not import yet. Its users fail when they run.
+                    pass
+        return isolated
+
+    @classmethod
+    def is_submodule(cls, directory: str, name: str) -> bool:
+        return os.path.isfile(os.path.join(directory, f"{name}.py")) or os.path.isdir(os.path.join(directory, name))
+
+    def find_spec(self, name: str, path, target=None) -> Optional[ModuleSpec]:
+        if name.split(".")[0] in self.UNSHELLED:
+            return None
+        directory = os.path.join(SRC, *name.split("."))
+        if not os.path.isfile(os.path.join(directory, "__init__.py")):
+            return None
+        spec = ModuleSpec(name, self, is_package=True)
+        spec.submodule_search_locations = [directory]
+        return spec
+
+    def create_module(self, spec: ModuleSpec) -> types.ModuleType:
+        module = PackageShell(spec.name)
+        module.__path__ = list(spec.submodule_search_locations)
+        return module
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        pass
+
+    @classmethod
+    def _unslotted(cls, node: ast.stmt) -> ast.stmt:
+        if not isinstance(node, ast.ClassDef):
+            return node
+        unslotted = copy.copy(node)
+        unslotted.body = [
+            statement for statement in node.body
+            if not (
+                    isinstance(statement, ast.Assign)
+                    and any(isinstance(target, ast.Name) and target.id == "__slots__" for target in statement.targets)
+            )
+        ] or [ast.Pass()]
+        return unslotted
+
+    @classmethod
+    def _run(cls, node: ast.stmt, path: str, flags: int, module: types.ModuleType) -> None:
+        tree = ast.fix_missing_locations(ast.Module(body=[node], type_ignores=[]))
+        code = compile(tree, path, "exec", flags=flags, dont_inherit=True)
+        exec(code, module.__dict__)
+
+    @classmethod
+    def _tree(cls, path: str) -> ast.Module:
+        if path not in cls._trees:
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    cls._trees[path] = ast.parse(file.read())
+            else:
+                cls._trees[path] = ast.Module(body=[], type_ignores=[])
+        return cls._trees[path]
+
+    @classmethod
+    def _defines(cls, path: str, name: str) -> bool:
+        for node in cls._tree(path).body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef)) and node.name == name:
+                return True
+            if isinstance(node, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id == name for target in node.targets
+            ):
+                return True
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.target.id == name:
+                return True
+        return False
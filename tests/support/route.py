@@ -0,0 +1,80 @@
+# tests/support/route.py
+
+"""
+Module: tests.support.route
+Author: Banji Lawal
+Created: 2026-04-08
+version: 0.0.2
+
+SearchRouter and the model routers built on it, run from their own source.
+
+route.search.router imports operation.Validator, which does not import yet. The routers
+only use it in annotations, so it is given a placeholder along with the bare Router base.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Generic, Optional, TypeVar
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from util import LoggingLevelRouter
+
+T = TypeVar("T")
+
+
+class RouterStandIn:
+    pass
+
+
+class SearchContextStandIn(Generic[T]):
+    """The id and name every SearchContext carries. The real base's __init__ takes no self."""
+
+    def __init__(self, id: Optional[int] = None, name: Optional[str] = None, max_enabled_toggles=None):
+        self._id = id
+        self._name = name
+
+    @property
+    def id(self) -> Optional[int]:
+        return self._id
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._name
+
+
+class ValidatorStandIn:
+    """Passes every candidate, as a context validator does for a well-formed context."""
+
+    def execute(self, candidate: Any):
+        from result import ValidationResult
+        return ValidationResult.success(candidate)
+
+
+def load_search_router() -> type:
+    return SourceLoader.isolate(
+        "route.search.router", Validator=Generic, Query=Generic, Router=RouterStandIn,
+    ).SearchRouter
+
+
+def load_token_router(search_router: type, token_index: type) -> type:
+    return SourceLoader.isolate(
+        "route.search.token.router",
+        SearchRouter=search_router,
+        TokenIndex=token_index,
+        TokenContext=object,
+        TokenContextValidator=ValidatorStandIn,
+        TokenQuery=object,
+        LoggingLevelRouter=LoggingLevelRouter,
+        Coord=object, HomeSquare=object, Rank=object, Team=object, Token=object,
+    ).TokenSearchRouter
+
+
+def load_token_context() -> type:
+    return SourceLoader.isolate(
+        "domain.search.context.stack.token.context",
+        SearchContext=SearchContextStandIn,
+        Coord=object, HomeSquare=object, Rank=object, Team=object, Token=object,
+    ).TokenContext
@@ -0,0 +1,204 @@
+import threading
+import unittest
+
+from support.board import load_state_model
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from assurance.validator import TrustedValidation
+from assurance.validator.priming.priming import PrimingValidator
+from err import NullException
+from result import ValidationResult
+
+
+class Probe:
+  """Stands in for a validator class; stamps are keyed by it."""
+
+
+class TrustedValidationTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    state = load_state_model()
+
+    class Piece(state):
+      __slots__ = ()
+
+    cls.Piece = Piece
+
+
+  def setUp(self):
+    self.piece = self.Piece()
+    self.result = ValidationResult.success(self.piece)
+
+
+  def test_nothing_is_stamped_outside_a_block(self):
+    self.assertFalse(TrustedValidation.is_enabled())
+    self.assertIs(TrustedValidation.stamp(Probe, self.piece, self.result), self.result)
+    self.assertIsNone(TrustedValidation.lookup(Probe, self.piece))
+    self.assertEqual(TrustedValidation.hits(), 0)
+    self.assertEqual(TrustedValidation.misses(), 0)
+
+    with TrustedValidation.trusted() as block:
+      self.assertEqual(block.stamps, {})
+      self.assertIsNone(TrustedValidation.lookup(Probe, self.piece))
+
+
+  def test_stamped_success_is_a_hit_inside_the_block(self):
+    with TrustedValidation.trusted() as block:
+      self.assertTrue(TrustedValidation.is_enabled())
+      self.assertIsNone(TrustedValidation.lookup(Probe, self.piece))
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+
+      self.assertIs(TrustedValidation.lookup(Probe, self.piece), self.result)
+      self.assertEqual((block.hits, block.misses), (1, 1))
+    self.assertFalse(TrustedValidation.is_enabled())
+
+
+  def test_failures_are_not_stamped(self):
+    with TrustedValidation.trusted() as block:
+      TrustedValidation.stamp(Probe, self.piece, ValidationResult.failure(ValueError("bad")))
+      self.assertEqual(block.stamps, {})
+      self.assertIsNone(TrustedValidation.lookup(Probe, self.piece))
+
+
+  def test_touch_turns_the_stamp_into_a_miss(self):
+    with TrustedValidation.trusted() as block:
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+      self.piece.touch()
+
+      self.assertIsNone(TrustedValidation.lookup(Probe, self.piece))
+      self.assertEqual((block.hits, block.misses), (0, 1))
+
+      # Restamped at the new version, it answers again.
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+      self.assertIs(TrustedValidation.lookup(Probe, self.piece), self.result)
+
+
+  def test_stamps_are_keyed_by_validator(self):
+    class Other:
+      pass
+
+    with TrustedValidation.trusted():
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+      self.assertIsNone(TrustedValidation.lookup(Other, self.piece))
+
+
+  def test_stamps_are_dropped_when_the_block_exits(self):
+    with TrustedValidation.trusted():
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+    with TrustedValidation.trusted():
+      self.assertIsNone(TrustedValidation.lookup(Probe, self.piece))
+
+
+  def test_nested_block_shares_the_enclosing_stamps(self):
+    with TrustedValidation.trusted() as outer:
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+      with TrustedValidation.trusted() as inner:
+        self.assertIs(inner, outer)
+        self.assertIs(TrustedValidation.lookup(Probe, self.piece), self.result)
+      # The inner exit does not drop what the outer block stamped.
+      self.assertIs(TrustedValidation.lookup(Probe, self.piece), self.result)
+      self.assertEqual(outer.hits, 2)
+
+
+  def test_counters_belong_to_their_block(self):
+    with TrustedValidation.trusted() as first:
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+      TrustedValidation.lookup(Probe, self.piece)
+      TrustedValidation.lookup(Probe, self.piece)
+
+    with TrustedValidation.trusted() as second:
+      TrustedValidation.lookup(Probe, self.piece)
+      self.assertEqual((TrustedValidation.hits(), TrustedValidation.misses()), (0, 1))
+
+    self.assertIsNot(first, second)
+    self.assertEqual((first.hits, first.misses), (2, 0))
+    self.assertEqual((second.hits, second.misses), (0, 1))
+    self.assertEqual((TrustedValidation.hits(), TrustedValidation.misses()), (0, 0))
+
+
+  def test_block_is_per_context_unless_passed_along(self):
+    seen = {}
+
+    def unshared():
+      seen["unshared"] = TrustedValidation.lookup(Probe, self.piece)
+
+    def shared(block):
+      with TrustedValidation.trusted(block):
+        seen["shared"] = TrustedValidation.lookup(Probe, self.piece)
+
+    with TrustedValidation.trusted() as block:
+      TrustedValidation.stamp(Probe, self.piece, self.result)
+      for thread in (threading.Thread(target=unshared), threading.Thread(target=shared, args=(block,))):
+        thread.start()
+        thread.join()
+
+    self.assertIsNone(seen["unshared"])
+    self.assertIs(seen["shared"], self.result)
+
+
+class PrimingValidatorTrustTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    state = load_state_model()
+
+    class Piece(state):
+      __slots__ = ()
+
+    cls.State = state
+    cls.Piece = Piece
+
+
+  def prime(self, candidate, target_model):
+    return PrimingValidator.execute(candidate=candidate, target_model=target_model, null_exception=NullException())
+
+
+  def test_primed_candidate_is_answered_from_the_stamp(self):
+    piece = self.Piece()
+    with TrustedValidation.trusted() as block:
+      first = self.prime(piece, self.Piece)
+      second = self.prime(piece, self.Piece)
+
+    self.assertTrue(first.is_success)
+    self.assertIs(second, first)
+    self.assertEqual((block.hits, block.misses), (1, 1))
+
+
+  def test_target_model_qualifies_the_stamp(self):
+    piece = self.Piece()
+    with TrustedValidation.trusted() as block:
+      as_piece = self.prime(piece, self.Piece)
+      as_state = self.prime(piece, self.State)
+
+      # Primed for two models, the object holds two stamps and neither answers for the other.
+      self.assertEqual(len(block.stamps), 2)
+      self.assertEqual((block.hits, block.misses), (0, 2))
+      self.assertIs(self.prime(piece, self.Piece), as_piece)
+      self.assertIs(self.prime(piece, self.State), as_state)
+      self.assertEqual(block.hits, 2)
+
+
+  def test_stamp_for_one_model_does_not_pass_another(self):
+    piece = self.Piece()
+    with TrustedValidation.trusted():
+      self.assertTrue(self.prime(piece, self.Piece).is_success)
+      self.assertFalse(self.prime(piece, int).is_success)
+
+
+  def test_touched_candidate_is_primed_again(self):
+    piece = self.Piece()
+    with TrustedValidation.trusted() as block:
+      first = self.prime(piece, self.Piece)
+      piece.touch()
+      second = self.prime(piece, self.Piece)
+
+    self.assertIsNot(second, first)
+    self.assertTrue(second.is_success)
+    self.assertEqual((block.hits, block.misses), (0, 2))
+
+
+if __name__ == '__main__':
+  unittest.main()
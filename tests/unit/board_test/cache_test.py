@@ -0,0 +1,197 @@
+import unittest
+
+from support.board import RankStandIn, TeamStandIn, TokenStandIn, build_board, coord_of, load_models
+from support.database import CountingFinder, load_square_context, load_square_database, load_square_router
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import SquareState
+from domain.model.state.board.cache import BoardQueryCache
+from domain.schema import Archetype, Persona
+from result import SearchResult
+
+
+class BoardQueryCacheTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.Context = load_square_context()
+    cls.normalize = load_models().SquareIndex.NORMALIZE
+
+
+  def setUp(self):
+    self.cache = BoardQueryCache()
+
+
+  def test_name_case_shares_a_key(self):
+    self.assertEqual(
+      BoardQueryCache.key(self.Context(name="e4"), self.normalize),
+      BoardQueryCache.key(self.Context(name="E4"), self.normalize),
+    )
+    self.assertNotEqual(
+      BoardQueryCache.key(self.Context(name="e4")), BoardQueryCache.key(self.Context(name="E4"))
+    )
+
+
+  def test_key_skips_unset_values_and_includes_the_context_type(self):
+    class OtherContext(self.Context):
+      pass
+
+    key = BoardQueryCache.key(self.Context(id=3))
+    self.assertEqual(key, (self.Context, ("id", 3)))
+    self.assertNotEqual(key, BoardQueryCache.key(OtherContext(id=3)))
+    self.assertNotEqual(key, BoardQueryCache.key(self.Context(id=3, name="A1")))
+
+
+  def test_hit_and_miss_counters(self):
+    key = BoardQueryCache.key(self.Context(id=1))
+    self.assertIsNone(self.cache.get(key))
+    self.cache.put(key, SearchResult.success(["a1"]))
+    self.assertEqual(self.cache.get(key).payload, ["a1"])
+    self.cache.get(key)
+    self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+    self.assertAlmostEqual(self.cache.hit_rate, 2 / 3)
+    self.cache.reset_counters()
+    self.assertEqual((self.cache.hits, self.cache.misses, self.cache.hit_rate), (0, 0, 0.0))
+
+
+  def test_empty_results_are_cached_and_failures_are_not(self):
+    self.cache.put("empty", SearchResult.empty())
+    self.cache.put("failure", SearchResult.failure(ValueError("bad context")))
+    self.assertIs(self.cache.get("empty"), SearchResult.empty())
+    self.assertIsNone(self.cache.get("failure"))
+    self.assertEqual(self.cache.size, 1)
+
+
+  def test_bump_drops_every_entry(self):
+    self.cache.put("a", SearchResult.success(["a1"]))
+    self.cache.put("b", SearchResult.empty())
+    self.cache.bump()
+    self.assertEqual((self.cache.epoch, self.cache.size), (1, 0))
+    self.assertIsNone(self.cache.get("a"))
+
+
+class SquareDatabaseCacheTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.Context = load_square_context()
+    index = load_models().SquareIndex
+    cls.router = load_square_router(index)
+    cls.finder = CountingFinder(cls.router)
+    cls.models = load_models(square_database=load_square_database(index, cls.finder).SquareDatabase)
+
+
+  def setUp(self):
+    self.board, self.squares = build_board(self.models)
+    self.database = self.board.squares
+    for square in self.squares.values():
+      self.database.insert_square(square)
+    self.cache = self.board.query_cache
+    self.white = TeamStandIn(Archetype.WHITE)
+    self.pawn = TokenStandIn("WP5", self.white, Persona.PAWN)
+    self.board.occupy(coord_of("E2"), self.pawn)
+    self.finder.routes = 0
+
+
+  def _search(self, **context):
+    return self.database.search(self.Context(**context))
+
+
+  def _assert_cached(self, **context):
+    first = self._search(**context)
+    routes = self.finder.routes
+    self.assertIs(self._search(**context), first)
+    self.assertEqual(self.finder.routes, routes)
+    return first
+
+
+  def _assert_dropped_by(self, write, **context):
+    self._assert_cached(**context)
+    routes = self.finder.routes
+    write()
+    self.assertEqual(self.cache.size, 0)
+    result = self._search(**context)
+    self.assertEqual(self.finder.routes, routes + 1)
+    return result
+
+
+  def test_repeat_search_is_answered_from_the_cache(self):
+    result = self._assert_cached(occupant=self.pawn)
+    self.assertEqual(result.payload, [self.squares["E2"]])
+    self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+
+  def test_name_case_contexts_share_an_entry(self):
+    self._search(name="e2")
+    routes = self.finder.routes
+    self.assertEqual(self._search(name="E2").payload, [self.squares["E2"]])
+    self.assertEqual(self.finder.routes, routes)
+    self.assertEqual(self.cache.size, 1)
+
+
+  def test_occupy_drops_cached_results(self):
+    knight = TokenStandIn("WN1", self.white, Persona.KNIGHT)
+    result = self._assert_dropped_by(lambda: self.board.occupy(coord_of("F3"), knight), occupant=knight)
+    self.assertEqual(result.payload, [self.squares["F3"]])
+
+
+  def test_vacate_drops_cached_results(self):
+    result = self._assert_dropped_by(lambda: self.board.vacate(coord_of("E2")), occupant=self.pawn)
+    self.assertTrue(result.is_empty)
+
+
+  def test_change_rank_drops_cached_results(self):
+    def promote():
+      self.pawn.rank = RankStandIn(Persona.QUEEN)
+      self.board.change_rank(coord_of("E2"), self.pawn, Persona.PAWN)
+
+    self._assert_dropped_by(promote, name="E2")
+
+
+  def test_square_state_write_drops_cached_results(self):
+    def write():
+      self.squares["A1"].state = SquareState.EMPTY
+
+    self._assert_dropped_by(write, name="A1")
+
+
+  def test_square_occupant_write_drops_cached_results(self):
+    bishop = TokenStandIn("WB1", self.white, Persona.BISHOP)
+
+    def write():
+      self.squares["C1"].occupant = bishop
+
+    result = self._assert_dropped_by(write, occupant=bishop)
+    self.assertEqual(result.payload, [self.squares["C1"]])
+
+
+  def test_database_insert_drops_cached_results(self):
+    square = self.models.Square(id=99, name="A1", coord=coord_of("A1"), board=self.board)
+    result = self._assert_dropped_by(lambda: self.database.insert_square(square), name="a1")
+    self.assertEqual(result.payload, [self.squares["A1"], square])
+
+
+  def test_database_occupant_writes_drop_cached_results(self):
+    rook = TokenStandIn("WR1", self.white, Persona.ROOK)
+    square = self.squares["H1"]
+    result = self._assert_dropped_by(
+      lambda: self.database.add_occupant_to_square(token=rook, square=square), occupant=rook,
+    )
+    self.assertEqual(result.payload, [square])
+    self.assertIs(self.database.token_map[rook], square)
+
+    result = self._assert_dropped_by(lambda: self.database.remove_occupant_by_search(rook), occupant=rook)
+    self.assertTrue(result.is_empty)
+    self.assertNotIn(rook, self.database.token_map)
+
+
+  def test_pass_turn_keeps_cached_results(self):
+    self._assert_cached(name="E2")
+    self.board.pass_turn()
+    self.assertEqual(self.cache.size, 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
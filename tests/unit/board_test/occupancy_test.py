@@ -0,0 +1,122 @@
+import unittest
+
+from support.board import RankStandIn, TeamStandIn, TokenStandIn, build_board, coord_of, load_models
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import CoordTable
+from domain.model.state.board.occupancy import BoardOccupancy
+from domain.schema import Archetype, Persona
+
+
+def bits(*names):
+  value = 0
+  for name in names:
+    value |= 1 << coord_of(name).index
+  return value
+
+
+class BoardOccupancyTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.models = load_models()
+
+
+  def setUp(self):
+    self.board, self.squares = build_board(self.models)
+    self.occupancy = self.board.occupancy
+    self.white = TeamStandIn(Archetype.WHITE)
+    self.black = TeamStandIn(Archetype.BLACK)
+    self.white_pawn = TokenStandIn("WP5", self.white, Persona.PAWN)
+    self.white_knight = TokenStandIn("WN2", self.white, Persona.KNIGHT)
+    self.black_pawn = TokenStandIn("BP4", self.black, Persona.PAWN)
+    self.board.occupy(coord_of("E2"), self.white_pawn)
+    self.board.occupy(coord_of("G1"), self.white_knight)
+    self.board.occupy(coord_of("D7"), self.black_pawn)
+
+
+  def test_new_board_is_empty(self):
+    board, _ = build_board(self.models, board_id=2)
+    self.assertEqual(board.occupancy.occupied, 0)
+    self.assertEqual(board.occupancy.empty, BoardOccupancy.FULL)
+
+
+  def test_occupy(self):
+    self.assertEqual(self.occupancy.occupied, bits("E2", "G1", "D7"))
+    self.assertEqual(self.occupancy.empty, BoardOccupancy.FULL & ~bits("E2", "G1", "D7"))
+    self.assertEqual(self.occupancy.team(self.white), bits("E2", "G1"))
+    self.assertEqual(self.occupancy.team(self.black), bits("D7"))
+    self.assertEqual(self.occupancy.enemies(self.white), bits("D7"))
+    self.assertEqual(self.occupancy.enemies(self.black), bits("E2", "G1"))
+    self.assertEqual(self.occupancy.persona(Persona.PAWN), bits("E2", "D7"))
+    self.assertEqual(self.occupancy.persona(Persona.KNIGHT), bits("G1"))
+    self.assertEqual(self.occupancy.persona(Persona.QUEEN), 0)
+    self.assertTrue(self.occupancy.is_occupied(coord_of("G1")))
+    self.assertFalse(self.occupancy.is_occupied(coord_of("G2")))
+
+
+  def test_capture_by_occupy_replaces_the_previous_occupant(self):
+    self.board.occupy(coord_of("D7"), self.board.vacate(coord_of("E2")))
+    self.assertEqual(self.occupancy.occupied, bits("G1", "D7"))
+    self.assertEqual(self.occupancy.team(self.white), bits("G1", "D7"))
+    self.assertEqual(self.occupancy.team(self.black), 0)
+    self.assertEqual(self.occupancy.enemies(self.white), 0)
+    self.assertEqual(self.occupancy.persona(Persona.PAWN), bits("D7"))
+
+
+  def test_capture_across_personas(self):
+    self.board.occupy(coord_of("D7"), self.board.vacate(coord_of("G1")))
+    self.assertEqual(self.occupancy.persona(Persona.PAWN), bits("E2"))
+    self.assertEqual(self.occupancy.persona(Persona.KNIGHT), bits("D7"))
+
+
+  def test_vacate(self):
+    self.assertIs(self.board.vacate(coord_of("G1")), self.white_knight)
+    self.assertEqual(self.occupancy.occupied, bits("E2", "D7"))
+    self.assertEqual(self.occupancy.team(self.white), bits("E2"))
+    self.assertEqual(self.occupancy.persona(Persona.KNIGHT), 0)
+    self.assertIsNone(self.board.vacate(coord_of("G1")))
+    self.assertEqual(self.occupancy.occupied, bits("E2", "D7"))
+
+
+  def test_change_persona_on_promotion(self):
+    self.white_pawn.rank = RankStandIn(Persona.QUEEN)
+    self.board.change_rank(coord_of("E2"), self.white_pawn, Persona.PAWN)
+    self.assertEqual(self.occupancy.persona(Persona.PAWN), bits("D7"))
+    self.assertEqual(self.occupancy.persona(Persona.QUEEN), bits("E2"))
+    self.assertEqual(self.occupancy.team(self.white), bits("E2", "G1"))
+    self.assertEqual(self.occupancy.occupied, bits("E2", "G1", "D7"))
+
+
+  def test_change_rank_of_a_token_not_on_the_coord_is_ignored(self):
+    self.board.change_rank(coord_of("E3"), self.white_pawn, Persona.PAWN)
+    self.assertEqual(self.occupancy.persona(Persona.PAWN), bits("E2", "D7"))
+
+
+  def test_bit_of_an_off_board_coord_is_zero(self):
+    off_board = CoordTable.get(row=8, column=0)
+    self.assertEqual(BoardOccupancy.bit(off_board), 0)
+    self.assertFalse(self.occupancy.is_occupied(off_board))
+
+
+  def test_coords_yields_the_lowest_index_first(self):
+    # G1 is index 6, E2 is 12 and D7 is 51.
+    self.assertEqual(
+      list(BoardOccupancy.coords(self.occupancy.occupied)), [coord_of("G1"), coord_of("E2"), coord_of("D7")]
+    )
+    indexes = [coord.index for coord in BoardOccupancy.coords(bits("H8", "A1", "C3", "B1"))]
+    self.assertEqual(indexes, sorted(indexes))
+    self.assertEqual(indexes[0], 0)
+    self.assertEqual(indexes[-1], CoordTable.SIZE - 1)
+    self.assertEqual(list(BoardOccupancy.coords(0)), [])
+
+
+  def test_coords_are_the_interned_table_coords(self):
+    for coord in BoardOccupancy.coords(self.occupancy.occupied):
+      self.assertIs(coord, CoordTable.at(coord.index))
+
+
+if __name__ == '__main__':
+  unittest.main()
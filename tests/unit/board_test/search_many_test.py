@@ -0,0 +1,142 @@
+import unittest
+
+from support.board import TeamStandIn, TokenStandIn, build_board, coord_of, load_models
+from support.database import CountingFinder, load_square_context, load_square_database, load_square_router
+from support.loader import SourceLoader
+from support.route import ValidatorStandIn
+
+SourceLoader.install()
+
+from domain.model import CoordTable, SquareState
+from domain.schema import Archetype, Persona
+
+
+class SquareDatabaseSearchManyTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.Context = load_square_context()
+    index = load_models().SquareIndex
+    cls.router = load_square_router(index)
+    cls.finder = CountingFinder(cls.router)
+    cls.loaded = load_square_database(index, cls.finder)
+    cls.models = load_models(square_database=cls.loaded.SquareDatabase)
+
+
+  def setUp(self):
+    self.board, self.squares = build_board(self.models)
+    self.white = TeamStandIn(Archetype.WHITE)
+    self.pawn = TokenStandIn("WP5", self.white, Persona.PAWN)
+    self.knight = TokenStandIn("WN1", self.white, Persona.KNIGHT)
+
+
+  def _fill(self, database):
+    for square in self.squares.values():
+      database.insert_square(square)
+    self.board.occupy(coord_of("E2"), self.pawn)
+    self.board.occupy(coord_of("F3"), self.knight)
+    self.squares["A1"].state = SquareState.EMPTY
+    return database
+
+
+  def _contexts(self):
+    absent = TokenStandIn("BQ", TeamStandIn(Archetype.BLACK), Persona.QUEEN)
+    return [
+      self.Context(coord=coord_of("E2")),
+      self.Context(name="f3"),
+      self.Context(occupant=self.knight),
+      self.Context(state=SquareState.EMPTY),
+      self.Context(id=self.squares["H8"].id),
+      self.Context(board=self.board),
+      self.Context(occupant=absent),
+      self.Context(coord=coord_of("E2")),
+      self.Context(name="Z9"),
+    ]
+
+
+  def _assert_matches_search(self, database):
+    contexts = self._contexts()
+    expected = [database.search(context).payload or [] for context in contexts]
+    if database.query_cache is not None:
+      database.query_cache.bump()
+
+    result = database.search_many(contexts)
+
+    self.assertTrue(result.is_success)
+    self.assertEqual(result.payload, expected)
+    return result.payload
+
+
+  def test_search_many_equals_repeated_search_with_the_cache(self):
+    payload = self._assert_matches_search(self._fill(self.board.squares))
+    self.assertEqual(payload[0], [self.squares["E2"]])
+    self.assertEqual(payload[2], [self.squares["F3"]])
+    self.assertEqual(payload[6], [])
+
+
+  def test_search_many_equals_repeated_search_without_the_cache(self):
+    database = self._fill(self.loaded.SquareDatabase(board=self.board))
+    self.assertIsNone(database.query_cache)
+    self._assert_matches_search(database)
+
+
+  def test_search_many_mixes_cached_and_new_contexts_in_order(self):
+    database = self._fill(self.board.squares)
+    contexts = self._contexts()
+    expected = [database.search(context).payload or [] for context in contexts]
+    database.query_cache.bump()
+    for context in contexts[::2]:
+      database.search(context)
+
+    self.finder.batches = 0
+    self.assertEqual(database.search_many(contexts).payload, expected)
+    self.assertEqual(self.finder.batches, 1)
+
+
+class SquareRouterBatchBoardTest(unittest.TestCase):
+  """Without an index, route() answers a coord search from the board's mailbox and so must route_batch."""
+
+  @classmethod
+  def setUpClass(cls):
+    cls.Context = load_square_context()
+    models = load_models()
+    cls.router = load_square_router(models.SquareIndex)
+    cls.board, cls.squares = build_board(models)
+
+
+  def _route(self, context, dataset, board):
+    return self.router.route(context=context, dataset=dataset, board=board, context_validator=ValidatorStandIn())
+
+
+  def _route_batch(self, contexts, dataset, board):
+    return self.router.route_batch(
+      dataset=dataset, contexts=contexts, board=board, context_validator=ValidatorStandIn(),
+    )
+
+
+  def test_batch_coord_search_reads_the_board_like_route(self):
+    # A dataset that is not the whole square set shows which path answered.
+    dataset = [self.squares["A1"], self.squares["B1"]]
+    contexts = [
+      self.Context(coord=coord_of("E2")),
+      self.Context(name="A1"),
+      self.Context(coord=coord_of("B1")),
+      self.Context(board=self.board),
+    ]
+    for board in (None, self.board):
+      with self.subTest(board=board is not None):
+        expected = [self._route(context, dataset, board).payload or [] for context in contexts]
+        self.assertEqual(self._route_batch(contexts, dataset, board).payload, expected)
+
+    self.assertEqual(self._route_batch(contexts[:1], dataset, self.board).payload, [[self.squares["E2"]]])
+    self.assertEqual(self._route_batch(contexts[:1], dataset, None).payload, [[]])
+
+
+  def test_batch_coord_search_of_every_square(self):
+    contexts = [self.Context(coord=coord) for coord in CoordTable.all()]
+    payload = self._route_batch(contexts, [], self.board).payload
+    self.assertEqual(payload, [[self.board.square_at(context.coord)] for context in contexts])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,141 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from support.board import RankStandIn, TeamStandIn, TokenStandIn, build_board, coord_of, load_models
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model.state.board.zobrist import ZobristTable
+from domain.schema import Archetype, Persona
+
+TESTS = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROBE = """
+import sys
+sys.path.insert(0, {tests!r})
+from support.loader import SourceLoader
+SourceLoader.install()
+from domain.model.state.board.zobrist import ZobristTable
+from domain.schema import Archetype, Persona
+# Ask in a different order from the parent so row generation order cannot matter.
+keys = [ZobristTable.key(archetype, persona, index)
+        for archetype in reversed(list(Archetype)) for persona in reversed(list(Persona)) for index in (63, 12, 0)]
+print(ZobristTable.SIDE, *keys)
+"""
+
+
+class ZobristTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.models = load_models()
+
+
+  def setUp(self):
+    self.board, self.squares = build_board(self.models)
+    self.white = TeamStandIn(Archetype.WHITE)
+    self.black = TeamStandIn(Archetype.BLACK)
+    self.pawn = TokenStandIn("WP5", self.white, Persona.PAWN)
+    self.knight = TokenStandIn("BN1", self.black, Persona.KNIGHT)
+    self.board.occupy(coord_of("E2"), self.pawn)
+    self.board.occupy(coord_of("B8"), self.knight)
+
+
+  def _move(self, origin, destination):
+    self.board.occupy(coord_of(destination), self.board.vacate(coord_of(origin)))
+
+
+  def test_key_is_the_xor_of_the_occupants(self):
+    expected = (
+      ZobristTable.key(Archetype.WHITE, Persona.PAWN, coord_of("E2").index)
+      ^ ZobristTable.key(Archetype.BLACK, Persona.KNIGHT, coord_of("B8").index)
+    )
+    self.assertEqual(self.board.zobrist_key, expected)
+
+
+  def test_move_and_its_reverse_restore_the_key(self):
+    start = self.board.zobrist_key
+    self._move("E2", "E4")
+    self.assertNotEqual(self.board.zobrist_key, start)
+    self._move("E4", "E2")
+    self.assertEqual(self.board.zobrist_key, start)
+
+
+  def test_transposed_moves_reach_the_same_key(self):
+    self._move("E2", "E4")
+    self._move("B8", "C6")
+    first = self.board.zobrist_key
+    board, _ = build_board(self.models, board_id=2)
+    board.occupy(coord_of("B8"), self.knight)
+    board.occupy(coord_of("E2"), self.pawn)
+    board.occupy(coord_of("C6"), board.vacate(coord_of("B8")))
+    board.occupy(coord_of("E4"), board.vacate(coord_of("E2")))
+    self.assertEqual(board.zobrist_key, first)
+
+
+  def test_capture_removes_the_captured_key(self):
+    self._move("B8", "C6")
+    self.board.occupy(coord_of("D5"), self.board.vacate(coord_of("E2")))
+    self.board.occupy(coord_of("C6"), self.board.vacate(coord_of("D5")))
+    self.assertEqual(
+      self.board.zobrist_key, ZobristTable.key(Archetype.WHITE, Persona.PAWN, coord_of("C6").index)
+    )
+
+
+  def test_pass_turn_twice_is_the_identity(self):
+    start = self.board.zobrist_key
+    self.board.pass_turn()
+    self.assertEqual(self.board.zobrist_key, start ^ ZobristTable.SIDE)
+    self.board.pass_turn()
+    self.assertEqual(self.board.zobrist_key, start)
+
+
+  def test_promotion_changes_the_key(self):
+    self._move("E2", "E8")
+    pawn_key = self.board.zobrist_key
+    self.pawn.rank = RankStandIn(Persona.QUEEN)
+    self.board.change_rank(coord_of("E8"), self.pawn, Persona.PAWN)
+    self.assertNotEqual(self.board.zobrist_key, pawn_key)
+
+    queen = TokenStandIn("WQ", self.white, Persona.QUEEN)
+    board, _ = build_board(self.models, board_id=2)
+    board.occupy(coord_of("B8"), self.knight)
+    board.occupy(coord_of("E8"), queen)
+    self.assertEqual(self.board.zobrist_key, board.zobrist_key)
+
+
+  def test_vacating_every_square_returns_to_zero(self):
+    self.board.vacate(coord_of("E2"))
+    self.board.vacate(coord_of("B8"))
+    self.assertEqual(self.board.zobrist_key, 0)
+
+
+  def test_keys_are_distinct_per_archetype_persona_and_square(self):
+    keys = {
+      ZobristTable.key(archetype, persona, index)
+      for archetype in Archetype for persona in Persona for index in range(64)
+    }
+    self.assertEqual(len(keys), len(Archetype) * len(Persona) * 64)
+    self.assertNotIn(ZobristTable.SIDE, keys)
+
+
+  def test_keys_are_stable_across_processes(self):
+    expected = [ZobristTable.SIDE] + [
+      ZobristTable.key(archetype, persona, index)
+      for archetype in reversed(list(Archetype)) for persona in reversed(list(Persona)) for index in (63, 12, 0)
+    ]
+    for seed in ("0", "1"):
+      with self.subTest(PYTHONHASHSEED=seed):
+        output = subprocess.run(
+          [sys.executable, "-c", PROBE.format(tests=TESTS)],
+          capture_output=True, text=True, check=True, cwd=TESTS,
+          env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        self.assertEqual([int(value) for value in output.split()], expected)
+
+
+if __name__ == '__main__':
+  unittest.main()
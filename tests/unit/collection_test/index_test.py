@@ -0,0 +1,213 @@
+import unittest
+
+from support.board import TeamStandIn, TokenStandIn, build_board, coord_of, load_models
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from collection.index import ModelIndex
+from domain.schema import Archetype, Persona
+
+
+class Item:
+
+  def __init__(self, id, color, size):
+    self.id = id
+    self.color = color
+    self.size = size
+
+  def __repr__(self):
+    return f"Item({self.id})"
+
+
+class ItemIndex(ModelIndex[Item]):
+  KEYS = {
+    "id": lambda item: item.id,
+    "color": lambda item: item.color.lower(),
+    "size": lambda item: item.size,
+  }
+  NORMALIZE = {"color": str.lower}
+
+
+class RecordingSet(set):
+  calls = []
+
+  def intersection(self, *others):
+    RecordingSet.calls.append((len(self), [len(other) for other in others]))
+    return super().intersection(*others)
+
+
+class ModelIndexTest(unittest.TestCase):
+
+  def setUp(self):
+    self.index = ItemIndex()
+    self.items = [
+      Item(1, "red", 1),
+      Item(2, "blue", 1),
+      Item(3, "red", 2),
+      Item(4, "red", 1),
+      Item(5, "blue", 2),
+    ]
+    for item in self.items:
+      self.index.add(item)
+
+
+  def test_add_files_every_key(self):
+    self.assertEqual(self.index.size, 5)
+    self.assertEqual(self.index.lookup("id", 3), [self.items[2]])
+    self.assertEqual(self.index.lookup("size", 2), [self.items[2], self.items[4]])
+
+
+  def test_add_twice_refreshes_instead_of_duplicating(self):
+    item = self.items[0]
+    item.size = 2
+    self.index.add(item)
+    self.assertEqual(self.index.size, 5)
+    self.assertNotIn(item, self.index.lookup("size", 1))
+    self.assertIn(item, self.index.lookup("size", 2))
+
+
+  def test_remove_drops_every_key(self):
+    self.index.remove(self.items[0])
+    self.assertEqual(self.index.size, 4)
+    self.assertEqual(self.index.lookup("id", 1), [])
+    self.assertNotIn(self.items[0], self.index.lookup("color", "red"))
+    self.index.remove(self.items[0])
+    self.assertEqual(self.index.size, 4)
+
+
+  def test_remove_deletes_empty_buckets(self):
+    self.index.remove(self.items[2])
+    self.assertNotIn(3, self.index._tables["id"])
+
+
+  def test_refresh_moves_the_item_to_its_new_buckets(self):
+    item = self.items[1]
+    item.color = "red"
+    self.assertEqual(self.index.lookup("color", "red"), [self.items[0], self.items[2], self.items[3]])
+    self.index.refresh(item)
+    self.assertEqual(
+      self.index.lookup("color", "red"), [self.items[0], item, self.items[2], self.items[3]]
+    )
+    self.assertEqual(self.index.lookup("color", "blue"), [self.items[4]])
+
+
+  def test_refresh_ignores_unfiled_items(self):
+    self.index.refresh(Item(9, "green", 3))
+    self.assertEqual(self.index.size, 5)
+    self.assertEqual(self.index.lookup("id", 9), [])
+
+
+  def test_stale_entry_is_never_returned(self):
+    item = self.items[0]
+    item.color = "green"
+    self.assertNotIn(item, self.index.lookup("color", "red"))
+
+
+  def test_intersect_returns_items_in_insertion_order(self):
+    self.index.remove(self.items[0])
+    self.index.add(self.items[0])
+    self.assertEqual(
+      self.index.intersect({"color": "red", "size": 1}), [self.items[3], self.items[0]]
+    )
+
+
+  def test_intersect_starts_from_the_smallest_bucket(self):
+    for name in ("color", "size"):
+      table = self.index._tables[name]
+      for key, bucket in table.items():
+        table[key] = RecordingSet(bucket)
+    RecordingSet.calls = []
+    result = self.index.intersect({"color": "blue", "size": 1})
+    self.assertEqual(result, [self.items[1]])
+    self.assertEqual(RecordingSet.calls, [(2, [3])])
+
+
+  def test_intersect_misses(self):
+    self.assertEqual(self.index.intersect({"color": "green", "size": 1}), [])
+    self.assertEqual(self.index.intersect({}), [])
+    with self.assertRaises(KeyError):
+      self.index.intersect({"weight": 1})
+
+
+  def test_normalize_applies_to_query_values(self):
+    self.assertEqual(self.index.lookup("color", "RED"), self.index.lookup("color", "red"))
+    self.assertEqual(len(self.index.lookup("color", "Blue")), 2)
+
+
+  def test_covers(self):
+    self.assertTrue(ItemIndex.covers(["color", "size"]))
+    self.assertTrue(ItemIndex.covers([]))
+    self.assertFalse(ItemIndex.covers(["color", "weight"]))
+
+
+  def test_clear(self):
+    self.index.clear()
+    self.assertEqual(self.index.size, 0)
+    self.assertEqual(self.index.lookup("color", "red"), [])
+
+
+class SquareIndexTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.models = load_models()
+
+
+  def setUp(self):
+    self.board, self.squares = build_board(self.models)
+    self.index = self.models.SquareIndex()
+    self.board.squares.index = self.index
+    for square in self.squares.values():
+      self.index.add(square)
+    self.white = TeamStandIn(Archetype.WHITE)
+
+
+  def test_lookup_by_id_coord_and_name(self):
+    square = self.squares["C4"]
+    self.assertEqual(self.index.by_id(square.id), [square])
+    self.assertEqual(self.index.by_coord(coord_of("C4")), [square])
+    self.assertEqual(self.index.by_name("C4"), [square])
+
+
+  def test_name_is_normalized(self):
+    self.assertEqual(self.index.by_name("c4"), [self.squares["C4"]])
+    self.assertEqual(self.index.intersect({"name": "h8", "coord": coord_of("H8")}), [self.squares["H8"]])
+
+
+  def test_empty_squares_share_the_none_occupant_bucket(self):
+    self.assertEqual(len(self.index.by_occupant(None)), 64)
+
+
+  def test_occupy_and_vacate_round_trip(self):
+    token = TokenStandIn("WP1", self.white, Persona.PAWN)
+    coord = coord_of("E2")
+    self.board.occupy(coord, token)
+    self.assertEqual(self.index.by_occupant(token), [self.squares["E2"]])
+    self.assertEqual(len(self.index.by_occupant(None)), 63)
+
+    self.assertIs(self.board.vacate(coord), token)
+    self.assertEqual(self.index.by_occupant(token), [])
+    self.assertNotIn(token, self.index._tables["occupant"])
+    self.assertEqual(len(self.index.by_occupant(None)), 64)
+
+
+  def test_move_re_keys_both_squares(self):
+    token = TokenStandIn("WN1", self.white, Persona.KNIGHT)
+    self.board.occupy(coord_of("G1"), token)
+    self.board.occupy(coord_of("F3"), self.board.vacate(coord_of("G1")))
+    self.assertEqual(self.index.by_occupant(token), [self.squares["F3"]])
+    self.assertIn(self.squares["G1"], self.index.by_occupant(None))
+
+
+  def test_square_occupant_write_goes_through_the_board(self):
+    token = TokenStandIn("WQ", self.white, Persona.QUEEN)
+    self.squares["D1"].occupant = token
+    self.assertIs(self.board.occupant_at(coord_of("D1")), token)
+    self.assertEqual(self.index.by_occupant(token), [self.squares["D1"]])
+    self.squares["D1"].occupant = None
+    self.assertEqual(self.index.by_occupant(token), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
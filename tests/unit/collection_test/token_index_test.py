@@ -0,0 +1,87 @@
+import unittest
+
+from support.board import RankStandIn, load_team_models, make_token
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import CoordTable, DeploymentState, TokenActivityState
+from domain.schema import Archetype, Persona
+
+
+class TokenIndexTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.models = load_team_models()
+    cls.Team = cls.models.Team
+    cls.Token = cls.models.Token
+
+
+  def setUp(self):
+    self.team = self.Team(id=1, board=None, owner=None, archetype=Archetype.WHITE)
+    self.index = self.team.roster.index
+    self.pawns = [self._token(id, Persona.PAWN, f"WP{id}") for id in range(1, 4)]
+    self.knight = self._token(4, Persona.KNIGHT, "WN1")
+
+
+  def _token(self, id, persona, designation):
+    return make_token(self.models, id, self.team, persona, designation)
+
+
+  def test_tokens_are_filed_under_every_key(self):
+    self.assertEqual(self.index.lookup("persona", Persona.PAWN), self.pawns)
+    self.assertEqual(self.index.lookup("team", self.team), self.pawns + [self.knight])
+    self.assertEqual(
+      self.index.lookup("readiness_state", TokenActivityState.NOT_INITIALIZED), self.pawns + [self.knight]
+    )
+
+
+  def test_set_rank_re_keys_through_team_reindex(self):
+    promoted = self.pawns[1]
+    promoted.set_rank(RankStandIn(Persona.QUEEN))
+    self.assertEqual(self.index.lookup("persona", Persona.QUEEN), [promoted])
+    self.assertEqual(self.index.lookup("persona", Persona.PAWN), [self.pawns[0], self.pawns[2]])
+    self.assertEqual(self.index._filed[promoted][list(self.index.KEYS).index("persona")], Persona.QUEEN)
+
+
+  def test_readiness_state_re_keys_through_team_reindex(self):
+    token = self.pawns[0]
+    token.readiness_state = TokenActivityState.FREE
+    self.assertEqual(self.index.lookup("readiness_state", TokenActivityState.FREE), [token])
+    self.assertNotIn(token, self.index.lookup("readiness_state", TokenActivityState.NOT_INITIALIZED))
+
+
+  def test_deployment_state_re_keys_through_team_reindex(self):
+    self.knight.mark_deployed()
+    self.assertEqual(self.index.lookup("deployment_state", DeploymentState.DEPLOYED), [self.knight])
+    self.assertEqual(self.index.lookup("deployment_state", DeploymentState.NOT_DEPLOYED), self.pawns)
+
+
+  def test_coord_key_follows_current_position(self):
+    token = self.pawns[2]
+    coord = CoordTable.get(row=1, column=2)
+    token.positions.current_item = coord
+    self.assertEqual(self.index.lookup("coord", coord), [])
+    self.team.reindex(token)
+    self.assertEqual(self.index.lookup("coord", coord), [token])
+
+
+  def test_combined_keys(self):
+    self.pawns[0].readiness_state = TokenActivityState.FREE
+    self.knight.readiness_state = TokenActivityState.FREE
+    self.assertEqual(
+      self.index.intersect({"persona": Persona.PAWN, "readiness_state": TokenActivityState.FREE}),
+      [self.pawns[0]],
+    )
+
+
+  def test_reindex_before_roster_exists_is_a_no_op(self):
+    team = self.Team(id=2, board=None, owner=None, archetype=Archetype.BLACK)
+    token = self.Token(id=9, rank=RankStandIn(Persona.PAWN), team=team, formation=None, home_square=None)
+    token.readiness_state = TokenActivityState.FREE
+    self.assertIsNone(team._roster)
+
+
+if __name__ == '__main__':
+  unittest.main()
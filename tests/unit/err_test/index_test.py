@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from support.loader import SRC, SourceLoader
+
+SourceLoader.install()
+
+from err.index import EXPORTS, OVERRIDES
+from err.indexer import ErrIndexBuilder
+from err.loader import LazyExportLoader
+
+
+class ErrIndexTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.exports, cls.overrides, cls.skipped = ErrIndexBuilder(SRC).build()
+
+
+  def test_committed_index_is_current(self):
+    # Run `python -m err.indexer` from src when this fails.
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, "index.py")
+      ErrIndexBuilder.write(path, self.exports, self.overrides, self.skipped)
+      with open(path, encoding="utf-8") as file:
+        generated = file.read()
+    with open(os.path.join(SRC, "err", "index.py"), encoding="utf-8") as file:
+      committed = file.read()
+    self.assertEqual(generated, committed)
+
+
+  def test_exports_match_build(self):
+    committed = {name: (modules,) if isinstance(modules, str) else modules for name, modules in EXPORTS.items()}
+    self.assertEqual(committed, self.exports)
+    self.assertEqual(OVERRIDES, self.overrides)
+
+
+  def test_every_export_resolves_to_a_module_file(self):
+    loader = LazyExportLoader(LazyExportLoader.ROOT_PACKAGE)
+    for name in self.exports:
+      module = loader.locate(name)
+      self.assertIsNotNone(module, name)
+      self.assertTrue(os.path.isfile(os.path.join(SRC, *module.split(".")) + ".py"), f"{name} -> {module}")
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.schema import Persona
+from geometry.span.table import RayGenerator, RayTable
+
+BOARDS = ((8, 8), (5, 11), (11, 5), (2, 9), (9, 2), (12, 3), (3, 12), (1, 7), (7, 1), (1, 1))
+
+
+def walk_indices(steps, limit, rows, columns):
+  # Steps a cursor from every origin and checks each square is on the board.
+  cap = max(rows, columns) if limit is None else limit
+  table = []
+  for row in range(rows):
+    for column in range(columns):
+      rays = []
+      for row_step, column_step in steps:
+        ray = []
+        cursor_row, cursor_column = row + row_step, column + column_step
+        while len(ray) < cap and 0 <= cursor_row < rows and 0 <= cursor_column < columns:
+          ray.append(cursor_row * columns + cursor_column)
+          cursor_row, cursor_column = cursor_row + row_step, cursor_column + column_step
+        if ray:
+          rays.append(tuple(ray))
+      table.append(tuple(rays))
+  return tuple(table)
+
+
+class RayGeneratorTest(unittest.TestCase):
+
+  def test_persona_rays_match_walk_on_rectangular_boards(self):
+    for rows, columns in BOARDS:
+      for persona, steps in RayTable.STEPS.items():
+        limit = None if persona in RayTable.SLIDERS else 1
+        self.assertEqual(
+          RayGenerator.indices(steps, limit, rows, columns),
+          walk_indices(steps, limit, rows, columns),
+          f"{persona.name} on {rows}x{columns}",
+        )
+
+
+  def test_limits_match_walk_on_rectangular_boards(self):
+    steps = RayTable.STEPS[Persona.QUEEN]
+    for rows, columns in BOARDS:
+      for limit in (1, 2, 3):
+        self.assertEqual(
+          RayGenerator.indices(steps, limit, rows, columns),
+          walk_indices(steps, limit, rows, columns),
+          f"limit {limit} on {rows}x{columns}",
+        )
+
+
+  def test_row_runs_to_edge_of_wide_board(self):
+    self.assertEqual(RayGenerator.indices(((0, 1),), None, 5, 11)[0], (tuple(range(1, 11)),))
+    self.assertEqual(RayGenerator.indices(((0, -1),), None, 2, 9)[8], (tuple(range(7, -1, -1)),))
+
+
+  def test_column_runs_to_edge_of_tall_board(self):
+    rays = RayGenerator.indices(((1, 0),), None, 12, 3)
+    self.assertEqual(rays[1], (tuple(range(4, 36, 3)),))
+
+
+  def test_pawn_push_on_tall_board(self):
+    pushes = RayGenerator.indices(((1, 0),), 2, 12, 3)
+    self.assertEqual(pushes[0], ((3, 6),))
+    self.assertEqual(pushes[31], ((34,),))
+    self.assertEqual(pushes[33], ())
+
+
+  def test_zero_step_gives_no_rays(self):
+    self.assertEqual(RayGenerator.indices(((0, 0),), None, 3, 4), ((),) * 12)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import CoordTable
+from domain.schema import Archetype, Persona
+from geometry.span.coord import CoordRay, CoordSpan
+from geometry.span.table import RayTable
+
+
+def compute_rays(origin, steps, limit):
+  # Steps a cursor from origin and checks each square is on the board, as the ray computers do.
+  rays = []
+  for row_step, column_step in steps:
+    ray = []
+    row, column = origin.row + row_step, origin.column + column_step
+    while len(ray) < limit and CoordTable.contains(row, column):
+      ray.append(CoordTable.get(row, column))
+      row, column = row + row_step, column + column_step
+    if ray:
+      rays.append(tuple(ray))
+  return tuple(rays)
+
+
+class RayTableTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    RayTable.build()
+
+
+  def test_slider_rays_match_computed_rays(self):
+    limit = max(CoordTable.ROWS, CoordTable.COLUMNS)
+    for persona in RayTable.SLIDERS:
+      for archetype in Archetype:
+        for origin in CoordTable.all():
+          self.assertEqual(
+            RayTable.rays(persona, archetype, origin),
+            compute_rays(origin, RayTable.STEPS[persona], limit),
+            f"{persona.name} from {origin}",
+          )
+
+
+  def test_king_and_knight_rays_are_single_steps(self):
+    for persona in (Persona.KING, Persona.KNIGHT):
+      for origin in CoordTable.all():
+        self.assertEqual(
+          RayTable.rays(persona, Archetype.WHITE, origin),
+          compute_rays(origin, RayTable.STEPS[persona], 1),
+          f"{persona.name} from {origin}",
+        )
+
+
+  def test_pawn_pushes_follow_archetype(self):
+    for archetype in Archetype:
+      forward = archetype.advancing_step.magnitude
+      for origin in CoordTable.all():
+        limit = 2 if origin.row == archetype.pawn_row else 1
+        self.assertEqual(
+          RayTable.rays(Persona.PAWN, archetype, origin),
+          compute_rays(origin, ((forward, 0),), limit),
+          f"{archetype.name} pawn from {origin}",
+        )
+
+
+  def test_pawn_attacks_are_forward_diagonals(self):
+    for archetype in Archetype:
+      forward = archetype.advancing_step.magnitude
+      for origin in CoordTable.all():
+        self.assertEqual(
+          RayTable.attack_rays(Persona.PAWN, archetype, origin),
+          compute_rays(origin, ((forward, 1), (forward, -1)), 1),
+        )
+
+
+  def test_reach_is_every_attacked_square(self):
+    for persona in Persona:
+      for origin in CoordTable.all():
+        expected = 0
+        for ray in RayTable.attack_rays(persona, Archetype.BLACK, origin):
+          for coord in ray:
+            expected |= 1 << coord.index
+        self.assertEqual(RayTable.reach(persona, Archetype.BLACK, origin), expected)
+
+
+  def test_rays_share_table_coords(self):
+    origin = CoordTable.get(3, 3)
+    for ray in RayTable.rays(Persona.QUEEN, Archetype.WHITE, origin):
+      for coord in ray:
+        self.assertIs(coord, CoordTable.get(coord.row, coord.column))
+
+
+  def test_span_wraps_rays(self):
+    origin = CoordTable.get(0, 0)
+    span = RayTable.span(Persona.ROOK, Archetype.WHITE, origin)
+    self.assertIsInstance(span, CoordSpan)
+    self.assertIs(span.origin, origin)
+    self.assertEqual(span.sub_span_roots, [])
+    self.assertTrue(all(isinstance(ray, CoordRay) and ray.origin is origin for ray in span.rays))
+    self.assertEqual(
+      tuple(tuple(ray.members) for ray in span.rays),
+      RayTable.rays(Persona.ROOK, Archetype.WHITE, origin),
+    )
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,114 @@
+import random
+import unittest
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import CoordTable
+from domain.schema import Archetype, Persona
+from geometry.span.table import RayTable, SliderTable
+
+
+def blocked_rays(persona, origin, occupied):
+  # Walks each ray square by square and stops on the first occupied square.
+  rays = []
+  for row_step, column_step in RayTable.STEPS[persona]:
+    ray = []
+    row, column = origin.row + row_step, origin.column + column_step
+    while CoordTable.contains(row, column):
+      coord = CoordTable.get(row, column)
+      ray.append(coord)
+      if occupied >> coord.index & 1:
+        break
+      row, column = row + row_step, column + column_step
+    if ray:
+      rays.append(tuple(ray))
+  return tuple(rays)
+
+
+def blocked_attacks(persona, origin, occupied):
+  attacks = 0
+  for ray in blocked_rays(persona, origin, occupied):
+    for coord in ray:
+      attacks |= 1 << coord.index
+  return attacks
+
+
+def scatter(generator, blockers):
+  return sum(1 << index for index in generator.sample(range(CoordTable.SIZE), blockers))
+
+
+class SliderTableTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    SliderTable.build()
+    generator = random.Random(11)
+    cls.boards = [0, (1 << CoordTable.SIZE) - 1] + [
+      scatter(generator, blockers) for blockers in (2, 8, 16, 24, 32, 48) for _ in range(4)
+    ]
+
+
+  def test_attacks_match_blocker_walk(self):
+    for persona in RayTable.SLIDERS:
+      for occupied in self.boards:
+        for origin in CoordTable.all():
+          self.assertEqual(
+            SliderTable.attacks(persona, Archetype.WHITE, origin, occupied),
+            blocked_attacks(persona, origin, occupied),
+            f"{persona.name} from {origin} over {occupied:#x}",
+          )
+
+
+  def test_empty_board_attacks_are_full_reach(self):
+    for persona in RayTable.SLIDERS:
+      for origin in CoordTable.all():
+        self.assertEqual(
+          SliderTable.attacks(persona, Archetype.WHITE, origin, 0),
+          RayTable.reach(persona, Archetype.WHITE, origin),
+        )
+
+
+  def test_origin_bit_does_not_block(self):
+    origin = CoordTable.get(3, 4)
+    occupied = 1 << origin.index
+    self.assertEqual(
+      SliderTable.attacks(Persona.QUEEN, Archetype.WHITE, origin, occupied),
+      blocked_attacks(Persona.QUEEN, origin, 0),
+    )
+
+
+  def test_rays_stop_on_first_blocker(self):
+    for persona in RayTable.SLIDERS:
+      for occupied in self.boards:
+        for origin in CoordTable.all():
+          self.assertEqual(
+            SliderTable.rays(persona, origin, occupied),
+            blocked_rays(persona, origin, occupied),
+          )
+
+
+  def test_reach_drops_friendly_squares(self):
+    generator = random.Random(5)
+    for occupied in self.boards[2:]:
+      friendly = occupied & scatter(generator, CoordTable.SIZE // 2)
+      for origin in CoordTable.all():
+        self.assertEqual(
+          SliderTable.reach(Persona.ROOK, Archetype.WHITE, origin, occupied, friendly),
+          blocked_attacks(Persona.ROOK, origin, occupied) & ~friendly,
+        )
+
+
+  def test_leapers_answer_from_ray_table(self):
+    occupied = (1 << CoordTable.SIZE) - 1
+    for persona in (Persona.KING, Persona.KNIGHT, Persona.PAWN):
+      for origin in CoordTable.all():
+        self.assertEqual(
+          SliderTable.attacks(persona, Archetype.BLACK, origin, occupied),
+          RayTable.reach(persona, Archetype.BLACK, origin),
+        )
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,111 @@
+import logging
+import queue
+import threading
+import unittest
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from util.logging.backend import BoundedQueueHandler, OverflowPolicy, QueuedLogBackend
+
+
+def record(message):
+  return logging.LogRecord("backend_test", logging.INFO, __file__, 0, message, None, None)
+
+
+def drain(log_queue):
+  messages = []
+  while not log_queue.empty():
+    messages.append(log_queue.get_nowait().msg)
+  return messages
+
+
+class CollectingHandler(logging.Handler):
+
+  def __init__(self):
+    super().__init__()
+    self.messages = []
+
+
+  def emit(self, record):
+    self.messages.append(record.getMessage())
+
+
+class BoundedQueueHandlerTest(unittest.TestCase):
+
+  def test_drop_newest_keeps_queued_records(self):
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, policy=OverflowPolicy.DROP_NEWEST)
+    for message in ("a", "b", "c", "d"):
+      handler.emit(record(message))
+    self.assertEqual(drain(log_queue), ["a", "b"])
+    self.assertEqual(handler.dropped, 2)
+
+
+  def test_drop_oldest_keeps_latest_records(self):
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, policy=OverflowPolicy.DROP_OLDEST)
+    for message in ("a", "b", "c", "d"):
+      handler.emit(record(message))
+    self.assertEqual(drain(log_queue), ["c", "d"])
+    self.assertEqual(handler.dropped, 2)
+
+
+  def test_block_waits_for_room_and_loses_nothing(self):
+    log_queue = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(log_queue, policy=OverflowPolicy.BLOCK)
+    handler.emit(record("a"))
+    writer = threading.Thread(target=handler.emit, args=(record("b"),))
+    writer.start()
+    writer.join(timeout=0.1)
+    self.assertTrue(writer.is_alive())
+    self.assertEqual(log_queue.get(timeout=1).msg, "a")
+    writer.join(timeout=1)
+    self.assertFalse(writer.is_alive())
+    self.assertEqual(drain(log_queue), ["b"])
+    self.assertEqual(handler.dropped, 0)
+
+
+class QueuedLogBackendTest(unittest.TestCase):
+
+  def setUp(self):
+    self.logger = logging.getLogger("backend_test")
+    self.logger.propagate = False
+    self.logger.setLevel(logging.INFO)
+    self.collector = CollectingHandler()
+    self.logger.addHandler(self.collector)
+
+
+  def tearDown(self):
+    QueuedLogBackend.stop()
+    self.logger.removeHandler(self.collector)
+
+
+  def test_stop_drains_queue_and_restores_handlers(self):
+    QueuedLogBackend.start(logger=self.logger, capacity=100, policy=OverflowPolicy.BLOCK)
+    self.assertTrue(QueuedLogBackend.is_running())
+    self.assertNotIn(self.collector, self.logger.handlers)
+    for number in range(50):
+      self.logger.info("record %d", number)
+    QueuedLogBackend.stop()
+    self.assertFalse(QueuedLogBackend.is_running())
+    self.assertEqual(self.collector.messages, [f"record {number}" for number in range(50)])
+    self.assertIn(self.collector, self.logger.handlers)
+    self.assertFalse(any(isinstance(handler, BoundedQueueHandler) for handler in self.logger.handlers))
+
+
+  def test_start_while_running_does_nothing(self):
+    QueuedLogBackend.start(logger=self.logger, capacity=10)
+    handlers = list(self.logger.handlers)
+    QueuedLogBackend.start(logger=self.logger, capacity=10)
+    self.assertEqual(self.logger.handlers, handlers)
+
+
+  def test_capacity_below_one_is_rejected(self):
+    with self.assertRaises(ValueError):
+      QueuedLogBackend.start(logger=self.logger, capacity=0)
+
+
+if __name__ == '__main__':
+  unittest.main()
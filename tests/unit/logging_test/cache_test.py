@@ -0,0 +1,78 @@
+import gc
+import logging
+import unittest
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from util.logging.writer import ContextCache, LogWriter
+
+
+class Holder:
+
+  def act(self):
+    return self
+
+
+def helper():
+  return None
+
+
+class ContextCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    ContextCache.clear()
+
+
+  def tearDown(self):
+    ContextCache.clear()
+
+
+  def test_instances_share_their_class_record(self):
+    first = ContextCache.resolve(Holder())
+    self.assertIs(ContextCache.resolve(Holder()), first)
+    self.assertIs(ContextCache.resolve(Holder), first)
+    self.assertEqual(ContextCache.size(), 1)
+
+
+  def test_record_describes_class(self):
+    record = ContextCache.resolve(Holder())
+    self.assertEqual((record.module, record.class_name), (__name__, "Holder"))
+    self.assertIs(record.logger, logging.getLogger(__name__))
+
+
+  def test_bound_method_resolves_to_its_function(self):
+    record = ContextCache.resolve(Holder().act)
+    self.assertIs(ContextCache.resolve(Holder.act), record)
+    self.assertEqual(record.class_name, "Holder")
+
+
+  def test_free_function_is_module_level(self):
+    self.assertEqual(ContextCache.resolve(helper).class_name, "module")
+
+
+  def test_invalidate_rebuilds_record(self):
+    first = ContextCache.resolve(Holder)
+    ContextCache.invalidate(Holder())
+    self.assertEqual(ContextCache.size(), 0)
+    second = ContextCache.resolve(Holder)
+    self.assertIsNot(second, first)
+    self.assertEqual(second, first)
+
+
+  def test_record_goes_with_its_class(self):
+    transient = type("Transient", (), {})
+    ContextCache.resolve(transient)
+    self.assertEqual(ContextCache.size(), 1)
+    del transient
+    gc.collect()
+    self.assertEqual(ContextCache.size(), 0)
+
+
+  def test_log_writer_uses_cached_logger(self):
+    self.assertIs(LogWriter.get_logger_for_context(Holder()), ContextCache.resolve(Holder).logger)
+
+
+if __name__ == '__main__':
+  unittest.main()
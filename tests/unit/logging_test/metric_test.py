@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from result import SearchResult
+from util.logging.metric import MethodMetric, MetricRegistry
+from util.logging.router import LoggingLevelRouter, MonitorMode
+from util.logging.writer import LogWriter
+
+
+@LoggingLevelRouter.monitor
+def succeed():
+  return SearchResult.success(payload=[1])
+
+
+@LoggingLevelRouter.monitor
+def report_failure():
+  return SearchResult.failure(ValueError("failed"))
+
+
+@LoggingLevelRouter.monitor
+def fail():
+  raise ValueError("failed")
+
+
+def name_of(function):
+  return f"{function.__module__}.{function.__qualname__}"
+
+
+class MetricRegistryTest(unittest.TestCase):
+
+  def setUp(self):
+    self.mode = LoggingLevelRouter.get_mode()
+    self.enabled = MetricRegistry.is_enabled()
+    mock.patch.object(LogWriter, "log_info").start()
+    mock.patch.object(LogWriter, "log_exception").start()
+    LoggingLevelRouter.configure(mode=MonitorMode.OFF)
+    MetricRegistry.reset()
+    MetricRegistry.enable()
+
+
+  def tearDown(self):
+    mock.patch.stopall()
+    MetricRegistry.reset()
+    if not self.enabled:
+      MetricRegistry.disable()
+    LoggingLevelRouter.configure(mode=self.mode)
+
+
+  def test_counts_calls_failures_and_errors(self):
+    for _ in range(3):
+      succeed()
+    report_failure()
+    with self.assertRaises(ValueError):
+      fail()
+    self.assertEqual(MetricRegistry.get(name_of(succeed)).calls, 3)
+    self.assertEqual(MetricRegistry.get(name_of(report_failure)).failures, 1)
+    self.assertEqual(MetricRegistry.get(name_of(fail)).errors, 1)
+    self.assertEqual(MetricRegistry.get(name_of(succeed)).failures, 0)
+
+
+  def test_records_whatever_the_monitor_mode(self):
+    for mode in MonitorMode:
+      LoggingLevelRouter.configure(mode=mode)
+      succeed()
+    self.assertEqual(MetricRegistry.get(name_of(succeed)).calls, len(MonitorMode))
+
+
+  def test_disabled_registry_records_nothing(self):
+    MetricRegistry.disable()
+    succeed()
+    self.assertIsNone(MetricRegistry.get(name_of(succeed)))
+
+
+  def test_timings_track_min_max_and_total(self):
+    for elapsed in (30, 10, 20):
+      MetricRegistry.record("timed", elapsed)
+    metric = MetricRegistry.get("timed")
+    self.assertEqual((metric.min_ns, metric.max_ns, metric.total_ns), (10, 30, 60))
+    self.assertEqual(metric.mean_ns, 20.0)
+
+
+  def test_percentiles_are_nearest_rank(self):
+    metric = MethodMetric(name="ranked", sample_size=100)
+    self.assertIsNone(metric.percentile(0.5))
+    for elapsed in range(1, 101):
+      metric.record(elapsed_ns=elapsed, failed=False, raised=False)
+    self.assertEqual(metric.percentile(0.50), 50)
+    self.assertEqual(metric.percentile(0.99), 99)
+    self.assertEqual(metric.percentile(1.0), 100)
+
+
+  def test_samples_keep_the_most_recent(self):
+    metric = MethodMetric(name="bounded", sample_size=2)
+    for elapsed in (5, 6, 7):
+      metric.record(elapsed_ns=elapsed, failed=False, raised=False)
+    self.assertEqual(list(metric.samples), [6, 7])
+    self.assertEqual(metric.calls, 3)
+
+
+  def test_hottest_orders_by_key(self):
+    MetricRegistry.record("cold", 5)
+    MetricRegistry.record("hot", 50)
+    MetricRegistry.record("warm", 20)
+    self.assertEqual([row["name"] for row in MetricRegistry.hottest(limit=2)], ["hot", "warm"])
+
+
+  def test_dump_json_writes_snapshot(self):
+    MetricRegistry.record("dumped", 7)
+    with tempfile.TemporaryDirectory() as directory:
+      path = MetricRegistry.dump_json(os.path.join(directory, "metrics.json"))
+      with open(path, encoding="utf-8") as file:
+        rows = json.load(file)
+    self.assertEqual([(row["name"], row["calls"]) for row in rows], [("dumped", 1)])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from util.logging.router import LoggingLevelRouter, MonitorMode
+from util.logging.writer import LogWriter
+
+
+@LoggingLevelRouter.monitor
+def succeed(value):
+  return value
+
+
+@LoggingLevelRouter.monitor
+def fail():
+  raise ValueError("failed")
+
+
+class MonitorModeTest(unittest.TestCase):
+
+  def setUp(self):
+    self.mode = LoggingLevelRouter.get_mode()
+    self.interval = LoggingLevelRouter.get_sample_interval()
+    self.info = mock.patch.object(LogWriter, "log_info").start()
+    self.exception = mock.patch.object(LogWriter, "log_exception").start()
+
+
+  def tearDown(self):
+    mock.patch.stopall()
+    LoggingLevelRouter.configure(mode=self.mode, sample_interval=self.interval)
+
+
+  def test_off_skips_logging(self):
+    LoggingLevelRouter.configure(mode=MonitorMode.OFF)
+    self.assertEqual(succeed(3), 3)
+    with self.assertRaises(ValueError):
+      fail()
+    self.info.assert_not_called()
+    self.exception.assert_not_called()
+
+
+  def test_errors_only_logs_only_failures(self):
+    LoggingLevelRouter.configure(mode=MonitorMode.ERRORS_ONLY)
+    for value in range(5):
+      succeed(value)
+    with self.assertRaises(ValueError):
+      fail()
+    self.info.assert_not_called()
+    self.assertEqual(self.exception.call_count, 1)
+
+
+  def test_sampled_logs_one_in_interval_successes(self):
+    LoggingLevelRouter.configure(mode=MonitorMode.SAMPLED, sample_interval=4)
+    for value in range(20):
+      succeed(value)
+    self.assertEqual(self.info.call_count, 5)
+    with self.assertRaises(ValueError):
+      fail()
+    self.assertEqual(self.exception.call_count, 1)
+
+
+  def test_full_logs_every_success(self):
+    LoggingLevelRouter.configure(mode=MonitorMode.FULL)
+    for value in range(3):
+      succeed(value)
+    self.assertEqual(self.info.call_count, 3)
+
+
+  def test_switch_takes_effect_on_next_call(self):
+    LoggingLevelRouter.configure(mode=MonitorMode.FULL)
+    succeed(1)
+    LoggingLevelRouter.configure(mode=MonitorMode.OFF)
+    succeed(2)
+    self.assertEqual(self.info.call_count, 1)
+
+
+  def test_sample_interval_below_one_is_rejected(self):
+    with self.assertRaises(ValueError):
+      LoggingLevelRouter.configure(sample_interval=0)
+
+
+  def test_resolve_reads_setting_names(self):
+    self.assertIs(MonitorMode.resolve("errors-only", MonitorMode.FULL), MonitorMode.ERRORS_ONLY)
+    self.assertIs(MonitorMode.resolve("sampled", MonitorMode.FULL), MonitorMode.SAMPLED)
+    self.assertIs(MonitorMode.resolve("", MonitorMode.OFF), MonitorMode.OFF)
+    self.assertIs(MonitorMode.resolve("loud", MonitorMode.FULL), MonitorMode.FULL)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,62 @@
+import importlib
+import os
+import pkgutil
+import unittest
+
+from support.loader import SRC, SourceLoader
+
+SourceLoader.install()
+
+from result import InsertionResult, Result, SearchResult
+
+
+def _load_result_modules():
+  # Subclasses only register once their module is imported. result.turn.result does not
+  # import yet, so any module that fails is skipped rather than failing the whole test.
+  for module in pkgutil.walk_packages([os.path.join(SRC, "result")], "result."):
+    try:
+      importlib.import_module(module.name)
+    except Exception:
+      continue
+
+
+def _subclasses(cls):
+  for subclass in cls.__subclasses__():
+    yield subclass
+    yield from _subclasses(subclass)
+
+
+class ResultLayoutTest(unittest.TestCase):
+
+  def test_empty_search_result_is_shared(self):
+    empty = SearchResult.empty()
+    self.assertIs(empty, SearchResult.empty())
+    self.assertTrue(empty.is_empty)
+    self.assertIsNone(empty.payload)
+
+
+  def test_success_search_result_is_not_shared(self):
+    self.assertIsNot(SearchResult.success(["a1"]), SearchResult.success(["a1"]))
+
+
+  def test_insertion_success_is_shared(self):
+    self.assertIs(InsertionResult.success(), InsertionResult.success())
+
+
+  def test_result_has_no_instance_dict(self):
+    self.assertFalse(hasattr(Result(payload=None), "__dict__"))
+
+
+  def test_every_result_subclass_has_no_instance_dict(self):
+    _load_result_modules()
+    subclasses = list(_subclasses(Result))
+    self.assertIn(SearchResult, subclasses)
+    for subclass in subclasses:
+      with self.subTest(subclass=subclass.__name__):
+        for klass in subclass.__mro__[:-1]:
+          self.assertIn("__slots__", vars(klass), klass.__qualname__)
+        self.assertNotIn("__dict__", dir(subclass))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+
+from support.loader import SourceLoader
+from support.route import load_search_router
+
+SourceLoader.install()
+
+from collection.index import ModelIndex
+from result import SearchResult
+
+
+class Item:
+
+  def __init__(self, id, color, size, label):
+    self.id = id
+    self.color = color
+    self.size = size
+    self.label = label
+
+  def __repr__(self):
+    return f"Item({self.id})"
+
+
+class ItemIndex(ModelIndex[Item]):
+  KEYS = {
+    "id": lambda item: item.id,
+    "color": lambda item: item.color,
+    "size": lambda item: item.size,
+  }
+
+
+class CountingIndex(ItemIndex):
+
+  def __init__(self):
+    super().__init__()
+    self.intersections = []
+
+  def intersect(self, criteria):
+    self.intersections.append(dict(criteria))
+    return super().intersect(criteria)
+
+
+class CountingList(list):
+  """A dataset that counts how often it is scanned."""
+
+  def __init__(self, items):
+    super().__init__(items)
+    self.scans = 0
+
+  def __iter__(self):
+    self.scans += 1
+    return super().__iter__()
+
+
+SCAN_KEYS = {
+  **ItemIndex.KEYS,
+  "label": lambda item: item.label,
+}
+
+
+class SearchRouterTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.Router = load_search_router()
+
+
+  def setUp(self):
+    self.items = [
+      Item(1, "red", 1, "a"),
+      Item(2, "blue", 1, "b"),
+      Item(3, "red", 2, "a"),
+      Item(4, "blue", 2, "a"),
+    ]
+    self.index = CountingIndex()
+    for item in self.items:
+      self.index.add(item)
+    self.dataset = CountingList(self.items)
+
+
+  def test_route_by_index_without_an_index_falls_back(self):
+    self.assertIsNone(self.Router._route_by_index(None, {"color": "red"}))
+
+
+  def test_route_by_index_with_an_uncovered_key_falls_back(self):
+    self.assertIsNone(self.Router._route_by_index(self.index, {"color": "red", "label": "a"}))
+    self.assertEqual(self.index.intersections, [])
+
+
+  def test_route_by_index_with_empty_criteria_falls_back(self):
+    self.assertIsNone(self.Router._route_by_index(self.index, {}))
+    self.assertEqual(self.index.intersections, [])
+
+
+  def test_route_by_index_answers_covered_criteria(self):
+    result = self.Router._route_by_index(self.index, {"color": "red", "size": 2})
+    self.assertTrue(result.is_success)
+    self.assertEqual(result.payload, [self.items[2]])
+
+
+  def test_route_by_index_miss_is_the_shared_empty_result(self):
+    self.assertIs(self.Router._route_by_index(self.index, {"color": "green"}), SearchResult.empty())
+
+
+  def test_route_batch_mixes_indexed_and_scanned_criteria(self):
+    batch = [
+      {"color": "red"},
+      {"label": "a"},
+      None,
+      {"color": "blue", "label": "a"},
+      {"size": 1},
+      {},
+    ]
+    matches = self.Router._route_batch(dataset=self.dataset, batch=batch, keys=SCAN_KEYS, index=self.index)
+    self.assertEqual(
+      matches,
+      [
+        [self.items[0], self.items[2]],
+        [self.items[0], self.items[2], self.items[3]],
+        [],
+        [self.items[3]],
+        [self.items[0], self.items[1]],
+        [],
+      ],
+    )
+    self.assertEqual(self.index.intersections, [{"color": "red"}, {"size": 1}])
+    self.assertEqual(self.dataset.scans, 1)
+
+
+  def test_route_batch_matches_scanning_every_criteria(self):
+    batch = [{"color": "red"}, None, {"label": "a", "size": 2}, {"id": 2}]
+    indexed = self.Router._route_batch(dataset=self.dataset, batch=batch, keys=SCAN_KEYS, index=self.index)
+    scanned = self.Router._route_batch(dataset=self.dataset, batch=batch, keys=SCAN_KEYS)
+    self.assertEqual(indexed, scanned)
+
+
+  def test_route_batch_fully_indexed_does_not_scan(self):
+    self.Router._route_batch(dataset=self.dataset, batch=[{"id": 1}, {"size": 2}], keys=SCAN_KEYS, index=self.index)
+    self.assertEqual(self.dataset.scans, 0)
+
+
+  def test_route_batch_gives_each_criteria_its_own_list(self):
+    matches = self.Router._route_batch(dataset=self.dataset, batch=[None, None, {"label": "b"}], keys=SCAN_KEYS)
+    self.assertEqual(matches, [[], [], [self.items[1]]])
+    self.assertIsNot(matches[0], matches[1])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+from types import SimpleNamespace
+
+from support.board import RankStandIn, load_team_models, make_token
+from support.loader import SourceLoader
+from support.route import load_search_router, load_token_context, load_token_router
+
+SourceLoader.install()
+
+from domain.model import DeploymentState, TokenActivityState
+from domain.schema import Archetype, Persona
+from result import SearchResult
+
+
+class TokenSearchRouterTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.models = load_team_models()
+    cls.Router = load_token_router(load_search_router(), cls.models.TokenIndex)
+    cls.Context = load_token_context()
+
+
+  def setUp(self):
+    self.white = self.models.Team(id=1, board=None, owner=None, archetype=Archetype.WHITE)
+    self.index = self.white.roster.index
+    self.tokens = [
+      make_token(self.models, 1, self.white, Persona.PAWN, "WP1"),
+      make_token(self.models, 2, self.white, Persona.PAWN, "WP2"),
+      make_token(self.models, 3, self.white, Persona.KNIGHT, "WN1"),
+      make_token(self.models, 4, self.white, Persona.PAWN, "WP3"),
+      make_token(self.models, 5, self.white, Persona.BISHOP, "WB1"),
+    ]
+    for token in (self.tokens[0], self.tokens[2], self.tokens[3]):
+      token.readiness_state = TokenActivityState.FREE
+    self.tokens[3].mark_deployed()
+    self.stack = SimpleNamespace(items=list(self.tokens), index=self.index)
+
+
+  def _query(self, **context):
+    return SimpleNamespace(stack=self.stack, context=self.Context(**context))
+
+
+  def _scan(self, criteria):
+    return self.Router._route_batch(dataset=self.stack.items, batch=[criteria], keys=self.Router.SCAN_KEYS)[0]
+
+
+  def test_criteria_names_every_key(self):
+    criteria = self.Router._criteria(
+      self.Context(id=2, designation="wp2", rank=RankStandIn(Persona.PAWN), team=self.white)
+    )
+    self.assertEqual(criteria, {"id": 2, "name": "WP2", "team": self.white, "persona": Persona.PAWN})
+
+
+  def test_rank_and_matching_persona_agree(self):
+    criteria = self.Router._criteria(self.Context(rank=RankStandIn(Persona.PAWN), persona=Persona.PAWN))
+    self.assertEqual(criteria, {"persona": Persona.PAWN})
+
+
+  def test_conflicting_rank_and_persona_finds_nothing(self):
+    query = self._query(rank=RankStandIn(Persona.PAWN), persona=Persona.KNIGHT)
+    self.assertIsNone(self.Router._criteria(query.context))
+    result = self.Router._find_by_index(query)
+    self.assertIs(result, SearchResult.empty())
+
+
+  def test_indexed_multi_key_search_equals_scan(self):
+    context = {
+      "team": self.white,
+      "persona": Persona.PAWN,
+      "readiness_state": TokenActivityState.FREE,
+    }
+    result = self.Router._find_by_index(self._query(**context))
+    self.assertTrue(result.is_success)
+    self.assertEqual(result.payload, [self.tokens[0], self.tokens[3]])
+    self.assertEqual(result.payload, self._scan(self.Router._criteria(self.Context(**context))))
+
+
+  def test_indexed_search_follows_re_keyed_tokens(self):
+    self.tokens[1].set_rank(RankStandIn(Persona.QUEEN))
+    self.tokens[4].mark_deployed()
+    for context in (
+      {"persona": Persona.QUEEN},
+      {"persona": Persona.PAWN},
+      {"deployment_state": DeploymentState.DEPLOYED, "team": self.white},
+    ):
+      with self.subTest(context=context):
+        result = self.Router._find_by_index(self._query(**context))
+        self.assertEqual(result.payload or [], self._scan(self.Router._criteria(self.Context(**context))))
+
+
+  def test_indexed_search_with_no_match_is_empty(self):
+    result = self.Router._find_by_index(self._query(persona=Persona.KING))
+    self.assertIs(result, SearchResult.empty())
+
+
+  def test_uncovered_key_falls_back_to_the_scan(self):
+    self.assertIsNone(self.Router._find_by_index(self._query(designation="WP1", persona=Persona.PAWN)))
+    self.assertIsNone(self.Router._find_by_index(self._query()))
+
+
+  def test_route_batch_answers_in_context_order(self):
+    contexts = [
+      self.Context(designation="wn1"),
+      self.Context(persona=Persona.PAWN, readiness_state=TokenActivityState.FREE),
+      self.Context(rank=RankStandIn(Persona.PAWN), persona=Persona.BISHOP),
+      self.Context(ransom=Persona.PAWN.ransom),
+    ]
+    result = self.Router.route_batch(stack=self.stack, contexts=contexts)
+    self.assertTrue(result.is_success)
+    self.assertEqual(
+      result.payload,
+      [[self.tokens[2]], [self.tokens[0], self.tokens[3]], [], [self.tokens[0], self.tokens[1], self.tokens[3]]],
+    )
+
+
+  def test_route_batch_rejects_a_context_without_keys(self):
+    result = self.Router.route_batch(stack=self.stack, contexts=[self.Context(persona=Persona.PAWN), self.Context()])
+    self.assertTrue(result.is_failure)
+
+
+  def test_route_batch_rejects_a_non_list(self):
+    result = self.Router.route_batch(stack=self.stack, contexts=(self.Context(persona=Persona.PAWN),))
+    self.assertTrue(result.is_failure)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+from types import SimpleNamespace
+from typing import Generic, TypeVar
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from result import BuildResult
+from util import ServiceContainer, ServiceScope
+
+T = TypeVar("T")
+
+
+class GameService:
+  pass
+
+
+class ProcessService:
+  pass
+
+
+class SearchService:
+  pass
+
+
+class ModelBuilderStandIn(Generic[T]):
+
+  def __init__(self, builder_toolkit):
+    self._builder_toolkit = builder_toolkit
+
+  @property
+  def builder_toolkit(self):
+    return self._builder_toolkit
+
+
+def _load_arena():
+  domain = SourceLoader.isolate("domain.domain")
+  model = SourceLoader.isolate("domain.model.model", DomainObject=domain.DomainObject).Model
+  state = SourceLoader.isolate("domain.model.state.model", Model=model).StateModel
+  return SourceLoader.isolate("domain.model.state.arena.model", StateModel=state, ArenaBinder=object).Arena
+
+
+class ServiceContainerScopeTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.Arena = _load_arena()
+
+
+  def setUp(self):
+    ServiceContainer.reset()
+
+
+  def tearDown(self):
+    ServiceContainer.reset()
+
+
+  def test_two_games_resolve_distinct_game_services(self):
+    first = self.Arena(id=1, arena_player_binder=None)
+    second = self.Arena(id=2, arena_player_binder=None)
+    with first.game_scope():
+      first_game = ServiceContainer.resolve(GameService, ServiceScope.GAME)
+      first_process = ServiceContainer.resolve(ProcessService)
+    with second.game_scope():
+      second_game = ServiceContainer.resolve(GameService, ServiceScope.GAME)
+      second_process = ServiceContainer.resolve(ProcessService)
+
+    self.assertIsNot(first_game, second_game)
+    self.assertIs(first_process, second_process)
+    with first.game_scope():
+      self.assertIs(ServiceContainer.resolve(GameService, ServiceScope.GAME), first_game)
+    self.assertIs(first.services[GameService], first_game)
+    self.assertNotIn(ProcessService, first.services)
+
+
+  def test_game_service_outside_a_game_is_process_wide(self):
+    arena = self.Arena(id=1, arena_player_binder=None)
+    outside = ServiceContainer.resolve(GameService, ServiceScope.GAME)
+    with arena.game_scope():
+      self.assertIsNot(ServiceContainer.resolve(GameService, ServiceScope.GAME), outside)
+    self.assertIs(ServiceContainer.resolve(GameService, ServiceScope.GAME), outside)
+
+
+  def test_arena_adopts_the_open_game_scope(self):
+    with ServiceContainer.game_scope() as services:
+      arena = self.Arena(id=1, arena_player_binder=None)
+      service = ServiceContainer.resolve(GameService, ServiceScope.GAME)
+    self.assertIs(arena.services, services)
+    with arena.game_scope():
+      self.assertIs(ServiceContainer.resolve(GameService, ServiceScope.GAME), service)
+
+
+  def test_arena_builder_opens_a_game_scope_per_arena(self):
+    Arena = self.Arena
+
+    class Assembler:
+      def execute(self, blueprint):
+        # Whatever the assembly resolves lands in the scope the arena adopts.
+        ServiceContainer.resolve(GameService, ServiceScope.GAME)
+        return BuildResult.success(Arena(id=blueprint, arena_player_binder=None))
+
+    class Certifier:
+      def execute(self, candidate):
+        return BuildResult.success(candidate)
+
+    toolkit = SimpleNamespace(root_certifier=Certifier(), assembler=Assembler())
+    ArenaBuilder = SourceLoader.isolate(
+      "fabrication.builder.model.arena.builder",
+      ModelBuilder=ModelBuilderStandIn,
+      ArenaBuilderToolkit=lambda: toolkit,
+      ArenaBlueprint=object,
+      Arena=Arena,
+    ).ArenaBuilder
+    builder = ArenaBuilder(builder_toolkit=toolkit)
+
+    first = builder.execute(blueprint=1).payload
+    second = builder.execute(blueprint=2).payload
+    self.assertIsNot(first.services, second.services)
+    self.assertIsNot(first.services[GameService], second.services[GameService])
+    self.assertIsNone(ServiceContainer.current_game_scope())
+
+
+  def test_turn_resolves_search_services_in_a_fresh_scope(self):
+    resolved = []
+
+    class Adviser:
+      def advice(self, graph):
+        resolved.append(ServiceContainer.resolve(SearchService, ServiceScope.SEARCH))
+        resolved.append(ServiceContainer.resolve(SearchService, ServiceScope.SEARCH))
+        return None
+
+    class Launcher:
+      def execute(self, approval):
+        return SimpleNamespace(is_success=False)
+
+    Turn = SourceLoader.isolate(
+      "turn.turn",
+      Player=object,
+      Graph=object,
+      ManeuverLauncher=Launcher,
+      ManeuverRequestDecision=object,
+      TurnResult=object,
+    ).Turn
+    player = SimpleNamespace(adviser=Adviser())
+    Turn(id=1, player=player, graph=None).execute()
+    Turn(id=2, player=player, graph=None).execute()
+
+    self.assertIs(resolved[0], resolved[1])
+    self.assertIsNot(resolved[0], resolved[2])
+    self.assertIs(resolved[2], resolved[3])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,188 @@
+import hashlib
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+from support.loader import SourceLoader
+
+SourceLoader.install()
+
+from domain.model import VectorTable
+
+
+class VectorSetStandIn:
+
+  def __init__(self, items):
+    self.items = items
+
+
+class VectorTreeStandIn:
+
+  def __init__(self, root, branches):
+    self.root = root
+    self.branches = branches
+
+
+class TopologyStandIn:
+
+  def __init__(self, tree):
+    self.tree = tree
+
+
+def fingerprint(seed):
+  return hashlib.sha256(seed.encode("utf-8")).hexdigest()
+
+
+class TopologyCacheTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    # collection.chain does not import yet, so the cache is loaded with the tree types it writes.
+    cls.TopologyCache = SourceLoader.isolate(
+      "topology.cache.cache",
+      VectorSet=VectorSetStandIn,
+      VectorTree=VectorTreeStandIn,
+      Topology=TopologyStandIn,
+    ).TopologyCache
+
+
+  def setUp(self):
+    self.directory = tempfile.TemporaryDirectory()
+    self.addCleanup(self.directory.cleanup)
+    self.cache = self.TopologyCache(directory=self.directory.name)
+    self.fingerprint = fingerprint("basis")
+    self.topology = TopologyStandIn(
+      VectorTreeStandIn(
+        root=VectorTable.get(0, 0),
+        branches=[
+          [VectorSetStandIn(items=(VectorTable.get(1, 0), VectorTable.get(2, 0))), VectorSetStandIn(items=())],
+          [VectorSetStandIn(items=(VectorTable.get(-1, 1), VectorTable.get(-7, -7), VectorTable.get(7, 7)))],
+        ],
+      )
+    )
+
+
+  def _flatten(self, topology):
+    tree = topology.tree
+    root = None if tree.root is None else (tree.root.x, tree.root.y)
+    branches = [
+      [[(vector.x, vector.y) for vector in vector_set.items] for vector_set in branch] for branch in tree.branches
+    ]
+    return root, branches
+
+
+  def test_round_trip(self):
+    self.assertTrue(self.cache.store(self.fingerprint, self.topology))
+    loaded = self.TopologyCache(directory=self.directory.name).load(self.fingerprint)
+
+    self.assertIsNotNone(loaded)
+    self.assertEqual(self._flatten(loaded), self._flatten(self.topology))
+    # Vectors come back through the VectorTable, so they are the interned instances.
+    self.assertIs(loaded.tree.branches[1][0].items[1], VectorTable.get(-7, -7))
+
+
+  def test_round_trip_without_a_root(self):
+    self.topology.tree.root = None
+    self.cache.store(self.fingerprint, self.topology)
+    self.assertEqual(self._flatten(self.cache.load(self.fingerprint)), self._flatten(self.topology))
+
+
+  def test_bodies_are_little_endian(self):
+    data = self.TopologyCache._encode(self.topology, self.fingerprint)
+    header = self.TopologyCache._HEADER
+    shape_size, vector_size = header.unpack_from(data)[-2:]
+    shape = [1, 0, 0, 2, 2, 2, 0, 1, 3]
+    vectors = [1, 0, 2, 0, -1, 1, -7, -7, 7, 7]
+
+    self.assertEqual((shape_size, vector_size), (len(shape), len(vectors)))
+    self.assertEqual(data[header.size:], struct.pack(f"<{len(shape)}i{len(vectors)}h", *shape, *vectors))
+
+
+  def test_changed_fingerprint_is_a_miss(self):
+    self.cache.store(self.fingerprint, self.topology)
+    # The same file name: only the first 16 digits name the file, the header holds the rest.
+    changed = self.fingerprint[:16] + fingerprint("edited")[16:]
+    self.assertEqual(self.cache.path(changed), self.cache.path(self.fingerprint))
+
+    self.assertIsNone(self.cache.load(changed))
+    self.assertIsNone(self.cache.load(fingerprint("edited")))
+    self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+
+
+  def test_truncated_file_is_a_miss(self):
+    self.cache.store(self.fingerprint, self.topology)
+    path = self.cache.path(self.fingerprint)
+    with open(path, "rb") as file:
+      data = file.read()
+
+    for size in (0, 10, self.TopologyCache._HEADER.size, len(data) - 1):
+      with self.subTest(size=size):
+        with open(path, "wb") as file:
+          file.write(data[:size])
+        self.assertIsNone(self.cache.load(self.fingerprint))
+
+
+  def test_trailing_bytes_are_a_miss(self):
+    self.cache.store(self.fingerprint, self.topology)
+    with open(self.cache.path(self.fingerprint), "ab") as file:
+      file.write(b"\x00\x00")
+    self.assertIsNone(self.cache.load(self.fingerprint))
+
+
+  def test_other_format_version_is_a_miss(self):
+    self.cache.store(self.fingerprint, self.topology)
+    with mock.patch.object(self.TopologyCache, "FORMAT_VERSION", self.TopologyCache.FORMAT_VERSION + 1):
+      self.assertIsNone(self.cache.load(self.fingerprint))
+
+
+class TopologyCacheSettingTest(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.TopologyCache = SourceLoader.isolate(
+      "topology.cache.cache",
+      VectorSet=VectorSetStandIn,
+      VectorTree=VectorTreeStandIn,
+      Topology=TopologyStandIn,
+    ).TopologyCache
+
+
+  def _cache(self, setting=None):
+    environ = {} if setting is None else {self.TopologyCache.DIR_ENV_VAR: setting}
+    with mock.patch.dict(os.environ, environ, clear=True):
+      return self.TopologyCache()
+
+
+  def test_off_unless_asked_for(self):
+    cache = self._cache()
+    self.assertFalse(cache.is_enabled)
+    self.assertIsNone(cache.path(fingerprint("basis")))
+    self.assertFalse(cache.store(fingerprint("basis"), None))
+    self.assertIsNone(cache.load(fingerprint("basis")))
+
+
+  def test_setting(self):
+    cases = {
+      "": None,
+      "off": None,
+      "OFF": None,
+      "0": None,
+      "on": self.TopologyCache.DEFAULT_DIR,
+      "1": self.TopologyCache.DEFAULT_DIR,
+      "/tmp/topology": "/tmp/topology",
+    }
+    for setting, directory in cases.items():
+      with self.subTest(setting=setting):
+        self.assertEqual(self._cache(setting).directory, directory)
+
+
+  def test_directory_argument_wins_over_the_setting(self):
+    with mock.patch.dict(os.environ, {self.TopologyCache.DIR_ENV_VAR: "off"}):
+      self.assertEqual(self.TopologyCache(directory="/tmp/topology").directory, "/tmp/topology")
+    self.assertIsNone(self.TopologyCache(directory="off").directory)
+
+
+if __name__ == '__main__':
+  unittest.main()